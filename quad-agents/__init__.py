@@ -4,7 +4,24 @@
 # Copyright (c) 2026 Gopi Suman Addanke. All Rights Reserved.
 # Patent Pending (63/956,810)
 
-from .quad_agent import QUADAgent
+from .quad_agent import AgentStalledError, AgentStreamError, DynamicAgent, QUADAgent
+from .catalog import AgentCatalog
+from .durable_queue import DurableQueue
+from .events import Event, EventBus
+from .transport import AgentClient, AgentServer, NameService, RemoteTransport
+from .registry import AgentRegistry
+from .scheduler import PriorityScheduler, pgce_score
+from .shared_context import PermissionLevel, SharedContext
+from .shared_payload import SharedPayload
+from .supervisor import Supervisor
+from .snapshot import dumps_snapshot, load_snapshot, loads_snapshot, save_snapshot
 
-__all__ = ["QUADAgent"]
+__all__ = [
+    "QUADAgent", "DynamicAgent", "AgentStreamError", "AgentStalledError",
+    "AgentRegistry", "AgentCatalog", "DurableQueue", "EventBus", "Event",
+    "AgentServer", "AgentClient", "NameService", "RemoteTransport",
+    "SharedPayload", "PriorityScheduler", "pgce_score",
+    "SharedContext", "PermissionLevel", "Supervisor",
+    "save_snapshot", "load_snapshot", "dumps_snapshot", "loads_snapshot",
+]
 __version__ = "0.1.0"
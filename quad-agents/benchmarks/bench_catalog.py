@@ -0,0 +1,75 @@
+#!/usr/bin/env python3
+"""
+Benchmark: Worker Startup With a Lazy Agent Catalog
+===================================================
+
+Compares startup of a worker hosting N role agents when every agent is
+constructed eagerly against registering them in the lazy catalog, then
+measures the first-message cost paid by a catalogued agent.
+
+Usage:
+  python quad-agents/benchmarks/bench_catalog.py [agents] [init_ms]
+"""
+
+import importlib
+import sys
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[2]))
+quad_agent = importlib.import_module("quad-agents.quad_agent")
+
+AgentConfig = quad_agent.AgentConfig
+QUADAgent = quad_agent.QUADAgent
+
+INIT_SECONDS = 0.01
+
+
+class RoleAgent(QUADAgent):
+    """Stands in for a role agent that loads prompts/indexes at startup"""
+
+    def __init__(self, config: AgentConfig = None, name: str = None):
+        super().__init__(config=config, name=name)
+        time.sleep(INIT_SECONDS)
+
+    def execute_task(self, input_data: dict) -> dict:
+        return {"role": self.name}
+
+    def _get_pretext(self) -> str:
+        return ""
+
+
+class Caller(RoleAgent):
+    pass
+
+
+def main():
+    global INIT_SECONDS
+    count = int(sys.argv[1]) if len(sys.argv) > 1 else 200
+    INIT_SECONDS = (float(sys.argv[2]) if len(sys.argv) > 2 else 10) / 1000
+
+    print(f"\n  Worker with {count} agents ({INIT_SECONDS * 1000:.0f} ms construction each)\n")
+
+    start = time.perf_counter()
+    eager = [RoleAgent(AgentConfig(name=f"eager-{i}", enable_logging=False)) for i in range(count)]
+    print(f"  eager startup        {time.perf_counter() - start:>9.4f}s")
+    for agent in eager:
+        agent.unregister()
+
+    catalog = QUADAgent._agent_catalog
+    start = time.perf_counter()
+    for i in range(count):
+        catalog.register(f"lazy-{i}", RoleAgent, enable_logging=False)
+    print(f"  catalog startup      {time.perf_counter() - start:>9.4f}s")
+
+    caller = Caller(AgentConfig(name="caller", enable_logging=False))
+    start = time.perf_counter()
+    caller.talk_to_agent("lazy-0", "ping", {})
+    print(f"  first message        {time.perf_counter() - start:>9.4f}s")
+    start = time.perf_counter()
+    caller.talk_to_agent("lazy-0", "ping", {})
+    print(f"  second message       {time.perf_counter() - start:>9.4f}s\n")
+
+
+if __name__ == "__main__":
+    main()
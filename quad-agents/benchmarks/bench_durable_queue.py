@@ -0,0 +1,75 @@
+#!/usr/bin/env python3
+"""
+Benchmark: Durable Queue Throughput
+===================================
+
+Measures group-committed write throughput and claim/ack throughput of the
+SQLite-WAL DurableQueue, plus the cost of committing every message on its
+own for comparison.
+
+Usage:
+  python quad-agents/benchmarks/bench_durable_queue.py [messages] [batch_size]
+"""
+
+import importlib
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[2]))
+quad_agent = importlib.import_module("quad-agents.quad_agent")
+durable_queue = importlib.import_module("quad-agents.durable_queue")
+
+AgentMessage = quad_agent.AgentMessage
+DurableQueue = durable_queue.DurableQueue
+
+
+def make_messages(count: int):
+    return [
+        AgentMessage(from_agent="bench", to_agent="Indexer", action="index",
+                     payload={"story_id": i, "title": f"Story {i}"})
+        for i in range(count)
+    ]
+
+
+def main():
+    count = int(sys.argv[1]) if len(sys.argv) > 1 else 100000
+    batch_size = int(sys.argv[2]) if len(sys.argv) > 2 else 1000
+
+    with tempfile.TemporaryDirectory() as tmp:
+        print(f"\n  {count:,} messages, batch size {batch_size}\n")
+
+        queue = DurableQueue(Path(tmp) / "grouped.db", batch_size=batch_size)
+        messages = make_messages(count)
+        start = time.perf_counter()
+        for message in messages:
+            queue.put(message)
+        queue.flush()
+        elapsed = time.perf_counter() - start
+        print(f"  put (group commit)     {count / elapsed:>12,.0f} msgs/s")
+
+        start = time.perf_counter()
+        claimed = 0
+        while True:
+            batch = queue.get(limit=batch_size)
+            if not batch:
+                break
+            queue.ack([q.message.id for q in batch])
+            claimed += len(batch)
+        elapsed = time.perf_counter() - start
+        print(f"  get + ack              {claimed / elapsed:>12,.0f} msgs/s")
+        queue.close()
+
+        single = min(count, 2000)
+        queue = DurableQueue(Path(tmp) / "single.db", batch_size=1)
+        start = time.perf_counter()
+        for message in make_messages(single):
+            queue.put(message, wait=True)
+        elapsed = time.perf_counter() - start
+        print(f"  put (commit each)      {single / elapsed:>12,.0f} msgs/s\n")
+        queue.close()
+
+
+if __name__ == "__main__":
+    main()
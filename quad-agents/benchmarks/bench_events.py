@@ -0,0 +1,106 @@
+#!/usr/bin/env python3
+"""
+Benchmark: Event Bus Fan-out
+============================
+
+1,000 subscribers with mixed patterns (exact topics, "domain.*",
+"*.event"), publishing a stream of topics. Compares finding subscribers
+with the topic trie against scanning every pattern per event, then
+measures end-to-end delivery throughput through the bounded mailboxes.
+No outside services needed.
+
+Usage:
+  python quad-agents/benchmarks/bench_events.py [subscribers] [events]
+"""
+
+import importlib
+import random
+import sys
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[2]))
+events = importlib.import_module("quad-agents.events")
+
+DOMAINS = [f"domain{i}" for i in range(50)]
+ACTIONS = [f"event{i}" for i in range(20)]
+
+
+def make_patterns(count: int, rng: random.Random) -> list:
+    patterns = []
+    for i in range(count):
+        kind = i % 4
+        if kind == 0:
+            patterns.append(f"{rng.choice(DOMAINS)}.*")
+        elif kind == 1:
+            patterns.append(f"*.{rng.choice(ACTIONS)}")
+        else:
+            patterns.append(f"{rng.choice(DOMAINS)}.{rng.choice(ACTIONS)}")
+    return patterns
+
+
+def scan_match(pattern: str, topic: str) -> bool:
+    """Same semantics as the trie, one pattern at a time"""
+    wanted, segments = pattern.split("."), topic.split(".")
+    if wanted[-1] == "*":
+        wanted = wanted[:-1]
+        if len(segments) <= len(wanted):
+            return False
+    elif len(segments) != len(wanted):
+        return False
+    return all(w == "*" or w == s for w, s in zip(wanted, segments))
+
+
+def main():
+    subscribers = int(sys.argv[1]) if len(sys.argv) > 1 else 1000
+    count = int(sys.argv[2]) if len(sys.argv) > 2 else 20000
+    rng = random.Random(7)
+    patterns = make_patterns(subscribers, rng)
+    topics = [f"{rng.choice(DOMAINS)}.{rng.choice(ACTIONS)}" for _ in range(count)]
+
+    bus = events.EventBus(workers=8)
+    def handler(event):
+        pass
+
+    for pattern in patterns:
+        bus.subscribe(pattern, handler, maxsize=count)
+
+    # Matching only
+    start = time.perf_counter()
+    scanned = sum(sum(scan_match(p, t) for p in patterns) for t in topics)
+    scan = time.perf_counter() - start
+
+    start = time.perf_counter()
+    matched = 0
+    for topic in topics:
+        bus._cache.clear()  # Walk the trie every time
+        matched += len(bus.match(topic))
+    trie = time.perf_counter() - start
+    assert matched == scanned, (matched, scanned)
+
+    start = time.perf_counter()
+    for topic in topics:
+        bus.match(topic)
+    cached = time.perf_counter() - start
+
+    # End to end: publish, then wait for every mailbox to drain
+    start = time.perf_counter()
+    for topic in topics:
+        bus.publish(topic, {"n": 1})
+    published = time.perf_counter() - start
+    bus.join()
+    total = time.perf_counter() - start
+    delivered = bus.stats()["delivered"]
+    bus.shutdown()
+
+    per_event = matched / count
+    print(f"\n  {subscribers:,} subscribers, {count:,} events, {per_event:.1f} matches per event\n")
+    print(f"  match, scan all patterns  {scan / count * 1e6:>9.1f} µs/event")
+    print(f"  match, topic trie         {trie / count * 1e6:>9.1f} µs/event   ({scan / trie:.0f}x)")
+    print(f"  match, trie + cache       {cached / count * 1e6:>9.1f} µs/event   ({scan / cached:.0f}x)")
+    print(f"  publish                   {published / count * 1e6:>9.1f} µs/event")
+    print(f"  delivered                 {delivered:>9,} of {matched:,}   {delivered / total:,.0f}/s\n")
+
+
+if __name__ == "__main__":
+    main()
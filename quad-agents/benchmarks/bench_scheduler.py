@@ -0,0 +1,71 @@
+#!/usr/bin/env python3
+"""
+Benchmark: PGCE Priority Scheduling
+===================================
+
+Saturates a worker pool with bulk background messages while a trickle of
+high-PGCE planning messages arrives, and compares their latency under
+call-order (FIFO) and PGCE-priority scheduling. No outside services needed.
+
+Usage:
+  python quad-agents/benchmarks/bench_scheduler.py [bulk] [urgent] [workers]
+"""
+
+import importlib
+import sys
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[2]))
+quad_agent = importlib.import_module("quad-agents.quad_agent")
+scheduler_mod = importlib.import_module("quad-agents.scheduler")
+
+
+class WorkAgent(quad_agent.QUADAgent):
+    def execute_task(self, input_data: dict) -> dict:
+        time.sleep(0.002)
+        return {"done": True}
+
+    def _get_pretext(self) -> str:
+        return ""
+
+
+def run(bulk: int, urgent: int, workers: int, prioritized: bool) -> dict:
+    agent = WorkAgent(quad_agent.AgentConfig(name="worker", enable_logging=False))
+    scheduler = scheduler_mod.PriorityScheduler(workers=workers).start()
+    every = max(bulk // urgent, 1)
+
+    futures = []
+    for i in range(bulk):
+        message = quad_agent.AgentMessage(to_agent="worker", action="bulk", payload={"i": i})
+        futures.append(scheduler.submit(message, agent))
+        if i % every == 0:
+            pgce = {"dependency": 9, "impact": 8, "complexity": 3} if prioritized else None
+            message = quad_agent.AgentMessage(to_agent="worker", action="plan", payload={"pgce": pgce})
+            futures.append(scheduler.submit(message, agent))
+    for future in futures:
+        future.result()
+    scheduler.stop()
+    agent.unregister()
+    return scheduler.stats()["bands"]
+
+
+def main():
+    bulk = int(sys.argv[1]) if len(sys.argv) > 1 else 4000
+    urgent = int(sys.argv[2]) if len(sys.argv) > 2 else 100
+    workers = int(sys.argv[3]) if len(sys.argv) > 3 else 4
+
+    fifo = run(bulk, urgent, workers, prioritized=False)
+    pgce = run(bulk, urgent, workers, prioritized=True)
+
+    print(f"\n  {bulk:,} bulk + {urgent} planning messages, {workers} workers, 2 ms each\n")
+    print(f"  planning latency, FIFO   p50 {fifo['low']['latency_p50_ms']:>9.1f} ms"
+          f"   p99 {fifo['low']['latency_p99_ms']:>9.1f} ms   (mixed with bulk)")
+    print(f"  planning latency, PGCE   p50 {pgce['high']['latency_p50_ms']:>9.1f} ms"
+          f"   p99 {pgce['high']['latency_p99_ms']:>9.1f} ms")
+    print(f"  bulk latency, PGCE       p50 {pgce['low']['latency_p50_ms']:>9.1f} ms"
+          f"   p99 {pgce['low']['latency_p99_ms']:>9.1f} ms\n")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,81 @@
+#!/usr/bin/env python3
+"""
+Benchmark: Shared Context
+=========================
+
+100k keys across story/task/stats prefixes. Measures permission-checked
+reads and incr from several threads, and prefix / glob scans through the
+sorted key index against filtering every key. No outside services needed.
+
+Usage:
+  python quad-agents/benchmarks/bench_shared_context.py [keys] [threads]
+"""
+
+import fnmatch
+import importlib
+import sys
+import threading
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[2]))
+shared_context = importlib.import_module("quad-agents.shared_context")
+PermissionLevel = shared_context.PermissionLevel
+
+OPS_PER_THREAD = 50000
+
+
+def timed_threads(threads: int, fn) -> float:
+    workers = [threading.Thread(target=fn, args=(i,)) for i in range(threads)]
+    start = time.perf_counter()
+    for worker in workers:
+        worker.start()
+    for worker in workers:
+        worker.join()
+    return time.perf_counter() - start
+
+
+def main():
+    count = int(sys.argv[1]) if len(sys.argv) > 1 else 100000
+    threads = int(sys.argv[2]) if len(sys.argv) > 2 else 8
+
+    context = shared_context.SharedContext()
+    for i in range(count):
+        prefix = ("story", "task", "stats")[i % 3]
+        context.set(f"{prefix}:{i}", {"i": i})
+    for pattern in ("task:*", "stats:*", "build:*", "deploy:*"):
+        context.grant("DevAgent", pattern, PermissionLevel.READ)
+    context.grant("DevAgent", "story:*", PermissionLevel.WRITE)
+    keys = [f"story:{i}" for i in range(0, count, 3)]
+
+    def read(worker: int):
+        n = len(keys)
+        for j in range(OPS_PER_THREAD):
+            context.get(keys[(worker * 7919 + j) % n], agent="DevAgent")
+
+    def incr(worker: int):
+        for j in range(OPS_PER_THREAD):
+            context.incr(f"story:counter:{j % 64}", agent="DevAgent")
+
+    total = threads * OPS_PER_THREAD
+    reads = timed_threads(threads, read)
+    incrs = timed_threads(threads, incr)
+    assert sum(context.get(f"story:counter:{j}") for j in range(64)) == total
+
+    start = time.perf_counter()
+    indexed = context.keys("stats:1*")
+    indexed_time = time.perf_counter() - start
+    start = time.perf_counter()
+    filtered = [k for k in list(context._index) if fnmatch.fnmatchcase(k, "stats:1*")]
+    full_time = time.perf_counter() - start
+    assert indexed == filtered
+
+    print(f"\n  {count:,} keys, {threads} threads\n")
+    print(f"  get (READ checked)      {total / reads:>12,.0f} ops/s")
+    print(f"  incr (WRITE checked)    {total / incrs:>12,.0f} ops/s")
+    print(f"  glob 'stats:1*', index  {indexed_time * 1000:>9.2f} ms   ({len(indexed):,} keys)")
+    print(f"  glob, filter all keys   {full_time * 1000:>9.2f} ms   ({full_time / indexed_time:.0f}x)\n")
+
+
+if __name__ == "__main__":
+    main()
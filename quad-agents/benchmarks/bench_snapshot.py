@@ -0,0 +1,91 @@
+#!/usr/bin/env python3
+"""
+Benchmark: Agent Tree Snapshots
+===============================
+
+Generates a parent agent with many spec-built sub-agents, checkpoints the
+tree, then measures a worker cold start (restore from the snapshot file)
+against regenerating the tree, plus cached re-checkpointing.
+
+Usage:
+  python quad-agents/benchmarks/bench_snapshot.py [agents]
+"""
+
+import gc
+import importlib
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[2]))
+quad_agent = importlib.import_module("quad-agents.quad_agent")
+snapshot = importlib.import_module("quad-agents.snapshot")
+
+
+class Orchestrator(quad_agent.QUADAgent):
+    def execute_task(self, input_data: dict) -> dict:
+        return {"children": len(self.children)}
+
+    def _get_pretext(self) -> str:
+        return "# PRETEXT: Orchestrates generated agents"
+
+
+def build(count: int) -> Orchestrator:
+    root = Orchestrator(quad_agent.AgentConfig(name="orchestrator", namespace="bench", enable_logging=False))
+    root.generate_sub_agents([
+        {"name": f"story-{i}", "purpose": f"Estimate stories for domain {i % 50}",
+         "data_sources": ["jira"], "capabilities": ["estimate", "plan"]}
+        for i in range(count)
+    ])
+    return root
+
+
+def teardown(root) -> None:
+    for child in list(root.children):
+        child.unregister()
+    root.unregister()
+    gc.collect()
+
+
+def timed(fn):
+    start = time.perf_counter()
+    value = fn()
+    return value, time.perf_counter() - start
+
+
+def main():
+    count = int(sys.argv[1]) if len(sys.argv) > 1 else 10000
+
+    with tempfile.TemporaryDirectory() as tmp:
+        root, generate = timed(lambda: build(count))
+        root.children[0].run({"warm": True})
+
+        path = Path(tmp) / "tree.snap"
+        _, first = timed(lambda: snapshot.save_snapshot(root, path))
+        size = path.stat().st_size
+        _, cached = timed(lambda: snapshot.save_snapshot(root, path))
+        root.children[1].run({"changed": True})
+        _, one_dirty = timed(lambda: snapshot.save_snapshot(root, path))
+        json_size = len(snapshot.dumps_snapshot(root, "json"))
+        _, to_dict = timed(root.to_dict)
+        _, to_dict_cached = timed(root.to_dict)
+        teardown(root)
+
+        restored, restore = timed(lambda: snapshot.load_snapshot(path, types={"Orchestrator": Orchestrator}))
+        assert len(restored.children) == count
+        assert restored.children[1].metrics()["executions"] == 1
+        assert restored.children[2].run({"x": 1}).success
+
+    print(f"\n  {count:,} spec-built sub-agents\n")
+    print(f"  generate tree             {generate * 1000:>9.1f} ms")
+    print(f"  cold start from snapshot  {restore * 1000:>9.1f} ms")
+    print(f"  checkpoint (first)        {first * 1000:>9.1f} ms   ({size:,} B)")
+    print(f"  checkpoint (unchanged)    {cached * 1000:>9.1f} ms")
+    print(f"  checkpoint (1 dirty)      {one_dirty * 1000:>9.1f} ms")
+    print(f"  json size                 {json_size:>9,} B")
+    print(f"  to_dict / cached          {to_dict * 1000:>9.1f} ms / {to_dict_cached * 1000:.3f} ms\n")
+
+
+if __name__ == "__main__":
+    main()
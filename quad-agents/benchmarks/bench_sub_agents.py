@@ -0,0 +1,89 @@
+#!/usr/bin/env python3
+"""
+Benchmark: Sub-Agent Creation Rate
+==================================
+
+Compares sub-agents created per second with a freshly defined class per
+call (the original `generate_sub_agent`) against the cached class factory
+and the bulk `generate_sub_agents` API.
+
+Usage:
+  python quad-agents/benchmarks/bench_sub_agents.py [count]
+"""
+
+import importlib
+import sys
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[2]))
+quad_agents = importlib.import_module("quad-agents")
+quad_agent = importlib.import_module("quad-agents.quad_agent")
+
+AgentConfig = quad_agent.AgentConfig
+QUADAgent = quad_agent.QUADAgent
+
+SPEC = {
+    "purpose": "Score stories",
+    "data_sources": ["stories"],
+    "capabilities": ["score"],
+}
+
+
+class RootAgent(QUADAgent):
+    def execute_task(self, input_data: dict) -> dict:
+        return input_data
+
+    def _get_pretext(self) -> str:
+        return ""
+
+
+def legacy_generate(parent: QUADAgent, name: str, purpose: str, execute_fn, pretext: str):
+    """Original behaviour: define a new class on every call"""
+    class DynamicAgent(QUADAgent):
+        __doc__ = purpose
+        _execute_fn = staticmethod(execute_fn)
+        _pretext = pretext
+
+        def execute_task(self, input_data: dict) -> dict:
+            return self._execute_fn(input_data)
+
+        def _get_pretext(self) -> str:
+            return self._pretext
+
+    agent = DynamicAgent(config=AgentConfig(name=name, enable_logging=False))
+    agent.parent = parent
+    parent.children.append(agent)
+    return agent
+
+
+def measure(label: str, count: int, create) -> None:
+    root = RootAgent(AgentConfig(name=f"bench-{label}", enable_logging=False))
+    start = time.perf_counter()
+    create(root, count)
+    elapsed = time.perf_counter() - start
+    print(f"  {label:<28} {count / elapsed:>12,.0f} agents/s  ({elapsed:.3f}s)")
+    for child in list(root.children):
+        child.unregister()
+    root.unregister()
+
+
+def main():
+    count = int(sys.argv[1]) if len(sys.argv) > 1 else 20000
+    print(f"\n  Creating {count:,} sub-agents from one spec\n")
+
+    measure("legacy (class per call)", count, lambda root, n: [
+        legacy_generate(root, f"legacy-{i}", SPEC["purpose"], lambda d: d, "# PRETEXT")
+        for i in range(n)
+    ])
+    measure("generate_sub_agent_from_spec", count, lambda root, n: [
+        root.generate_sub_agent_from_spec({**SPEC, "name": f"spec-{i}"}) for i in range(n)
+    ])
+    measure("generate_sub_agents (bulk)", count, lambda root, n: root.generate_sub_agents(
+        [{**SPEC, "name": f"bulk-{i}"} for i in range(n)]
+    ))
+    print()
+
+
+if __name__ == "__main__":
+    main()
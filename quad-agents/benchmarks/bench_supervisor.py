@@ -0,0 +1,115 @@
+#!/usr/bin/env python3
+"""
+Benchmark: Supervision of Wedged Agents
+=======================================
+
+Caller threads send messages to a worker agent through SUMA WIRE. Each
+worker instance wedges after a number of calls (a hung backend
+connection): every later call on it hangs without making progress.
+Without a supervisor the callers pile up on the wedged instance and
+throughput drops to zero; with one, the instance is replaced and its
+hung calls are cancelled. No outside services needed.
+
+Usage:
+  python quad-agents/benchmarks/bench_supervisor.py [seconds] [callers]
+"""
+
+import importlib
+import logging
+import sys
+import threading
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[2]))
+quad_agent = importlib.import_module("quad-agents.quad_agent")
+supervisor_mod = importlib.import_module("quad-agents.supervisor")
+
+WEDGE_AFTER = 500
+
+
+class WorkerAgent(quad_agent.QUADAgent):
+    def __init__(self, config, finished: threading.Event):
+        super().__init__(config=config)
+        self.finished = finished
+        self.calls = 0
+
+    def execute_task(self, input_data: dict) -> dict:
+        self.calls += 1
+        if self.calls > WEDGE_AFTER:
+            # Hung backend call: no progress (no heartbeat), but the poll
+            # loop notices when the supervisor cancels it
+            while not self.finished.is_set():
+                if self.context.cancelled:
+                    raise quad_agent.AgentStalledError("backend call abandoned")
+                time.sleep(0.01)
+        time.sleep(0.001)
+        return {"ok": True}
+
+    def respawn(self) -> 'WorkerAgent':
+        return type(self)(self.config, self.finished)
+
+    def _get_pretext(self) -> str:
+        return ""
+
+
+class CallerAgent(quad_agent.QUADAgent):
+    def execute_task(self, input_data: dict) -> dict:
+        return {}
+
+    def _get_pretext(self) -> str:
+        return ""
+
+
+def run(seconds: float, callers: int, supervised: bool) -> dict:
+    finished = threading.Event()
+    config = quad_agent.AgentConfig(name="worker", timeout=30, max_retries=0, enable_logging=False)
+    worker = WorkerAgent(config, finished)
+    caller = CallerAgent(quad_agent.AgentConfig(name="caller", enable_logging=False))
+    supervisor = supervisor_mod.Supervisor(
+        stall_factor=50, min_stall=0.2, max_restarts=1000
+    ).start() if supervised else None
+
+    counts = {"ok": 0, "failed": 0}
+    lock = threading.Lock()
+    deadline = time.perf_counter() + seconds
+
+    def call():
+        while time.perf_counter() < deadline:
+            result = caller.talk_to_agent("worker", "work", {})
+            with lock:
+                counts["ok" if result.success else "failed"] += 1
+
+    threads = [threading.Thread(target=call) for _ in range(callers)]
+    for thread in threads:
+        thread.start()
+    time.sleep(seconds)
+    finished.set()  # Unwedge whatever is still hung
+    for thread in threads:
+        thread.join()
+
+    if supervisor is not None:
+        supervisor.stop()
+        counts.update(supervisor.stats())
+    quad_agent.QUADAgent.get_agent("worker").unregister()
+    caller.unregister()
+    del worker
+    return counts
+
+
+def main():
+    seconds = float(sys.argv[1]) if len(sys.argv) > 1 else 3.0
+    callers = int(sys.argv[2]) if len(sys.argv) > 2 else 8
+    logging.getLogger("QUADAgent").setLevel(logging.ERROR)  # One warning per restart
+
+    plain = run(seconds, callers, supervised=False)
+    supervised = run(seconds, callers, supervised=True)
+
+    print(f"\n  {callers} callers for {seconds:.0f}s, each worker instance wedges after {WEDGE_AFTER} calls\n")
+    print(f"  unsupervised   {plain['ok'] / seconds:>9,.0f} calls/s")
+    print(f"  supervised     {supervised['ok'] / seconds:>9,.0f} calls/s   "
+          f"({supervised['restarts']} restarts, {supervised['failed']} calls cancelled)\n")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,110 @@
+#!/usr/bin/env python3
+"""
+Benchmark: Cross-Process SUMA WIRE
+==================================
+
+Starts several local worker processes, each serving an agent over a Unix
+domain socket, then measures request throughput and latency from the
+parent process over multiplexed connections. No outside services needed.
+
+Usage:
+  python quad-agents/benchmarks/bench_transport.py [workers] [requests] [threads]
+"""
+
+import importlib
+import multiprocessing
+import statistics
+import sys
+import tempfile
+import time
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parents[2]
+
+
+def load():
+    sys.path.insert(0, str(ROOT))
+    return importlib.import_module("quad-agents.quad_agent"), importlib.import_module("quad-agents.transport")
+
+
+def worker(index: int, tmp: str, stop) -> None:
+    quad_agent, transport = load()
+
+    class EchoAgent(quad_agent.QUADAgent):
+        def execute_task(self, input_data: dict) -> dict:
+            if input_data.get("stream"):
+                return iter([{"part": i} for i in range(input_data["stream"])])
+            return {"worker": index, "echo": input_data}
+
+        def _get_pretext(self) -> str:
+            return ""
+
+    agent = EchoAgent(quad_agent.AgentConfig(name=f"echo-{index}", namespace="bench", enable_logging=False))
+    server = transport.AgentServer(
+        f"unix://{tmp}/worker-{index}.sock",
+        name_service=transport.NameService(Path(tmp) / "names.json")
+    )
+    server.start()
+    server.advertise()
+    stop.wait()
+    server.stop()
+    del agent
+
+
+def main():
+    workers = int(sys.argv[1]) if len(sys.argv) > 1 else 4
+    requests = int(sys.argv[2]) if len(sys.argv) > 2 else 20000
+    threads = int(sys.argv[3]) if len(sys.argv) > 3 else 16
+
+    quad_agent, transport = load()
+    ctx = multiprocessing.get_context("spawn")
+
+    with tempfile.TemporaryDirectory() as tmp:
+        names = transport.NameService(Path(tmp) / "names.json")
+        stop = ctx.Event()
+        procs = [ctx.Process(target=worker, args=(i, tmp, stop)) for i in range(workers)]
+        for proc in procs:
+            proc.start()
+        while len(names.names()) < workers:
+            time.sleep(0.05)
+
+        class Caller(quad_agent.QUADAgent):
+            def execute_task(self, input_data: dict) -> dict:
+                return input_data
+
+            def _get_pretext(self) -> str:
+                return ""
+
+        quad_agent.QUADAgent.set_remote_transport(transport.RemoteTransport(names))
+        caller = Caller(quad_agent.AgentConfig(name="caller", namespace="bench", enable_logging=False))
+
+        def one(i: int) -> float:
+            start = time.perf_counter()
+            result = caller.talk_to_agent(f"echo-{i % workers}", "echo", {"i": i})
+            assert result.success and result.data["echo"]["i"] == i, result
+            return time.perf_counter() - start
+
+        one(0)  # connect
+        start = time.perf_counter()
+        with ThreadPoolExecutor(max_workers=threads) as pool:
+            latencies = sorted(pool.map(one, range(requests)))
+        elapsed = time.perf_counter() - start
+
+        chunks = list(caller.talk_to_agent("echo-0", "report", {"stream": 1000}, stream=True))
+        assert len(chunks) == 1000
+
+        print(f"\n  {workers} workers, {requests:,} requests, {threads} client threads\n")
+        print(f"  throughput   {requests / elapsed:>10,.0f} req/s")
+        print(f"  p50          {statistics.median(latencies) * 1000:>10.3f} ms")
+        print(f"  p99          {latencies[int(len(latencies) * 0.99)] * 1000:>10.3f} ms")
+        print(f"  stream       {len(chunks):>10} chunks\n")
+
+        quad_agent.QUADAgent._remote_transport.close()
+        stop.set()
+        for proc in procs:
+            proc.join()
+
+
+if __name__ == "__main__":
+    main()
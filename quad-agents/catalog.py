@@ -0,0 +1,238 @@
+"""
+QUAD Agent Catalog
+==================
+
+Lazy agent catalog: register agents by name, build them on first message.
+
+Key Features:
+- Targets are import paths ("pkg.module:ClassName"), factories or specs
+- Agents are constructed on the first `talk_to_agent` / `get_agent`
+- Idle agents are evicted after a configurable time and rebuilt on demand;
+  an agent with an invocation in flight is never idle
+
+Copyright (c) 2026 Gopi Suman Addanke. All Rights Reserved.
+Patent Pending (63/956,810) - QUAD Platform
+"""
+
+import importlib
+import threading
+import time
+from dataclasses import dataclass, field
+from typing import Any, Callable, Dict, List, Optional, Union
+
+from .registry import NAMESPACE_SEPARATOR, qualify
+
+# What a catalog entry can point at
+AgentTarget = Union[str, Callable[..., Any], Dict[str, Any]]
+
+
+@dataclass
+class CatalogEntry:
+    """One catalogued agent and its (possibly not yet built) instance"""
+    name: str
+    namespace: str
+    target: AgentTarget
+    config: Dict[str, Any] = field(default_factory=dict)
+    agent: Any = None
+    last_used: float = 0.0
+    builds: int = 0
+    lock: threading.Lock = field(default_factory=threading.Lock, repr=False)
+
+
+class AgentCatalog:
+    """
+    Maps agent names to how to build them.
+
+    Registering is a dict insert, so a worker hosting hundreds of agents
+    starts instantly and only pays construction for agents that actually
+    receive messages. The catalog owns the agents it builds (the SUMA WIRE
+    registry only holds weak references) and drops them again once idle.
+
+    Example:
+        catalog = QUADAgent._agent_catalog
+        catalog.register("Planner", "my_agents.planner:PlannerAgent")
+        catalog.register("Scorer", {"purpose": "Score stories", "capabilities": ["score"]})
+        agent.talk_to_agent("Planner", "plan", {...})  # built here
+    """
+
+    def __init__(self, idle_timeout: Optional[float] = 300.0, sweep_interval: float = 30.0):
+        """
+        Initialize the catalog.
+
+        Args:
+            idle_timeout: Seconds without messages before a built agent is
+                evicted (None disables eviction)
+            sweep_interval: Minimum seconds between idle sweeps
+        """
+        self.idle_timeout = idle_timeout
+        self.sweep_interval = sweep_interval
+        self._entries: Dict[str, CatalogEntry] = {}
+        self._lock = threading.Lock()
+        self._last_sweep = time.monotonic()
+
+    def register(
+        self,
+        name: str,
+        target: AgentTarget,
+        namespace: str = "",
+        **config: Any
+    ) -> str:
+        """
+        Add an agent to the catalog without constructing it.
+
+        Args:
+            name: Agent name used for SUMA WIRE routing
+            target: One of
+                - "package.module:Attr" import path of a QUADAgent subclass
+                  or factory
+                - a QUADAgent subclass or factory called as `target(config=...)`
+                - a spec dict as accepted by `generate_sub_agent_from_spec`
+            namespace: Scope the agent is registered in once built
+            **config: Extra AgentConfig fields (max_retries, timeout, ...)
+
+        Returns:
+            The qualified name
+        """
+        key = qualify(name, namespace)
+        entry = CatalogEntry(name=name, namespace=namespace, target=target, config=config)
+        with self._lock:
+            self._entries[key] = entry
+        return key
+
+    def unregister(self, name: str, namespace: str = "") -> bool:
+        """Remove an entry, unregistering its agent if built"""
+        with self._lock:
+            entry = self._entries.pop(qualify(name, namespace), None)
+        if entry is None:
+            return False
+        self._release(entry)
+        return True
+
+    def get(self, name: str, namespace: str = "") -> Optional[Any]:
+        """
+        Get a catalogued agent, building it on first use.
+
+        Resolves scopes the same way as the registry: `namespace` first,
+        then each parent scope up to the global scope.
+
+        Returns:
+            The agent, or None if the name is not catalogued
+        """
+        entry = self._find(name, namespace)
+        if entry is None:
+            return None
+
+        self._maybe_sweep()
+        agent = entry.agent
+        if agent is None:
+            with entry.lock:
+                if entry.agent is None:
+                    entry.agent = self._build(entry)
+                    entry.builds += 1
+                agent = entry.agent
+        entry.last_used = time.monotonic()
+        return agent
+
+    def touch(self, qualified_name: str) -> None:
+        """Mark a built agent as used (called on every routed message)"""
+        entry = self._entries.get(qualified_name)
+        if entry is not None:
+            entry.last_used = time.monotonic()
+            self._maybe_sweep()
+
+    def evict_idle(self, now: Optional[float] = None) -> List[str]:
+        """
+        Evict built agents idle longer than `idle_timeout`.
+
+        An agent still running a call counts as used now: it is kept, and
+        its idle time starts over (so a call longer than `idle_timeout`
+        never loses its agent midway).
+
+        Returns:
+            Qualified names of evicted agents
+        """
+        if self.idle_timeout is None:
+            return []
+        now = time.monotonic() if now is None else now
+        self._last_sweep = now
+        evicted = []
+        for key, entry in list(self._entries.items()):
+            if entry.agent is not None and now - entry.last_used > self.idle_timeout:
+                with entry.lock:
+                    if entry.agent is None or now - entry.last_used <= self.idle_timeout:
+                        continue
+                    if self._busy(entry.agent):
+                        entry.last_used = now
+                        continue
+                    self._release(entry)
+                    evicted.append(key)
+        return evicted
+
+    def names(self) -> List[str]:
+        """Qualified names of all catalogued agents"""
+        return list(self._entries.keys())
+
+    def is_built(self, name: str, namespace: str = "") -> bool:
+        """Whether the agent is currently instantiated"""
+        entry = self._entries.get(qualify(name, namespace))
+        return entry is not None and entry.agent is not None
+
+    def __contains__(self, key: str) -> bool:
+        return key in self._entries
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    # ─────────────────────────────────────────────────────────────
+    # INTERNALS
+    # ─────────────────────────────────────────────────────────────
+
+    def _find(self, name: str, namespace: str) -> Optional[CatalogEntry]:
+        scope = namespace.strip(NAMESPACE_SEPARATOR)
+        while scope:
+            entry = self._entries.get(f"{scope}{NAMESPACE_SEPARATOR}{name}")
+            if entry is not None:
+                return entry
+            scope = scope.rpartition(NAMESPACE_SEPARATOR)[0]
+        return self._entries.get(name)
+
+    def _maybe_sweep(self) -> None:
+        if self.idle_timeout is not None and time.monotonic() - self._last_sweep >= self.sweep_interval:
+            self.evict_idle()
+
+    @staticmethod
+    def _busy(agent: Any) -> bool:
+        """Whether an agent has invocations in flight"""
+        active = getattr(agent, "active_contexts", None)
+        return bool(active()) if active is not None else False
+
+    @staticmethod
+    def _release(entry: CatalogEntry) -> None:
+        agent, entry.agent = entry.agent, None
+        if agent is not None:
+            agent.unregister()
+
+    @staticmethod
+    def _build(entry: CatalogEntry) -> Any:
+        """Construct the agent for an entry"""
+        # Imported here: quad_agent imports this module
+        from .quad_agent import AgentConfig, QUADAgent
+
+        config = AgentConfig(name=entry.name, namespace=entry.namespace, **entry.config)
+        target = entry.target
+
+        if isinstance(target, dict):
+            agent_class, _, execute_fn, pretext = QUADAgent._prepare_spec({**target, "name": entry.name})
+            return agent_class(config=config, execute_fn=execute_fn, pretext=pretext)
+
+        if isinstance(target, str):
+            module_name, _, attr = target.partition(":")
+            if not attr:
+                raise ValueError(f"Invalid agent import path (expected 'module:Attr'): {target}")
+            target = getattr(importlib.import_module(module_name), attr)
+
+        return target(config=config)
+
+    def __repr__(self) -> str:
+        built = sum(1 for e in self._entries.values() if e.agent is not None)
+        return f"<AgentCatalog(entries={len(self._entries)}, built={built})>"
@@ -0,0 +1,97 @@
+"""
+QUAD Wire Codec
+===============
+
+Compact binary encoding for SUMA WIRE frames, snapshots and traces.
+
+Plain data (None, bool, int, float, str, bytes, list, tuple, dict, set)
+is encoded with `marshal`, which is implemented in C and much smaller and
+faster than JSON. Other types can be registered as extensions; values
+containing them are rewritten to tagged dicts before marshalling.
+
+Not meant for untrusted input: only decode data from your own workers.
+
+Copyright (c) 2026 Gopi Suman Addanke. All Rights Reserved.
+Patent Pending (63/956,810) - QUAD Platform
+"""
+
+import marshal
+from datetime import datetime
+from typing import Any, Callable, Dict, Tuple, Type
+
+MARSHAL_VERSION = 4
+
+# First byte of every encoded value
+_PLAIN = b"M"
+_EXTENDED = b"X"
+
+# Key marking an encoded extension value inside a dict
+_EXT_KEY = "__quad_ext__"
+
+# tag -> (type, encode, decode)
+_extensions: Dict[str, Tuple[Type, Callable[[Any], Any], Callable[[Any], Any]]] = {}
+_extension_tags: Dict[Type, str] = {}
+
+
+def register_type(tag: str, cls: Type, encode: Callable[[Any], Any], decode: Callable[[Any], Any]) -> None:
+    """
+    Teach the codec to carry a custom type.
+
+    Args:
+        tag: Short unique name written to the wire
+        cls: Type to handle (exact type, subclasses are not matched)
+        encode: Converts an instance to plain data
+        decode: Rebuilds the instance from plain data
+    """
+    _extensions[tag] = (cls, encode, decode)
+    _extension_tags[cls] = tag
+
+
+def pack(value: Any) -> bytes:
+    """Encode a value to bytes"""
+    try:
+        return _PLAIN + marshal.dumps(value, MARSHAL_VERSION)
+    except ValueError:
+        # Contains non-marshallable values: rewrite registered types
+        return _EXTENDED + marshal.dumps(_to_plain(value), MARSHAL_VERSION)
+
+
+def unpack(data: bytes) -> Any:
+    """Decode bytes produced by `pack`"""
+    marker, body = data[:1], memoryview(data)[1:]
+    value = marshal.loads(body)
+    if marker == _EXTENDED:
+        return _from_plain(value)
+    return value
+
+
+def has_extensions(data: bytes) -> bool:
+    """Whether packed data contains registered extension values"""
+    return data[:1] == _EXTENDED
+
+
+def _to_plain(value: Any) -> Any:
+    cls = type(value)
+    if cls is dict:
+        return {k: _to_plain(v) for k, v in value.items()}
+    if cls is list or cls is tuple:
+        return cls(_to_plain(v) for v in value)
+    tag = _extension_tags.get(cls)
+    if tag is not None:
+        return {_EXT_KEY: tag, "value": _to_plain(_extensions[tag][1](value))}
+    return value
+
+
+def _from_plain(value: Any) -> Any:
+    cls = type(value)
+    if cls is dict:
+        tag = value.get(_EXT_KEY)
+        if tag is not None:
+            return _extensions[tag][2](_from_plain(value["value"]))
+        return {k: _from_plain(v) for k, v in value.items()}
+    if cls is list or cls is tuple:
+        return cls(_from_plain(v) for v in value)
+    return value
+
+
+register_type("datetime", datetime, datetime.isoformat, datetime.fromisoformat)
@@ -0,0 +1,459 @@
+"""
+QUAD Durable Message Queue
+==========================
+
+SQLite-backed (WAL mode) transport for fire-and-forget SUMA WIRE messages.
+
+Key Features:
+- Group commit: messages are buffered and written in batched transactions
+- At-least-once delivery: claim with visibility timeout, then ack
+- Dead-lettering after `max_retries` failed deliveries
+- Dedup by AgentMessage.id (re-sent messages are ignored)
+- Survives process restarts: pending messages are replayed
+- Bodies use the wire codec, so payloads may carry datetimes and
+  SharedPayload handles (a stored message holds its own reference until
+  it is acked)
+
+Copyright (c) 2026 Gopi Suman Addanke. All Rights Reserved.
+Patent Pending (63/956,810) - QUAD Platform
+"""
+
+import logging
+import sqlite3
+import threading
+import time
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any, Callable, Dict, List, Optional, Union
+
+from . import codec
+
+logger = logging.getLogger("QUADAgent.DurableQueue")
+
+# Message lifecycle
+STATUS_PENDING = "pending"
+STATUS_ACKED = "acked"
+STATUS_DEAD = "dead"
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS messages (
+    id TEXT PRIMARY KEY,
+    to_agent TEXT NOT NULL,
+    body BLOB NOT NULL,
+    status TEXT NOT NULL DEFAULT 'pending',
+    attempts INTEGER NOT NULL DEFAULT 0,
+    enqueued_at REAL NOT NULL,
+    visible_at REAL NOT NULL,
+    updated_at REAL NOT NULL,
+    last_error TEXT
+);
+CREATE INDEX IF NOT EXISTS idx_messages_ready ON messages (status, visible_at);
+"""
+
+
+@dataclass
+class QueuedMessage:
+    """A claimed message, to be acked or nacked by the consumer"""
+    message: Any  # AgentMessage
+    attempts: int
+
+
+class DurableQueue:
+    """
+    Durable, at-least-once message queue for SUMA WIRE.
+
+    `put` only appends to an in-memory buffer; a background flusher writes
+    buffered messages in one transaction every `flush_interval` seconds or
+    as soon as `batch_size` messages are waiting. Pass `wait=True` (or call
+    `flush`) to block until the message is on disk.
+
+    Example:
+        queue = DurableQueue("~/.quad/wire.db")
+        QUADAgent.set_message_queue(queue)
+        agent.talk_to_agent("Indexer", "index", {...}, wait_for_response=False)
+
+        # In the worker process (also after a restart):
+        queue.start_consumer()
+    """
+
+    def __init__(
+        self,
+        path: Union[str, Path],
+        batch_size: int = 1000,
+        flush_interval: float = 0.01,
+        visibility_timeout: float = 30.0,
+        max_retries: int = 3,
+        synchronous: str = "NORMAL"
+    ):
+        """
+        Open (or create) a queue database.
+
+        Args:
+            path: SQLite database file
+            batch_size: Messages per group commit
+            flush_interval: Max seconds a message waits in the buffer
+            visibility_timeout: Seconds a claimed message stays invisible
+                before it is redelivered (consumer crashed or too slow)
+            max_retries: Redeliveries before a message is dead-lettered
+            synchronous: SQLite synchronous pragma ("NORMAL" survives
+                process crashes, "FULL" also survives power loss)
+        """
+        self.path = Path(path).expanduser()
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self.batch_size = batch_size
+        self.flush_interval = flush_interval
+        self.visibility_timeout = visibility_timeout
+        self.max_retries = max_retries
+
+        self._conn = sqlite3.connect(str(self.path), check_same_thread=False, isolation_level=None)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute(f"PRAGMA synchronous={synchronous}")
+        self._conn.execute("PRAGMA busy_timeout=5000")
+        self._conn.executescript(SCHEMA)
+        self._db_lock = threading.Lock()
+
+        # Group commit state: rows buffered in generation `_gen` are durable
+        # once `_flushed_gen` reaches it. Flushes run one at a time so
+        # generations are committed in order
+        self._buffer: List[tuple] = []
+        self._buffer_cond = threading.Condition()
+        self._flush_lock = threading.Lock()
+        self._gen = 0
+        self._flushed_gen = -1
+        self._closed = False
+        self._flusher = threading.Thread(target=self._flush_loop, name="quad-queue-flush", daemon=True)
+        self._flusher.start()
+
+        self._consumer: Optional[threading.Thread] = None
+        self._stop_consumer = threading.Event()
+
+    # ─────────────────────────────────────────────────────────────
+    # PRODUCER
+    # ─────────────────────────────────────────────────────────────
+
+    def put(self, message: Any, wait: bool = False) -> None:
+        """
+        Enqueue an AgentMessage.
+
+        Args:
+            message: Message to deliver to `message.to_agent`
+            wait: Block until the message has been committed
+        """
+        self.put_many([message], wait=wait)
+
+    def put_many(self, messages: List[Any], wait: bool = False) -> None:
+        """Enqueue several messages (committed in the same group)"""
+        now = time.time()
+        rows = [
+            (m.id, m.to_agent, codec.pack(m.to_dict()), now, now, now)
+            for m in messages
+        ]
+        with self._buffer_cond:
+            if self._closed:
+                raise RuntimeError("Queue is closed")
+            self._buffer.extend(rows)
+            gen = self._gen
+            if len(self._buffer) >= self.batch_size:
+                self._buffer_cond.notify_all()
+            if wait:
+                while self._flushed_gen < gen:
+                    self._buffer_cond.wait()
+
+    def flush(self) -> int:
+        """
+        Commit all buffered messages now.
+
+        Returns:
+            Number of messages written (duplicates included)
+        """
+        with self._flush_lock:
+            with self._buffer_cond:
+                rows, self._buffer = self._buffer, []
+                gen = self._gen
+                self._gen += 1
+
+            ignored = []
+            if rows:
+                try:
+                    with self._db_lock:
+                        self._conn.execute("BEGIN IMMEDIATE")
+                        try:
+                            ignored = self._insert(rows)
+                            self._conn.execute("COMMIT")
+                        except Exception:
+                            self._conn.execute("ROLLBACK")
+                            raise
+                except Exception:
+                    # Keep the rows for the next flush; waiters keep waiting
+                    with self._buffer_cond:
+                        self._buffer[:0] = rows
+                    raise
+
+            with self._buffer_cond:
+                self._flushed_gen = gen
+                self._buffer_cond.notify_all()
+
+        # Duplicates were not stored: drop the references their bodies hold
+        for body in ignored:
+            codec.unpack(body)
+        return len(rows)
+
+    def _insert(self, rows: List[tuple]) -> List[bytes]:
+        """Insert buffered rows; returns ignored duplicates' bodies that hold payload references"""
+        sql = ("INSERT OR IGNORE INTO messages "
+               "(id, to_agent, body, enqueued_at, visible_at, updated_at) "
+               "VALUES (?, ?, ?, ?, ?, ?)")
+        plain = [row for row in rows if not codec.has_extensions(row[2])]
+        self._conn.executemany(sql, plain)
+        if len(plain) == len(rows):
+            return []
+        ignored = []
+        for row in rows:
+            if codec.has_extensions(row[2]) and self._conn.execute(sql, row).rowcount == 0:
+                ignored.append(row[2])
+        return ignored
+
+    def _flush_loop(self) -> None:
+        while True:
+            with self._buffer_cond:
+                if len(self._buffer) < self.batch_size and not self._closed:
+                    self._buffer_cond.wait(self.flush_interval)
+                closed = self._closed
+            try:
+                self.flush()
+            except Exception as e:
+                logger.error(f"Durable queue flush failed: {e}")
+            if closed:
+                return
+
+    # ─────────────────────────────────────────────────────────────
+    # CONSUMER
+    # ─────────────────────────────────────────────────────────────
+
+    def get(self, to_agent: Optional[str] = None, limit: int = 100) -> List[QueuedMessage]:
+        """
+        Claim up to `limit` visible messages.
+
+        Claimed messages are hidden for `visibility_timeout` seconds; if not
+        acked by then they are redelivered. Messages that were already
+        delivered `max_retries + 1` times are dead-lettered instead.
+
+        Args:
+            to_agent: Only claim messages for this (qualified) agent name
+            limit: Maximum number of messages
+
+        Returns:
+            Claimed messages
+        """
+        # Imported here: quad_agent imports the package that contains this module
+        from .quad_agent import AgentMessage
+
+        now = time.time()
+        where = "status = ? AND visible_at <= ?"
+        params: List[Any] = [STATUS_PENDING, now]
+        if to_agent is not None:
+            where += " AND to_agent = ?"
+            params.append(to_agent)
+
+        with self._db_lock:
+            self._conn.execute("BEGIN IMMEDIATE")
+            try:
+                rows = self._conn.execute(
+                    f"SELECT id, body, attempts FROM messages WHERE {where} "
+                    f"ORDER BY enqueued_at LIMIT ?",
+                    params + [limit]
+                ).fetchall()
+
+                exhausted = [r[0] for r in rows if r[2] > self.max_retries]
+                claimed = [r for r in rows if r[2] <= self.max_retries]
+                if exhausted:
+                    self._conn.executemany(
+                        "UPDATE messages SET status = ?, updated_at = ?, "
+                        "last_error = COALESCE(last_error, 'visibility timeout exceeded') WHERE id = ?",
+                        [(STATUS_DEAD, now, msg_id) for msg_id in exhausted]
+                    )
+                self._conn.executemany(
+                    "UPDATE messages SET attempts = attempts + 1, visible_at = ?, updated_at = ? WHERE id = ?",
+                    [(now + self.visibility_timeout, now, r[0]) for r in claimed]
+                )
+                self._conn.execute("COMMIT")
+            except Exception:
+                self._conn.execute("ROLLBACK")
+                raise
+
+        queued = []
+        for _, body, attempts in claimed:
+            message = AgentMessage.from_dict(codec.unpack(body))
+            if codec.has_extensions(body):
+                # Decoding took over the stored references: the claim keeps
+                # them, and re-encoding gives the row its own again
+                codec.pack(message.to_dict())
+            queued.append(QueuedMessage(message=message, attempts=attempts + 1))
+        return queued
+
+    def ack(self, message_ids: Union[str, List[str]]) -> None:
+        """Mark messages as delivered (their ids stay recorded for dedup)"""
+        ids = [message_ids] if isinstance(message_ids, str) else message_ids
+        now = time.time()
+        with self._db_lock:
+            self._conn.execute("BEGIN IMMEDIATE")
+            try:
+                held = self._held_bodies(ids)
+                self._conn.executemany(
+                    "UPDATE messages SET status = ?, updated_at = ?, body = X'' WHERE id = ?",
+                    [(STATUS_ACKED, now, msg_id) for msg_id in ids]
+                )
+                self._conn.execute("COMMIT")
+            except Exception:
+                self._conn.execute("ROLLBACK")
+                raise
+
+        # The bodies are gone: release the payload references they held
+        for body in held:
+            codec.unpack(body)
+
+    def _held_bodies(self, ids: List[str]) -> List[bytes]:
+        """Stored bodies that hold payload references (db lock held)"""
+        bodies = []
+        for msg_id in ids:
+            row = self._conn.execute(
+                "SELECT body FROM messages WHERE id = ? AND status != ?", (msg_id, STATUS_ACKED)
+            ).fetchone()
+            if row is not None and codec.has_extensions(row[0]):
+                bodies.append(row[0])
+        return bodies
+
+    def nack(self, message_id: str, error: str = "", delay: float = 0.0) -> None:
+        """
+        Report a failed delivery.
+
+        The message becomes visible again after `delay` seconds, or is
+        dead-lettered once it has been delivered `max_retries + 1` times.
+        """
+        now = time.time()
+        with self._db_lock:
+            self._conn.execute(
+                "UPDATE messages SET "
+                "status = CASE WHEN attempts > ? THEN ? ELSE status END, "
+                "visible_at = ?, updated_at = ?, last_error = ? WHERE id = ?",
+                (self.max_retries, STATUS_DEAD, now + delay, now, error, message_id)
+            )
+
+    def deliver(self, limit: int = 100, resolver: Optional[Callable[[str], Any]] = None) -> int:
+        """
+        Claim messages and hand them to their target agents.
+
+        Args:
+            limit: Maximum messages to deliver in this call
+            resolver: Maps `to_agent` to an agent (default: QUADAgent lookup)
+
+        Returns:
+            Number of messages delivered successfully
+        """
+        if resolver is None:
+            from .quad_agent import QUADAgent
+            resolver = QUADAgent.get_agent
+
+        delivered = []
+        for queued in self.get(limit=limit):
+            message = queued.message
+            agent = resolver(message.to_agent)
+            if agent is None:
+                self.nack(message.id, f"Agent not found: {message.to_agent}", delay=self.visibility_timeout)
+                continue
+            try:
+                result = agent.receive_message(message)
+            except Exception as e:
+                self.nack(message.id, str(e))
+                continue
+            if result.success:
+                delivered.append(message.id)
+            else:
+                self.nack(message.id, result.error or "")
+
+        if delivered:
+            self.ack(delivered)
+        return len(delivered)
+
+    def start_consumer(self, poll_interval: float = 0.05, limit: int = 100) -> None:
+        """Deliver messages continuously on a background thread"""
+        if self._consumer is not None:
+            return
+        self._stop_consumer.clear()
+
+        def consume():
+            while not self._stop_consumer.is_set():
+                try:
+                    if self.deliver(limit=limit) == 0:
+                        self._stop_consumer.wait(poll_interval)
+                except Exception as e:
+                    logger.error(f"Durable queue delivery failed: {e}")
+                    self._stop_consumer.wait(poll_interval)
+
+        self._consumer = threading.Thread(target=consume, name="quad-queue-consume", daemon=True)
+        self._consumer.start()
+
+    def stop_consumer(self) -> None:
+        """Stop the background consumer"""
+        if self._consumer is not None:
+            self._stop_consumer.set()
+            self._consumer.join()
+            self._consumer = None
+
+    # ─────────────────────────────────────────────────────────────
+    # MAINTENANCE
+    # ─────────────────────────────────────────────────────────────
+
+    def dead_letters(self, limit: int = 100) -> List[Dict[str, Any]]:
+        """List dead-lettered messages (id, to_agent, attempts, last_error)"""
+        with self._db_lock:
+            rows = self._conn.execute(
+                "SELECT id, to_agent, attempts, last_error FROM messages WHERE status = ? "
+                "ORDER BY updated_at LIMIT ?",
+                (STATUS_DEAD, limit)
+            ).fetchall()
+        return [dict(zip(("id", "to_agent", "attempts", "last_error"), row)) for row in rows]
+
+    def requeue_dead(self, message_ids: List[str]) -> None:
+        """Give dead-lettered messages a fresh set of delivery attempts"""
+        now = time.time()
+        with self._db_lock:
+            self._conn.executemany(
+                "UPDATE messages SET status = ?, attempts = 0, visible_at = ?, updated_at = ? "
+                "WHERE id = ? AND status = ?",
+                [(STATUS_PENDING, now, now, msg_id, STATUS_DEAD) for msg_id in message_ids]
+            )
+
+    def purge_acked(self, older_than: float = 86400.0) -> int:
+        """
+        Forget acked message ids older than `older_than` seconds.
+
+        Re-sent messages are only deduplicated while their id is retained.
+        """
+        with self._db_lock:
+            cursor = self._conn.execute(
+                "DELETE FROM messages WHERE status = ? AND updated_at < ?",
+                (STATUS_ACKED, time.time() - older_than)
+            )
+        return cursor.rowcount
+
+    def stats(self) -> Dict[str, int]:
+        """Message counts by status"""
+        with self._db_lock:
+            rows = self._conn.execute("SELECT status, COUNT(*) FROM messages GROUP BY status").fetchall()
+        counts = {STATUS_PENDING: 0, STATUS_ACKED: 0, STATUS_DEAD: 0}
+        counts.update(dict(rows))
+        counts["buffered"] = len(self._buffer)
+        return counts
+
+    def close(self) -> None:
+        """Flush buffered messages and close the database"""
+        self.stop_consumer()
+        with self._buffer_cond:
+            self._closed = True
+            self._buffer_cond.notify()
+        self._flusher.join()
+        self._conn.close()
+
+    def __repr__(self) -> str:
+        return f"<DurableQueue(path={self.path})>"
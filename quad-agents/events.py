@@ -0,0 +1,323 @@
+"""
+QUAD Event Bus
+==============
+
+Topic-based pub/sub for agents (QUAD_AGENT_ARCHITECTURE.md, "Event Bus").
+
+Topics are dot-separated: story.created, code.pushed, pipeline.failed.
+Patterns may use `*`:
+- inside a pattern it matches exactly one segment: "*.failed"
+- at the end it matches one or more segments: "story.*", or "*" for all
+
+Patterns are compiled into a topic trie, so finding the subscribers of a
+topic costs O(topic depth), not O(subscribers); results are cached per
+topic until subscriptions change.
+
+Delivery is asynchronous: every subscription has a bounded mailbox,
+drained in order by a shared worker pool. A slow subscriber only fills
+its own mailbox; when full, new events for it are dropped (counted) or,
+with overflow="block", the publisher waits.
+
+Copyright (c) 2026 Gopi Suman Addanke. All Rights Reserved.
+Patent Pending (63/956,810) - QUAD Platform
+"""
+
+import itertools
+import logging
+import threading
+import time
+import weakref
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass, field
+from typing import Any, Callable, Deque, Dict, List, Optional, Tuple
+
+logger = logging.getLogger("QUADAgent.EventBus")
+
+TOPIC_SEPARATOR = "."
+WILDCARD = "*"
+
+# Events handled per mailbox drain before yielding the worker to others
+_DRAIN_BATCH = 64
+
+
+@dataclass
+class Event:
+    """An emitted event"""
+    topic: str
+    payload: Dict[str, Any] = field(default_factory=dict)
+    source: str = ""
+    id: int = 0
+    timestamp: float = field(default_factory=time.time)
+
+
+class Subscription:
+    """A pattern, its handler and its mailbox"""
+
+    def __init__(self, bus: 'EventBus', pattern: str, handler: Callable[[Event], Any], maxsize: int, overflow: str):
+        self.bus = bus
+        self.pattern = pattern
+        self.maxsize = maxsize
+        self.overflow = overflow
+        self.delivered = 0
+        self.dropped = 0
+        self.failed = 0
+        self.active = True
+        self._mailbox: Deque[Event] = deque()
+        self._lock = threading.Lock()
+        self._space = threading.Condition(self._lock)
+        self._scheduled = False
+        # Bound methods are held weakly so subscribing never keeps an agent alive
+        if hasattr(handler, "__self__") and hasattr(handler, "__func__"):
+            self._handler_ref = weakref.WeakMethod(handler)
+        else:
+            self._handler_ref = lambda: handler
+
+    def cancel(self) -> None:
+        """Stop receiving events (queued events are discarded)"""
+        self.bus.unsubscribe(self)
+
+    @property
+    def pending(self) -> int:
+        return len(self._mailbox)
+
+    def _offer(self, event: Event) -> bool:
+        with self._lock:
+            while len(self._mailbox) >= self.maxsize:
+                if self.overflow != "block" or not self.active:
+                    self.dropped += 1
+                    return False
+                self._space.wait()
+            self._mailbox.append(event)
+            if self._scheduled:
+                return True
+            self._scheduled = True
+        self.bus._schedule(self)
+        return True
+
+    def _drain(self) -> None:
+        handler = self._handler_ref()
+        if handler is None:
+            self.bus.unsubscribe(self)  # Owner was garbage-collected
+            return
+        for _ in range(_DRAIN_BATCH):
+            with self._lock:
+                if not self._mailbox or not self.active:
+                    self._scheduled = False
+                    return
+                event = self._mailbox.popleft()
+                self._space.notify()
+            try:
+                handler(event)
+                self.delivered += 1
+            except Exception as e:
+                self.failed += 1
+                logger.error(f"Subscriber {self.pattern!r} failed on {event.topic}: {e}")
+        # More queued: go to the back of the pool's queue for fairness
+        self.bus._schedule(self)
+
+    def __repr__(self) -> str:
+        return f"<Subscription({self.pattern!r}, pending={self.pending}, delivered={self.delivered})>"
+
+
+class _TrieNode:
+    __slots__ = ("children", "exact", "tail")
+
+    def __init__(self):
+        self.children: Dict[str, '_TrieNode'] = {}
+        self.exact: List[Subscription] = []  # Pattern ends here
+        self.tail: List[Subscription] = []   # Pattern ends here with a trailing "*"
+
+
+class EventBus:
+    """
+    Topic-trie pub/sub with bounded, asynchronous per-subscriber delivery.
+
+    Example:
+        bus = QUADAgent._event_bus
+        bus.subscribe("story.*", lambda event: print(event.topic))
+        bus.publish("story.created", {"story_id": 123})
+    """
+
+    def __init__(self, workers: int = 8, cache_size: int = 4096):
+        """
+        Args:
+            workers: Threads delivering events (started on first publish)
+            cache_size: Topics whose subscriber lists are cached
+        """
+        self.workers = workers
+        self.cache_size = cache_size
+        self._root = _TrieNode()
+        self._lock = threading.Lock()
+        self._cache: Dict[str, Tuple[Subscription, ...]] = {}
+        self._pool: Optional[ThreadPoolExecutor] = None
+        self._ids = itertools.count(1)
+        self.published = 0
+
+    # ─────────────────────────────────────────────────────────────
+    # SUBSCRIPTIONS
+    # ─────────────────────────────────────────────────────────────
+
+    def subscribe(
+        self,
+        pattern: str,
+        handler: Callable[[Event], Any],
+        maxsize: int = 1000,
+        overflow: str = "drop"
+    ) -> Subscription:
+        """
+        Receive events whose topic matches `pattern`.
+
+        Args:
+            pattern: Topic pattern, e.g. "story.created", "story.*", "*.failed"
+            handler: Called with each Event on a bus worker thread
+            maxsize: Mailbox capacity
+            overflow: "drop" new events when full, or "block" the publisher
+        """
+        if overflow not in ("drop", "block"):
+            raise ValueError(f"overflow must be 'drop' or 'block', not {overflow!r}")
+        subscription = Subscription(self, pattern, handler, maxsize, overflow)
+        segments = pattern.split(TOPIC_SEPARATOR)
+        trailing = segments[-1] == WILDCARD
+        if trailing:
+            segments = segments[:-1]
+
+        with self._lock:
+            node = self._root
+            for segment in segments:
+                node = node.children.setdefault(segment, _TrieNode())
+            # Copy-on-write so publishers can iterate without the lock
+            if trailing:
+                node.tail = node.tail + [subscription]
+            else:
+                node.exact = node.exact + [subscription]
+            self._cache = {}
+        return subscription
+
+    def unsubscribe(self, subscription: Subscription) -> None:
+        """Remove a subscription (no-op if already removed)"""
+        segments = subscription.pattern.split(TOPIC_SEPARATOR)
+        trailing = segments[-1] == WILDCARD
+        if trailing:
+            segments = segments[:-1]
+
+        with self._lock:
+            path = [self._root]
+            for segment in segments:
+                node = path[-1].children.get(segment)
+                if node is None:
+                    return
+                path.append(node)
+            node = path[-1]
+            if trailing:
+                node.tail = [s for s in node.tail if s is not subscription]
+            else:
+                node.exact = [s for s in node.exact if s is not subscription]
+            # Prune empty branches
+            for parent, segment, child in zip(reversed(path[:-1]), reversed(segments), reversed(path[1:])):
+                if child.children or child.exact or child.tail:
+                    break
+                del parent.children[segment]
+            self._cache = {}
+
+        with subscription._lock:
+            subscription.active = False
+            subscription._mailbox.clear()
+            subscription._space.notify_all()
+
+    def match(self, topic: str) -> Tuple[Subscription, ...]:
+        """Subscriptions whose pattern matches `topic`"""
+        # Subscription changes swap in a new dict, so a result computed
+        # from the old trie can only land in the discarded one
+        cache = self._cache
+        cached = cache.get(topic)
+        if cached is not None:
+            return cached
+
+        segments = topic.split(TOPIC_SEPARATOR)
+        found: List[Subscription] = []
+        stack = [(self._root, 0)]
+        while stack:
+            node, depth = stack.pop()
+            if depth == len(segments):
+                found.extend(node.exact)
+                continue
+            found.extend(node.tail)
+            for key in (segments[depth], WILDCARD):
+                child = node.children.get(key)
+                if child is not None:
+                    stack.append((child, depth + 1))
+
+        matched = tuple(dict.fromkeys(found))
+        if len(cache) >= self.cache_size:
+            cache.clear()
+        cache[topic] = matched
+        return matched
+
+    # ─────────────────────────────────────────────────────────────
+    # PUBLISHING
+    # ─────────────────────────────────────────────────────────────
+
+    def publish(self, topic: str, payload: Optional[Dict[str, Any]] = None, source: str = "") -> int:
+        """
+        Emit an event to every matching subscription.
+
+        Returns:
+            Number of mailboxes the event was queued in
+        """
+        event = Event(topic=topic, payload=payload or {}, source=source, id=next(self._ids))
+        self.published += 1
+        queued = 0
+        for subscription in self.match(topic):
+            queued += subscription._offer(event)
+        return queued
+
+    def stats(self) -> Dict[str, Any]:
+        """Published count and per-subscription delivery counters"""
+        subscriptions = self.subscriptions()
+        return {
+            "published": self.published,
+            "subscriptions": len(subscriptions),
+            "delivered": sum(s.delivered for s in subscriptions),
+            "dropped": sum(s.dropped for s in subscriptions),
+            "failed": sum(s.failed for s in subscriptions),
+            "pending": sum(s.pending for s in subscriptions)
+        }
+
+    def subscriptions(self) -> List[Subscription]:
+        """All current subscriptions"""
+        found, stack = [], [self._root]
+        while stack:
+            node = stack.pop()
+            found.extend(node.exact)
+            found.extend(node.tail)
+            stack.extend(node.children.values())
+        return found
+
+    def join(self, timeout: Optional[float] = None) -> bool:
+        """Wait until every mailbox is empty; returns False on timeout"""
+        deadline = None if timeout is None else time.monotonic() + timeout
+        while any(s.pending or s._scheduled for s in self.subscriptions()):
+            if deadline is not None and time.monotonic() >= deadline:
+                return False
+            time.sleep(0.001)
+        return True
+
+    def shutdown(self) -> None:
+        """Stop the worker pool (restarted on the next publish)"""
+        with self._lock:
+            pool, self._pool = self._pool, None
+        if pool is not None:
+            pool.shutdown(wait=True)
+
+    def _schedule(self, subscription: Subscription) -> None:
+        pool = self._pool
+        if pool is None:
+            with self._lock:
+                if self._pool is None:
+                    self._pool = ThreadPoolExecutor(max_workers=self.workers, thread_name_prefix="quad-events")
+                pool = self._pool
+        pool.submit(subscription._drain)
+
+    def __repr__(self) -> str:
+        return f"<EventBus(subscriptions={len(self.subscriptions())}, published={self.published})>"
@@ -9,20 +9,55 @@ Key Features:
 - Agent-to-agent: Communicate via SUMA WIRE
 - PRETEXT: AI-modifiable code sections
 - Sub-agent generation: Create specialized agents
+- Scoped registry: Weakly-held agents in tenant/domain/pipeline namespaces
+- Lazy catalog: Agents built on first message, evicted when idle
+- Streaming: Agents can yield partial results (run_stream)
+- Batching: run_many over an overridable, vectorizable execute_batch
+- Durable delivery: Optional queue for fire-and-forget messages
+- Cross-process: SUMA WIRE over Unix/TCP sockets (transport.py)
+- Zero-copy payloads: Large buffers shared by handle (shared_payload.py)
+- Priority scheduling: PGCE-ordered execution with aging (scheduler.py)
+- Concurrency-safe: per-invocation ExecutionContext, one instance serves many calls
+- Snapshots: Save agent trees to disk and warm-restore them (snapshot.py)
+- Record/replay: Trace real traffic, replay it as a regression benchmark (replay.py)
+- Event bus: emit / subscribe with wildcard topics (events.py)
+- Shared context: Permission-gated key/value state with TTL (shared_context.py)
+- Supervision: Heartbeats, stall detection and automatic restarts (supervisor.py)
 
 Copyright (c) 2026 Gopi Suman Addanke. All Rights Reserved.
 Patent Pending (63/956,810) - QUAD Platform
 """
 
+import asyncio
+import contextvars
 import json
 import logging
+import queue
+import threading
 import time
 import uuid
+import weakref
 from abc import ABC, abstractmethod
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import contextmanager
 from dataclasses import dataclass, field
 from datetime import datetime
 from enum import Enum
-from typing import Any, Callable, Dict, List, Optional, Type
+from functools import lru_cache
+from itertools import islice
+from typing import Any, AsyncIterator, Callable, Dict, Iterable, Iterator, List, Optional, Type, Union
+
+if not __package__:
+    # Running as a script (python quad_agent.py): load as part of the package
+    import sys
+    from pathlib import Path
+    sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
+    __package__ = Path(__file__).resolve().parent.name
+
+from .catalog import AgentCatalog
+from .events import Event, EventBus, Subscription
+from .registry import AgentRegistry
+from .shared_context import PermissionLevel, SharedContext
 
 # Configure logging
 logging.basicConfig(level=logging.INFO)
@@ -50,6 +85,7 @@ class AgentConfig:
     enable_self_heal: bool = True
     enable_logging: bool = True
     api_base_url: Optional[str] = None
+    namespace: str = ""  # SUMA WIRE scope, e.g. "tenant/domain/pipeline"
     metadata: Dict[str, Any] = field(default_factory=dict)
 
 
@@ -63,6 +99,27 @@ class AgentMessage:
     payload: Dict[str, Any] = field(default_factory=dict)
     timestamp: datetime = field(default_factory=datetime.now)
     correlation_id: Optional[str] = None
+    priority: Optional[float] = None  # Higher runs first (see scheduler.py)
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Serialize for transports and durable queues"""
+        return {
+            "id": self.id,
+            "from_agent": self.from_agent,
+            "to_agent": self.to_agent,
+            "action": self.action,
+            "payload": self.payload,
+            "timestamp": self.timestamp.isoformat(),
+            "correlation_id": self.correlation_id,
+            "priority": self.priority
+        }
+
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any]) -> 'AgentMessage':
+        """Rebuild a message serialized with to_dict"""
+        data = dict(data)
+        data["timestamp"] = datetime.fromisoformat(data["timestamp"])
+        return cls(**data)
 
 
 @dataclass
@@ -75,6 +132,69 @@ class AgentResult:
     retries: int = 0
     metadata: Dict[str, Any] = field(default_factory=dict)
 
+    def to_dict(self) -> Dict[str, Any]:
+        """Serialize for transports"""
+        return {
+            "success": self.success,
+            "data": self.data,
+            "error": self.error,
+            "execution_time": self.execution_time,
+            "retries": self.retries,
+            "metadata": self.metadata
+        }
+
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any]) -> 'AgentResult':
+        """Rebuild a result serialized with to_dict"""
+        return cls(**data)
+
+
+@dataclass
+class ExecutionContext:
+    """
+    State of one invocation (a run, run_stream or run_many batch).
+
+    Retry parameters start from the agent's config and are tuned per call
+    by self_heal, so concurrent calls on one agent never interfere.
+    Inside execute_task / self_heal it is available as `self.context`.
+    """
+    agent: 'QUADAgent' = field(repr=False)
+    timeout: int
+    retry_delay: float
+    id: str = field(default_factory=lambda: uuid.uuid4().hex)
+    state: AgentState = AgentState.RUNNING
+    retries: int = 0
+    started_at: float = field(default_factory=time.time)
+    last_beat: float = field(default_factory=time.monotonic)  # See QUADAgent.heartbeat
+    cancelled: bool = False  # Set by a Supervisor that gave up on this invocation
+
+
+# Context of the invocation currently executing agent code
+_current_context: contextvars.ContextVar[Optional[ExecutionContext]] = contextvars.ContextVar(
+    "quad_execution_context", default=None
+)
+
+
+class AgentStreamError(Exception):
+    """Raised by run_stream when a streaming execution fails"""
+
+    def __init__(self, result: AgentResult):
+        super().__init__(result.error)
+        self.result = result
+
+
+class AgentStalledError(Exception):
+    """Raised by heartbeat() in an invocation a Supervisor has given up on"""
+
+
+# Sentinel marking the end of a stream pulled from a worker thread
+_STREAM_END = object()
+
+
+def _is_stream(result: Any) -> bool:
+    """Whether execute_task returned partial results instead of one value"""
+    return isinstance(result, Iterator)
+
 
 class QUADAgent(ABC):
     """
@@ -92,8 +212,36 @@ class QUADAgent(ABC):
                 return "# PRETEXT: Can modify greeting message"
     """
 
-    # Class-level registry of all agents (SUMA WIRE routing)
-    _agent_registry: Dict[str, 'QUADAgent'] = {}
+    # Class-level registry of all agents (SUMA WIRE routing).
+    # Holds weak references: agents live only as long as their owners.
+    _agent_registry: AgentRegistry = AgentRegistry()
+
+    # Lazily-built agents, constructed on first message (see catalog.py)
+    _agent_catalog: AgentCatalog = AgentCatalog()
+
+    # Transport for fire-and-forget messages (e.g. DurableQueue); None
+    # delivers them inline
+    _message_queue: Optional[Any] = None
+
+    # Resolves agents living in other processes (e.g. RemoteTransport)
+    _remote_transport: Optional[Any] = None
+
+    # Runs messages in priority order on a worker pool (PriorityScheduler);
+    # None delivers them in call order on the caller's thread
+    _scheduler: Optional[Any] = None
+
+    # Receives runtime events for record/replay (TraceRecorder); None disables
+    _tracer: Optional[Any] = None
+
+    # Topic pub/sub between agents (emit / subscribe)
+    _event_bus: EventBus = EventBus()
+
+    # Permission-gated key/value state shared between agents. The built-in
+    # context is open: every agent may read and write (not delete) any key
+    _shared_context: SharedContext = SharedContext(default_level=PermissionLevel.WRITE)
+
+    # Watches invocations for stalls and restarts wedged agents (Supervisor)
+    _supervisor: Optional[Any] = None
 
     def __init__(self, config: Optional[AgentConfig] = None, name: str = None):
         """
@@ -105,17 +253,93 @@ class QUADAgent(ABC):
         """
         self.config = config or AgentConfig(name=name or self.__class__.__name__)
         self.name = self.config.name
+        self._cache: Dict[str, Any] = {}  # Serialized forms; empty when dirty
         self.state = AgentState.IDLE
+        self._contexts: Dict[str, ExecutionContext] = {}
+        self._contexts_lock = threading.Lock()
+        # Sub-agents are owned by their parent: held strongly here, while
+        # their `parent` link is weak (see _spawn_child)
         self.children: List['QUADAgent'] = []
-        self.parent: Optional['QUADAgent'] = None
+        self.parent = None
         self._execution_history: List[AgentResult] = []
+        self._metrics: Dict[str, Any] = {"executions": 0, "failures": 0, "retries": 0, "total_time": 0.0}
+        self._spec: Optional[Dict[str, Any]] = None  # Set on agents built from a spec
+        self._subscriptions: List[Subscription] = []
 
         # Register this agent for SUMA WIRE routing
-        QUADAgent._agent_registry[self.name] = self
+        self.qualified_name = QUADAgent._agent_registry.register(self, self.config.namespace)
 
         if self.config.enable_logging:
             logger.info(f"Agent initialized: {self.name}")
 
+    @property
+    def parent(self) -> Optional['QUADAgent']:
+        """Parent agent (held weakly so parent/child links don't form cycles)"""
+        return self._parent_ref() if self._parent_ref is not None else None
+
+    @parent.setter
+    def parent(self, agent: Optional['QUADAgent']):
+        self._parent_ref = weakref.ref(agent) if agent is not None else None
+
+    @property
+    def state(self) -> AgentState:
+        """
+        Aggregate state: HEALING or RUNNING while any invocation is, otherwise
+        the outcome of the most recent one (see get_status for counts).
+        """
+        states = [c.state for c in self.active_contexts()]
+        if AgentState.HEALING in states:
+            return AgentState.HEALING
+        if states:
+            return AgentState.RUNNING
+        return self._last_state
+
+    @state.setter
+    def state(self, value: AgentState):
+        self._last_state = value
+        self.mark_dirty()
+
+    @property
+    def context(self) -> Optional[ExecutionContext]:
+        """Context of the invocation running this agent's code, if any"""
+        context = _current_context.get()
+        return context if context is not None and context.agent is self else None
+
+    def active_contexts(self) -> List[ExecutionContext]:
+        """Invocations currently in flight on this agent"""
+        with self._contexts_lock:
+            return list(self._contexts.values())
+
+    def _begin(self, kind: str = "run") -> ExecutionContext:
+        context = ExecutionContext(agent=self, timeout=self.config.timeout, retry_delay=self.config.retry_delay)
+        with self._contexts_lock:
+            self._contexts[context.id] = context
+        self.mark_dirty()
+        if QUADAgent._tracer is not None:
+            QUADAgent._tracer.on_start(context, _current_context.get(), kind)
+        if QUADAgent._supervisor is not None:
+            QUADAgent._supervisor.watch(context)
+        return context
+
+    def _end(self, context: ExecutionContext) -> None:
+        with self._contexts_lock:
+            self._contexts.pop(context.id, None)
+        self.mark_dirty()
+
+    @staticmethod
+    def _trace_attempt(context: ExecutionContext, started: float, error: Optional[Exception] = None) -> None:
+        if QUADAgent._tracer is not None:
+            QUADAgent._tracer.on_attempt(context, time.perf_counter() - started, error)
+
+    @contextmanager
+    def _activate(self, context: ExecutionContext) -> Iterator[ExecutionContext]:
+        """Expose `context` as self.context while agent code runs"""
+        token = _current_context.set(context)
+        try:
+            yield context
+        finally:
+            _current_context.reset(token)
+
     # ─────────────────────────────────────────────────────────────
     # CORE METHODS
     # ─────────────────────────────────────────────────────────────
@@ -126,6 +350,8 @@ class QUADAgent(ABC):
 
         This is the main entry point for running an agent.
         Handles retries, error recovery, and result tracking.
+        If `execute_task` streams (returns an iterator), the chunks are
+        collected into a list and returned as the result data.
 
         Args:
             input_data: Input parameters for the task
@@ -133,78 +359,435 @@ class QUADAgent(ABC):
         Returns:
             AgentResult with success status and data
         """
+        return self._run(input_data)
+
+    def _run(self, input_data: Dict[str, Any], error: Optional[Exception] = None) -> AgentResult:
+        """
+        The retry loop of `run`.
+
+        Args:
+            input_data: Input parameters for the task
+            error: Failure of a first attempt already made elsewhere (a
+                run_many batch); it counts toward max_retries
+        """
         start_time = time.time()
-        retries = 0
         last_error = None
 
-        self.state = AgentState.RUNNING
+        context = self._begin()
+        try:
+            with self._activate(context):
+                if error is not None:
+                    last_error = error
+                    context.retries = 1
+                    if not self._should_retry(error, input_data, context.retries):
+                        return self._record_failure(error, start_time, context.retries)
+
+                while context.retries <= self.config.max_retries:
+                    attempt_start = time.perf_counter()
+                    try:
+                        # Execute the task
+                        result = self.execute_task(input_data)
+                        if _is_stream(result):
+                            result = list(result)
+                        self._trace_attempt(context, attempt_start)
+
+                        # Success
+                        return self._record_success(result, start_time, context.retries)
+
+                    except Exception as e:
+                        self._trace_attempt(context, attempt_start, e)
+                        last_error = e
+                        context.retries += 1
+
+                        # Try self-healing if enabled
+                        if self._should_retry(e, input_data, context.retries):
+                            continue
+
+                        # If not healed or out of retries, fail
+                        break
+
+                # Failed after all retries
+                return self._record_failure(last_error, start_time, context.retries)
+        finally:
+            self._end(context)
+
+    def run_stream(self, input_data: Dict[str, Any]) -> Iterator[Any]:
+        """
+        Execute agent and yield partial results as they are produced.
 
-        while retries <= self.config.max_retries:
-            try:
-                # Execute the task
-                result = self.execute_task(input_data)
+        Agents opt in by returning an iterator from `execute_task` (for
+        example by writing it as a generator); a plain dict result is
+        yielded as a single chunk. Chunks are produced only as fast as the
+        caller consumes them, so a slow consumer throttles the agent.
 
-                # Success
-                self.state = AgentState.COMPLETED
-                execution_time = time.time() - start_time
+        Retry semantics:
+            - Errors before the first chunk is yielded are retried and
+              self-healed exactly like `run()`.
+            - Once a chunk has been yielded the stream is never retried
+              (the consumer has already seen partial output); the error is
+              raised as AgentStreamError, whose `result` records how many
+              chunks were emitted.
 
-                agent_result = AgentResult(
-                    success=True,
-                    data=result,
-                    execution_time=execution_time,
-                    retries=retries
-                )
-                self._execution_history.append(agent_result)
+        Args:
+            input_data: Input parameters for the task
+
+        Yields:
+            Partial results from `execute_task`
+
+        Raises:
+            AgentStreamError: If the stream fails
+        """
+        start_time = time.time()
+        emitted = 0
+        first_chunk_time = None
+        last_error = None
+
+        # The context is activated only while agent code runs, never across
+        # a yield, so it cannot leak into the consumer
+        context = self._begin("stream")
+        try:
+            while context.retries <= self.config.max_retries:
+                attempt_start = time.perf_counter()
+                try:
+                    with self._activate(context):
+                        result = self.execute_task(input_data)
+                        chunks = result if _is_stream(result) else iter((result,))
+
+                    while True:
+                        with self._activate(context):
+                            chunk = next(chunks, _STREAM_END)
+                        if chunk is _STREAM_END:
+                            break
+                        if first_chunk_time is None:
+                            first_chunk_time = time.time() - start_time
+                        emitted += 1
+                        yield chunk
+
+                    self._trace_attempt(context, attempt_start)
+                    with self._activate(context):
+                        self._record_success(None, start_time, context.retries, metadata={
+                            "chunks": emitted,
+                            "time_to_first_chunk": first_chunk_time
+                        })
+                    return
+
+                except Exception as e:
+                    self._trace_attempt(context, attempt_start, e)
+                    last_error = e
+                    context.retries += 1
+
+                    # Partial output already delivered: never replay the stream
+                    if emitted == 0:
+                        with self._activate(context):
+                            if self._should_retry(e, input_data, context.retries):
+                                continue
+
+                    break
+
+            with self._activate(context):
+                agent_result = self._record_failure(last_error, start_time, context.retries, metadata={
+                    "chunks": emitted,
+                    "time_to_first_chunk": first_chunk_time
+                })
+            raise AgentStreamError(agent_result) from last_error
+        finally:
+            self._end(context)
+
+    async def arun_stream(self, input_data: Dict[str, Any]) -> AsyncIterator[Any]:
+        """
+        Async iterator over `run_stream`.
+
+        Each chunk is pulled from the agent in a worker thread only when the
+        consumer asks for the next one, so backpressure is preserved and
+        the event loop is never blocked by the agent.
+
+        Args:
+            input_data: Input parameters for the task
+
+        Yields:
+            Partial results from `execute_task`
+        """
+        loop = asyncio.get_running_loop()
+        stream = self.run_stream(input_data)
+        try:
+            while True:
+                chunk = await loop.run_in_executor(None, next, stream, _STREAM_END)
+                if chunk is _STREAM_END:
+                    return
+                yield chunk
+        finally:
+            stream.close()
+
+    def run_many(
+        self,
+        inputs: Iterable[Dict[str, Any]],
+        concurrency: int = 1,
+        batch_size: int = 32
+    ) -> Iterator[AgentResult]:
+        """
+        Execute the agent over many inputs, yielding results as they complete.
+
+        Inputs are read lazily and split into batches handed to
+        `execute_batch`, with up to `concurrency` batches in flight on a
+        thread pool, so memory is bounded by the batches in flight, not by
+        the input. A batch's successes are yielded as soon as the batch
+        returns; items that failed in it are self-healed and retried
+        individually (the batch attempt counts toward max_retries) and each
+        is yielded when its retries end. The rest of the batch is not
+        re-executed.
+
+        The agent's state becomes COMPLETED once every input succeeded;
+        failed items leave the state of their last retry.
 
-                if self.config.enable_logging:
-                    logger.info(f"Agent {self.name} completed in {execution_time:.2f}s")
+        Args:
+            inputs: Input parameters, one dict per task (any iterable)
+            concurrency: Number of batches executed in parallel
+            batch_size: Inputs per `execute_batch` call
+
+        Yields:
+            One AgentResult per input, in completion order, with the input
+            position in `metadata["index"]`
+        """
+        batches = self._batches(inputs, max(1, batch_size))
+        if concurrency <= 1:
+            results = (result for start, items in batches for result in self._run_batch(start, items))
+        else:
+            results = self._run_batches(batches, concurrency)
+
+        failed = False
+        for result in results:
+            failed = failed or not result.success
+            yield result
+
+        if not failed:
+            self.state = AgentState.COMPLETED
+
+    @staticmethod
+    def _batches(inputs: Iterable[Dict[str, Any]], batch_size: int) -> Iterator[tuple]:
+        """(position of the first item, items) for each batch, read lazily"""
+        iterator = iter(inputs)
+        start = 0
+        while True:
+            items = list(islice(iterator, batch_size))
+            if not items:
+                return
+            yield start, items
+            start += len(items)
+
+    def _run_batches(self, batches: Iterator[tuple], concurrency: int) -> Iterator[AgentResult]:
+        """Run batches on a thread pool, yielding each item's result as it arrives"""
+        results: queue.Queue = queue.Queue()
+        stop = threading.Event()
+        done = object()  # Sentinel ending one batch's results
+
+        def drain(start: int, items: List[Dict[str, Any]]) -> None:
+            try:
+                for result in self._run_batch(start, items):
+                    if stop.is_set():
+                        break
+                    results.put(result)
+            except BaseException as e:
+                results.put(e)
+            finally:
+                results.put(done)
+
+        pool = ThreadPoolExecutor(max_workers=concurrency)
+        try:
+            in_flight = 0
+            for start, items in islice(batches, concurrency):
+                pool.submit(drain, start, items)
+                in_flight += 1
+
+            while in_flight:
+                item = results.get()
+                if item is done:
+                    in_flight -= 1
+                    for start, items in islice(batches, 1):
+                        pool.submit(drain, start, items)
+                        in_flight += 1
+                elif isinstance(item, BaseException):
+                    raise item
+                else:
+                    yield item
+        finally:
+            # Consumer gone or a batch raised: let in-flight batches wind down
+            stop.set()
+            pool.shutdown(wait=True)
+
+    def execute_batch(self, inputs: List[Dict[str, Any]]) -> List[Any]:
+        """
+        Execute the agent's task for a batch of inputs.
+
+        Override this to use batch-friendly backends (bulk SQL, batched LLM
+        calls, vectorized scoring). The default loops over `execute_task`.
+
+        Args:
+            inputs: Input parameters for each task
 
-                return agent_result
+        Returns:
+            One entry per input, in order: the task result, or the Exception
+            raised for that input. Raising instead fails the whole batch and
+            every item is retried individually.
+        """
+        results = []
+        for input_data in inputs:
+            try:
+                result = self.execute_task(input_data)
+                results.append(list(result) if _is_stream(result) else result)
+            except Exception as e:
+                results.append(e)
+        return results
 
+    def _run_batch(self, start: int, items: List[Dict[str, Any]]) -> Iterator[AgentResult]:
+        """Run one batch: yield its successes, then each failed item once retried"""
+        start_time = time.time()
+        failed = []
+        succeeded = True
+
+        # As in run_stream, the context is only active while agent code
+        # runs, never across a yield
+        context = self._begin("batch")
+        try:
+            attempt_start = time.perf_counter()
+            try:
+                with self._activate(context):
+                    outputs = self.execute_batch(items)
+                if len(outputs) != len(items):
+                    raise ValueError(f"execute_batch returned {len(outputs)} results for {len(items)} inputs")
+                self._trace_attempt(context, attempt_start)
             except Exception as e:
-                last_error = e
-                retries += 1
+                self._trace_attempt(context, attempt_start, e)
+                outputs = [e] * len(items)
+            execution_time = time.time() - start_time
+
+            for index, (input_data, output) in enumerate(zip(items, outputs), start):
+                if isinstance(output, Exception):
+                    failed.append((index, input_data, output))
+                    continue
+                agent_result = AgentResult(success=True, data=output, execution_time=execution_time,
+                                           metadata={"index": index})
+                self._add_history(agent_result)
+                yield agent_result
+
+            for index, input_data, error in failed:
+                agent_result = self._run(input_data, error)
+                agent_result.metadata["index"] = index
+                succeeded = succeeded and agent_result.success
+                yield agent_result
+
+            if QUADAgent._tracer is not None:
+                QUADAgent._tracer.on_result(context, AgentResult(
+                    success=succeeded, execution_time=time.time() - start_time
+                ))
+        finally:
+            self._end(context)
+
+        if self.config.enable_logging:
+            logger.info(f"Agent {self.name} batch of {len(items)} completed in {time.time() - start_time:.2f}s "
+                        f"({len(failed)} retried)")
 
-                if self.config.enable_logging:
-                    logger.warning(f"Agent {self.name} error (attempt {retries}): {e}")
+    def _should_retry(self, error: Exception, input_data: Dict[str, Any], retries: int) -> bool:
+        """Log a failed attempt and decide (via self-healing) whether to retry"""
+        if self.config.enable_logging:
+            logger.warning(f"Agent {self.name} error (attempt {retries}): {error}")
+
+        context = self.context
+        if context.cancelled:
+            return False
 
-                # Try self-healing if enabled
-                if self.config.enable_self_heal and retries <= self.config.max_retries:
-                    self.state = AgentState.HEALING
-                    healed = self.self_heal(e, input_data)
+        if self.config.enable_self_heal and retries <= self.config.max_retries:
+            context.state = AgentState.HEALING
+            try:
+                healed = self.self_heal(error, input_data)
+                if QUADAgent._tracer is not None:
+                    QUADAgent._tracer.on_heal(context, error, healed)
+                if healed:
+                    if self.config.enable_logging:
+                        logger.info(f"Agent {self.name} self-healed, retrying...")
+                    time.sleep(context.retry_delay)
+            finally:
+                context.state = AgentState.RUNNING
+                context.last_beat = time.monotonic()
+
+            if healed:
+                return True
+
+        return False
+
+    def _record_success(
+        self,
+        data: Any,
+        start_time: float,
+        retries: int,
+        metadata: Optional[Dict[str, Any]] = None
+    ) -> AgentResult:
+        """Mark the run completed and append it to the history"""
+        self.state = AgentState.COMPLETED
+        if self.context is not None:
+            self.context.state = AgentState.COMPLETED
+        execution_time = time.time() - start_time
+
+        agent_result = AgentResult(
+            success=True,
+            data=data,
+            execution_time=execution_time,
+            retries=retries,
+            metadata=metadata or {}
+        )
+        self._add_history(agent_result)
+        if QUADAgent._tracer is not None and self.context is not None:
+            QUADAgent._tracer.on_result(self.context, agent_result)
 
-                    if healed:
-                        if self.config.enable_logging:
-                            logger.info(f"Agent {self.name} self-healed, retrying...")
-                        time.sleep(self.config.retry_delay)
-                        continue
+        if self.config.enable_logging:
+            logger.info(f"Agent {self.name} completed in {execution_time:.2f}s")
 
-                # If not healed or out of retries, fail
-                break
+        return agent_result
 
-        # Failed after all retries
+    def _record_failure(
+        self,
+        error: Optional[Exception],
+        start_time: float,
+        retries: int,
+        metadata: Optional[Dict[str, Any]] = None
+    ) -> AgentResult:
+        """Mark the run failed and append it to the history"""
         self.state = AgentState.FAILED
+        if self.context is not None:
+            self.context.state = AgentState.FAILED
         execution_time = time.time() - start_time
 
         agent_result = AgentResult(
             success=False,
-            error=str(last_error),
+            error=str(error),
             execution_time=execution_time,
-            retries=retries
+            retries=retries,
+            metadata=metadata or {}
         )
-        self._execution_history.append(agent_result)
+        self._add_history(agent_result)
+        if QUADAgent._tracer is not None and self.context is not None:
+            QUADAgent._tracer.on_result(self.context, agent_result)
 
         if self.config.enable_logging:
-            logger.error(f"Agent {self.name} failed after {retries} retries: {last_error}")
+            logger.error(f"Agent {self.name} failed after {retries} retries: {error}")
 
         return agent_result
 
+    def _add_history(self, agent_result: AgentResult) -> None:
+        """Append to the history and update the metrics summary"""
+        self._execution_history.append(agent_result)
+        metrics = self._metrics
+        metrics["executions"] += 1
+        metrics["failures"] += not agent_result.success
+        metrics["retries"] += agent_result.retries
+        metrics["total_time"] += agent_result.execution_time
+
     def self_heal(self, error: Exception, input_data: Dict[str, Any]) -> bool:
         """
         Attempt to auto-fix errors.
 
         Override this method to implement custom self-healing logic.
-        Default implementation handles common API errors.
+        Default implementation handles common API errors. Retry parameters
+        are tuned on `self.context`, so only the failing call is affected.
 
         Args:
             error: The exception that occurred
@@ -214,22 +797,25 @@ class QUADAgent(ABC):
             True if healing was successful, False otherwise
         """
         error_str = str(error).lower()
+        context = self.context or ExecutionContext(
+            agent=self, timeout=self.config.timeout, retry_delay=self.config.retry_delay
+        )
 
         # PRETEXT: Self-healing logic
-        # Allowed: Modify retry parameters, update API endpoints
+        # Allowed: Modify retry parameters (on the context), update API endpoints
         # Restricted: Cannot change core business logic
 
         # Handle common error types
         if "timeout" in error_str:
             # Increase timeout for next retry
-            self.config.timeout = int(self.config.timeout * 1.5)
-            logger.info(f"Increased timeout to {self.config.timeout}s")
+            context.timeout = int(context.timeout * 1.5)
+            logger.info(f"Increased timeout to {context.timeout}s")
             return True
 
         elif "rate limit" in error_str or "429" in error_str:
             # Wait longer before retry
-            self.config.retry_delay = self.config.retry_delay * 2
-            logger.info(f"Rate limited, waiting {self.config.retry_delay}s")
+            context.retry_delay = context.retry_delay * 2
+            logger.info(f"Rate limited, waiting {context.retry_delay}s")
             return True
 
         elif "connection" in error_str:
@@ -252,49 +838,78 @@ class QUADAgent(ABC):
         agent_name: str,
         action: str,
         payload: Dict[str, Any],
-        wait_for_response: bool = True
-    ) -> Optional[AgentResult]:
+        wait_for_response: bool = True,
+        stream: bool = False,
+        priority: Optional[float] = None
+    ) -> Union[AgentResult, Iterator[Any], None]:
         """
         Communicate with another agent via SUMA WIRE.
 
         This enables agent-to-agent communication without tight coupling.
-        Agents are discovered via the registry.
+        Agents are discovered via the registry, starting in this agent's
+        namespace and walking up to the global scope.
 
         Args:
-            agent_name: Name of the target agent
+            agent_name: Name (or fully qualified key) of the target agent
             action: Action to perform
             payload: Data to send
             wait_for_response: Whether to wait for response
+            stream: Return an iterator over the target's partial results
+                (see `run_stream`) instead of one AgentResult
+            priority: Scheduling priority (higher first); defaults to the
+                PGCE score in the payload, if any
 
         Returns:
-            AgentResult if waiting, None if async
+            AgentResult if waiting, chunk iterator if streaming, None if async
         """
         # Create message
         message = AgentMessage(
             from_agent=self.name,
             to_agent=agent_name,
             action=action,
-            payload=payload
+            payload=payload,
+            priority=priority
         )
+        if QUADAgent._tracer is not None:
+            QUADAgent._tracer.on_message(message)
 
         if self.config.enable_logging:
             logger.info(f"SUMA WIRE: {self.name} -> {agent_name} ({action})")
 
         # Find target agent
-        target_agent = QUADAgent._agent_registry.get(agent_name)
+        target_agent = QUADAgent._resolve_agent(agent_name, self.config.namespace)
 
         if not target_agent:
             logger.error(f"Agent not found: {agent_name}")
-            return AgentResult(
+            not_found = AgentResult(
                 success=False,
                 error=f"Agent not found: {agent_name}"
             )
+            if stream:
+                raise AgentStreamError(not_found)
+            return not_found
 
         # Route message to target
-        if wait_for_response:
+        scheduler = QUADAgent._scheduler
+        if stream:
+            return target_agent.receive_message_stream(message)
+        elif scheduler is not None and not scheduler.on_worker and (
+            wait_for_response or QUADAgent._message_queue is None
+        ):
+            # Queue by priority; calls made from a scheduler worker run
+            # inline so nested waits cannot exhaust the pool
+            future = scheduler.submit(message, target_agent)
+            return future.result() if wait_for_response else None
+        elif wait_for_response:
             return target_agent.receive_message(message)
+        elif QUADAgent._message_queue is not None:
+            # Async - fire and forget through the configured queue, addressed
+            # by qualified name so the consumer resolves the same agent
+            message.to_agent = target_agent.qualified_name
+            QUADAgent._message_queue.put(message)
+            return None
         else:
-            # Async - fire and forget (would use queue in production)
+            # Async - no queue configured, deliver inline
             target_agent.receive_message(message)
             return None
 
@@ -316,6 +931,94 @@ class QUADAgent(ABC):
         # Default: execute task with payload
         return self.run(message.payload)
 
+    def receive_message_stream(self, message: AgentMessage) -> Iterator[Any]:
+        """
+        Receive a message and stream back partial results.
+
+        Override this together with `receive_message` to customize routing.
+
+        Args:
+            message: Incoming message from another agent
+
+        Returns:
+            Iterator over partial results
+        """
+        if self.config.enable_logging:
+            logger.info(f"SUMA WIRE: {self.name} streaming to {message.from_agent}")
+
+        return self.run_stream(message.payload)
+
+    def emit(self, topic: str, payload: Optional[Dict[str, Any]] = None) -> int:
+        """
+        Publish an event on the event bus (e.g. "story.created").
+
+        Delivery is asynchronous; this returns once the event is queued.
+
+        Args:
+            topic: Dot-separated topic
+            payload: Event data
+
+        Returns:
+            Number of subscribers the event was queued for
+        """
+        return QUADAgent._event_bus.publish(topic, payload, source=self.qualified_name)
+
+    def subscribe(
+        self,
+        pattern: str,
+        handler: Optional[Callable[[Event], Any]] = None,
+        maxsize: int = 1000,
+        overflow: str = "drop"
+    ) -> Subscription:
+        """
+        Receive events whose topic matches `pattern`.
+
+        Args:
+            pattern: Topic pattern; `*` matches one segment, or one or more
+                at the end ("story.*", "*.failed", "*" for everything)
+            handler: Called with each Event; defaults to `on_event`
+            maxsize: Events queued for this subscription before overflow
+            overflow: "drop" new events when full, or "block" the emitter
+
+        Returns:
+            The Subscription (cancel() to stop); all are cancelled by unregister()
+        """
+        subscription = QUADAgent._event_bus.subscribe(pattern, handler or self.on_event, maxsize, overflow)
+        self._subscriptions.append(subscription)
+        return subscription
+
+    def on_event(self, event: Event) -> None:
+        """
+        Handle a subscribed event.
+
+        Default: deliver it like a SUMA WIRE message (action = topic), so the
+        agent runs with the event payload. Override to react differently.
+        """
+        self.receive_message(AgentMessage(
+            from_agent=event.source,
+            to_agent=self.qualified_name,
+            action=event.topic,
+            payload=event.payload
+        ))
+
+    def set_shared(self, key: str, value: Any, ttl: Optional[float] = None) -> None:
+        """
+        Write to the shared context (needs WRITE permission on `key`).
+
+        Every agent has WRITE on the built-in context; a context installed
+        with `set_shared_context` applies its own grants and default level.
+
+        Args:
+            key: Context key, e.g. "story:123"
+            value: Value to share
+            ttl: Seconds until the key expires; None never expires
+        """
+        QUADAgent._shared_context.set(key, value, ttl, agent=self.qualified_name)
+
+    def get_shared(self, key: str, default: Any = None) -> Any:
+        """Read from the shared context (needs READ permission on `key`; see `set_shared`)"""
+        return QUADAgent._shared_context.get(key, default, agent=self.qualified_name)
+
     # ─────────────────────────────────────────────────────────────
     # SUB-AGENT GENERATION
     # ─────────────────────────────────────────────────────────────
@@ -325,45 +1028,70 @@ class QUADAgent(ABC):
         name: str,
         purpose: str,
         execute_fn: Callable[[Dict], Dict],
-        pretext: str = ""
+        pretext: str = "",
+        capabilities: Optional[List[str]] = None
     ) -> 'QUADAgent':
         """
         Generate a specialized sub-agent dynamically.
 
         This is the core of "code that generates agents" concept.
+        Sub-agents with the same (purpose, capabilities) share one generated
+        class; `execute_fn` and the PRETEXT are bound per instance.
+
+        The new agent is owned by this one (see `_spawn_child`): call its
+        `unregister()` to release it before this agent is freed, or use
+        `sub_agent()` for one that only lives for a block.
 
         Args:
             name: Name for the new agent
             purpose: Description of what the agent does
             execute_fn: Function that implements execute_task
             pretext: AI-modifiable code description
+            capabilities: Capabilities advertised by the agent
 
         Returns:
             New QUADAgent instance
         """
-        # Create dynamic agent class
-        class DynamicAgent(QUADAgent):
-            __doc__ = purpose
-            _execute_fn = staticmethod(execute_fn)
-            _pretext = pretext
-
-            def execute_task(self, input_data: dict) -> dict:
-                return self._execute_fn(input_data)
-
-            def _get_pretext(self) -> str:
-                return self._pretext
-
-        # Instantiate and register as child
-        config = AgentConfig(name=name)
-        agent = DynamicAgent(config=config)
-        agent.parent = self
-        self.children.append(agent)
+        agent_class = dynamic_agent_class(purpose, tuple(capabilities or ()))
+        agent = self._spawn_child(agent_class, name, execute_fn, pretext=pretext)
 
         if self.config.enable_logging:
             logger.info(f"Generated sub-agent: {name} (parent: {self.name})")
 
         return agent
 
+    @contextmanager
+    def sub_agent(
+        self,
+        name: str,
+        purpose: str,
+        execute_fn: Callable[[Dict], Dict],
+        pretext: str = "",
+        capabilities: Optional[List[str]] = None
+    ) -> Iterator['QUADAgent']:
+        """
+        A short-lived sub-agent, detached and unregistered when the block ends.
+
+        For parents that spawn many throwaway helpers: nothing is left
+        behind in `children` or the registry, so memory stays flat however
+        long the parent lives.
+
+        Example:
+            with planner.sub_agent("Scorer", "Score one story", score) as scorer:
+                result = scorer.run({"story": story})
+
+        Args:
+            Same as `generate_sub_agent`
+
+        Yields:
+            The new sub-agent
+        """
+        agent = self.generate_sub_agent(name, purpose, execute_fn, pretext, capabilities)
+        try:
+            yield agent
+        finally:
+            agent.unregister()
+
     def generate_sub_agent_from_spec(self, spec: Dict[str, Any]) -> 'QUADAgent':
         """
         Generate sub-agent from a specification dictionary.
@@ -378,6 +1106,50 @@ class QUADAgent(ABC):
         Returns:
             New QUADAgent instance
         """
+        agent_class, name, execute_fn, pretext = self._prepare_spec(spec)
+        agent = self._spawn_child(agent_class, name, execute_fn, {**spec, "name": name}, pretext)
+
+        if self.config.enable_logging:
+            logger.info(f"Generated sub-agent: {name} (parent: {self.name})")
+
+        return agent
+
+    def generate_sub_agents(self, specs: List[Dict[str, Any]]) -> List['QUADAgent']:
+        """
+        Generate many sub-agents in one call.
+
+        Each spec is either a `generate_sub_agent_from_spec` specification or,
+        when it carries an `execute_fn`, the keyword arguments of
+        `generate_sub_agent` (name, purpose, execute_fn, pretext, capabilities).
+
+        Args:
+            specs: List of agent specifications
+
+        Returns:
+            New QUADAgent instances, in spec order
+        """
+        agents = []
+        for spec in specs:
+            if "execute_fn" in spec:
+                agent_class = dynamic_agent_class(
+                    spec.get("purpose", "Generated agent"),
+                    tuple(spec.get("capabilities", ()))
+                )
+                name, execute_fn, pretext = spec["name"], spec["execute_fn"], spec.get("pretext", "")
+                spec = None
+            else:
+                agent_class, name, execute_fn, pretext = self._prepare_spec(spec)
+                spec = {**spec, "name": name}
+            agents.append(self._spawn_child(agent_class, name, execute_fn, spec, pretext))
+
+        if self.config.enable_logging:
+            logger.info(f"Generated {len(agents)} sub-agents (parent: {self.name})")
+
+        return agents
+
+    @staticmethod
+    def _prepare_spec(spec: Dict[str, Any]):
+        """Resolve a spec into (agent class, name, execute_fn, pretext)"""
         name = spec.get("name", f"Agent_{uuid.uuid4().hex[:8]}")
         purpose = spec.get("purpose", "Generated agent")
         data_sources = spec.get("data_sources", [])
@@ -403,7 +1175,38 @@ class QUADAgent(ABC):
 # Restricted: Cannot delete data, cannot access unauthorized data sources
 """
 
-        return self.generate_sub_agent(name, purpose, execute_fn, pretext)
+        return dynamic_agent_class(purpose, tuple(capabilities)), name, execute_fn, pretext
+
+    def _spawn_child(
+        self,
+        agent_class: Type['DynamicAgent'],
+        name: str,
+        execute_fn: Callable[[Dict], Dict],
+        spec: Optional[Dict[str, Any]] = None,
+        pretext: str = ""
+    ) -> 'DynamicAgent':
+        """
+        Instantiate a dynamic agent and attach it as a child.
+
+        The parent owns the child: `children` holds it strongly and the
+        registry only weakly, so a sub-agent lives exactly as long as its
+        parent, unless detached earlier with `unregister()`. Dropping the
+        root of a tree frees the whole tree. A long-lived parent that
+        spawns short-lived sub-agents should use `sub_agent()` (or
+        unregister them when done), or they accumulate in `children`.
+        """
+        # Register in the parent's namespace, inheriting its logging setting
+        config = AgentConfig(
+            name=name,
+            namespace=self.config.namespace,
+            enable_logging=self.config.enable_logging
+        )
+        agent = agent_class(config=config, execute_fn=execute_fn, pretext=pretext)
+        agent._spec = spec
+        agent.parent = self
+        self.children.append(agent)
+        self.mark_dirty()
+        return agent
 
     # ─────────────────────────────────────────────────────────────
     # ABSTRACT METHODS (Must Override)
@@ -414,13 +1217,15 @@ class QUADAgent(ABC):
         """
         Execute the agent's main task.
 
-        MUST be implemented by subclasses.
+        MUST be implemented by subclasses. Long-running agents may
+        instead return an iterator of partial results (e.g. by using
+        `yield`), which callers can consume through `run_stream`.
 
         Args:
             input_data: Input parameters
 
         Returns:
-            Result dictionary
+            Result dictionary (or an iterator of partial results)
         """
         pass
 
@@ -443,9 +1248,12 @@ class QUADAgent(ABC):
 
     def get_status(self) -> Dict[str, Any]:
         """Get current agent status"""
+        states = [c.state for c in self.active_contexts()]
         return {
             "name": self.name,
             "state": self.state.value,
+            "running": states.count(AgentState.RUNNING),
+            "healing": states.count(AgentState.HEALING),
             "children": [c.name for c in self.children],
             "parent": self.parent.name if self.parent else None,
             "execution_count": len(self._execution_history),
@@ -456,35 +1264,248 @@ class QUADAgent(ABC):
         """Get execution history"""
         return self._execution_history.copy()
 
+    def metrics(self) -> Dict[str, Any]:
+        """Execution summary (kept in snapshots, unlike the full history)"""
+        metrics = dict(self._metrics)
+        metrics["avg_time"] = metrics["total_time"] / metrics["executions"] if metrics["executions"] else 0.0
+        return metrics
+
+    def heartbeat(self) -> None:
+        """
+        Report progress from inside execute_task.
+
+        A Supervisor treats an invocation as stalled when it has not beaten
+        for longer than the agent's expected latency allows; invocations
+        beat automatically when they start and between retries. Call this
+        in long loops so slow-but-alive work is not mistaken for a hang.
+
+        Raises:
+            AgentStalledError: If the supervisor already gave up on this
+                invocation (the agent has been restarted); not retried
+        """
+        context = self.context
+        if context is None:
+            return
+        context.last_beat = time.monotonic()
+        if context.cancelled:
+            raise AgentStalledError(f"Agent {self.name} was restarted by its supervisor")
+
+    def respawn(self) -> 'QUADAgent':
+        """
+        Build a fresh instance to take this agent's place on restart.
+
+        Override when the constructor needs more than the config.
+        """
+        return type(self)(config=self.config)
+
+    def mark_dirty(self) -> None:
+        """
+        Invalidate cached serializations (to_dict, snapshots) of this agent
+        and its ancestors.
+
+        Called automatically on state and child changes; call it yourself
+        after mutating `config` in place.
+        """
+        node = self
+        # A node with an empty cache has empty-cache ancestors, so stop there
+        while node is not None and node._cache:
+            node._cache.clear()
+            node = node.parent
+
+    def unregister(self) -> bool:
+        """
+        Remove this agent from SUMA WIRE routing and detach it from its parent.
+
+        After this call nothing in the framework references the agent, so it
+        is freed as soon as the caller drops it.
+
+        Returns:
+            True if the agent was still registered (False if another agent
+            has since replaced it under the same name)
+        """
+        parent = self.parent
+        if parent is not None and self in parent.children:
+            parent.children.remove(self)
+            parent.mark_dirty()
+        self.parent = None
+        for subscription in self._subscriptions:
+            subscription.cancel()
+        self._subscriptions.clear()
+        return QUADAgent._agent_registry.unregister(self.qualified_name, agent=self)
+
     @classmethod
-    def get_registered_agents(cls) -> List[str]:
-        """Get list of all registered agents"""
-        return list(cls._agent_registry.keys())
+    def set_message_queue(cls, queue: Optional[Any]) -> None:
+        """
+        Route fire-and-forget messages through a queue.
+
+        Args:
+            queue: Any object with `put(message)`, e.g. DurableQueue;
+                None restores inline delivery
+        """
+        cls._message_queue = queue
+
+    @classmethod
+    def set_scheduler(cls, scheduler: Optional[Any]) -> None:
+        """
+        Run agent-to-agent messages in priority order.
+
+        Args:
+            scheduler: A started PriorityScheduler; None restores
+                call-order delivery
+        """
+        cls._scheduler = scheduler
+
+    @classmethod
+    def set_tracer(cls, tracer: Optional[Any]) -> None:
+        """
+        Record runtime events (messages, attempts, heals, results).
+
+        Args:
+            tracer: e.g. TraceRecorder; None stops recording
+        """
+        cls._tracer = tracer
+
+    @classmethod
+    def set_shared_context(cls, context: SharedContext) -> None:
+        """
+        Replace the shared context used by set_shared / get_shared.
+
+        Agents are checked against the new context's grants; with the
+        default `default_level=NONE` an agent needs a grant for every key.
+
+        Args:
+            context: e.g. SharedContext(path="~/.quad/context.db") for
+                persistence, with its permission grants
+        """
+        cls._shared_context = context
+
+    @classmethod
+    def set_supervisor(cls, supervisor: Optional[Any]) -> None:
+        """
+        Watch every invocation for stalls.
+
+        Args:
+            supervisor: A started Supervisor; None stops supervision
+        """
+        cls._supervisor = supervisor
+
+    @classmethod
+    def get_registered_agents(cls, namespace: Optional[str] = None) -> List[str]:
+        """Get list of all registered agents (optionally within a namespace)"""
+        return cls._agent_registry.names(namespace)
+
+    @classmethod
+    def get_agent(cls, name: str, namespace: str = "") -> Optional['QUADAgent']:
+        """Get agent by name from registry (building catalogued agents on demand)"""
+        return cls._resolve_agent(name, namespace)
 
     @classmethod
-    def get_agent(cls, name: str) -> Optional['QUADAgent']:
-        """Get agent by name from registry"""
-        return cls._agent_registry.get(name)
+    def set_remote_transport(cls, transport: Optional[Any]) -> None:
+        """
+        Reach agents in other processes when a name is not found locally.
+
+        Args:
+            transport: Object with `resolve(name, namespace)` returning an
+                agent proxy, e.g. RemoteTransport; None disables it
+        """
+        cls._remote_transport = transport
+
+    @classmethod
+    def _resolve_agent(cls, name: str, namespace: str = "", remote: bool = True) -> Optional['QUADAgent']:
+        """Look up a live agent, falling back to the lazy catalog, then remote"""
+        agent = cls._agent_registry.get(name, namespace)
+        if agent is not None:
+            cls._agent_catalog.touch(agent.qualified_name)
+            return agent
+        agent = cls._agent_catalog.get(name, namespace)
+        if agent is None and remote and cls._remote_transport is not None:
+            agent = cls._remote_transport.resolve(name, namespace)
+        return agent
 
     def to_dict(self) -> Dict[str, Any]:
-        """Serialize agent to dictionary"""
-        return {
-            "name": self.name,
-            "type": self.__class__.__name__,
-            "config": {
-                "version": self.config.version,
-                "max_retries": self.config.max_retries,
-                "timeout": self.config.timeout
-            },
-            "state": self.state.value,
-            "pretext": self._get_pretext(),
-            "children": [c.to_dict() for c in self.children]
-        }
+        """
+        Serialize agent to dictionary.
+
+        Cached until the agent or a descendant changes (see mark_dirty), so
+        treat the result as read-only.
+        """
+        cached = self._cache.get("dict")
+        if cached is None:
+            cached = self._cache["dict"] = {
+                "name": self.name,
+                "type": self.__class__.__name__,
+                "config": {
+                    "version": self.config.version,
+                    "max_retries": self.config.max_retries,
+                    "timeout": self.config.timeout
+                },
+                "state": self.state.value,
+                "pretext": self._get_pretext(),
+                "children": [c.to_dict() for c in self.children]
+            }
+        return cached
 
     def __repr__(self) -> str:
         return f"<{self.__class__.__name__}(name={self.name}, state={self.state.value})>"
 
 
+# ─────────────────────────────────────────────────────────────────
+# DYNAMIC AGENTS
+# ─────────────────────────────────────────────────────────────────
+
+class DynamicAgent(QUADAgent):
+    """
+    Base class for agents produced by `generate_sub_agent`.
+
+    Purpose and capabilities live on the (cached) class; the execute
+    function and the PRETEXT (which names the agent) are bound per instance.
+    """
+
+    capabilities: tuple = ()
+
+    def __init__(
+        self,
+        config: Optional[AgentConfig] = None,
+        name: str = None,
+        execute_fn: Optional[Callable[[Dict], Dict]] = None,
+        pretext: str = ""
+    ):
+        self._execute_fn = execute_fn
+        self._pretext = pretext
+        super().__init__(config=config, name=name)
+
+    def execute_task(self, input_data: dict) -> dict:
+        return self._execute_fn(input_data)
+
+    def _get_pretext(self) -> str:
+        return self._pretext
+
+    def respawn(self) -> 'DynamicAgent':
+        return type(self)(config=self.config, execute_fn=self._execute_fn, pretext=self._pretext)
+
+
+@lru_cache(maxsize=1024)
+def dynamic_agent_class(purpose: str, capabilities: tuple = ()) -> Type[DynamicAgent]:
+    """
+    Get the generated agent class for a (purpose, capabilities) signature.
+
+    Classes are built once and reused, so spawning thousands of sub-agents
+    from the same spec pays type creation and ABC setup only once.
+
+    Args:
+        purpose: Agent description (becomes the class docstring)
+        capabilities: Tuple of capability names
+
+    Returns:
+        A DynamicAgent subclass
+    """
+    return type("DynamicAgent", (DynamicAgent,), {
+        "__doc__": purpose,
+        "__module__": __name__,
+        "capabilities": capabilities,
+    })
+
+
 # ─────────────────────────────────────────────────────────────────
 # EXAMPLE USAGE
 # ─────────────────────────────────────────────────────────────────
@@ -0,0 +1,187 @@
+"""
+QUAD Agent Registry
+===================
+
+Scoped, thread-safe registry used for SUMA WIRE routing.
+
+Key Features:
+- Weak references: agents are garbage-collected once nothing else holds them.
+  The registry never owns an agent: whoever created it does (a parent agent
+  owns its sub-agents through `children`, see QUADAgent._spawn_child)
+- Hierarchical namespaces: per tenant/domain/pipeline scoping ("acme/suma/ci")
+- Lock-free reads, locked writes
+- Explicit unregister
+
+Copyright (c) 2026 Gopi Suman Addanke. All Rights Reserved.
+Patent Pending (63/956,810) - QUAD Platform
+"""
+
+import threading
+import weakref
+from contextlib import contextmanager
+from typing import Any, Dict, Iterator, List, Optional
+
+# Separator between namespace segments and the agent name
+NAMESPACE_SEPARATOR = "/"
+
+
+def qualify(name: str, namespace: str = "") -> str:
+    """Build the registry key for an agent name inside a namespace"""
+    namespace = namespace.strip(NAMESPACE_SEPARATOR)
+    return f"{namespace}{NAMESPACE_SEPARATOR}{name}" if namespace else name
+
+
+class AgentRegistry:
+    """
+    Weak-reference registry of live agents, keyed by qualified name.
+
+    Reads never take the lock: a single dict lookup is atomic under the GIL,
+    so `get` stays O(1) (times namespace depth when walking up scopes).
+    Writes (register/unregister/reaping of collected agents) are serialized
+    by a re-entrant lock, since weakref callbacks may fire from the garbage
+    collector while the same thread is already inside a write.
+
+    Example:
+        registry = AgentRegistry()
+        registry.register(agent, namespace="acme/suma")
+        registry.get("Planner", namespace="acme/suma/ci")  # walks up scopes
+    """
+
+    def __init__(self):
+        self._agents: Dict[str, weakref.ref] = {}
+        self._lock = threading.RLock()
+        self._local = threading.local()
+
+    # ─────────────────────────────────────────────────────────────
+    # WRITES (locked)
+    # ─────────────────────────────────────────────────────────────
+
+    def register(self, agent: Any, namespace: str = "", replace: bool = False) -> str:
+        """
+        Register an agent under its name inside a namespace.
+
+        Args:
+            agent: Agent instance (must expose `.name`)
+            namespace: Scope such as "tenant/domain"; "" is the global scope
+            replace: Replace a different live agent already using the name
+
+        Returns:
+            The qualified registry key
+
+        Raises:
+            ValueError: If another live agent is registered under the same key
+        """
+        key = qualify(agent.name, namespace)
+        replace = replace or getattr(self._local, "replacing", False)
+        with self._lock:
+            existing = self._resolve(self._agents.get(key))
+            if existing is not None and existing is not agent and not replace:
+                raise ValueError(f"Agent already registered: {key}")
+            self._agents[key] = weakref.ref(agent, lambda ref, key=key: self._discard(key, ref))
+        return key
+
+    @contextmanager
+    def replacing(self) -> Iterator[None]:
+        """
+        Within the block, agents constructed on this thread replace live
+        agents registered under the same key. Lookups never see the key
+        missing, which is what restarts need (see supervisor.py).
+        """
+        previous = getattr(self._local, "replacing", False)
+        self._local.replacing = True
+        try:
+            yield
+        finally:
+            self._local.replacing = previous
+
+    def register_many(self, agents: List[Any], namespace: str = "") -> List[str]:
+        """Register several agents under one lock acquisition"""
+        with self._lock:
+            return [self.register(agent, namespace) for agent in agents]
+
+    def unregister(self, name: str, namespace: str = "", agent: Optional[Any] = None) -> bool:
+        """
+        Remove an agent from the registry.
+
+        Args:
+            name: Agent name (or fully qualified key when namespace is "")
+            namespace: Scope the agent was registered in
+            agent: Only remove the entry if it still points at this agent,
+                so an agent replaced under its name (see replacing()) cannot
+                unregister its replacement
+
+        Returns:
+            True if an entry was removed
+        """
+        key = qualify(name, namespace)
+        with self._lock:
+            ref = self._agents.get(key)
+            if ref is None or (agent is not None and ref() is not agent):
+                return False
+            del self._agents[key]
+            return True
+
+    def clear(self) -> None:
+        """Remove every entry"""
+        with self._lock:
+            self._agents.clear()
+
+    def _discard(self, key: str, ref: weakref.ref) -> None:
+        """Weakref callback: drop the entry if it still points at the dead agent"""
+        with self._lock:
+            if self._agents.get(key) is ref:
+                del self._agents[key]
+
+    # ─────────────────────────────────────────────────────────────
+    # READS (lock-free)
+    # ─────────────────────────────────────────────────────────────
+
+    def get(self, name: str, namespace: str = "") -> Optional[Any]:
+        """
+        Find a live agent.
+
+        Looks in `namespace` first, then each parent scope up to the global
+        scope, so agents in a pipeline can reach domain- and tenant-level
+        agents by their short name.
+
+        Args:
+            name: Agent name or fully qualified key
+            namespace: Scope of the caller
+
+        Returns:
+            The agent, or None if not registered (or already collected)
+        """
+        scope = namespace.strip(NAMESPACE_SEPARATOR)
+        while scope:
+            agent = self._resolve(self._agents.get(f"{scope}{NAMESPACE_SEPARATOR}{name}"))
+            if agent is not None:
+                return agent
+            scope = scope.rpartition(NAMESPACE_SEPARATOR)[0]
+        return self._resolve(self._agents.get(name))
+
+    def names(self, namespace: Optional[str] = None) -> List[str]:
+        """
+        List qualified names of live agents.
+
+        Args:
+            namespace: Only include agents inside this scope (None = all)
+        """
+        entries = list(self._agents.items())
+        if namespace is not None:
+            namespace = namespace.strip(NAMESPACE_SEPARATOR)
+            prefix = namespace + NAMESPACE_SEPARATOR if namespace else ""
+            entries = [(k, r) for k, r in entries if k.startswith(prefix)]
+        return [key for key, ref in entries if ref() is not None]
+
+    def __contains__(self, key: str) -> bool:
+        return self._resolve(self._agents.get(key)) is not None
+
+    def __len__(self) -> int:
+        return len(self.names())
+
+    @staticmethod
+    def _resolve(ref: Optional[weakref.ref]) -> Optional[Any]:
+        return ref() if ref is not None else None
+
+    def __repr__(self) -> str:
+        return f"<AgentRegistry(agents={len(self)})>"
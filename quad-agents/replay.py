@@ -0,0 +1,216 @@
+"""
+QUAD Trace Replay
+=================
+
+Re-drives the agent runtime from a trace recorded with TraceRecorder
+(tracing.py), so runtime changes can be measured against real traffic
+shapes without the external systems agents call.
+
+Every recorded agent is replaced by a ReplayAgent that:
+- sleeps each attempt's recorded latency (optionally scaled)
+- raises the recorded error text, so the real self_heal logic decides
+  again, and reports decisions that diverge from the recording
+- makes the same nested SUMA WIRE calls, in the same attempts
+
+Recorded run_many batches are replayed as single runs of the batch.
+
+Everything else (retries, contexts, routing, scheduling) is the real
+runtime, which is what a replay benchmarks.
+
+Run replays in a fresh process: replay agents register under the
+recorded names.
+
+Copyright (c) 2026 Gopi Suman Addanke. All Rights Reserved.
+Patent Pending (63/956,810) - QUAD Platform
+"""
+
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Dict, List, Optional
+
+from .quad_agent import AgentConfig, QUADAgent
+from .registry import NAMESPACE_SEPARATOR
+from .tracing import Invocation, Trace, summarize
+
+# Payload key carrying the recorded invocation id
+REPLAY_KEY = "__replay__"
+
+
+class ReplayedError(Exception):
+    """An error recorded in the trace, raised again during replay"""
+
+
+class ReplayAgent(QUADAgent):
+    """Stand-in for a recorded agent (see module docstring)"""
+
+    def __init__(self, config: AgentConfig, replayer: 'Replayer'):
+        self._replayer = replayer
+        super().__init__(config=config)
+
+    def execute_task(self, input_data: dict) -> dict:
+        invocation = self._replayer.trace.invocations[input_data[REPLAY_KEY]]
+        attempt = self.context.retries
+        duration, error = (
+            invocation.attempts[min(attempt, len(invocation.attempts) - 1)]
+            if invocation.attempts else (0.0, None)
+        )
+
+        started = time.perf_counter()
+        for child in invocation.children:
+            if child.parent_attempt == attempt:
+                self.talk_to_agent(child.agent, "replay", {REPLAY_KEY: child.id})
+
+        # The recorded duration includes the nested calls just replayed
+        remaining = duration * self._replayer.latency_scale - (time.perf_counter() - started)
+        if remaining > 0:
+            time.sleep(remaining)
+
+        if error is not None:
+            raise ReplayedError(error)
+        return {"replayed": invocation.id}
+
+    def self_heal(self, error: Exception, input_data: dict) -> bool:
+        healed = super().self_heal(error, input_data)
+        invocation = self._replayer.trace.invocations[input_data[REPLAY_KEY]]
+        index = self.context.retries - 1
+        recorded = invocation.heals[index][1] if index < len(invocation.heals) else None
+        if recorded != healed:
+            self._replayer._diverged(invocation, str(error), recorded, healed)
+        return healed
+
+    def respawn(self) -> 'ReplayAgent':
+        return type(self)(self.config, self._replayer)
+
+    def _get_pretext(self) -> str:
+        return ""
+
+
+class Replayer:
+    """
+    Replays a trace and reports throughput and latency.
+
+    Example:
+        report = Replayer(load_trace("traffic.qtrace"), concurrency=32).run()
+        regressions = compare_to_baseline(report, baseline)
+    """
+
+    def __init__(
+        self,
+        trace: Trace,
+        latency_scale: float = 1.0,
+        time_scale: Optional[float] = None,
+        concurrency: int = 16,
+        limit: Optional[int] = None
+    ):
+        """
+        Args:
+            trace: Loaded trace (tracing.load_trace)
+            latency_scale: Multiplier for recorded attempt latencies and
+                retry delays (0.1 replays external calls 10x faster)
+            time_scale: Replay top-level calls at their recorded arrival
+                times multiplied by this (open loop); None sends them as
+                fast as `concurrency` allows (closed loop)
+            concurrency: Top-level calls in flight
+            limit: Replay only the first N top-level calls
+        """
+        self.trace = trace
+        self.latency_scale = latency_scale
+        self.time_scale = time_scale
+        self.concurrency = concurrency
+        self.limit = limit
+        self._divergences: List[Dict[str, Any]] = []
+        self._lock = threading.Lock()
+
+    def run(self) -> Dict[str, Any]:
+        """
+        Replay the trace.
+
+        Returns:
+            summarize() fields (invocations, failures, elapsed, throughput,
+            p50_ms, p99_ms) plus heal divergences and the recorded summary
+        """
+        roots = self.trace.roots[:self.limit] if self.limit else self.trace.roots
+        agents = self._build_agents()
+        latencies: List[float] = []
+        failures = 0
+
+        def drive(root: Invocation):
+            started = time.perf_counter()
+            result = agents[root.agent].run({REPLAY_KEY: root.id})
+            return time.perf_counter() - started, result.success
+
+        start = time.perf_counter()
+        try:
+            with ThreadPoolExecutor(max_workers=self.concurrency) as pool:
+                futures = []
+                origin = roots[0].start if roots else 0.0
+                for root in roots:
+                    if self.time_scale is not None:
+                        delay = (root.start - origin) * self.time_scale - (time.perf_counter() - start)
+                        if delay > 0:
+                            time.sleep(delay)
+                    futures.append(pool.submit(drive, root))
+                for future in futures:
+                    latency, success = future.result()
+                    latencies.append(latency)
+                    failures += not success
+            elapsed = time.perf_counter() - start
+        finally:
+            for agent in agents.values():
+                agent.unregister()
+
+        report = summarize(latencies, elapsed, failures)
+        report["heal_divergences"] = len(self._divergences)
+        report["divergence_samples"] = self._divergences[:10]
+        report["recorded"] = self.trace.summary()
+        return report
+
+    def _build_agents(self) -> Dict[str, ReplayAgent]:
+        agents: Dict[str, ReplayAgent] = {}
+        for invocation in self.trace.invocations.values():
+            if invocation.agent in agents:
+                continue
+            namespace, _, name = invocation.agent.rpartition(NAMESPACE_SEPARATOR)
+            config = invocation.config
+            agents[invocation.agent] = ReplayAgent(AgentConfig(
+                name=name,
+                namespace=namespace,
+                max_retries=config["max_retries"],
+                timeout=config["timeout"],
+                retry_delay=config["retry_delay"] * self.latency_scale,
+                enable_self_heal=config["enable_self_heal"],
+                enable_logging=False
+            ), self)
+        return agents
+
+    def _diverged(self, invocation: Invocation, error: str, recorded: Optional[bool], healed: bool) -> None:
+        with self._lock:
+            self._divergences.append({
+                "agent": invocation.agent, "invocation": invocation.id,
+                "error": error, "recorded": recorded, "replayed": healed
+            })
+
+
+def compare_to_baseline(report: Dict[str, Any], baseline: Dict[str, Any], tolerance: float = 0.1) -> List[str]:
+    """
+    Regressions of a replay report against a stored one.
+
+    Args:
+        report: Replayer.run() output
+        baseline: An earlier report
+        tolerance: Allowed relative slowdown (0.1 = 10%)
+
+    Returns:
+        Human-readable regressions (empty if none)
+    """
+    regressions = []
+    if report["throughput"] < baseline["throughput"] * (1 - tolerance):
+        regressions.append(f"throughput {report['throughput']:.1f}/s < baseline {baseline['throughput']:.1f}/s")
+    if report["p99_ms"] > baseline["p99_ms"] * (1 + tolerance):
+        regressions.append(f"p99 {report['p99_ms']:.1f} ms > baseline {baseline['p99_ms']:.1f} ms")
+    if report["failures"] > baseline["failures"]:
+        regressions.append(f"failures {report['failures']} > baseline {baseline['failures']}")
+    if report["heal_divergences"] > baseline.get("heal_divergences", 0):
+        regressions.append(f"{report['heal_divergences']} self-heal decisions differ from the recording")
+    return regressions
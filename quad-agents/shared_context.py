@@ -0,0 +1,556 @@
+"""
+QUAD Shared Context
+===================
+
+Permission-gated key/value state shared between agents
+(QUAD_AGENT_ARCHITECTURE.md, "Shared Context" and "Permission System").
+
+Agents hand each other data by key instead of copying it through every
+message payload.
+
+Key Features:
+- Sharded, lock-striped map: writers only contend within a shard, reads
+  take no lock at all
+- TTL: expired keys are invisible immediately (lazy) and removed by a
+  background sweeper
+- Atomic `incr` and `cas`
+- Prefix and glob scans served from a sorted key index
+- Optional SQLite tier: writes are persisted in batches and reloaded on
+  startup
+- Permission levels (NONE / READ / SUGGEST / WRITE / ADMIN) per agent and
+  key pattern, checked against precomputed bitmaps
+
+Copyright (c) 2026 Gopi Suman Addanke. All Rights Reserved.
+Patent Pending (63/956,810) - QUAD Platform
+"""
+
+import bisect
+import fnmatch
+import heapq
+import logging
+import re
+import sqlite3
+import threading
+import time
+import weakref
+from enum import IntEnum
+from pathlib import Path
+from typing import Any, Dict, Iterator, List, Optional, Set, Tuple, Union
+
+from . import codec
+
+logger = logging.getLogger("QUADAgent.SharedContext")
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS context (
+    key TEXT PRIMARY KEY,
+    value BLOB NOT NULL,
+    expires_at REAL
+);
+"""
+
+_GLOB_CHARS = re.compile(r"[*?\[]")
+
+
+class PermissionLevel(IntEnum):
+    """Access an agent has to a key (higher levels include lower ones)"""
+    NONE = 0     # Cannot access
+    READ = 1     # get / scan
+    SUGGEST = 2  # Propose values for a writer to apply
+    WRITE = 3    # set / incr / cas
+    ADMIN = 4    # delete
+
+
+class _Shard:
+    __slots__ = ("lock", "data", "expiries")
+
+    def __init__(self):
+        self.lock = threading.Lock()
+        # key -> (value, expires_at or None); replaced whole, so readers
+        # see either the old or the new entry without locking
+        self.data: Dict[str, Tuple[Any, Optional[float]]] = {}
+        self.expiries: List[Tuple[float, str]] = []  # Heap for the sweeper
+
+
+class _Grants:
+    """One agent's precomputed permission bitmaps"""
+    __slots__ = ("levels", "masks")
+
+    def __init__(self):
+        self.levels: Dict[int, PermissionLevel] = {}  # Pattern bit -> level
+        self.masks: Tuple[int, ...] = (0,) * len(PermissionLevel)
+
+    def rebuild(self) -> None:
+        # masks[level] has the bit of every pattern granting at least `level`
+        self.masks = tuple(
+            sum(1 << bit for bit, granted in self.levels.items() if granted >= level)
+            for level in PermissionLevel
+        )
+
+
+class SharedContext:
+    """
+    Shared key/value store for agents.
+
+    Every operation takes the acting agent's qualified name; `agent=None`
+    is the runtime itself and is never restricted. Agents get
+    `default_level` on keys no grant covers.
+
+    Example:
+        context = SharedContext(path="~/.quad/context.db")
+        context.grant("StoryAgent", "story:*", PermissionLevel.WRITE)
+        context.grant("DevAgent", "story:*", PermissionLevel.READ)
+
+        context.set("story:123", {"title": "..."}, ttl=3600, agent="StoryAgent")
+        context.get("story:123", agent="DevAgent")
+        context.incr("stats:stories", agent="StoryAgent")   # PermissionError
+    """
+
+    def __init__(
+        self,
+        shards: int = 16,
+        path: Optional[Union[str, Path]] = None,
+        sweep_interval: float = 1.0,
+        default_level: PermissionLevel = PermissionLevel.NONE,
+        max_value_size: Optional[int] = None
+    ):
+        """
+        Args:
+            shards: Lock stripes (rounded up to a power of two)
+            path: SQLite file for persistence; None keeps everything in memory
+            sweep_interval: Seconds between expiry sweeps (and SQLite flushes)
+            default_level: Access agents have to keys no grant covers
+            max_value_size: Reject persisted values larger than this many bytes
+        """
+        count = 1
+        while count < shards:
+            count <<= 1
+        self._shards = [_Shard() for _ in range(count)]
+        self._shard_mask = count - 1
+        self.sweep_interval = sweep_interval
+        self.default_level = PermissionLevel(default_level)
+        self.max_value_size = max_value_size
+
+        # Sorted key index for scans
+        self._index: List[str] = []
+        self._index_lock = threading.Lock()
+
+        # Permissions: pattern bits, per-agent bitmaps, per-key pattern bitmaps
+        self._patterns: List[str] = []
+        self._grants: Dict[str, _Grants] = {}
+        self._key_masks: Dict[str, int] = {}
+        self._acl_lock = threading.Lock()
+
+        self._suggestions: Dict[str, List[Tuple[str, Any]]] = {}
+        self._lock = threading.Lock()
+
+        self._stop = threading.Event()
+        self._sweeper: Optional[threading.Thread] = None
+
+        self._conn: Optional[sqlite3.Connection] = None
+        self._dirty: Set[str] = set()
+        self._dirty_lock = threading.Lock()
+        if path is not None:
+            self._open(Path(path).expanduser())
+            self._start_sweeper()  # Also flushes to SQLite
+
+    # ─────────────────────────────────────────────────────────────
+    # PERMISSIONS
+    # ─────────────────────────────────────────────────────────────
+
+    def grant(self, agent: str, pattern: str, level: PermissionLevel) -> None:
+        """
+        Give an agent `level` on keys matching a glob pattern.
+
+        An agent's level on a key is the highest level of its matching grants.
+
+        Args:
+            agent: Qualified agent name
+            pattern: Key glob, e.g. "story:*"
+            level: PermissionLevel
+        """
+        with self._acl_lock:
+            if pattern in self._patterns:
+                bit = self._patterns.index(pattern)
+            else:
+                bit = len(self._patterns)
+                self._patterns.append(pattern)
+                self._key_masks = {}
+            grants = self._grants.setdefault(agent, _Grants())
+            grants.levels[bit] = PermissionLevel(level)
+            grants.rebuild()
+
+    def revoke(self, agent: str, pattern: Optional[str] = None) -> None:
+        """Remove an agent's grant on `pattern`, or all of its grants"""
+        with self._acl_lock:
+            grants = self._grants.get(agent)
+            if grants is None:
+                return
+            if pattern is None:
+                del self._grants[agent]
+                return
+            if pattern in self._patterns:
+                grants.levels.pop(self._patterns.index(pattern), None)
+                grants.rebuild()
+
+    def level(self, agent: Optional[str], key: str) -> PermissionLevel:
+        """Effective access of `agent` to `key`"""
+        if agent is None:
+            return PermissionLevel.ADMIN
+        for level in reversed(PermissionLevel):
+            if self._allowed(agent, key, level):
+                return level
+        return PermissionLevel.NONE
+
+    def _allowed(self, agent: Optional[str], key: str, level: PermissionLevel) -> bool:
+        if agent is None or self.default_level >= level:
+            return True
+        grants = self._grants.get(agent)
+        if grants is None:
+            return False
+        mask = self._key_masks.get(key)
+        if mask is None:
+            mask = self._key_mask(key)
+        return bool(mask & grants.masks[level])
+
+    def _key_mask(self, key: str) -> int:
+        patterns, masks = self._patterns, self._key_masks
+        mask = 0
+        for bit, pattern in enumerate(patterns):
+            if fnmatch.fnmatchcase(key, pattern):
+                mask |= 1 << bit
+        if len(masks) < 100000:
+            masks[key] = mask
+        return mask
+
+    def _check(self, agent: Optional[str], key: str, level: PermissionLevel) -> None:
+        if not self._allowed(agent, key, level):
+            raise PermissionError(f"{agent} lacks {level.name} permission on {key!r}")
+
+    # ─────────────────────────────────────────────────────────────
+    # READS
+    # ─────────────────────────────────────────────────────────────
+
+    def get(self, key: str, default: Any = None, agent: Optional[str] = None) -> Any:
+        """Value of `key`, or `default` if missing or expired (requires READ)"""
+        self._check(agent, key, PermissionLevel.READ)
+        entry = self._live(key)
+        return default if entry is None else entry[0]
+
+    def __contains__(self, key: str) -> bool:
+        return self._live(key) is not None
+
+    def ttl(self, key: str, agent: Optional[str] = None) -> Optional[float]:
+        """Seconds until `key` expires (None if it never does or is missing)"""
+        self._check(agent, key, PermissionLevel.READ)
+        entry = self._live(key)
+        if entry is None or entry[1] is None:
+            return None
+        return max(entry[1] - time.time(), 0.0)
+
+    def keys(self, pattern: str = "*", agent: Optional[str] = None) -> List[str]:
+        """
+        Live keys matching a glob, in sorted order.
+
+        Keys the agent cannot READ are left out. The literal prefix of the
+        pattern (up to the first wildcard) is located in the sorted index,
+        so "story:*" only visits story keys.
+        """
+        return [key for key, _ in self._scan(pattern, agent)]
+
+    def scan(self, pattern: str = "*", agent: Optional[str] = None) -> Iterator[Tuple[str, Any]]:
+        """(key, value) pairs matching a glob, in key order (see `keys`)"""
+        for key, entry in self._scan(pattern, agent):
+            yield key, entry[0]
+
+    def _scan(self, pattern: str, agent: Optional[str]) -> Iterator[Tuple[str, Tuple[Any, Optional[float]]]]:
+        literal = _GLOB_CHARS.search(pattern)
+        prefix = pattern[:literal.start()] if literal else pattern
+        matcher = None if literal is None else _glob_regex(pattern).match
+        with self._index_lock:
+            start = bisect.bisect_left(self._index, prefix)
+            end = bisect.bisect_left(self._index, prefix + "\U0010ffff") if prefix else len(self._index)
+            candidates = self._index[start:end]
+
+        for key in candidates:
+            if matcher is None and key != pattern:
+                continue
+            if matcher is not None and not matcher(key):
+                continue
+            if not self._allowed(agent, key, PermissionLevel.READ):
+                continue
+            entry = self._live(key)
+            if entry is not None:
+                yield key, entry
+
+    def _live(self, key: str) -> Optional[Tuple[Any, Optional[float]]]:
+        shard = self._shard(key)
+        entry = shard.data.get(key)
+        if entry is not None and entry[1] is not None and entry[1] <= time.time():
+            with shard.lock:
+                if shard.data.get(key) is entry:
+                    self._remove(shard, key)
+            return None
+        return entry
+
+    # ─────────────────────────────────────────────────────────────
+    # WRITES
+    # ─────────────────────────────────────────────────────────────
+
+    def set(self, key: str, value: Any, ttl: Optional[float] = None, agent: Optional[str] = None) -> None:
+        """
+        Store a value (requires WRITE).
+
+        Args:
+            key: Key
+            value: Any codec-encodable value
+            ttl: Seconds until the key expires; None never expires
+            agent: Acting agent
+        """
+        self._check(agent, key, PermissionLevel.WRITE)
+        shard = self._shard(key)
+        with shard.lock:
+            self._store(shard, key, value, ttl)
+
+    def incr(self, key: str, amount: Union[int, float] = 1, ttl: Optional[float] = None,
+             agent: Optional[str] = None) -> Union[int, float]:
+        """
+        Atomically add to a numeric value (missing keys start at 0; requires WRITE).
+
+        Args:
+            ttl: Expiry to set; None keeps the key's current expiry
+
+        Returns:
+            The new value
+        """
+        self._check(agent, key, PermissionLevel.WRITE)
+        shard = self._shard(key)
+        with shard.lock:
+            entry = self._live_locked(shard, key)
+            current = 0 if entry is None else entry[0]
+            if not isinstance(current, (int, float)) or isinstance(current, bool):
+                raise TypeError(f"Cannot increment {key!r}: value is {type(current).__name__}")
+            value = current + amount
+            if ttl is None and entry is not None and entry[1] is not None:
+                ttl = entry[1] - time.time()
+            self._store(shard, key, value, ttl)
+            return value
+
+    def decr(self, key: str, amount: Union[int, float] = 1, ttl: Optional[float] = None,
+             agent: Optional[str] = None) -> Union[int, float]:
+        """Atomically subtract from a numeric value (see `incr`)"""
+        return self.incr(key, -amount, ttl, agent)
+
+    def cas(self, key: str, expected: Any, value: Any, ttl: Optional[float] = None,
+            agent: Optional[str] = None) -> bool:
+        """
+        Compare-and-set: store `value` only if the current value equals
+        `expected` (a missing key compares equal to None; requires WRITE).
+
+        Returns:
+            True if the value was stored
+        """
+        self._check(agent, key, PermissionLevel.WRITE)
+        shard = self._shard(key)
+        with shard.lock:
+            entry = self._live_locked(shard, key)
+            if (None if entry is None else entry[0]) != expected:
+                return False
+            self._store(shard, key, value, ttl)
+            return True
+
+    def delete(self, key: str, agent: Optional[str] = None) -> bool:
+        """Remove a key (requires ADMIN); returns whether it existed"""
+        self._check(agent, key, PermissionLevel.ADMIN)
+        shard = self._shard(key)
+        with shard.lock:
+            existed = self._live_locked(shard, key) is not None
+            self._remove(shard, key)
+        return existed
+
+    def suggest(self, key: str, value: Any, agent: str) -> None:
+        """Propose a value for a writer to review (requires SUGGEST)"""
+        self._check(agent, key, PermissionLevel.SUGGEST)
+        with self._lock:
+            self._suggestions.setdefault(key, []).append((agent, value))
+
+    def suggestions(self, key: str, agent: Optional[str] = None) -> List[Tuple[str, Any]]:
+        """Pending (agent, value) suggestions for `key` (requires READ)"""
+        self._check(agent, key, PermissionLevel.READ)
+        return list(self._suggestions.get(key, ()))
+
+    def _shard(self, key: str) -> _Shard:
+        return self._shards[hash(key) & self._shard_mask]
+
+    def _live_locked(self, shard: _Shard, key: str) -> Optional[Tuple[Any, Optional[float]]]:
+        entry = shard.data.get(key)
+        if entry is not None and entry[1] is not None and entry[1] <= time.time():
+            self._remove(shard, key)
+            return None
+        return entry
+
+    def _store(self, shard: _Shard, key: str, value: Any, ttl: Optional[float]) -> None:
+        # Caller holds shard.lock
+        if self.max_value_size is not None and self._conn is not None:
+            size = len(codec.pack(value))
+            if size > self.max_value_size:
+                raise ValueError(f"Value for {key!r} is {size} bytes (max {self.max_value_size})")
+        expires_at = None if ttl is None else time.time() + ttl
+        is_new = key not in shard.data
+        shard.data[key] = (value, expires_at)
+        if expires_at is not None:
+            heapq.heappush(shard.expiries, (expires_at, key))
+            if self._sweeper is None:
+                self._start_sweeper()
+        if is_new:
+            with self._index_lock:
+                bisect.insort(self._index, key)
+        self._mark_dirty(key)
+
+    def _remove(self, shard: _Shard, key: str) -> None:
+        # Caller holds shard.lock
+        if shard.data.pop(key, None) is None:
+            return
+        with self._index_lock:
+            i = bisect.bisect_left(self._index, key)
+            if i < len(self._index) and self._index[i] == key:
+                del self._index[i]
+        self._mark_dirty(key)
+
+    # ─────────────────────────────────────────────────────────────
+    # EXPIRY & PERSISTENCE
+    # ─────────────────────────────────────────────────────────────
+
+    def sweep(self) -> int:
+        """Remove expired keys now; returns how many were removed"""
+        removed = 0
+        now = time.time()
+        for shard in self._shards:
+            if not shard.expiries or shard.expiries[0][0] > now:
+                continue
+            with shard.lock:
+                while shard.expiries and shard.expiries[0][0] <= now:
+                    expires_at, key = heapq.heappop(shard.expiries)
+                    entry = shard.data.get(key)
+                    # Stale heap entries (key rewritten since) are skipped
+                    if entry is not None and entry[1] == expires_at:
+                        self._remove(shard, key)
+                        removed += 1
+        return removed
+
+    def flush(self) -> None:
+        """Write changed keys to SQLite (no-op without a path)"""
+        if self._conn is None:
+            return
+        with self._dirty_lock:
+            dirty, self._dirty = self._dirty, set()
+        if not dirty:
+            return
+        try:
+            upserts, deletes = [], []
+            for key in dirty:
+                entry = self._shard(key).data.get(key)
+                if entry is None:
+                    deletes.append((key,))
+                else:
+                    upserts.append((key, codec.pack(entry[0]), entry[1]))
+            with self._db_lock:
+                with self._conn:
+                    self._conn.executemany(
+                        "INSERT INTO context (key, value, expires_at) VALUES (?, ?, ?) "
+                        "ON CONFLICT(key) DO UPDATE SET value = excluded.value, expires_at = excluded.expires_at",
+                        upserts
+                    )
+                    self._conn.executemany("DELETE FROM context WHERE key = ?", deletes)
+        except Exception:
+            # Nothing was written: keep the keys for the next flush
+            with self._dirty_lock:
+                self._dirty |= dirty
+            raise
+
+    def close(self) -> None:
+        """Stop the sweeper and flush to SQLite"""
+        self._stop.set()
+        if self._sweeper is not None:
+            self._sweeper.join()
+        if self._conn is not None:
+            self.flush()
+            with self._db_lock:
+                self._conn.close()
+            self._conn = None
+
+    def __len__(self) -> int:
+        return len(self._index)
+
+    def __enter__(self) -> 'SharedContext':
+        return self
+
+    def __exit__(self, exc_type, exc, tb) -> None:
+        self.close()
+
+    def _mark_dirty(self, key: str) -> None:
+        if self._conn is not None:
+            with self._dirty_lock:
+                self._dirty.add(key)
+
+    def _open(self, path: Path) -> None:
+        path.parent.mkdir(parents=True, exist_ok=True)
+        self._conn = sqlite3.connect(str(path), check_same_thread=False)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute("PRAGMA synchronous=NORMAL")
+        self._conn.executescript(SCHEMA)
+        self._db_lock = threading.Lock()
+
+        now = time.time()
+        loaded = 0
+        rows = self._conn.execute("SELECT key, value, expires_at FROM context WHERE expires_at IS NULL OR expires_at > ?", (now,))
+        for key, value, expires_at in rows:
+            shard = self._shard(key)
+            shard.data[key] = (codec.unpack(value), expires_at)
+            if expires_at is not None:
+                heapq.heappush(shard.expiries, (expires_at, key))
+            loaded += 1
+        self._index = sorted(key for shard in self._shards for key in shard.data)
+        with self._conn:
+            self._conn.execute("DELETE FROM context WHERE expires_at IS NOT NULL AND expires_at <= ?", (now,))
+        if loaded:
+            logger.info(f"Loaded {loaded} context keys from {path}")
+
+    def _start_sweeper(self) -> None:
+        with self._lock:
+            if self._sweeper is not None:
+                return
+            # The thread holds a weak reference so an unused context can be collected
+            self._sweeper = threading.Thread(
+                target=_sweep_loop, args=(weakref.ref(self), self._stop, self.sweep_interval),
+                name="quad-context-sweep", daemon=True
+            )
+            self._sweeper.start()
+
+    def __repr__(self) -> str:
+        return f"<SharedContext(keys={len(self)}, shards={len(self._shards)})>"
+
+
+def _sweep_loop(ref: 'weakref.ref[SharedContext]', stop: threading.Event, interval: float) -> None:
+    while not stop.wait(interval):
+        context = ref()
+        if context is None:
+            return
+        try:
+            context.sweep()
+            context.flush()
+        except Exception as e:
+            logger.error(f"Context sweep failed: {e}")
+        del context
+
+
+_glob_cache: Dict[str, Any] = {}
+
+
+def _glob_regex(pattern: str) -> Any:
+    regex = _glob_cache.get(pattern)
+    if regex is None:
+        if len(_glob_cache) > 1024:
+            _glob_cache.clear()
+        regex = _glob_cache[pattern] = re.compile(fnmatch.translate(pattern))
+    return regex
@@ -0,0 +1,235 @@
+"""
+QUAD Shared Payloads
+====================
+
+Zero-copy handles for large agent payloads (parsed workbooks, codebase
+indexes, generated files, NumPy arrays).
+
+A SharedPayload lives in `multiprocessing.shared_memory`. Putting the
+handle in `AgentMessage.payload` passes it by reference in-process, and
+across SUMA WIRE (transport.py) only the segment name travels; the bytes
+are never copied.
+
+Lifetime is reference counted in the segment header. Every handle object
+owns one reference and releases it when closed or garbage-collected; the
+segment is unlinked when the last reference goes away.
+
+Copyright (c) 2026 Gopi Suman Addanke. All Rights Reserved.
+Patent Pending (63/956,810) - QUAD Platform
+"""
+
+import os
+import struct
+import tempfile
+import threading
+import uuid
+import weakref
+from contextlib import contextmanager
+from multiprocessing import shared_memory
+from typing import Any, Dict, Iterator, Optional
+
+from . import codec
+
+try:
+    import fcntl
+    HAS_FCNTL = True
+except ImportError:
+    HAS_FCNTL = False
+
+try:
+    import _posixshmem
+    HAS_POSIXSHMEM = True
+except ImportError:
+    HAS_POSIXSHMEM = False
+
+try:
+    import numpy as np
+    HAS_NUMPY = True
+except ImportError:
+    HAS_NUMPY = False
+
+# Segment layout: int64 reference count, then the data
+_HEADER = struct.Struct("q")
+
+# Serializes refcount updates across processes on this host
+_LOCK_PATH = os.path.join(tempfile.gettempdir(), "quad-shared-payload.lock")
+_thread_lock = threading.Lock()
+
+
+@contextmanager
+def _refcount_lock() -> Iterator[None]:
+    with _thread_lock:
+        if not HAS_FCNTL:
+            yield
+            return
+        with open(_LOCK_PATH, "a") as lock_file:
+            fcntl.flock(lock_file, fcntl.LOCK_EX)
+            yield
+
+
+def _open_segment(name: str, create: bool = False, size: int = 0) -> shared_memory.SharedMemory:
+    """Open a segment whose lifetime we manage ourselves (not the resource tracker)"""
+    try:
+        return shared_memory.SharedMemory(name=name, create=create, size=size, track=False)
+    except TypeError:  # Python < 3.13
+        segment = shared_memory.SharedMemory(name=name, create=create, size=size)
+        try:
+            from multiprocessing import resource_tracker
+            resource_tracker.unregister(segment._name, "shared_memory")
+        except Exception:
+            pass
+        return segment
+
+
+def _add_ref(segment: shared_memory.SharedMemory, delta: int) -> int:
+    with _refcount_lock():
+        (count,) = _HEADER.unpack_from(segment.buf, 0)
+        count += delta
+        _HEADER.pack_into(segment.buf, 0, count)
+        return count
+
+
+def _release(segment: shared_memory.SharedMemory) -> None:
+    """Drop one reference; unlink the segment when it was the last one"""
+    try:
+        remaining = _add_ref(segment, -1)
+    except (ValueError, TypeError):
+        return  # Mapping already closed
+    try:
+        segment.close()
+    except BufferError:
+        pass  # Views (e.g. NumPy arrays) still alive; unmapped when they go away
+    if remaining <= 0:
+        try:
+            if HAS_POSIXSHMEM:
+                # SharedMemory.unlink would unregister from the resource tracker again
+                _posixshmem.shm_unlink(segment._name)
+            else:
+                segment.unlink()
+        except FileNotFoundError:
+            pass
+
+
+class SharedPayload:
+    """
+    Handle to a buffer in shared memory.
+
+    Example:
+        blob = SharedPayload.from_bytes(workbook_bytes)
+        agent.talk_to_agent("Parser", "parse", {"workbook": blob})
+
+        # In the receiving agent (same or another process):
+        with input_data["workbook"].open() as view:
+            parse(view)
+    """
+
+    def __init__(self, segment: shared_memory.SharedMemory, size: int, metadata: Optional[Dict[str, Any]] = None):
+        """Use from_bytes / from_array / allocate instead"""
+        self._segment = segment
+        self.name = segment.name
+        self.size = size
+        self.metadata = metadata or {}
+        self._finalizer = weakref.finalize(self, _release, segment)
+
+    # ─────────────────────────────────────────────────────────────
+    # CREATION
+    # ─────────────────────────────────────────────────────────────
+
+    @classmethod
+    def allocate(cls, size: int, metadata: Optional[Dict[str, Any]] = None) -> 'SharedPayload':
+        """Create an uninitialized payload of `size` bytes to fill in place"""
+        name = f"quad_{uuid.uuid4().hex[:16]}"
+        segment = _open_segment(name, create=True, size=_HEADER.size + max(size, 1))
+        _HEADER.pack_into(segment.buf, 0, 1)
+        return cls(segment, size, metadata)
+
+    @classmethod
+    def from_bytes(cls, data: Any, metadata: Optional[Dict[str, Any]] = None) -> 'SharedPayload':
+        """Copy a bytes-like object into a new payload (the only copy made)"""
+        data = memoryview(data).cast("B")
+        payload = cls.allocate(data.nbytes, metadata)
+        payload._segment.buf[_HEADER.size:_HEADER.size + data.nbytes] = data
+        return payload
+
+    @classmethod
+    def from_array(cls, array: Any) -> 'SharedPayload':
+        """Copy a NumPy array into a new payload; rebuild it with `as_array`"""
+        if not HAS_NUMPY:
+            raise ImportError("numpy not installed. Run: pip install numpy")
+        array = np.ascontiguousarray(array)
+        return cls.from_bytes(array.reshape(-1).view(np.uint8), {
+            "dtype": array.dtype.str,
+            "shape": list(array.shape)
+        })
+
+    # ─────────────────────────────────────────────────────────────
+    # ACCESS
+    # ─────────────────────────────────────────────────────────────
+
+    @contextmanager
+    def open(self) -> Iterator[memoryview]:
+        """Borrow a zero-copy view of the data for the duration of the block"""
+        view = self._segment.buf[_HEADER.size:_HEADER.size + self.size]
+        try:
+            yield view
+        finally:
+            view.release()
+
+    def as_array(self) -> Any:
+        """Zero-copy NumPy array over the data (see from_array)"""
+        if not HAS_NUMPY:
+            raise ImportError("numpy not installed. Run: pip install numpy")
+        dtype = np.dtype(self.metadata.get("dtype", "|u1"))
+        return np.frombuffer(
+            self._segment.buf, dtype=dtype, count=self.size // dtype.itemsize, offset=_HEADER.size
+        ).reshape(self.metadata.get("shape", [-1]))
+
+    def to_bytes(self) -> bytes:
+        """Copy the data out"""
+        with self.open() as view:
+            return bytes(view)
+
+    @property
+    def refcount(self) -> int:
+        """Live references across all processes"""
+        return _HEADER.unpack_from(self._segment.buf, 0)[0]
+
+    # ─────────────────────────────────────────────────────────────
+    # LIFETIME
+    # ─────────────────────────────────────────────────────────────
+
+    def close(self) -> None:
+        """Release this handle's reference now instead of at garbage collection"""
+        self._finalizer()
+
+    @property
+    def closed(self) -> bool:
+        return not self._finalizer.alive
+
+    def __enter__(self) -> 'SharedPayload':
+        return self
+
+    def __exit__(self, exc_type, exc, tb) -> None:
+        self.close()
+
+    def _export(self) -> Dict[str, Any]:
+        """Encode for another process, handing it a reference of its own"""
+        _add_ref(self._segment, 1)
+        return {"name": self.name, "size": self.size, "metadata": self.metadata}
+
+    @classmethod
+    def _adopt(cls, state: Dict[str, Any]) -> 'SharedPayload':
+        """Attach to an exported payload, taking over the exported reference"""
+        return cls(_open_segment(state["name"]), state["size"], state["metadata"])
+
+    def __reduce__(self):
+        # Pickling (e.g. multiprocessing queues/pools) transfers a reference too
+        return SharedPayload._adopt, (self._export(),)
+
+    def __repr__(self) -> str:
+        state = "closed" if self.closed else f"refs={self.refcount}"
+        return f"<SharedPayload(name={self.name}, size={self.size}, {state})>"
+
+
+# Carry handles (not bytes) across SUMA WIRE
+codec.register_type("shared_payload", SharedPayload, SharedPayload._export, SharedPayload._adopt)
@@ -0,0 +1,173 @@
+"""
+QUAD Agent Snapshots
+====================
+
+Checkpoint an agent tree to disk and warm-restore it after a restart,
+without re-running the logic that generated it.
+
+A snapshot records, per agent: config, class, generating spec, state and
+metrics summary. Two encodings:
+- binary: zlib-compressed wire codec (compact, fast; the default)
+- json: indented JSON for debugging (files ending in .json)
+
+Agents built from specs (generate_sub_agent_from_spec / generate_sub_agents
+/ catalog specs) are rebuilt from their spec. Other agents are rebuilt from
+their class and config. Sub-agents made with a bare `execute_fn` cannot be
+restored, because a function is not data; they are skipped with a warning.
+
+Copyright (c) 2026 Gopi Suman Addanke. All Rights Reserved.
+Patent Pending (63/956,810) - QUAD Platform
+"""
+
+import dataclasses
+import importlib
+import json
+import logging
+import os
+import zlib
+from pathlib import Path
+from typing import Any, Dict, Optional, Type, Union
+
+from . import codec
+from .quad_agent import AgentConfig, AgentState, DynamicAgent, QUADAgent
+
+logger = logging.getLogger("QUADAgent.Snapshot")
+
+SNAPSHOT_VERSION = 1
+
+# Prefix of binary snapshots: magic + format version
+_MAGIC = b"QSNP"
+
+
+def snapshot_tree(agent: Any) -> Dict[str, Any]:
+    """
+    Plain-data snapshot of an agent and its descendants.
+
+    Unchanged subtrees are served from cache (see QUADAgent.mark_dirty),
+    so repeated checkpoints only pay for what changed.
+    """
+    cached = agent._cache.get("snapshot")
+    if cached is None:
+        cls = type(agent)
+        cached = agent._cache["snapshot"] = {
+            "class": f"{cls.__module__}:{cls.__qualname__}",
+            "config": dataclasses.asdict(agent.config),
+            "spec": agent._spec,
+            "state": agent.state.value,
+            "metrics": dict(agent._metrics),
+            "children": [snapshot_tree(child) for child in agent.children]
+        }
+    return cached
+
+
+def dumps_snapshot(agent: Any, format: str = "binary") -> bytes:
+    """
+    Encode an agent tree.
+
+    Args:
+        agent: Root of the tree
+        format: "binary" or "json"
+    """
+    document = {"version": SNAPSHOT_VERSION, "root": snapshot_tree(agent)}
+    if format == "json":
+        return json.dumps(document, indent=2, default=str).encode("utf-8")
+    if format != "binary":
+        raise ValueError(f"Unknown snapshot format: {format}")
+    return _MAGIC + bytes([SNAPSHOT_VERSION]) + zlib.compress(codec.pack(document), 1)
+
+
+def loads_snapshot(data: bytes, types: Optional[Dict[str, Type]] = None) -> Any:
+    """
+    Rebuild an agent tree from `dumps_snapshot` output (either format).
+
+    Args:
+        data: Encoded snapshot
+        types: Classes by name ("module:QualName" or bare class name) for
+            agents whose class cannot be imported (e.g. defined in __main__)
+
+    Returns:
+        The restored root agent (registered for SUMA WIRE, like any agent)
+    """
+    if data[:len(_MAGIC)] == _MAGIC:
+        version = data[len(_MAGIC)]
+        if version > SNAPSHOT_VERSION:
+            raise ValueError(f"Snapshot version {version} is newer than supported ({SNAPSHOT_VERSION})")
+        document = codec.unpack(zlib.decompress(data[len(_MAGIC) + 1:]))
+    else:
+        document = json.loads(data)
+
+    types = types or {}
+    # Nothing is in flight after a restart
+    settled = {AgentState.COMPLETED, AgentState.FAILED}
+
+    def restore(node: Dict[str, Any], parent: Any = None) -> Any:
+        config = AgentConfig(**node["config"])
+        spec = node["spec"]
+        if spec is not None:
+            agent_class, _, execute_fn, pretext = QUADAgent._prepare_spec(spec)
+            agent = agent_class(config=config, execute_fn=execute_fn, pretext=pretext)
+            agent._spec = spec
+        else:
+            agent_class = _resolve_class(node["class"], types)
+            if agent_class is None or issubclass(agent_class, DynamicAgent):
+                logger.warning(f"Cannot restore {config.name} ({node['class']}): no spec or importable class, skipped")
+                return None
+            agent = agent_class(config=config)
+
+        state = AgentState(node["state"])
+        agent._metrics = dict(node["metrics"])
+        agent.state = state if state in settled else AgentState.IDLE
+        if parent is not None:
+            agent.parent = parent
+            parent.children.append(agent)
+        for child in node["children"]:
+            restore(child, agent)
+        return agent
+
+    return restore(document["root"])
+
+
+def save_snapshot(agent: Any, path: Union[str, Path], format: Optional[str] = None) -> Path:
+    """
+    Write a snapshot atomically (a crash never leaves a partial file).
+
+    Args:
+        agent: Root of the tree
+        path: Destination file
+        format: "binary" or "json"; defaults to json for *.json paths
+    """
+    path = Path(path)
+    if format is None:
+        format = "json" if path.suffix == ".json" else "binary"
+    data = dumps_snapshot(agent, format)
+
+    path.parent.mkdir(parents=True, exist_ok=True)
+    tmp = path.with_name(f".{path.name}.tmp")
+    with open(tmp, "wb") as f:
+        f.write(data)
+        f.flush()
+        os.fsync(f.fileno())
+    os.replace(tmp, path)
+    return path
+
+
+def load_snapshot(path: Union[str, Path], types: Optional[Dict[str, Type]] = None) -> Any:
+    """Restore an agent tree written by `save_snapshot`"""
+    return loads_snapshot(Path(path).read_bytes(), types)
+
+
+def _resolve_class(name: str, types: Dict[str, Type]) -> Optional[Type]:
+    if name in types:
+        return types[name]
+    module_name, _, qualname = name.partition(":")
+    if qualname in types:
+        return types[qualname]
+    if "<locals>" in qualname:
+        return None
+    try:
+        target = importlib.import_module(module_name)
+        for attr in qualname.split("."):
+            target = getattr(target, attr)
+        return target
+    except (ImportError, AttributeError):
+        return None
@@ -0,0 +1,347 @@
+"""
+QUAD Agent Supervisor
+=====================
+
+Health monitor for the agent tree (QUAD_AGENT_ARCHITECTURE.md, "Health
+Monitor"): detects invocations stuck in RUNNING or HEALING and restarts
+the agents running them.
+
+How it works:
+- Every invocation is put on a timer wheel at the time it would count as
+  stalled. One thread advances the wheel, so watching costs an O(1)
+  insert per call, not a thread or a timer per agent.
+- An invocation is stalled when it has not beaten (QUADAgent.heartbeat,
+  also implicit at start and between retries) for longer than its
+  agent's expected latency allows: `stall_factor` x average run time,
+  at least `min_stall`, at most the invocation's timeout. Agents without
+  history get the timeout.
+- A stalled agent is replaced by a fresh instance (QUADAgent.respawn) that
+  takes its name, place in the tree, children and subscriptions, so new
+  messages go to the replacement at once. one_for_one replaces only the
+  stalled agent; one_for_all replaces it and all of its siblings.
+  Replaced top-level agents are kept alive in `Supervisor.replacements`
+  until they are unregistered (or replaced again).
+- Replaced instances drain: their healthy in-flight calls may finish for
+  `drain_timeout` seconds, then they are cancelled. Stalled calls are
+  cancelled at once. Python threads cannot be killed, so cancellation is
+  cooperative: the next heartbeat() raises AgentStalledError, and waits
+  that make no progress should poll `self.context.cancelled`.
+- Restarts are rate-limited per agent (`max_restarts` per
+  `restart_window`); past that the supervisor stops restarting it.
+
+Example:
+    with Supervisor(root=orchestrator, strategy="one_for_one"):
+        orchestrator.run({...})
+
+Copyright (c) 2026 Gopi Suman Addanke. All Rights Reserved.
+Patent Pending (63/956,810) - QUAD Platform
+"""
+
+import logging
+import threading
+import time
+from collections import deque
+from typing import Any, Deque, Dict, List, Optional, Tuple
+
+from .quad_agent import ExecutionContext, QUADAgent
+
+logger = logging.getLogger("QUADAgent.Supervisor")
+
+ONE_FOR_ONE = "one_for_one"
+ONE_FOR_ALL = "one_for_all"
+
+# Runs averaged before an agent's own latency replaces its timeout
+_MIN_HISTORY = 5
+
+
+class TimerWheel:
+    """
+    Hashed timer wheel: O(1) scheduling; advancing costs O(due timers)
+    plus one visit per elapsed tick. Deadlines further away than one turn
+    of the wheel stay in their slot until a later turn.
+    """
+
+    def __init__(self, tick: float = 0.05, slots: int = 512):
+        """
+        Args:
+            tick: Seconds per slot (timer resolution)
+            slots: Slots per turn of the wheel
+        """
+        self.tick = tick
+        self._slots: List[List[Tuple[float, Any]]] = [[] for _ in range(slots)]
+        self._current = int(time.monotonic() / tick)
+        self._lock = threading.Lock()
+        self._size = 0
+
+    def schedule(self, deadline: float, item: Any) -> None:
+        """Fire `item` once time.monotonic() reaches `deadline`"""
+        with self._lock:
+            index = max(int(deadline / self.tick), self._current + 1)
+            self._slots[index % len(self._slots)].append((deadline, item))
+            self._size += 1
+
+    def advance(self, now: float) -> List[Any]:
+        """Items whose deadline is at or before `now`"""
+        due = []
+        with self._lock:
+            # A slot is processed once its whole tick has passed, so every
+            # deadline in it is due
+            target = int(now / self.tick) - 1
+            for step in range(1, min(target - self._current, len(self._slots)) + 1):
+                index = (self._current + step) % len(self._slots)
+                slot = self._slots[index]
+                if not slot:
+                    continue
+                keep = []
+                for entry in slot:
+                    (due if entry[0] <= now else keep).append(entry)
+                self._slots[index] = keep
+            self._current = max(self._current, target)
+            self._size -= len(due)
+        return [item for _, item in due]
+
+    def __len__(self) -> int:
+        return self._size
+
+
+class Supervisor:
+    """
+    Watches agent invocations and restarts agents that wedge (see module
+    docstring).
+    """
+
+    def __init__(
+        self,
+        root: Optional[QUADAgent] = None,
+        strategy: str = ONE_FOR_ONE,
+        tick: float = 0.05,
+        stall_factor: float = 10.0,
+        min_stall: float = 1.0,
+        drain_timeout: float = 5.0,
+        max_restarts: int = 5,
+        restart_window: float = 60.0
+    ):
+        """
+        Args:
+            root: Supervise this agent and its descendants (None = all agents)
+            strategy: "one_for_one" or "one_for_all"
+            tick: Timer wheel resolution in seconds
+            stall_factor: Silence allowed, as a multiple of average run time
+            min_stall: Lower bound on allowed silence (seconds)
+            drain_timeout: Seconds replaced agents may finish healthy calls
+            max_restarts: Restarts allowed per agent within `restart_window`
+            restart_window: Seconds over which restarts are counted
+        """
+        if strategy not in (ONE_FOR_ONE, ONE_FOR_ALL):
+            raise ValueError(f"Unknown restart strategy: {strategy}")
+        self.root = root
+        self.strategy = strategy
+        self.stall_factor = stall_factor
+        self.min_stall = min_stall
+        self.drain_timeout = drain_timeout
+        self.max_restarts = max_restarts
+        self.restart_window = restart_window
+
+        self._wheel = TimerWheel(tick)
+        self._draining: List[Tuple[QUADAgent, float]] = []
+        self._restarts: Dict[str, Deque[float]] = {}
+        # Replacements of top-level agents: there is no parent to own them,
+        # so they are held here while they are registered
+        self.replacements: Dict[str, QUADAgent] = {}
+        self._lock = threading.Lock()
+        self._stop = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+        self.stalls = 0
+        self.restarts = 0
+        self.given_up = 0
+
+    # ─────────────────────────────────────────────────────────────
+    # LIFECYCLE
+    # ─────────────────────────────────────────────────────────────
+
+    def start(self) -> 'Supervisor':
+        """Start the monitor thread and install as QUADAgent's supervisor"""
+        if self._thread is None:
+            self._stop.clear()
+            self._thread = threading.Thread(target=self._loop, name="quad-supervisor", daemon=True)
+            self._thread.start()
+        QUADAgent.set_supervisor(self)
+        return self
+
+    def stop(self) -> None:
+        """Stop watching (replaced agents still draining are left to finish)"""
+        if QUADAgent._supervisor is self:
+            QUADAgent.set_supervisor(None)
+        self._stop.set()
+        if self._thread is not None:
+            self._thread.join()
+            self._thread = None
+
+    def __enter__(self) -> 'Supervisor':
+        return self.start()
+
+    def __exit__(self, exc_type, exc, tb) -> None:
+        self.stop()
+
+    # ─────────────────────────────────────────────────────────────
+    # WATCHING
+    # ─────────────────────────────────────────────────────────────
+
+    def watch(self, context: ExecutionContext) -> None:
+        """Track an invocation (called by QUADAgent when it starts)"""
+        if self.root is not None and not self._supervises(context.agent):
+            return
+        self._wheel.schedule(context.last_beat + self.stall_after(context), context)
+
+    def stall_after(self, context: ExecutionContext) -> float:
+        """Seconds an invocation may go without a heartbeat"""
+        metrics = context.agent._metrics
+        if metrics["executions"] < _MIN_HISTORY:
+            return float(context.timeout)
+        expected = metrics["total_time"] / metrics["executions"]
+        return min(float(context.timeout), max(self.min_stall, expected * self.stall_factor))
+
+    def stats(self) -> Dict[str, Any]:
+        """Watched invocations, stalls detected, restarts performed"""
+        return {
+            "watched": len(self._wheel),
+            "stalls": self.stalls,
+            "restarts": self.restarts,
+            "given_up": self.given_up,
+            "draining": len(self._draining)
+        }
+
+    def _supervises(self, agent: QUADAgent) -> bool:
+        node = agent
+        while node is not None:
+            if node is self.root:
+                return True
+            node = node.parent
+        return False
+
+    def _loop(self) -> None:
+        while not self._stop.wait(self._wheel.tick):
+            now = time.monotonic()
+            for context in self._wheel.advance(now):
+                try:
+                    self._check(context, now)
+                except Exception as e:
+                    logger.error(f"Supervising {context.agent.qualified_name} failed: {e}")
+            if self._draining:
+                self._drain(now)
+            if self.replacements:
+                self._release_replacements()
+
+    def _check(self, context: ExecutionContext, now: float) -> None:
+        agent = context.agent
+        if context.cancelled or agent._contexts.get(context.id) is not context:
+            return  # Finished or already given up on
+        deadline = context.last_beat + self.stall_after(context)
+        if deadline > now:
+            self._wheel.schedule(deadline, context)  # Beat since it was scheduled
+            return
+
+        self.stalls += 1
+        context.cancelled = True
+        logger.warning(f"Agent {agent.qualified_name} stalled: no heartbeat for "
+                       f"{now - context.last_beat:.1f}s while {context.state.value}")
+        if QUADAgent._agent_registry.get(agent.qualified_name) is not agent:
+            return  # Already replaced (or unregistered); its other calls are draining
+
+        parent = agent.parent
+        if self.strategy == ONE_FOR_ALL and parent is not None:
+            targets = list(parent.children)
+        else:
+            targets = [agent]
+        for target in targets:
+            self._restart(target, now)
+
+    # ─────────────────────────────────────────────────────────────
+    # RESTARTS
+    # ─────────────────────────────────────────────────────────────
+
+    def _restart(self, agent: QUADAgent, now: float) -> Optional[QUADAgent]:
+        history = self._restarts.setdefault(agent.qualified_name, deque())
+        while history and history[0] <= now - self.restart_window:
+            history.popleft()
+        if len(history) >= self.max_restarts:
+            self.given_up += 1
+            logger.error(f"Agent {agent.qualified_name} restarted {len(history)} times in "
+                         f"{self.restart_window:.0f}s; not restarting again")
+            return None
+
+        registry = QUADAgent._agent_registry
+        try:
+            # The replacement takes over the registry key in one step, so
+            # messages never find the agent missing
+            with registry.replacing():
+                replacement = agent.respawn()
+        except Exception as e:
+            logger.error(f"Cannot restart {agent.qualified_name}: {e}")
+            return None
+
+        if agent.parent is None:
+            self.replacements[replacement.qualified_name] = replacement
+        self._transplant(agent, replacement)
+        history.append(now)
+        self.restarts += 1
+        with self._lock:
+            self._draining.append((agent, now + self.drain_timeout))
+        logger.info(f"Agent {agent.qualified_name} restarted "
+                    f"({len(agent.active_contexts())} in-flight calls draining)")
+        return replacement
+
+    @staticmethod
+    def _transplant(old: QUADAgent, new: QUADAgent) -> None:
+        """Move tree position, children, spec, metrics and subscriptions to `new`"""
+        parent = old.parent
+        if parent is not None and old in parent.children:
+            parent.children[parent.children.index(old)] = new
+            new.parent = parent
+            parent.mark_dirty()
+        old.parent = None
+
+        new.children, old.children = old.children, []
+        for child in new.children:
+            child.parent = new
+        new._spec = old._spec
+        new._metrics = dict(old._metrics)
+
+        for subscription in old._subscriptions:
+            handler = subscription._handler_ref()
+            subscription.cancel()
+            if handler is None:
+                continue
+            if getattr(handler, "__self__", None) is old:
+                handler = handler.__func__.__get__(new)
+            new.subscribe(subscription.pattern, handler, subscription.maxsize, subscription.overflow)
+        old._subscriptions.clear()
+        new.mark_dirty()
+
+    def _drain(self, now: float) -> None:
+        with self._lock:
+            draining, self._draining = self._draining, []
+        still = []
+        for agent, deadline in draining:
+            active = agent.active_contexts()
+            if not active:
+                continue
+            if now >= deadline:
+                for context in active:
+                    context.cancelled = True
+                logger.warning(f"Agent {agent.qualified_name}: cancelled {len(active)} calls "
+                               f"still running after {self.drain_timeout:.0f}s drain")
+                continue
+            still.append((agent, deadline))
+        with self._lock:
+            self._draining.extend(still)
+
+    def _release_replacements(self) -> None:
+        """Stop holding replacements that no longer own their registry key"""
+        registry = QUADAgent._agent_registry
+        for name, agent in list(self.replacements.items()):
+            if registry.get(name) is not agent:
+                del self.replacements[name]
+
+    def __repr__(self) -> str:
+        return f"<Supervisor({self.strategy}, restarts={self.restarts}, stalls={self.stalls})>"
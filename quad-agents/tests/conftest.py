@@ -0,0 +1,50 @@
+"""
+Shared fixtures for the quad-agents tests.
+
+The package directory has a hyphen in its name, so modules are imported
+by path (as the benchmarks do): `load("registry")`.
+
+Copyright (c) 2026 Gopi Suman Addanke. All Rights Reserved.
+"""
+
+import importlib
+import sys
+from pathlib import Path
+
+import pytest
+
+ROOT = Path(__file__).resolve().parents[2]
+if str(ROOT) not in sys.path:
+    sys.path.insert(0, str(ROOT))
+
+
+def load(module: str):
+    """Import quad-agents.<module>"""
+    return importlib.import_module(f"quad-agents.{module}")
+
+
+@pytest.fixture
+def quad_agent():
+    """The quad_agent module, with an empty global agent registry"""
+    module = load("quad_agent")
+    module.QUADAgent._agent_registry.clear()
+    yield module
+    module.QUADAgent._agent_registry.clear()
+
+
+@pytest.fixture
+def echo_agent(quad_agent):
+    """Factory for a minimal agent that echoes its input"""
+
+    class EchoAgent(quad_agent.QUADAgent):
+        def execute_task(self, input_data: dict) -> dict:
+            return {"echo": input_data}
+
+        def _get_pretext(self) -> str:
+            return "# PRETEXT: EchoAgent"
+
+    def make(name: str = "Echo", namespace: str = "", **config):
+        config.setdefault("enable_logging", False)
+        return EchoAgent(quad_agent.AgentConfig(name=name, namespace=namespace, **config))
+
+    return make
@@ -0,0 +1,172 @@
+"""
+Tests for the lazy agent catalog: build on first use, idle eviction and
+rebuild.
+
+Copyright (c) 2026 Gopi Suman Addanke. All Rights Reserved.
+"""
+
+import threading
+import time
+
+import pytest
+
+from conftest import load
+
+quad_agent_module = load("quad_agent")
+AgentCatalog = load("catalog").AgentCatalog
+
+BUILT = []
+
+
+class CountingAgent(quad_agent_module.QUADAgent):
+    """Records every construction; blocks while input has a "gate" event"""
+
+    def __init__(self, config=None):
+        super().__init__(config)
+        BUILT.append(self)
+
+    def execute_task(self, input_data: dict) -> dict:
+        if "gate" in input_data:
+            input_data["started"].set()
+            input_data["gate"].wait(10)
+        return {"by": self.name}
+
+    def _get_pretext(self) -> str:
+        return "# PRETEXT: CountingAgent"
+
+
+@pytest.fixture
+def catalog(quad_agent, monkeypatch):
+    """A fresh catalog installed on QUADAgent"""
+    BUILT.clear()
+    catalog = AgentCatalog(idle_timeout=60, sweep_interval=3600)
+    monkeypatch.setattr(quad_agent.QUADAgent, "_agent_catalog", catalog)
+    yield catalog
+    for name in catalog.names():
+        catalog.unregister(name)
+
+
+# ─────────────────────────────────────────────────────────────
+# Lazy build
+# ─────────────────────────────────────────────────────────────
+
+def test_register_does_not_build(catalog, quad_agent):
+    catalog.register("Worker", CountingAgent, enable_logging=False)
+    assert "Worker" in catalog and not catalog.is_built("Worker")
+    assert BUILT == [] and quad_agent.QUADAgent.get_registered_agents() == []
+
+
+def test_first_message_builds_once(catalog, echo_agent):
+    catalog.register("Worker", CountingAgent, namespace="acme", enable_logging=False, max_retries=0)
+    caller = echo_agent("Caller", namespace="acme/suma")
+
+    for _ in range(3):
+        result = caller.talk_to_agent("Worker", "work", {})
+        assert result.success and result.data == {"by": "Worker"}
+    assert len(BUILT) == 1 and catalog.is_built("Worker", "acme")
+    assert BUILT[0].qualified_name == "acme/Worker" and BUILT[0].config.max_retries == 0
+
+
+def test_concurrent_first_calls_build_once(catalog):
+    catalog.register("Worker", CountingAgent, enable_logging=False)
+    barrier = threading.Barrier(8)
+    found = []
+
+    def get():
+        barrier.wait()
+        found.append(catalog.get("Worker"))
+
+    threads = [threading.Thread(target=get) for _ in range(8)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    assert len(BUILT) == 1 and all(agent is BUILT[0] for agent in found)
+
+
+def test_import_path_and_spec_targets(catalog):
+    catalog.register("Imported", f"{__name__}:CountingAgent", enable_logging=False)
+    catalog.register("Scorer", {"purpose": "Score stories", "capabilities": ["score"]}, enable_logging=False)
+    catalog.register("Broken", "no_colon_here")
+
+    assert isinstance(catalog.get("Imported"), CountingAgent)
+    scorer = catalog.get("Scorer")
+    assert scorer.capabilities == ("score",) and "# PRETEXT: Scorer" in scorer._get_pretext()
+    with pytest.raises(ValueError, match="Invalid agent import path"):
+        catalog.get("Broken")
+    assert catalog.get("Missing") is None
+
+
+# ─────────────────────────────────────────────────────────────
+# Eviction & rebuild
+# ─────────────────────────────────────────────────────────────
+
+def test_idle_agent_is_evicted_and_rebuilt(catalog, quad_agent):
+    catalog.register("Worker", CountingAgent, enable_logging=False)
+    first = catalog.get("Worker")
+
+    assert catalog.evict_idle(now=time.monotonic() + 30) == []
+    assert catalog.evict_idle(now=time.monotonic() + 61) == ["Worker"]
+    assert not catalog.is_built("Worker")
+    assert quad_agent.QUADAgent._agent_registry.get("Worker") is None
+
+    second = catalog.get("Worker")
+    assert second is not first and len(BUILT) == 2
+    assert quad_agent.QUADAgent._agent_registry.get("Worker") is second
+
+
+def test_routed_messages_keep_an_agent_alive(catalog, echo_agent):
+    catalog.register("Worker", CountingAgent, enable_logging=False)
+    caller = echo_agent("Caller")
+    caller.talk_to_agent("Worker", "work", {})
+    catalog._entries["Worker"].last_used -= 50
+
+    caller.talk_to_agent("Worker", "work", {})  # Resolved through the registry: touch()
+    assert catalog.evict_idle(now=time.monotonic() + 30) == []
+
+
+def test_agent_running_a_call_is_not_evicted(catalog, quad_agent, echo_agent):
+    catalog.register("Worker", CountingAgent, enable_logging=False)
+    caller = echo_agent("Caller")
+    gate, started = threading.Event(), threading.Event()
+    results = []
+    thread = threading.Thread(target=lambda: results.append(
+        caller.talk_to_agent("Worker", "work", {"gate": gate, "started": started})))
+    thread.start()
+    assert started.wait(10)
+
+    # The call has outlived idle_timeout
+    assert catalog.evict_idle(now=time.monotonic() + 120) == []
+    assert quad_agent.QUADAgent._agent_registry.get("Worker") is BUILT[0]
+
+    gate.set()
+    thread.join(10)
+    assert results[0].success
+    # Idle time restarted when the busy agent was seen
+    assert catalog.evict_idle(now=time.monotonic() + 150) == []
+    assert catalog.evict_idle(now=time.monotonic() + 190) == ["Worker"]
+
+
+def test_evicting_a_replaced_agent_keeps_its_replacement(catalog, quad_agent):
+    catalog.register("Worker", CountingAgent, enable_logging=False)
+    old = catalog.get("Worker")
+    with quad_agent.QUADAgent._agent_registry.replacing():
+        new = old.respawn()
+
+    assert catalog.evict_idle(now=time.monotonic() + 61) == ["Worker"]
+    assert quad_agent.QUADAgent._agent_registry.get("Worker") is new
+
+
+def test_unregister_releases_the_agent(catalog, quad_agent):
+    catalog.register("Worker", CountingAgent, enable_logging=False)
+    catalog.get("Worker")
+    assert catalog.unregister("Worker")
+    assert not catalog.unregister("Worker")
+    assert "Worker" not in catalog and quad_agent.QUADAgent._agent_registry.get("Worker") is None
+
+
+def test_no_eviction_without_timeout(catalog):
+    catalog.idle_timeout = None
+    catalog.register("Worker", CountingAgent, enable_logging=False)
+    catalog.get("Worker")
+    assert catalog.evict_idle(now=time.monotonic() + 10 ** 6) == []
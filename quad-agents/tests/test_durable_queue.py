@@ -0,0 +1,241 @@
+"""
+Tests for the durable message queue: acks, redelivery, dead-lettering,
+dedup and group commit.
+
+Copyright (c) 2026 Gopi Suman Addanke. All Rights Reserved.
+"""
+
+import sqlite3
+import threading
+import time
+from datetime import datetime
+from multiprocessing import shared_memory
+
+import pytest
+
+from conftest import load
+
+DurableQueue = load("durable_queue").DurableQueue
+AgentMessage = load("quad_agent").AgentMessage
+SharedPayload = load("shared_payload").SharedPayload
+
+
+@pytest.fixture
+def open_queue(tmp_path):
+    """Factory for queues on one database file, closed at teardown"""
+    queues = []
+
+    def make(**options):
+        queue = DurableQueue(tmp_path / "wire.db", **options)
+        queues.append(queue)
+        return queue
+
+    yield make
+    for queue in queues:
+        if queue._flusher.is_alive():
+            queue.close()
+
+
+def message(**payload):
+    return AgentMessage(from_agent="Caller", to_agent="Worker", action="work", payload=payload)
+
+
+def stored(queue):
+    """Rows on disk, read through a connection of their own"""
+    with sqlite3.connect(str(queue.path)) as conn:
+        return dict(conn.execute("SELECT id, status FROM messages").fetchall())
+
+
+# ─────────────────────────────────────────────────────────────
+# Delivery
+# ─────────────────────────────────────────────────────────────
+
+def test_put_wait_commits_and_get_decodes(open_queue):
+    queue = open_queue()
+    sent = message(due=datetime(2026, 10, 19, 9, 30), tags=("a", "b"))
+    queue.put(sent, wait=True)
+    assert stored(queue) == {sent.id: "pending"}
+
+    (claimed,) = queue.get()
+    assert claimed.attempts == 1
+    assert claimed.message == sent
+    assert queue.get() == []  # Invisible while claimed
+
+
+def test_ack(open_queue):
+    queue = open_queue(visibility_timeout=0)
+    first, second = message(n=1), message(n=2)
+    queue.put_many([first, second], wait=True)
+
+    queue.ack([m.message.id for m in queue.get()])
+    assert queue.get() == []
+    assert queue.stats() == {"pending": 0, "acked": 2, "dead": 0, "buffered": 0}
+
+
+def test_unacked_message_is_redelivered_after_visibility_timeout(open_queue):
+    queue = open_queue(visibility_timeout=0.05)
+    sent = message()
+    queue.put(sent, wait=True)
+
+    assert [m.attempts for m in queue.get()] == [1]
+    assert queue.get() == []
+    time.sleep(0.06)
+    assert [(m.message.id, m.attempts) for m in queue.get()] == [(sent.id, 2)]
+
+
+def test_dead_letter_after_max_retries(open_queue):
+    queue = open_queue(max_retries=1)
+    sent = message()
+    queue.put(sent, wait=True)
+
+    for attempt in (1, 2):
+        (claimed,) = queue.get()
+        assert claimed.attempts == attempt
+        queue.nack(sent.id, f"failed {attempt}")
+    assert queue.get() == []
+    assert queue.dead_letters() == [{"id": sent.id, "to_agent": "Worker", "attempts": 2,
+                                     "last_error": "failed 2"}]
+
+    queue.requeue_dead([sent.id])
+    assert [m.attempts for m in queue.get()] == [1]
+
+
+def test_timed_out_deliveries_are_dead_lettered(open_queue):
+    queue = open_queue(visibility_timeout=0, max_retries=1)
+    queue.put(message(), wait=True)
+    assert len(queue.get()) == 1 and len(queue.get()) == 1
+    assert queue.get() == []
+    assert queue.dead_letters()[0]["last_error"] == "visibility timeout exceeded"
+
+
+def test_resent_message_is_ignored(open_queue):
+    queue = open_queue()
+    sent = message()
+    queue.put(sent, wait=True)
+    queue.put(sent, wait=True)
+    (claimed,) = queue.get()
+    queue.ack(claimed.message.id)
+
+    queue.put(sent, wait=True)  # Also after it was delivered
+    assert queue.get() == []
+    assert stored(queue) == {sent.id: "acked"}
+
+
+def test_pending_messages_survive_a_restart(open_queue):
+    queue = open_queue()
+    sent = message()
+    queue.put(sent)
+    queue.close()  # Flushes the buffer
+
+    (claimed,) = open_queue().get()
+    assert claimed.message == sent
+
+
+def test_deliver_routes_to_agents(open_queue):
+    queue = open_queue(visibility_timeout=0, max_retries=0)
+    received = []
+
+    class Worker:
+        def receive_message(self, msg):
+            received.append(msg.payload)
+            return load("quad_agent").AgentResult(success=msg.payload["ok"], error="nope")
+
+    agents = {"Worker": Worker()}
+    queue.put_many([message(ok=True), message(ok=False)], wait=True)
+    assert queue.deliver(resolver=agents.get) == 1
+    assert received == [{"ok": True}, {"ok": False}]
+    assert queue.get() == []
+    assert [d["last_error"] for d in queue.dead_letters()] == ["nope"]
+
+
+# ─────────────────────────────────────────────────────────────
+# Group commit
+# ─────────────────────────────────────────────────────────────
+
+def test_waiters_wake_only_once_their_generation_is_committed(open_queue, monkeypatch):
+    queue = open_queue(flush_interval=3600)  # Only the flushes below
+    entered, gate = threading.Event(), threading.Event()
+
+    class StallFirstWrite:
+        """The first flush stalls after taking its rows, before writing them"""
+
+        def __init__(self, lock):
+            self.lock = lock
+
+        def __enter__(self):
+            if not entered.is_set():
+                entered.set()
+                gate.wait(10)
+            self.lock.acquire()
+
+        def __exit__(self, *exc):
+            self.lock.release()
+
+    monkeypatch.setattr(queue, "_db_lock", StallFirstWrite(queue._db_lock))
+    first, second = message(n=1), message(n=2)
+    waiter = threading.Thread(target=queue.put, args=(first,), kwargs={"wait": True})
+    waiter.start()
+    while not queue._buffer:
+        time.sleep(0.001)
+
+    flushes = [threading.Thread(target=queue.flush)]
+    flushes[0].start()  # Takes the first message, then stalls
+    assert entered.wait(10)
+    queue.put(second)
+    flushes.append(threading.Thread(target=queue.flush))
+    flushes[1].start()  # Takes the second message
+
+    time.sleep(0.1)
+    assert waiter.is_alive()
+    assert stored(queue) == {}
+
+    gate.set()
+    for thread in [waiter] + flushes:
+        thread.join(10)
+    assert not waiter.is_alive()
+    assert stored(queue) == {first.id: "pending", second.id: "pending"}
+
+
+def test_batch_size_triggers_a_flush(open_queue):
+    queue = open_queue(batch_size=10, flush_interval=3600)
+    queue.put_many([message(n=i) for i in range(10)])
+    deadline = time.monotonic() + 5
+    while len(stored(queue)) < 10 and time.monotonic() < deadline:
+        time.sleep(0.01)
+    assert len(stored(queue)) == 10
+
+
+def test_closed_queue_rejects_messages(open_queue):
+    queue = open_queue()
+    queue.close()
+    with pytest.raises(RuntimeError, match="Queue is closed"):
+        queue.put(message())
+
+
+# ─────────────────────────────────────────────────────────────
+# Shared payloads
+# ─────────────────────────────────────────────────────────────
+
+def test_shared_payload_is_held_until_acked(open_queue):
+    queue = open_queue(visibility_timeout=0)
+    blob = SharedPayload.from_bytes(b"x" * 4096)
+    sent = message(blob=blob)
+    queue.put(sent, wait=True)
+    assert blob.refcount == 2  # The stored message holds a reference
+
+    for attempt in (1, 2):  # Redelivery hands out a reference per claim
+        (claimed,) = queue.get()
+        handle = claimed.message.payload["blob"]
+        assert handle.to_bytes() == b"x" * 4096 and blob.refcount == 3
+        handle.close()
+        assert blob.refcount == 2
+
+    queue.put(sent, wait=True)  # A duplicate's reference is dropped
+    assert blob.refcount == 2
+    queue.ack(sent.id)
+    assert blob.refcount == 1
+
+    name = blob.name
+    blob.close()
+    with pytest.raises(FileNotFoundError):
+        shared_memory.SharedMemory(name=name)
@@ -0,0 +1,199 @@
+"""
+Tests for the event bus: trie wildcard matching, match-cache invalidation
+and per-subscription delivery.
+
+Copyright (c) 2026 Gopi Suman Addanke. All Rights Reserved.
+"""
+
+import gc
+import threading
+
+import pytest
+
+from conftest import load
+
+events = load("events")
+
+
+@pytest.fixture
+def bus():
+    bus = events.EventBus(workers=2)
+    yield bus
+    bus.shutdown()
+
+
+def patterns(bus, topic):
+    return sorted(subscription.pattern for subscription in bus.match(topic))
+
+
+# ─────────────────────────────────────────────────────────────
+# Matching
+# ─────────────────────────────────────────────────────────────
+
+PATTERNS = ["story.created", "story.*", "*.failed", "*", "story.*.done", "pipeline.*.failed", "*.*"]
+
+
+@pytest.mark.parametrize("topic, expected", [
+    ("story.created", ["*", "*.*", "story.*", "story.created"]),
+    ("story.updated", ["*", "*.*", "story.*"]),
+    ("story", ["*"]),  # A trailing "*" needs at least one more segment
+    ("story.task.done", ["*", "*.*", "story.*", "story.*.done"]),
+    ("pipeline.failed", ["*", "*.*", "*.failed"]),
+    ("pipeline.build.failed", ["*", "*.*", "pipeline.*.failed"]),  # "*.failed" is exactly two segments
+    ("code.pushed", ["*", "*.*"]),
+    ("code", ["*"]),
+])
+def test_wildcard_matching(bus, topic, expected):
+    for pattern in PATTERNS:
+        bus.subscribe(pattern, lambda event: None)
+    assert patterns(bus, topic) == expected
+
+
+def test_overlapping_paths_match_a_subscription_once(bus):
+    bus.subscribe("a.*", lambda event: None)
+    bus.subscribe("*.b", lambda event: None)
+    subscription = bus.subscribe("*", lambda event: None)
+    matched = bus.match("a.b")
+    assert len(matched) == 3 and matched.count(subscription) == 1
+
+
+# ─────────────────────────────────────────────────────────────
+# Match cache
+# ─────────────────────────────────────────────────────────────
+
+def test_subscribe_invalidates_cached_matches(bus):
+    bus.subscribe("story.created", lambda event: None)
+    assert patterns(bus, "story.created") == ["story.created"]
+    assert patterns(bus, "code.pushed") == []
+    assert set(bus._cache) == {"story.created", "code.pushed"}
+
+    bus.subscribe("*", lambda event: None)
+    assert bus._cache == {}
+    assert patterns(bus, "story.created") == ["*", "story.created"]
+    assert patterns(bus, "code.pushed") == ["*"]
+
+
+def test_unsubscribe_invalidates_cached_matches_and_prunes_the_trie(bus):
+    keep = bus.subscribe("story.*", lambda event: None)
+    gone = bus.subscribe("story.task.done", lambda event: None)
+    assert patterns(bus, "story.task.done") == ["story.*", "story.task.done"]
+
+    gone.cancel()
+    assert patterns(bus, "story.task.done") == ["story.*"]
+    assert list(bus._root.children["story"].children) == []  # "task.done" branch pruned
+    assert not gone.active
+
+    keep.cancel()
+    assert bus.match("story.task.done") == () and bus._root.children == {}
+    keep.cancel()  # No-op once removed
+
+
+def test_cache_is_bounded(bus):
+    bus.cache_size = 4
+    bus.subscribe("*", lambda event: None)
+    for n in range(10):
+        bus.match(f"topic.{n}")
+    assert 0 < len(bus._cache) <= 4
+
+
+# ─────────────────────────────────────────────────────────────
+# Delivery
+# ─────────────────────────────────────────────────────────────
+
+def test_events_are_delivered_in_order(bus):
+    received = []
+    bus.subscribe("story.*", received.append)
+    assert bus.publish("code.pushed") == 0
+    for n in range(200):
+        assert bus.publish("story.created", {"n": n}, source="Planner") == 1
+
+    assert bus.join(5)
+    assert [event.payload["n"] for event in received] == list(range(200))
+    assert received[0].source == "Planner" and received[0].topic == "story.created"
+    assert bus.stats()["delivered"] == 200 and bus.stats()["published"] == 201
+
+
+def test_full_mailbox_drops_new_events(bus):
+    gate, received = threading.Event(), []
+
+    def slow(event):
+        gate.wait(5)
+        received.append(event.payload["n"])
+
+    subscription = bus.subscribe("job", slow, maxsize=2)
+    queued = [bus.publish("job", {"n": n}) for n in range(10)]
+    gate.set()
+    assert bus.join(5)
+    # The first event may already be with the handler, freeing a slot
+    assert sum(queued) == len(received) and 2 <= len(received) <= 3
+    assert received == sorted(received) and subscription.dropped == 10 - len(received)
+
+
+def test_full_mailbox_blocks_the_publisher(bus):
+    gate, received = threading.Event(), []
+
+    def slow(event):
+        gate.wait(5)
+        received.append(event.payload["n"])
+
+    bus.subscribe("job", slow, maxsize=1, overflow="block")
+    publisher = threading.Thread(target=lambda: [bus.publish("job", {"n": n}) for n in range(5)])
+    publisher.start()
+    publisher.join(0.1)
+    assert publisher.is_alive()  # Waiting for mailbox space
+
+    gate.set()
+    publisher.join(5)
+    assert bus.join(5) and received == list(range(5))
+
+
+def test_failing_handler_is_counted_and_delivery_continues(bus):
+    received = []
+
+    def handler(event):
+        if event.payload["n"] == 1:
+            raise ValueError("bad event")
+        received.append(event.payload["n"])
+
+    subscription = bus.subscribe("job", handler)
+    for n in range(3):
+        bus.publish("job", {"n": n})
+    assert bus.join(5)
+    assert received == [0, 2] and subscription.failed == 1 and subscription.delivered == 2
+
+
+def test_collected_owner_is_unsubscribed(bus):
+    class Owner:
+        def handle(self, event):
+            pass
+
+    owner = Owner()
+    bus.subscribe("job", owner.handle)  # Bound methods are held weakly
+    del owner
+    gc.collect()
+
+    bus.publish("job")
+    assert bus.join(5)
+    assert bus.subscriptions() == [] and bus.match("job") == ()
+
+
+def test_invalid_overflow(bus):
+    with pytest.raises(ValueError, match="overflow"):
+        bus.subscribe("job", lambda event: None, overflow="wait")
+
+
+# ─────────────────────────────────────────────────────────────
+# Agents
+# ─────────────────────────────────────────────────────────────
+
+def test_agent_subscriptions_end_with_unregister(echo_agent, quad_agent, monkeypatch, bus):
+    monkeypatch.setattr(quad_agent.QUADAgent, "_event_bus", bus)
+    received = []
+    listener, emitter = echo_agent("Listener"), echo_agent("Emitter")
+    listener.subscribe("story.*", received.append)
+
+    assert emitter.emit("story.created", {"id": 1}) == 1
+    assert bus.join(5) and received[0].source == "Emitter"
+
+    listener.unregister()
+    assert emitter.emit("story.created", {"id": 2}) == 0
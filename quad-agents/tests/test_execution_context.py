@@ -0,0 +1,142 @@
+"""
+Tests for per-invocation ExecutionContexts: concurrent calls on one agent
+never share retry state.
+
+Copyright (c) 2026 Gopi Suman Addanke. All Rights Reserved.
+"""
+
+import threading
+
+import pytest
+
+
+@pytest.fixture
+def context_agent(quad_agent):
+    """Factory for an agent recording the context each attempt ran under"""
+
+    class ContextAgent(quad_agent.QUADAgent):
+        def __init__(self, config, barrier=None):
+            super().__init__(config)
+            self.barrier = barrier
+            self.seen = []  # (input n, retries so far, context, retry_delay)
+            self.lock = threading.Lock()
+            self.helper = None
+
+        def execute_task(self, input_data: dict) -> dict:
+            context = self.context
+            with self.lock:
+                self.seen.append((input_data["n"], context.retries, context, context.retry_delay))
+            if self.barrier is not None:
+                self.barrier.wait(5)
+            if context.retries < input_data.get("fail", 0):
+                raise RuntimeError(input_data.get("error", "connection reset"))
+            if self.helper is not None:
+                inner = self.helper.run({"n": f"inner {input_data['n']}"})
+                assert self.context is context  # Restored after the nested call
+                return {"n": input_data["n"], "inner": inner.data}
+            return {"n": input_data["n"], "context": context.id}
+
+        def _get_pretext(self) -> str:
+            return "# PRETEXT: ContextAgent"
+
+    def make(name="Worker", barrier=None, **config):
+        config.setdefault("enable_logging", False)
+        config.setdefault("retry_delay", 0.001)
+        return ContextAgent(quad_agent.AgentConfig(name=name, **config), barrier)
+
+    return make
+
+
+def run_concurrently(agent, inputs):
+    results = [None] * len(inputs)
+
+    def call(i):
+        results[i] = agent.run(inputs[i])
+
+    threads = [threading.Thread(target=call, args=(i,)) for i in range(len(inputs))]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join(10)
+    return results
+
+
+def test_concurrent_calls_get_their_own_context(context_agent):
+    agent = context_agent(barrier=threading.Barrier(4))
+    results = run_concurrently(agent, [{"n": n} for n in range(4)])
+
+    assert all(result.success for result in results)
+    contexts = {result.data["context"] for result in results}
+    assert len(contexts) == 4
+    assert agent.context is None and agent.active_contexts() == []
+
+
+def test_retries_are_counted_per_call(context_agent):
+    agent = context_agent(max_retries=3)
+    results = run_concurrently(agent, [{"n": 0, "fail": 2}, {"n": 1}, {"n": 2, "fail": 1}])
+
+    assert [result.retries for result in results] == [2, 0, 1]
+    attempts = {}
+    for n, retries, context, _ in agent.seen:
+        attempts.setdefault(n, []).append((retries, context))
+    for n, calls in attempts.items():
+        assert [retries for retries, _ in calls] == list(range(len(calls)))
+        assert len({id(context) for _, context in calls}) == 1  # One context per call
+
+
+def test_backoff_stays_in_the_failing_call(context_agent):
+    agent = context_agent(max_retries=3)
+    limited = agent.run({"n": "limited", "fail": 2, "error": "429 rate limit"})
+    healthy = agent.run({"n": "healthy", "fail": 1})
+    assert limited.success and healthy.success
+
+    delays = {}
+    for n, _, _, delay in agent.seen:
+        delays.setdefault(n, []).append(delay)
+    assert delays == {"limited": [0.001, 0.002, 0.004], "healthy": [0.001, 0.001]}
+    assert agent.config.retry_delay == 0.001  # The config is never tuned
+
+
+def test_state_aggregates_concurrent_calls(context_agent, quad_agent):
+    gate, started = threading.Event(), threading.Barrier(3)
+
+    class Gated:
+        def wait(self, timeout=None):
+            started.wait(5)
+            gate.wait(5)
+
+    agent = context_agent(barrier=Gated())
+    threads = [threading.Thread(target=agent.run, args=({"n": n},)) for n in range(2)]
+    for thread in threads:
+        thread.start()
+    started.wait(5)
+
+    assert agent.state == quad_agent.AgentState.RUNNING
+    assert agent.get_status()["running"] == 2
+    contexts = agent.active_contexts()
+    contexts[0].state = quad_agent.AgentState.HEALING
+    assert agent.state == quad_agent.AgentState.HEALING
+
+    contexts[0].state = quad_agent.AgentState.RUNNING
+    gate.set()
+    for thread in threads:
+        thread.join(5)
+    assert agent.state == quad_agent.AgentState.COMPLETED
+    assert agent.get_status()["running"] == 0
+
+
+def test_nested_calls_restore_the_outer_context(context_agent):
+    outer, inner = context_agent("Outer"), context_agent("Inner")
+    outer.helper = inner
+    result = outer.run({"n": 1})
+    assert result.success and result.data["inner"]["n"] == "inner 1"
+    assert inner.seen[0][2] is not outer.seen[0][2]
+
+
+def test_run_many_batches_have_their_own_contexts(context_agent):
+    agent = context_agent()
+    results = list(agent.run_many(({"n": n} for n in range(40)), concurrency=4, batch_size=5))
+    assert sorted(result.data["n"] for result in results) == list(range(40))
+    contexts = {id(context) for _, _, context, _ in agent.seen}
+    assert len(contexts) == 8  # One per batch
+    assert agent.active_contexts() == []
@@ -0,0 +1,180 @@
+"""
+Tests for the weak-reference agent registry.
+
+Copyright (c) 2026 Gopi Suman Addanke. All Rights Reserved.
+"""
+
+import gc
+
+import pytest
+
+from conftest import load
+
+registry_module = load("registry")
+AgentRegistry = registry_module.AgentRegistry
+
+
+class Named:
+    def __init__(self, name: str):
+        self.name = name
+
+
+# ─────────────────────────────────────────────────────────────
+# GC reaping
+# ─────────────────────────────────────────────────────────────
+
+def test_collected_agent_is_reaped():
+    registry = AgentRegistry()
+    agent = Named("Planner")
+    registry.register(agent, namespace="acme")
+    assert registry.get("Planner", "acme") is agent
+
+    del agent
+    gc.collect()
+    assert registry.get("Planner", "acme") is None
+    assert registry.names() == []
+    assert registry._agents == {}  # The weakref callback removed the entry
+
+
+def test_sub_agents_live_as_long_as_their_parent(quad_agent, echo_agent):
+    parent = echo_agent("Parent")
+    parent.generate_sub_agent("Child", "Child agent", lambda data: data)
+    gc.collect()
+    assert quad_agent.QUADAgent.get_agent("Child") is not None  # Owned by parent.children
+
+    del parent
+    gc.collect()
+    assert quad_agent.QUADAgent.get_registered_agents() == []
+
+
+def test_unregister_detaches_a_sub_agent(quad_agent, echo_agent):
+    parent = echo_agent("Parent")
+    child = parent.generate_sub_agent("Child", "Child agent", lambda data: data)
+    assert child.unregister()
+    assert parent.children == [] and child.parent is None
+
+    del child
+    gc.collect()
+    assert quad_agent.QUADAgent.get_registered_agents() == ["Parent"]
+
+
+# ─────────────────────────────────────────────────────────────
+# replacing()
+# ─────────────────────────────────────────────────────────────
+
+def test_duplicate_live_name_is_rejected():
+    registry = AgentRegistry()
+    first = Named("Planner")
+    registry.register(first)
+    with pytest.raises(ValueError):
+        registry.register(Named("Planner"))
+    registry.register(first)  # Re-registering the same agent is fine
+
+
+def test_replacing_swaps_without_a_gap():
+    registry = AgentRegistry()
+    old = Named("Planner")
+    registry.register(old, namespace="acme")
+    with registry.replacing():
+        new = Named("Planner")
+        registry.register(new, namespace="acme")
+    assert registry.get("Planner", "acme") is new
+
+    # The old agent dying must not remove the entry that replaced it
+    del old
+    gc.collect()
+    assert registry.get("Planner", "acme") is new
+
+    # Outside the block replacement is refused again
+    with pytest.raises(ValueError):
+        registry.register(Named("Planner"), namespace="acme")
+
+
+def test_replaced_agent_cannot_unregister_its_replacement():
+    registry = AgentRegistry()
+    old = Named("Planner")
+    registry.register(old, namespace="acme")
+    with registry.replacing():
+        new = Named("Planner")
+        registry.register(new, namespace="acme")
+
+    assert not registry.unregister("Planner", "acme", agent=old)
+    assert registry.get("Planner", "acme") is new
+    assert registry.unregister("Planner", "acme", agent=new)
+    assert registry.get("Planner", "acme") is None
+
+
+def test_respawned_agent_survives_the_old_instance_unregistering(quad_agent, echo_agent):
+    old = echo_agent("worker")
+    with quad_agent.QUADAgent._agent_registry.replacing():
+        new = old.respawn()
+    assert quad_agent.QUADAgent.get_agent("worker") is new
+
+    assert not old.unregister()
+    assert quad_agent.QUADAgent.get_agent("worker") is new
+    assert new.unregister()
+
+
+def test_replacing_is_per_thread():
+    import threading
+
+    registry = AgentRegistry()
+    keep = Named("Planner")
+    registry.register(keep)
+    errors = []
+
+    def other_thread():
+        try:
+            registry.register(Named("Planner"))
+        except ValueError as e:
+            errors.append(e)
+
+    with registry.replacing():
+        thread = threading.Thread(target=other_thread)
+        thread.start()
+        thread.join()
+    assert len(errors) == 1 and registry.get("Planner") is keep
+
+
+# ─────────────────────────────────────────────────────────────
+# Namespaces
+# ─────────────────────────────────────────────────────────────
+
+def test_lookup_walks_up_scopes():
+    registry = AgentRegistry()
+    tenant, domain, leaf = Named("Planner"), Named("Reviewer"), Named("Planner")
+    top = Named("Global")
+    registry.register(tenant, namespace="acme")
+    registry.register(domain, namespace="acme/suma")
+    registry.register(leaf, namespace="acme/suma/ci")
+    registry.register(top)
+
+    assert registry.get("Planner", "acme/suma/ci") is leaf
+    assert registry.get("Planner", "acme/suma") is tenant
+    assert registry.get("Reviewer", "acme/suma/ci") is domain
+    assert registry.get("Reviewer", "acme") is None
+    assert registry.get("Global", "acme/suma/ci") is top
+    assert registry.get("acme/suma/Reviewer") is domain  # Qualified key
+
+
+def test_names_filter_by_scope():
+    registry = AgentRegistry()
+    agents = [Named("A"), Named("B"), Named("C")]
+    registry.register(agents[0], namespace="acme")
+    registry.register(agents[1], namespace="acme/suma")
+    registry.register(agents[2], namespace="acmex")
+
+    assert sorted(registry.names("acme")) == ["acme/A", "acme/suma/B"]
+    assert registry.names("/acme/suma/") == ["acme/suma/B"]
+    assert len(registry.names()) == 3 and len(registry) == 3
+    assert registry.unregister("B", "acme/suma") and "acme/suma/B" not in registry
+
+
+def test_agents_register_in_their_namespace(quad_agent, echo_agent):
+    agent = echo_agent("Planner", namespace="acme/suma")
+    assert agent.qualified_name == "acme/suma/Planner"
+    assert quad_agent.QUADAgent.get_agent("Planner", "acme/suma/ci") is agent
+    assert quad_agent.QUADAgent.get_agent("Planner") is None
+
+    child = agent.generate_sub_agent("Helper", "Helper agent", lambda data: data)
+    assert child.qualified_name == "acme/suma/Helper"  # Inherits the parent's scope
@@ -0,0 +1,160 @@
+"""
+Tests for trace replay: a replayed run makes the same calls, attempts and
+self-heal decisions as the recording.
+
+Copyright (c) 2026 Gopi Suman Addanke. All Rights Reserved.
+"""
+
+import pytest
+
+from conftest import load
+
+tracing = load("tracing")
+replay = load("replay")
+
+
+@pytest.fixture
+def app(quad_agent):
+    """Factory for a recorded app: a Planner calling a flaky Fetcher per item"""
+
+    class Fetcher(quad_agent.QUADAgent):
+        def __init__(self, config, errors):
+            super().__init__(config)
+            self.errors = errors  # item -> errors raised on its first attempts
+
+        def execute_task(self, input_data: dict) -> dict:
+            errors = self.errors.get(input_data["item"], [])
+            if self.context.retries < len(errors):
+                raise RuntimeError(errors[self.context.retries])
+            return {"item": input_data["item"]}
+
+        def self_heal(self, error: Exception, input_data: dict) -> bool:
+            if "unrecoverable" in str(error):
+                return False
+            return super().self_heal(error, input_data)
+
+        def _get_pretext(self) -> str:
+            return "# PRETEXT: Fetcher"
+
+    class Planner(quad_agent.QUADAgent):
+        def execute_task(self, input_data: dict) -> dict:
+            results = [self.talk_to_agent("Fetcher", "fetch", {"item": item}) for item in input_data["items"]]
+            return {"fetched": [result.success for result in results]}
+
+        def _get_pretext(self) -> str:
+            return "# PRETEXT: Planner"
+
+    def make(errors=None):
+        config = {"namespace": "app", "max_retries": 2, "retry_delay": 0.001, "enable_logging": False}
+        fetcher = Fetcher(quad_agent.AgentConfig(name="Fetcher", **config), errors or {})
+        return Planner(quad_agent.AgentConfig(name="Planner", **config)), fetcher
+
+    return make
+
+
+def record(path, quad_agent, calls):
+    """Record `calls` (zero-argument callables), then clear the registry for the replay"""
+    with tracing.TraceRecorder(path):
+        for call in calls:
+            call()
+    quad_agent.QUADAgent._agent_registry.clear()
+    return tracing.load_trace(path)
+
+
+def shape(invocation):
+    """What a replay must reproduce about a recorded invocation"""
+    return (
+        invocation.agent,
+        invocation.parent_attempt,
+        [error for _, error in invocation.attempts],
+        [healed for _, healed in invocation.heals],
+        invocation.success,
+        [shape(child) for child in invocation.children]
+    )
+
+
+# ─────────────────────────────────────────────────────────────
+# Reproducing a run
+# ─────────────────────────────────────────────────────────────
+
+def test_replay_reproduces_the_recorded_run(app, quad_agent, tmp_path):
+    planner, _ = app({"b": ["connection reset"], "c": ["429 rate limit", "timeout"]})
+    recorded = record(tmp_path / "run.qtrace", quad_agent, [
+        lambda: planner.run({"items": ["a", "b", "c"]}),
+        lambda: planner.run({"items": ["d"]})
+    ])
+    assert len(recorded.roots) == 2 and len(recorded.invocations) == 6
+
+    with tracing.TraceRecorder(tmp_path / "replay.qtrace"):
+        report = replay.Replayer(recorded, latency_scale=0, concurrency=1).run()
+    replayed = tracing.load_trace(tmp_path / "replay.qtrace")
+
+    assert [shape(root) for root in replayed.roots] == [shape(root) for root in recorded.roots]
+    assert report["invocations"] == 2 and report["failures"] == 0
+    assert report["heal_divergences"] == 0
+    assert report["recorded"] == recorded.summary()
+    assert len(quad_agent.QUADAgent._agent_registry) == 0  # Replay agents unregistered
+
+
+def test_recorded_failures_fail_again(app, quad_agent, tmp_path):
+    _, fetcher = app({"a": ["fatal"] * 3})
+    recorded = record(tmp_path / "run.qtrace", quad_agent, [
+        lambda: fetcher.run({"item": "a"}),
+        lambda: fetcher.run({"item": "b"})
+    ])
+    assert [root.success for root in recorded.roots] == [False, True]
+
+    report = replay.Replayer(recorded, latency_scale=0).run()
+    assert report["failures"] == 1 and report["heal_divergences"] == 0
+
+
+def test_replay_reports_diverging_heal_decisions(app, quad_agent, tmp_path):
+    # Fetcher gives up on "unrecoverable" errors; the replay agent retries them
+    _, fetcher = app({"a": ["unrecoverable"]})
+    recorded = record(tmp_path / "run.qtrace", quad_agent, [lambda: fetcher.run({"item": "a"})])
+    assert recorded.roots[0].heals == [("unrecoverable", False)] and not recorded.roots[0].success
+
+    report = replay.Replayer(recorded, latency_scale=0).run()
+    assert report["failures"] == 1  # Every replayed attempt raises the recorded error
+    assert report["heal_divergences"] == 2  # Once per retry the recording never made
+    assert report["divergence_samples"][0] == {
+        "agent": "app/Fetcher", "invocation": recorded.roots[0].id,
+        "error": "unrecoverable", "recorded": False, "replayed": True
+    }
+    assert report["divergence_samples"][1]["recorded"] is None
+
+
+def test_limit_replays_the_first_calls(app, quad_agent, tmp_path):
+    _, fetcher = app()
+    recorded = record(tmp_path / "run.qtrace", quad_agent, [
+        (lambda item=item: fetcher.run({"item": item})) for item in "abcde"
+    ])
+    assert replay.Replayer(recorded, latency_scale=0, limit=3).run()["invocations"] == 3
+
+
+def test_truncated_trace_keeps_complete_segments(app, quad_agent, tmp_path):
+    _, fetcher = app()
+    path = tmp_path / "run.qtrace"
+    with tracing.TraceRecorder(path, buffer_events=4):
+        for item in "abc":
+            fetcher.run({"item": item})
+    complete = tracing.read_events(path)
+    path.write_bytes(path.read_bytes()[:-3])
+
+    events = tracing.read_events(path)
+    assert 0 < len(events) < len(complete) and events == complete[:len(events)]
+
+
+# ─────────────────────────────────────────────────────────────
+# Baselines
+# ─────────────────────────────────────────────────────────────
+
+def test_compare_to_baseline():
+    baseline = {"throughput": 100.0, "p99_ms": 10.0, "failures": 0, "heal_divergences": 0}
+    assert replay.compare_to_baseline(dict(baseline, throughput=95.0, p99_ms=10.5), baseline) == []
+
+    regressions = replay.compare_to_baseline(
+        {"throughput": 80.0, "p99_ms": 12.0, "failures": 1, "heal_divergences": 2}, baseline
+    )
+    assert len(regressions) == 4
+    assert regressions[0].startswith("throughput 80.0/s")
@@ -0,0 +1,113 @@
+"""
+Tests for QUADAgent.run_many: lazy batching, per-item results and retries.
+
+Copyright (c) 2026 Gopi Suman Addanke. All Rights Reserved.
+"""
+
+import threading
+
+import pytest
+
+
+@pytest.fixture
+def flaky_agent(quad_agent):
+    """Factory for an agent that fails inputs marked "fail" until healed"""
+
+    class FlakyAgent(quad_agent.QUADAgent):
+        def __init__(self, config, fail_times=1):
+            super().__init__(config)
+            self.fail_times = fail_times
+            self.attempts = {}
+            self.lock = threading.Lock()
+
+        def execute_task(self, input_data: dict) -> dict:
+            key = input_data["n"]
+            with self.lock:
+                self.attempts[key] = self.attempts.get(key, 0) + 1
+                attempt = self.attempts[key]
+            if input_data.get("fail") and attempt <= self.fail_times:
+                raise RuntimeError(f"attempt {attempt} of {key} failed")
+            return {"n": key}
+
+        def self_heal(self, error: Exception, input_data: dict) -> bool:
+            return True
+
+        def _get_pretext(self) -> str:
+            return "# PRETEXT: FlakyAgent"
+
+    def make(fail_times: int = 1, **config):
+        config.setdefault("enable_logging", False)
+        config.setdefault("retry_delay", 0)
+        return FlakyAgent(quad_agent.AgentConfig(name="Flaky", **config), fail_times)
+
+    return make
+
+
+def test_inputs_are_read_lazily(echo_agent):
+    agent = echo_agent()
+    read = []
+
+    def inputs():
+        for n in range(100):
+            read.append(n)
+            yield {"n": n}
+
+    results = agent.run_many(inputs(), batch_size=10)
+    first = next(results)
+    assert first.data == {"echo": {"n": 0}}
+    assert len(read) == 10
+    results.close()
+
+
+def test_results_cover_every_input(echo_agent, quad_agent):
+    agent = echo_agent()
+    results = list(agent.run_many(({"n": n} for n in range(25)), batch_size=4))
+    assert sorted(r.metadata["index"] for r in results) == list(range(25))
+    assert all(r.data == {"echo": {"n": r.metadata["index"]}} for r in results)
+    assert agent.state == quad_agent.AgentState.COMPLETED
+
+
+def test_batch_successes_are_not_held_back_by_a_retry(flaky_agent):
+    agent = flaky_agent()
+    results = agent.run_many([{"n": 0, "fail": True}, {"n": 1}, {"n": 2}], batch_size=3)
+    assert [r.metadata["index"] for r in results] == [1, 2, 0]
+
+
+def test_batch_attempt_counts_toward_max_retries(flaky_agent, quad_agent):
+    agent = flaky_agent(fail_times=100, max_retries=2)
+    [result] = agent.run_many([{"n": 0, "fail": True}])
+    assert not result.success
+    assert agent.attempts[0] == 3  # The batch attempt plus two retries
+    assert result.retries == 3
+    assert agent.state != quad_agent.AgentState.COMPLETED
+
+
+def test_healed_item_succeeds(flaky_agent, quad_agent):
+    agent = flaky_agent(fail_times=1)
+    [result] = agent.run_many([{"n": 0, "fail": True}])
+    assert result.success and result.data == {"n": 0}
+    assert agent.attempts[0] == 2
+    assert agent.state == quad_agent.AgentState.COMPLETED
+
+
+def test_concurrent_batches(flaky_agent):
+    agent = flaky_agent()
+    inputs = ({"n": n, "fail": n % 7 == 0} for n in range(50))
+    results = list(agent.run_many(inputs, concurrency=4, batch_size=5))
+    assert sorted(r.metadata["index"] for r in results) == list(range(50))
+    assert all(r.success and r.data == {"n": r.metadata["index"]} for r in results)
+
+
+def test_closing_early_stops_concurrent_batches(echo_agent):
+    agent = echo_agent()
+    read = []
+
+    def inputs():
+        for n in range(1000):
+            read.append(n)
+            yield {"n": n}
+
+    results = agent.run_many(inputs(), concurrency=2, batch_size=10)
+    next(results)
+    results.close()
+    assert len(read) <= 30
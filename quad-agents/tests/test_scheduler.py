@@ -0,0 +1,193 @@
+"""
+Tests for the priority scheduler: PGCE priorities, aging and stats.
+
+Copyright (c) 2026 Gopi Suman Addanke. All Rights Reserved.
+"""
+
+import threading
+
+import pytest
+
+from conftest import load
+
+scheduler_module = load("scheduler")
+AgentMessage = load("quad_agent").AgentMessage
+AgentResult = load("quad_agent").AgentResult
+PriorityScheduler = scheduler_module.PriorityScheduler
+
+
+class Clock:
+    """Stands in for the scheduler's `time` module"""
+
+    def __init__(self):
+        self.now = 1000.0
+
+    def monotonic(self):
+        return self.now
+
+
+class Recorder:
+    """Agent stand-in recording the order messages run in"""
+
+    def __init__(self):
+        self.order = []
+        self.gate = threading.Event()
+
+    def receive_message(self, message):
+        if message.action == "block":
+            self.gate.wait(10)
+        else:
+            self.order.append(message.action)
+        return AgentResult(success=True, data=message.action)
+
+
+@pytest.fixture
+def clock(monkeypatch):
+    clock = Clock()
+    monkeypatch.setattr(scheduler_module, "time", clock)
+    return clock
+
+
+@pytest.fixture
+def busy(clock):
+    """Factory for a one-worker scheduler whose worker is blocked until `release()`"""
+    started = []
+
+    def make(**options):
+        recorder = Recorder()
+        scheduler = PriorityScheduler(workers=1, resolver=lambda name: recorder, **options).start()
+        started.append((scheduler, recorder))
+        blocker = scheduler.submit(message("block"))
+        while len(scheduler):  # Wait until the worker holds the blocker
+            pass
+
+        def release():
+            recorder.gate.set()
+            blocker.result(5)
+            scheduler.stop()
+            return recorder.order
+
+        return scheduler, release
+
+    yield make
+    for scheduler, recorder in started:
+        recorder.gate.set()
+        scheduler.stop(drain=False)
+
+
+def message(action, priority=None, **payload):
+    return AgentMessage(to_agent="Worker", action=action, priority=priority, payload=payload)
+
+
+# ─────────────────────────────────────────────────────────────
+# Priorities
+# ─────────────────────────────────────────────────────────────
+
+def test_pgce_score():
+    assert scheduler_module.pgce_score(10, 10, 0) == pytest.approx(1.0)
+    assert scheduler_module.pgce_score(0, 0, 10) == 0.0
+    assert scheduler_module.pgce_score(8, 6, 4) == pytest.approx(0.4 + 0.18 + 0.12)
+    assert scheduler_module.pgce_score(20, -5, 15) == pytest.approx(0.5)  # Clamped to 0-10
+
+
+def test_message_priority():
+    priority = scheduler_module.message_priority
+    assert priority(message("a", priority=0.3, pgce=0.9)) == 0.3
+    assert priority(message("a", pgce=0.9)) == 0.9
+    assert priority(message("a", pgce={"dependency": 10, "impact": 10, "complexity": 0})) == pytest.approx(1.0)
+    assert priority(message("a", pgce={"impact": 10})) == pytest.approx(0.3)
+    assert priority(message("a"), default=0.2) == 0.2
+
+
+def test_priority_bands():
+    band = scheduler_module.priority_band
+    assert [band(p) for p in (0.92, 0.7, 0.5, 0.4, 0.1, -3)] == ["high", "high", "medium", "medium", "low", "low"]
+
+
+def test_higher_priority_runs_first(busy):
+    scheduler, release = busy()
+    scheduler.submit(message("low", pgce=0.1))
+    scheduler.submit(message("high", pgce={"dependency": 9, "impact": 9, "complexity": 1}))
+    scheduler.submit(message("medium", priority=0.5))
+    scheduler.submit(message("default"))
+    assert release() == ["high", "medium", "low", "default"]
+
+
+def test_equal_priorities_run_in_submission_order(busy):
+    scheduler, release = busy(aging_rate=0)
+    for n in range(20):
+        scheduler.submit(message(str(n), priority=0.5))
+    assert release() == [str(n) for n in range(20)]
+
+
+# ─────────────────────────────────────────────────────────────
+# Aging
+# ─────────────────────────────────────────────────────────────
+
+def test_waiting_work_overtakes_fresh_high_priority_work(busy, clock):
+    scheduler, release = busy()  # aging_rate 0.01: +1.0 priority per 100s
+    scheduler.submit(message("bulk", priority=0.0))
+    clock.now += 99
+    scheduler.submit(message("urgent at 99s", priority=1.0))
+    clock.now += 2
+    scheduler.submit(message("urgent at 101s", priority=1.0))
+    assert release() == ["urgent at 99s", "bulk", "urgent at 101s"]
+
+
+def test_without_aging_a_steady_high_priority_stream_starves_bulk_work(busy, clock):
+    scheduler, release = busy(aging_rate=0)
+    scheduler.submit(message("bulk", priority=0.0))
+    for n in range(50):
+        clock.now += 10
+        scheduler.submit(message(f"urgent {n}", priority=1.0))
+    assert release()[-1] == "bulk"
+
+
+def test_aging_bounds_how_long_bulk_work_waits(busy, clock):
+    scheduler, release = busy()
+    scheduler.submit(message("bulk", priority=0.0))
+    for n in range(50):
+        clock.now += 10
+        scheduler.submit(message(f"urgent {n}", priority=1.0))
+    # Urgent work submitted 100s or more after the bulk job queues behind it
+    assert release().index("bulk") == 9
+
+
+# ─────────────────────────────────────────────────────────────
+# Lifecycle & stats
+# ─────────────────────────────────────────────────────────────
+
+def test_results_and_stats(clock):
+    recorder = Recorder()
+    scheduler = PriorityScheduler(workers=2, resolver=lambda name: recorder).start()
+    futures = [scheduler.submit(message(str(n), priority=p)) for n, p in enumerate((0.9, 0.5, 0.1, 0.8))]
+    assert [f.result(5).data for f in futures] == ["0", "1", "2", "3"]
+    scheduler.stop()
+
+    bands = scheduler.stats()["bands"]
+    assert {band: bands[band]["completed"] for band in bands} == {"high": 2, "medium": 1, "low": 1}
+    assert scheduler.stats()["queued"] == 0 and scheduler.stats()["workers"] == 0
+
+
+def test_unknown_agent_fails_the_future(clock):
+    scheduler = PriorityScheduler(workers=1, resolver=lambda name: None).start()
+    with pytest.raises(LookupError, match="Agent not found: Worker"):
+        scheduler.submit(message("x")).result(5)
+    scheduler.stop()
+
+
+def test_stop_without_draining_cancels_queued_work(busy):
+    scheduler, release = busy()
+    queued = [scheduler.submit(message(str(n))) for n in range(3)]
+    stopping = threading.Thread(target=scheduler.stop, kwargs={"drain": False})
+    stopping.start()  # Cancels the queue, then waits for the blocked worker
+    while len(scheduler):
+        pass
+    assert all(future.cancelled() for future in queued)
+    assert release() == []
+    stopping.join(5)
+
+
+def test_submit_requires_start():
+    with pytest.raises(RuntimeError, match="not running"):
+        PriorityScheduler().submit(message("x"))
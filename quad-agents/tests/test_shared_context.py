@@ -0,0 +1,276 @@
+"""
+Tests for the shared context: TTLs, atomic updates, scans, permissions and
+the SQLite tier.
+
+Copyright (c) 2026 Gopi Suman Addanke. All Rights Reserved.
+"""
+
+import threading
+import time
+from datetime import datetime
+
+import pytest
+
+from conftest import load
+
+shared_context = load("shared_context")
+SharedContext = shared_context.SharedContext
+PermissionLevel = shared_context.PermissionLevel
+
+
+@pytest.fixture
+def context():
+    context = SharedContext(shards=4, sweep_interval=0.05)
+    yield context
+    context.close()
+
+
+def hammer(fn, threads=8, times=500):
+    """Call `fn` from several threads at once"""
+    barrier = threading.Barrier(threads)
+
+    def work():
+        barrier.wait()
+        for _ in range(times):
+            fn()
+
+    workers = [threading.Thread(target=work) for _ in range(threads)]
+    for worker in workers:
+        worker.start()
+    for worker in workers:
+        worker.join()
+
+
+# ─────────────────────────────────────────────────────────────
+# TTL
+# ─────────────────────────────────────────────────────────────
+
+def test_expired_key_is_invisible_at_once(context):
+    context.set("session", "abc", ttl=0.05)
+    context.set("forever", 1)
+    assert context.get("session") == "abc" and 0 < context.ttl("session") <= 0.05
+    assert context.ttl("forever") is None
+
+    time.sleep(0.06)
+    assert context.get("session", "gone") == "gone"
+    assert "session" not in context and context.ttl("session") is None
+    assert context.keys() == ["forever"]
+
+
+def test_sweeper_removes_expired_keys(context):
+    for i in range(10):
+        context.set(f"tmp:{i}", i, ttl=0.01)
+    context.set("tmp:kept", 1, ttl=0.01)
+    context.set("tmp:kept", 2)  # Rewritten without a TTL: its old expiry is stale
+    deadline = time.monotonic() + 5
+    while len(context) > 1 and time.monotonic() < deadline:
+        time.sleep(0.01)
+    assert len(context) == 1 and context.get("tmp:kept") == 2
+
+
+# ─────────────────────────────────────────────────────────────
+# Atomic updates
+# ─────────────────────────────────────────────────────────────
+
+def test_concurrent_incr_loses_no_updates(context):
+    hammer(lambda: context.incr("hits"))
+    assert context.get("hits") == 4000
+    assert context.decr("hits", 0.5) == 3999.5
+
+
+def test_incr_keeps_the_expiry_and_rejects_non_numbers(context):
+    context.set("counter", 1, ttl=60)
+    context.incr("counter")
+    assert context.get("counter") == 2 and 59 < context.ttl("counter") <= 60
+
+    context.set("name", "Ann")
+    with pytest.raises(TypeError, match="value is str"):
+        context.incr("name")
+    context.set("flag", True)
+    with pytest.raises(TypeError, match="value is bool"):
+        context.incr("flag")
+
+
+def test_cas(context):
+    assert context.cas("owner", None, "Ann")  # Missing compares equal to None
+    assert not context.cas("owner", None, "Bob")
+    assert context.cas("owner", "Ann", "Bob") and context.get("owner") == "Bob"
+
+
+def test_concurrent_cas_loops_lose_no_updates(context):
+    context.set("total", 0)
+
+    def add_one():
+        while True:
+            current = context.get("total")
+            if context.cas("total", current, current + 1):
+                return
+
+    hammer(add_one, times=200)
+    assert context.get("total") == 1600
+
+
+# ─────────────────────────────────────────────────────────────
+# Scans
+# ─────────────────────────────────────────────────────────────
+
+@pytest.mark.parametrize("pattern, expected", [
+    ("*", ["epic:1", "story:1", "story:10", "story:2", "story:a:b"]),
+    ("story:*", ["story:1", "story:10", "story:2", "story:a:b"]),
+    ("story:?", ["story:1", "story:2"]),
+    ("story:[12]*", ["story:1", "story:10", "story:2"]),
+    ("*:1", ["epic:1", "story:1"]),
+    ("story:10", ["story:10"]),
+    ("story:1*0", ["story:10"]),
+    ("task:*", []),
+])
+def test_glob_scans(context, pattern, expected):
+    for key in ["story:2", "story:10", "epic:1", "story:1", "story:a:b"]:
+        context.set(key, key.upper())
+    context.set("story:old", 0, ttl=0.001)
+    time.sleep(0.002)
+
+    assert context.keys(pattern) == expected
+    assert list(context.scan(pattern)) == [(key, key.upper()) for key in expected]
+
+
+# ─────────────────────────────────────────────────────────────
+# Permissions
+# ─────────────────────────────────────────────────────────────
+
+def test_agents_need_grants_by_default(context):
+    with pytest.raises(PermissionError, match="Dev lacks READ permission on 'story:1'"):
+        context.get("story:1", agent="Dev")
+    with pytest.raises(PermissionError, match="Dev lacks WRITE permission"):
+        context.set("story:1", {}, agent="Dev")
+    context.set("story:1", {})  # The runtime itself is never restricted
+
+
+def test_highest_matching_grant_wins(context):
+    context.grant("Story", "story:*", PermissionLevel.WRITE)
+    context.grant("Story", "story:draft:*", PermissionLevel.ADMIN)
+    context.grant("Dev", "story:*", PermissionLevel.READ)
+
+    assert context.level("Story", "story:1") == PermissionLevel.WRITE
+    assert context.level("Story", "story:draft:1") == PermissionLevel.ADMIN
+    assert context.level("Story", "epic:1") == PermissionLevel.NONE
+    assert context.level(None, "epic:1") == PermissionLevel.ADMIN
+
+    context.set("story:draft:1", "x", agent="Story")
+    assert context.get("story:draft:1", agent="Dev") == "x"
+    with pytest.raises(PermissionError, match="ADMIN"):
+        context.delete("story:draft:1", agent="Dev")
+    assert context.delete("story:draft:1", agent="Story")
+
+
+def test_new_patterns_apply_to_keys_already_checked(context):
+    context.grant("Dev", "story:*", PermissionLevel.READ)
+    assert context.level("Dev", "epic:1") == PermissionLevel.NONE  # Caches epic:1's mask
+    context.grant("Dev", "epic:*", PermissionLevel.WRITE)
+    assert context.level("Dev", "epic:1") == PermissionLevel.WRITE
+
+
+def test_revoke(context):
+    context.grant("Dev", "story:*", PermissionLevel.WRITE)
+    context.grant("Dev", "epic:*", PermissionLevel.WRITE)
+    context.revoke("Dev", "story:*")
+    assert context.level("Dev", "story:1") == PermissionLevel.NONE
+    assert context.level("Dev", "epic:1") == PermissionLevel.WRITE
+    context.revoke("Dev")
+    assert context.level("Dev", "epic:1") == PermissionLevel.NONE
+
+
+def test_scans_skip_unreadable_keys(context):
+    for key in ["story:1", "story:secret:1", "epic:1"]:
+        context.set(key, 1)
+    context.grant("Dev", "story:*", PermissionLevel.READ)
+    context.grant("Dev", "story:secret:*", PermissionLevel.NONE)
+    assert context.keys(agent="Dev") == ["story:1", "story:secret:1"]  # Highest grant wins
+
+    context.revoke("Dev", "story:*")
+    context.grant("Dev", "story:[0-9]*", PermissionLevel.READ)
+    assert context.keys("story:*", agent="Dev") == ["story:1"]
+
+
+def test_suggestions(context):
+    context.grant("QA", "story:*", PermissionLevel.SUGGEST)
+    context.suggest("story:1", {"title": "Better"}, agent="QA")
+    with pytest.raises(PermissionError):
+        context.set("story:1", {"title": "Better"}, agent="QA")
+    assert context.suggestions("story:1") == [("QA", {"title": "Better"})]
+
+
+def test_default_level(context):
+    context.default_level = PermissionLevel.WRITE
+    context.set("any", 1, agent="Dev")
+    assert context.incr("any", agent="Dev") == 2
+    with pytest.raises(PermissionError):
+        context.delete("any", agent="Dev")
+
+
+# ─────────────────────────────────────────────────────────────
+# SQLite tier
+# ─────────────────────────────────────────────────────────────
+
+def test_values_survive_a_restart(tmp_path):
+    path = tmp_path / "context.db"
+    with SharedContext(path=path) as context:
+        context.set("story:1", {"title": "Login", "due": datetime(2026, 10, 19)})
+        context.set("story:2", "deleted")
+        context.set("session", "abc", ttl=0.05)
+        context.set("counter", 1, ttl=60)
+        context.flush()
+        context.delete("story:2")
+        context.incr("counter")
+
+    time.sleep(0.06)
+    with SharedContext(path=path) as context:
+        assert context.keys() == ["counter", "story:1"]
+        assert context.get("story:1") == {"title": "Login", "due": datetime(2026, 10, 19)}
+        assert context.get("counter") == 2 and context.ttl("counter") > 59
+
+
+def test_failed_flush_keeps_keys_for_the_next_one(tmp_path):
+    path = tmp_path / "context.db"
+    with SharedContext(path=path, sweep_interval=3600) as context:
+        context.set("story:1", "kept")
+        context.set("story:2", object())  # The codec cannot encode it
+        with pytest.raises(ValueError):
+            context.flush()
+
+        context.set("story:2", "fixed")
+        context.flush()
+
+    with SharedContext(path=path) as context:
+        assert dict(context.scan()) == {"story:1": "kept", "story:2": "fixed"}
+
+
+def test_max_value_size(tmp_path):
+    with SharedContext(path=tmp_path / "context.db", max_value_size=100) as context:
+        context.set("small", "x" * 10)
+        with pytest.raises(ValueError, match="max 100"):
+            context.set("big", "x" * 200)
+        assert "big" not in context
+
+
+# ─────────────────────────────────────────────────────────────
+# Agents
+# ─────────────────────────────────────────────────────────────
+
+def test_agents_share_the_built_in_context(echo_agent):
+    writer, reader = echo_agent("Writer"), echo_agent("Reader", namespace="acme")
+    writer.set_shared("test:shared:greeting", "hello")
+    assert reader.get_shared("test:shared:greeting") == "hello"
+    assert reader.get_shared("test:shared:missing", "none") == "none"
+
+
+def test_installed_context_applies_its_grants(quad_agent, echo_agent, monkeypatch):
+    context = SharedContext()
+    monkeypatch.setattr(quad_agent.QUADAgent, "_shared_context", context)
+    agent = echo_agent("Writer", namespace="acme")
+    with pytest.raises(PermissionError, match="acme/Writer lacks WRITE"):
+        agent.set_shared("story:1", 1)
+
+    context.grant("acme/Writer", "story:*", PermissionLevel.WRITE)
+    agent.set_shared("story:1", 1)
+    assert agent.get_shared("story:1") == 1
@@ -0,0 +1,124 @@
+"""
+Tests for shared payloads: reference counting across handles, codec
+round trips and processes, and unlinking the segment at zero.
+
+Copyright (c) 2026 Gopi Suman Addanke. All Rights Reserved.
+"""
+
+import gc
+import multiprocessing
+import pickle
+
+import pytest
+
+from conftest import load
+
+codec = load("codec")
+shared_payload = load("shared_payload")
+SharedPayload = shared_payload.SharedPayload
+
+
+def exists(name):
+    """Whether a shared memory segment is still linked"""
+    try:
+        segment = shared_payload._open_segment(name)
+    except FileNotFoundError:
+        return False
+    segment.close()
+    return True
+
+
+def read_and_close(pickled):
+    """Child process: adopt a handle, read it, release the reference"""
+    with pickle.loads(pickled) as payload:
+        return payload.to_bytes(), payload.refcount
+
+
+# ─────────────────────────────────────────────────────────────
+# One handle
+# ─────────────────────────────────────────────────────────────
+
+def test_closing_the_last_handle_unlinks_the_segment():
+    payload = SharedPayload.from_bytes(b"hello", {"kind": "greeting"})
+    assert payload.refcount == 1 and payload.to_bytes() == b"hello"
+    assert exists(payload.name)
+
+    payload.close()
+    assert payload.closed and not exists(payload.name)
+    payload.close()  # Idempotent
+
+
+def test_collected_handle_unlinks_the_segment():
+    payload = SharedPayload.from_bytes(b"x" * 100)
+    name = payload.name
+    del payload
+    gc.collect()
+    assert not exists(name)
+
+
+def test_context_manager_and_views():
+    with SharedPayload.allocate(4) as payload:
+        with payload.open() as view:
+            view[:] = b"abcd"
+        assert payload.to_bytes() == b"abcd"
+    assert not exists(payload.name)
+
+
+# ─────────────────────────────────────────────────────────────
+# Several handles
+# ─────────────────────────────────────────────────────────────
+
+def test_codec_round_trip_shares_the_segment():
+    payload = SharedPayload.from_bytes(b"data")
+    copy = codec.unpack(codec.pack({"blob": payload, "n": 1}))["blob"]
+    assert copy is not payload and copy.name == payload.name
+    assert payload.refcount == copy.refcount == 2
+    assert copy.to_bytes() == b"data" and copy.metadata == {}
+
+    payload.close()
+    assert exists(copy.name) and copy.refcount == 1
+    copy.close()
+    assert not exists(copy.name)
+
+
+def test_every_encoding_hands_out_a_reference():
+    payload = SharedPayload.from_bytes(b"data")
+    copies = [codec.unpack(codec.pack(payload)) for _ in range(3)]
+    assert payload.refcount == 4
+    for copy in copies:
+        copy.close()
+    assert payload.refcount == 1
+    payload.close()
+    assert not exists(payload.name)
+
+
+def test_other_process_releases_its_reference():
+    payload = SharedPayload.from_bytes(b"across processes")
+    with multiprocessing.get_context("spawn").Pool(1) as pool:
+        data, refcount = pool.apply(read_and_close, (pickle.dumps(payload),))
+    assert (data, refcount) == (b"across processes", 2)
+    assert payload.refcount == 1
+
+    payload.close()
+    assert not exists(payload.name)
+
+
+def test_unsent_encoding_keeps_the_segment_until_decoded():
+    payload = SharedPayload.from_bytes(b"data")
+    packed = codec.pack(payload)  # The encoded form owns a reference
+    payload.close()
+    assert exists(payload.name)
+
+    codec.unpack(packed).close()
+    assert not exists(payload.name)
+
+
+def test_numpy_arrays_are_shared_without_copies():
+    np = pytest.importorskip("numpy")
+    array = np.arange(12, dtype=np.int32).reshape(3, 4)
+    payload = SharedPayload.from_array(array)
+    view = payload.as_array()
+    assert (view == array).all() and view.shape == (3, 4)
+
+    payload.close()  # The array view keeps the mapping alive
+    assert not exists(payload.name) and view[2, 3] == 11
@@ -0,0 +1,205 @@
+"""
+Tests for QUADAgent.run_stream / arun_stream: chunk order, backpressure,
+retries and cancellation.
+
+Copyright (c) 2026 Gopi Suman Addanke. All Rights Reserved.
+"""
+
+import asyncio
+import threading
+
+import pytest
+
+
+@pytest.fixture
+def stream_agent(quad_agent):
+    """Factory for an agent streaming input["n"] chunks, logging what it did"""
+
+    class StreamAgent(quad_agent.QUADAgent):
+        def __init__(self, config, fail_before=0, fail_after=None):
+            super().__init__(config)
+            self.fail_before = fail_before  # Attempts failing before any chunk
+            self.fail_after = fail_after  # Fail once this many chunks are out
+            self.attempts = 0
+            self.produced = []
+            self.closed = threading.Event()
+            self.contexts = []
+
+        def execute_task(self, input_data: dict):
+            self.attempts += 1
+            if self.attempts <= self.fail_before:
+                raise RuntimeError(f"attempt {self.attempts} failed")
+            if input_data.get("plain"):
+                return {"done": True}
+            return self.chunks(input_data["n"])
+
+        def chunks(self, n):
+            try:
+                for i in range(n):
+                    if i == self.fail_after:
+                        raise RuntimeError(f"failed after {i} chunks")
+                    self.contexts.append(self.context)
+                    self.produced.append(i)
+                    yield {"i": i}
+            finally:
+                self.closed.set()
+
+        def self_heal(self, error: Exception, input_data: dict) -> bool:
+            return True
+
+        def _get_pretext(self) -> str:
+            return "# PRETEXT: StreamAgent"
+
+    def make(fail_before=0, fail_after=None, **config):
+        config.setdefault("enable_logging", False)
+        config.setdefault("retry_delay", 0)
+        return StreamAgent(quad_agent.AgentConfig(name="Streamer", **config), fail_before, fail_after)
+
+    return make
+
+
+# ─────────────────────────────────────────────────────────────
+# run_stream
+# ─────────────────────────────────────────────────────────────
+
+def test_chunks_arrive_in_order(stream_agent):
+    agent = stream_agent()
+    assert list(agent.run_stream({"n": 50})) == [{"i": i} for i in range(50)]
+    assert agent.active_contexts() == []
+    assert agent.get_execution_history()[-1].metadata["chunks"] == 50
+
+
+def test_plain_result_is_one_chunk(stream_agent):
+    assert list(stream_agent().run_stream({"plain": True})) == [{"done": True}]
+
+
+def test_chunks_are_produced_as_they_are_consumed(stream_agent):
+    agent = stream_agent()
+    stream = agent.run_stream({"n": 10})
+    assert agent.produced == []  # Nothing runs before the first pull
+    next(stream)
+    next(stream)
+    assert agent.produced == [0, 1]
+    stream.close()
+
+
+def test_context_is_active_only_inside_agent_code(stream_agent):
+    agent = stream_agent()
+    stream = agent.run_stream({"n": 3})
+    for _ in stream:
+        assert agent.context is None  # Not leaked into the consumer
+    contexts = agent.contexts
+    assert contexts[0] is not None and all(context is contexts[0] for context in contexts)
+
+
+def test_closing_the_stream_cancels_the_agent(stream_agent):
+    agent = stream_agent()
+    stream = agent.run_stream({"n": 1000})
+    assert [next(stream) for _ in range(3)] == [{"i": 0}, {"i": 1}, {"i": 2}]
+    assert len(agent.active_contexts()) == 1
+
+    stream.close()
+    assert agent.closed.is_set()
+    assert agent.produced == [0, 1, 2]
+    assert agent.active_contexts() == []
+
+
+def test_errors_before_the_first_chunk_are_retried(stream_agent):
+    agent = stream_agent(fail_before=2, max_retries=3)
+    assert list(agent.run_stream({"n": 3})) == [{"i": 0}, {"i": 1}, {"i": 2}]
+    assert agent.attempts == 3
+
+
+def test_errors_after_a_chunk_are_not_retried(stream_agent, quad_agent):
+    agent = stream_agent(fail_after=2, max_retries=3)
+    received = []
+    with pytest.raises(quad_agent.AgentStreamError, match="failed after 2 chunks") as raised:
+        for chunk in agent.run_stream({"n": 5}):
+            received.append(chunk)
+    assert received == [{"i": 0}, {"i": 1}]
+    assert agent.attempts == 1
+    assert raised.value.result.metadata["chunks"] == 2 and not raised.value.result.success
+
+
+# ─────────────────────────────────────────────────────────────
+# arun_stream
+# ─────────────────────────────────────────────────────────────
+
+def test_async_chunks_arrive_in_order(stream_agent):
+    agent = stream_agent()
+
+    async def consume():
+        return [chunk async for chunk in agent.arun_stream({"n": 20})]
+
+    assert asyncio.run(consume()) == [{"i": i} for i in range(20)]
+    assert agent.active_contexts() == []
+
+
+def test_async_consumer_breaking_out_closes_the_stream(stream_agent):
+    agent = stream_agent()
+
+    async def consume():
+        stream = agent.arun_stream({"n": 1000})
+        received = []
+        async for chunk in stream:
+            received.append(chunk)
+            if len(received) == 3:
+                break
+        await stream.aclose()
+        return received
+
+    assert len(asyncio.run(consume())) == 3
+    assert agent.closed.is_set() and agent.produced == [0, 1, 2]
+    assert agent.active_contexts() == []
+
+
+def test_cancelling_the_consuming_task_closes_the_stream(stream_agent):
+    agent = stream_agent()
+
+    async def consume(pulled):
+        async for _ in agent.arun_stream({"n": 1000}):
+            pulled.set()
+            await asyncio.sleep(10)
+
+    async def main():
+        pulled = asyncio.Event()
+        task = asyncio.create_task(consume(pulled))
+        await pulled.wait()
+        task.cancel()
+        with pytest.raises(asyncio.CancelledError):
+            await task
+
+    asyncio.run(main())
+    assert agent.closed.is_set() and agent.produced == [0]
+    assert agent.active_contexts() == []
+
+
+def test_event_loop_keeps_running_while_the_agent_works(stream_agent):
+    agent = stream_agent()
+    gate = threading.Event()
+    original = agent.chunks
+
+    def slow_chunks(n):
+        gate.wait(5)
+        yield from original(n)
+
+    agent.chunks = slow_chunks
+
+    async def main():
+        ticks = 0
+
+        async def tick():
+            nonlocal ticks
+            while not gate.is_set():
+                ticks += 1
+                if ticks == 5:
+                    gate.set()
+                await asyncio.sleep(0.01)
+
+        ticker = asyncio.create_task(tick())
+        chunks = [chunk async for chunk in agent.arun_stream({"n": 2})]
+        await ticker
+        return chunks, ticks
+
+    chunks, ticks = asyncio.run(main())
+    assert chunks == [{"i": 0}, {"i": 1}] and ticks >= 5
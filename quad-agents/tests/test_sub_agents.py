@@ -0,0 +1,108 @@
+"""
+Tests for generated sub-agents and the shared class cache.
+
+Copyright (c) 2026 Gopi Suman Addanke. All Rights Reserved.
+"""
+
+from conftest import load
+
+SPEC = {"purpose": "Score stories", "data_sources": ["stories"], "capabilities": ["score"]}
+
+
+def test_spec_pretext_names_the_agent(quad_agent, echo_agent):
+    root = echo_agent("Root")
+    scorer = root.generate_sub_agent_from_spec({**SPEC, "name": "Scorer"})
+    pretext = scorer._get_pretext()
+    assert "# PRETEXT: Scorer" in pretext
+    assert "# Purpose: Score stories" in pretext
+    assert "# Data Sources: stories" in pretext
+    assert scorer.to_dict()["pretext"] == pretext
+
+
+def test_agents_from_one_spec_share_a_class(quad_agent, echo_agent):
+    root = echo_agent("Root")
+    first, second = root.generate_sub_agents([{**SPEC, "name": "A"}, {**SPEC, "name": "B"}])
+    assert type(first) is type(second)
+    assert "# PRETEXT: A" in first._get_pretext() and "# PRETEXT: B" in second._get_pretext()
+
+    other = root.generate_sub_agent_from_spec({**SPEC, "name": "C", "capabilities": ["rank"]})
+    assert type(other) is not type(first)
+
+
+def test_explicit_pretext_is_per_instance(quad_agent, echo_agent):
+    root = echo_agent("Root")
+    one = root.generate_sub_agent("One", "Helper", lambda data: {"one": data}, pretext="# PRETEXT: One")
+    two = root.generate_sub_agents([
+        {"name": "Two", "purpose": "Helper", "execute_fn": lambda data: {"two": data}, "pretext": "# PRETEXT: Two"}
+    ])[0]
+    assert type(one) is type(two)
+    assert one._get_pretext() == "# PRETEXT: One" and two._get_pretext() == "# PRETEXT: Two"
+    assert one.run({"x": 1}).data == {"one": {"x": 1}}
+
+
+def test_respawn_and_snapshot_keep_the_pretext(quad_agent, echo_agent):
+    snapshot = load("snapshot")
+    root = echo_agent("Root")
+    scorer = root.generate_sub_agent_from_spec({**SPEC, "name": "Scorer"})
+    pretext = scorer._get_pretext()
+
+    with quad_agent.QUADAgent._agent_registry.replacing():
+        assert scorer.respawn()._get_pretext() == pretext
+
+    data = snapshot.dumps_snapshot(root)
+    root.children[0].unregister()
+    root.unregister()
+    restored = snapshot.loads_snapshot(data, types={type(root).__qualname__: type(root)})
+    assert restored.children[0]._get_pretext() == pretext
+
+
+# ─────────────────────────────────────────────────────────────────
+# Short-lived sub-agents
+# ─────────────────────────────────────────────────────────────────
+
+def test_sub_agent_block_releases_the_child(quad_agent, echo_agent):
+    parent = echo_agent("Parent")
+    with parent.sub_agent("Helper", "Helper", lambda data: {"seen": data}) as helper:
+        assert parent.children == [helper]
+        assert quad_agent.QUADAgent.get_agent("Helper") is helper
+        assert helper.run({"x": 1}).data == {"seen": {"x": 1}}
+    assert parent.children == [] and helper.parent is None
+    assert quad_agent.QUADAgent.get_registered_agents() == ["Parent"]
+
+
+def test_sub_agent_is_released_when_the_block_raises(quad_agent, echo_agent):
+    parent = echo_agent("Parent")
+    try:
+        with parent.sub_agent("Helper", "Helper", lambda data: data):
+            raise RuntimeError("boom")
+    except RuntimeError:
+        pass
+    assert parent.children == []
+    assert quad_agent.QUADAgent.get_agent("Helper") is None
+
+
+def test_long_lived_parent_memory_stays_flat(quad_agent, echo_agent):
+    import gc
+    import tracemalloc
+
+    parent = echo_agent("Parent")
+
+    def spawn(count: int) -> None:
+        for i in range(count):
+            with parent.sub_agent(f"Helper-{i}", "Helper", lambda data: {"n": data["n"]}) as helper:
+                assert helper.run({"n": i}).success
+
+    spawn(200)  # Warm caches (generated class, logging, interned strings)
+    gc.collect()
+    tracemalloc.start()
+    try:
+        before = tracemalloc.get_traced_memory()[0]
+        spawn(2000)
+        gc.collect()
+        growth = tracemalloc.get_traced_memory()[0] - before
+    finally:
+        tracemalloc.stop()
+
+    assert parent.children == []
+    assert quad_agent.QUADAgent.get_registered_agents() == ["Parent"]
+    assert growth < 64 * 1024, f"{growth} bytes retained by 2000 short-lived sub-agents"
@@ -0,0 +1,227 @@
+"""
+Tests for the supervisor: timer wheel, stall detection, restart limits,
+draining and replacement lifetime.
+
+Copyright (c) 2026 Gopi Suman Addanke. All Rights Reserved.
+"""
+
+import gc
+import threading
+import time
+import weakref
+
+import pytest
+
+from conftest import load
+
+quad_agent_module = load("quad_agent")
+supervisor_module = load("supervisor")
+Supervisor = supervisor_module.Supervisor
+TimerWheel = supervisor_module.TimerWheel
+
+
+class Worker(quad_agent_module.QUADAgent):
+    """
+    {"stall": True} waits without a heartbeat; {"beat": seconds} heartbeats
+    that long (or until cancelled); anything else returns at once.
+    """
+
+    def execute_task(self, input_data: dict) -> dict:
+        if input_data.get("stall"):
+            deadline = time.monotonic() + 10
+            while not self.context.cancelled and time.monotonic() < deadline:
+                time.sleep(0.005)
+        if "beat" in input_data:
+            deadline = time.monotonic() + input_data["beat"]
+            while time.monotonic() < deadline:
+                self.heartbeat()
+                time.sleep(0.01)
+        self.heartbeat()
+        return {"by": id(self)}
+
+    def _get_pretext(self) -> str:
+        return "# PRETEXT: Worker"
+
+
+def worker(name="Worker", timeout=0.2):
+    return Worker(quad_agent_module.AgentConfig(name=name, timeout=timeout, max_retries=0, enable_logging=False))
+
+
+@pytest.fixture
+def supervise(quad_agent):
+    """Factory for started supervisors with a fast wheel"""
+    started = []
+
+    def make(**options):
+        options.setdefault("tick", 0.01)
+        supervisor = Supervisor(**options).start()
+        started.append(supervisor)
+        return supervisor
+
+    yield make
+    for supervisor in started:
+        supervisor.stop()
+
+
+def run_in_thread(agent, input_data):
+    results = []
+    thread = threading.Thread(target=lambda: results.append(agent.run(input_data)))
+    thread.start()
+    return thread, results
+
+
+def registered(name="Worker"):
+    return quad_agent_module.QUADAgent._agent_registry.get(name)
+
+
+def wait_for(condition, timeout=5.0):
+    deadline = time.monotonic() + timeout
+    while not condition() and time.monotonic() < deadline:
+        time.sleep(0.01)
+    return condition()
+
+
+# ─────────────────────────────────────────────────────────────
+# Timer wheel
+# ─────────────────────────────────────────────────────────────
+
+def test_timer_wheel_fires_items_once_due():
+    wheel = TimerWheel(tick=0.01, slots=8)
+    now = time.monotonic()
+    wheel.schedule(now + 0.05, "later")
+    wheel.schedule(now + 0.02, "soon")
+    wheel.schedule(now + 0.5, "next turns")  # Beyond one turn of the wheel
+    wheel.schedule(now - 1, "overdue")
+    assert len(wheel) == 4
+
+    assert wheel.advance(now + 0.035) == ["overdue", "soon"]
+    assert wheel.advance(now + 0.1) == ["later"]
+    assert wheel.advance(now + 0.3) == []  # Its slot came round, but not its turn
+    assert wheel.advance(now + 0.6) == ["next turns"]
+    assert len(wheel) == 0
+
+
+def test_timer_wheel_keeps_items_until_their_tick_has_passed():
+    wheel = TimerWheel(tick=0.01, slots=8)
+    now = time.monotonic()
+    wheel.schedule(now + 0.05, "item")
+    assert wheel.advance(now + 0.049) == []
+    assert wheel.advance(now + 0.07) == ["item"]
+
+
+# ─────────────────────────────────────────────────────────────
+# Stalls & restarts
+# ─────────────────────────────────────────────────────────────
+
+def test_stalled_agent_is_replaced(supervise):
+    supervisor = supervise()
+    old = worker()
+    thread, results = run_in_thread(old, {"stall": True})
+    thread.join(5)
+
+    assert not results[0].success and "restarted by its supervisor" in results[0].error
+    new = registered()
+    assert new is not old and isinstance(new, Worker)
+    assert supervisor.stats()["stalls"] == 1 and supervisor.restarts == 1
+    assert supervisor.replacements == {"Worker": new}
+    assert new.run({}).data == {"by": id(new)}
+
+
+def test_heartbeats_keep_slow_calls_alive(supervise):
+    supervisor = supervise()
+    agent = worker()
+    result = agent.run({"beat": 0.5})  # Longer than the 0.2s timeout
+    assert result.success
+    assert supervisor.stalls == 0 and registered() is agent
+
+
+def test_restarts_stop_after_max_restarts_in_window(supervise):
+    supervisor = supervise(max_restarts=1, restart_window=60)
+    first = worker()
+    run_in_thread(first, {"stall": True})[0].join(5)
+    second = registered()
+    assert second is not first
+
+    thread, results = run_in_thread(second, {"stall": True})
+    thread.join(5)
+    assert not results[0].success  # Still cancelled...
+    assert registered() is second  # ...but not restarted again
+    assert supervisor.stats()["given_up"] == 1 and supervisor.restarts == 1
+
+
+def test_restart_window_forgets_old_restarts(supervise):
+    supervisor = supervise(max_restarts=1, restart_window=0.1)
+    first = worker()
+    run_in_thread(first, {"stall": True})[0].join(5)
+    time.sleep(0.1)
+    second = registered()
+    run_in_thread(second, {"stall": True})[0].join(5)
+    assert registered() not in (first, second)
+    assert supervisor.restarts == 2 and supervisor.given_up == 0
+
+
+def test_only_the_root_subtree_is_supervised(supervise):
+    watched, other = worker("Watched"), worker("Other")
+    supervisor = supervise(root=watched)
+    run_in_thread(other, {"beat": 0.01})[0].join(5)
+    assert supervisor.stats()["watched"] == 0
+
+
+# ─────────────────────────────────────────────────────────────
+# Draining
+# ─────────────────────────────────────────────────────────────
+
+def test_healthy_calls_finish_on_the_replaced_agent(supervise):
+    supervisor = supervise(drain_timeout=5)
+    old = worker()
+    healthy, healthy_results = run_in_thread(old, {"beat": 0.4})
+    stalled, _ = run_in_thread(old, {"stall": True})
+    stalled.join(5)
+    assert registered() is not old and supervisor.stats()["draining"] == 1
+
+    healthy.join(5)
+    assert healthy_results[0].success and healthy_results[0].data == {"by": id(old)}
+    assert wait_for(lambda: supervisor.stats()["draining"] == 0)
+
+
+def test_calls_still_running_after_the_drain_timeout_are_cancelled(supervise):
+    supervisor = supervise(drain_timeout=0.1)
+    old = worker()
+    healthy, healthy_results = run_in_thread(old, {"beat": 10})
+    stalled, _ = run_in_thread(old, {"stall": True})
+    stalled.join(5)
+
+    started = time.monotonic()
+    healthy.join(5)
+    assert time.monotonic() - started < 5
+    assert not healthy_results[0].success and "restarted by its supervisor" in healthy_results[0].error
+    assert supervisor.stats()["draining"] == 0
+
+
+# ─────────────────────────────────────────────────────────────
+# Replacement lifetime
+# ─────────────────────────────────────────────────────────────
+
+def test_unregistered_replacement_is_released(supervise):
+    supervisor = supervise()
+    run_in_thread(worker(), {"stall": True})[0].join(5)
+    replacement = registered()
+    assert supervisor.replacements == {"Worker": replacement}
+
+    assert replacement.unregister()
+    assert wait_for(lambda: not supervisor.replacements)
+    ref = weakref.ref(replacement)
+    del replacement
+    gc.collect()
+    assert ref() is None
+
+
+def test_replacement_replaced_again_is_released(supervise):
+    supervisor = supervise()
+    run_in_thread(worker(), {"stall": True})[0].join(5)
+    first = registered()
+
+    run_in_thread(first, {"stall": True})[0].join(5)
+    second = registered()
+    assert second is not first
+    assert supervisor.replacements == {"Worker": second}
@@ -0,0 +1,267 @@
+"""
+Tests for the cross-process SUMA WIRE transport.
+
+Workers are real local processes serving agents over Unix domain sockets,
+advertised through a name service file in a temporary directory.
+
+Copyright (c) 2026 Gopi Suman Addanke. All Rights Reserved.
+"""
+
+import multiprocessing
+import socket
+import threading
+import time
+from datetime import datetime
+from pathlib import Path
+
+import pytest
+
+from conftest import load
+
+WORKERS = 3
+
+
+def worker(index: int, tmp: str, stop) -> None:
+    """Serve an echo agent in namespace "wire" until `stop` is written to or closed"""
+    quad_agent = load("quad_agent")
+    transport = load("transport")
+
+    class EchoAgent(quad_agent.QUADAgent):
+        def execute_task(self, input_data: dict) -> dict:
+            if "note" in input_data:
+                (Path(tmp) / f"note-{index}").write_text(input_data["note"])
+            if "sleep" in input_data:
+                time.sleep(input_data["sleep"])
+            if "stream" in input_data:
+                return self._chunks(input_data["stream"], input_data.get("fail_after"))
+            return {"worker": index, "echo": input_data}
+
+        @staticmethod
+        def _chunks(count: int, fail_after):
+            for i in range(count):
+                if i == fail_after:
+                    raise RuntimeError("stream broke")
+                yield {"part": i}
+
+        def _get_pretext(self) -> str:
+            return ""
+
+    agent = EchoAgent(quad_agent.AgentConfig(
+        name=f"echo-{index}", namespace="wire", max_retries=0, enable_self_heal=False, enable_logging=False
+    ))
+    server = transport.AgentServer(
+        f"unix://{tmp}/worker-{index}.sock",
+        name_service=transport.NameService(Path(tmp) / "names.json")
+    )
+    server.start()
+    server.advertise()
+    stop.poll(None)
+    server.stop()
+    del agent
+
+
+@pytest.fixture
+def transport():
+    return load("transport")
+
+
+@pytest.fixture
+def workers(tmp_path, transport):
+    """Start the worker processes; yields (name service, processes)"""
+    ctx = multiprocessing.get_context("spawn")
+    names = transport.NameService(tmp_path / "names.json")
+    # A pipe rather than an Event: set() can hang on a waiter that was killed
+    pipes = [ctx.Pipe(duplex=False) for _ in range(WORKERS)]
+    procs = [ctx.Process(target=worker, args=(i, str(tmp_path), pipes[i][0]), daemon=True) for i in range(WORKERS)]
+    for proc in procs:
+        proc.start()
+
+    deadline = time.monotonic() + 30
+    while len(names.names()) < WORKERS:
+        assert time.monotonic() < deadline, "workers did not start"
+        time.sleep(0.05)
+
+    yield names, procs
+
+    for _, stop in pipes:
+        stop.close()
+    for proc in procs:
+        proc.join(10)
+        if proc.is_alive():
+            proc.kill()
+
+
+@pytest.fixture
+def caller(quad_agent, echo_agent, transport, workers):
+    """A local agent in namespace "wire/team" that reaches the workers"""
+    names, _ = workers
+    remote = transport.RemoteTransport(names)
+    quad_agent.QUADAgent.set_remote_transport(remote)
+    yield echo_agent("caller", namespace="wire/team")
+    quad_agent.QUADAgent.set_remote_transport(None)
+    remote.close()
+
+
+# ─────────────────────────────────────────────────────────────────
+# ROUND TRIPS
+# ─────────────────────────────────────────────────────────────────
+
+def test_request_reaches_each_worker(caller):
+    for i in range(WORKERS):
+        result = caller.talk_to_agent(f"echo-{i}", "echo", {"i": i, "at": datetime(2026, 1, 2)})
+        assert result.success, result.error
+        assert result.data == {"worker": i, "echo": {"i": i, "at": datetime(2026, 1, 2)}}
+
+
+def test_concurrent_requests_share_one_connection(caller, quad_agent):
+    remote = quad_agent.QUADAgent._remote_transport
+    results = {}
+
+    def call(i: int) -> None:
+        results[i] = caller.talk_to_agent(f"echo-{i % WORKERS}", "echo", {"i": i})
+
+    threads = [threading.Thread(target=call, args=(i,)) for i in range(60)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    assert all(results[i].data == {"worker": i % WORKERS, "echo": {"i": i}} for i in range(60))
+    assert len(remote._clients) == WORKERS
+
+
+def test_stream(caller):
+    chunks = list(caller.talk_to_agent("echo-1", "report", {"stream": 500}, stream=True))
+    assert chunks == [{"part": i} for i in range(500)]
+
+
+def test_stream_error_after_chunks(caller, quad_agent):
+    chunks = []
+    with pytest.raises(quad_agent.AgentStreamError) as raised:
+        for chunk in caller.talk_to_agent("echo-0", "report", {"stream": 10, "fail_after": 3}, stream=True):
+            chunks.append(chunk)
+    assert chunks == [{"part": i} for i in range(3)]
+    assert "stream broke" in raised.value.result.error
+
+
+def test_fire_and_forget(caller, tmp_path):
+    assert caller.talk_to_agent("echo-2", "note", {"note": "hello"}, wait_for_response=False) is None
+
+    note = tmp_path / "note-2"
+    deadline = time.monotonic() + 10
+    while not note.exists() or not note.read_text():
+        assert time.monotonic() < deadline, "message was not delivered"
+        time.sleep(0.05)
+    assert note.read_text() == "hello"
+
+
+def test_unknown_remote_agent_is_an_error_result(caller, quad_agent):
+    client = quad_agent.QUADAgent._remote_transport.resolve("echo-0", "wire").client
+    result = client.call(quad_agent.AgentMessage(to_agent="wire/missing", payload={}), timeout=10)
+    assert not result.success
+    assert "Agent not found: wire/missing" in result.error
+
+
+# ─────────────────────────────────────────────────────────────────
+# NAME SERVICE
+# ─────────────────────────────────────────────────────────────────
+
+def test_name_service_resolution(workers, tmp_path):
+    names, _ = workers
+    endpoint = f"unix://{tmp_path}/worker-1.sock"
+    assert names.names()["wire/echo-1"] == endpoint
+    assert names.lookup("echo-1", "wire/team/sub") == ("wire/echo-1", endpoint)
+    assert names.lookup("wire/echo-1") == ("wire/echo-1", endpoint)
+    assert names.lookup("echo-1") is None
+    assert names.lookup("echo-1", "other") is None
+
+
+def test_unregister_endpoint_withdraws_its_names(workers, tmp_path, transport):
+    names, _ = workers
+    other = transport.NameService(tmp_path / "names.json")
+    other.register(["wire/echo-9"], "unix:///nowhere.sock")
+    assert names.lookup("echo-9", "wire") == ("wire/echo-9", "unix:///nowhere.sock")
+
+    other.unregister_endpoint("unix:///nowhere.sock")
+    assert names.lookup("echo-9", "wire") is None
+    assert len(names.names()) == WORKERS
+
+
+def test_unresolved_name_is_not_found(caller):
+    result = caller.talk_to_agent("echo-missing", "echo", {})
+    assert not result.success
+    assert result.error == "Agent not found: echo-missing"
+
+
+# ─────────────────────────────────────────────────────────────────
+# CODEC & FRAMING ERRORS
+# ─────────────────────────────────────────────────────────────────
+
+def test_codec_rejects_unregistered_types():
+    codec = load("codec")
+    assert codec.unpack(codec.pack({"a": [1, (2, b"x")], "t": datetime(2026, 3, 4)})) == {
+        "a": [1, (2, b"x")], "t": datetime(2026, 3, 4)
+    }
+    with pytest.raises(ValueError):
+        codec.pack({"value": object()})
+
+
+def test_oversized_frame_is_rejected(transport):
+    left, right = socket.socketpair()
+    reader = transport.FramedConnection(right)
+    try:
+        left.sendall(transport.FRAME_HEADER.pack(transport.MAX_FRAME_SIZE + 1, transport.FrameType.REQUEST, 1))
+        with pytest.raises(ValueError, match="Frame too large"):
+            reader.recv()
+    finally:
+        left.close()
+        reader.close()
+
+
+def test_truncated_frame_reads_as_closed(transport):
+    left, right = socket.socketpair()
+    reader = transport.FramedConnection(right)
+    try:
+        left.sendall(transport.FRAME_HEADER.pack(10, transport.FrameType.RESULT, 1) + b"abc")
+        left.close()
+        assert reader.recv() is None
+    finally:
+        reader.close()
+
+
+def test_bad_endpoint(transport):
+    with pytest.raises(ValueError, match="Unsupported endpoint"):
+        transport.parse_endpoint("http://localhost:80")
+    assert transport.parse_endpoint("tcp://10.0.0.5:7420") == (socket.AF_INET, ("10.0.0.5", 7420))
+
+
+# ─────────────────────────────────────────────────────────────────
+# CONNECTION ERRORS
+# ─────────────────────────────────────────────────────────────────
+
+def test_connect_to_missing_endpoint(tmp_path, transport, quad_agent):
+    client = transport.AgentClient(f"unix://{tmp_path}/absent.sock")
+    with pytest.raises(OSError):
+        client.call(quad_agent.AgentMessage(to_agent="echo", payload={}), timeout=5)
+
+
+def test_worker_exit_fails_pending_requests(caller, workers):
+    _, procs = workers
+    pending = {}
+
+    def call() -> None:
+        pending["result"] = caller.talk_to_agent("echo-0", "echo", {"sleep": 30})
+
+    thread = threading.Thread(target=call)
+    thread.start()
+    time.sleep(0.5)
+    procs[0].kill()
+    thread.join(10)
+
+    assert not thread.is_alive()
+    result = pending["result"]
+    assert not result.success
+    assert result.error.startswith("Connection lost")
+
+    # Other workers are unaffected
+    assert caller.talk_to_agent("echo-1", "echo", {"i": 1}).success
@@ -0,0 +1,262 @@
+"""
+QUAD Agent Tracing
+==================
+
+Records what the agent runtime does: SUMA WIRE messages, invocations,
+every execute_task attempt with its duration and error text, self-heal
+decisions, and final results. replay.py re-drives the runtime from a
+trace with stubbed external calls.
+
+Trace file format: a sequence of segments, each a 4-byte big-endian
+length followed by zlib(codec.pack(list of event tuples)). Segments are
+appended as the buffer fills, so long recordings stream to disk.
+
+Example:
+    with TraceRecorder("traffic.qtrace"):
+        orchestrator.run({"story": "..."})
+
+Copyright (c) 2026 Gopi Suman Addanke. All Rights Reserved.
+Patent Pending (63/956,810) - QUAD Platform
+"""
+
+import itertools
+import struct
+import threading
+import time
+import zlib
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Tuple, Union
+
+from . import codec
+
+# Event kinds (first element of every event tuple)
+EVENT_MESSAGE = "message"  # (kind, t, message_id, from_agent, to_agent, action, priority)
+EVENT_START = "start"      # (kind, t, inv, parent_inv, parent_attempt, agent, class, run_kind, config)
+EVENT_ATTEMPT = "attempt"  # (kind, t, inv, duration, error)
+EVENT_HEAL = "heal"        # (kind, t, inv, error, healed, timeout, retry_delay)
+EVENT_RESULT = "result"    # (kind, t, inv, success, execution_time, retries)
+
+_SEGMENT = struct.Struct("!I")
+
+
+class TraceRecorder:
+    """
+    Runtime tracer writing a compact trace file.
+
+    Install with `QUADAgent.set_tracer(recorder)` or use it as a context
+    manager. Invocation ids are small integers, times are seconds since
+    the recorder started.
+    """
+
+    def __init__(self, path: Union[str, Path], buffer_events: int = 10000):
+        """
+        Args:
+            path: Trace file (truncated)
+            buffer_events: Events buffered before a segment is written
+        """
+        self.path = Path(path)
+        self.buffer_events = buffer_events
+        self._file = open(self.path, "wb")
+        self._events: List[Tuple] = []
+        self._ids: Dict[str, int] = {}
+        self._next_id = itertools.count()
+        self._lock = threading.Lock()
+        self._origin = time.perf_counter()
+
+    # ─────────────────────────────────────────────────────────────
+    # RUNTIME HOOKS (called by QUADAgent)
+    # ─────────────────────────────────────────────────────────────
+
+    def on_message(self, message: Any) -> None:
+        self._add((EVENT_MESSAGE, self._now(), message.id, message.from_agent,
+                   message.to_agent, message.action, message.priority))
+
+    def on_start(self, context: Any, parent: Optional[Any], kind: str) -> None:
+        agent = context.agent
+        config = agent.config
+        self._add((
+            EVENT_START, self._now(), self._id(context),
+            self._id(parent) if parent is not None else None,
+            parent.retries if parent is not None else None,
+            agent.qualified_name, type(agent).__name__, kind,
+            {"max_retries": config.max_retries, "timeout": config.timeout,
+             "retry_delay": config.retry_delay, "enable_self_heal": config.enable_self_heal}
+        ))
+
+    def on_attempt(self, context: Any, duration: float, error: Optional[BaseException]) -> None:
+        self._add((EVENT_ATTEMPT, self._now(), self._id(context), duration,
+                   str(error) if error is not None else None))
+
+    def on_heal(self, context: Any, error: BaseException, healed: bool) -> None:
+        self._add((EVENT_HEAL, self._now(), self._id(context), str(error), healed,
+                   context.timeout, context.retry_delay))
+
+    def on_result(self, context: Any, result: Any) -> None:
+        self._add((EVENT_RESULT, self._now(), self._id(context, release=True), result.success,
+                   result.execution_time, result.retries))
+
+    # ─────────────────────────────────────────────────────────────
+    # LIFECYCLE
+    # ─────────────────────────────────────────────────────────────
+
+    def flush(self) -> None:
+        """Write buffered events as a segment"""
+        with self._lock:
+            events, self._events = self._events, []
+            if not events or self._file.closed:
+                return
+            data = zlib.compress(codec.pack(events), 6)
+            self._file.write(_SEGMENT.pack(len(data)) + data)
+            self._file.flush()
+
+    def close(self) -> None:
+        self.flush()
+        with self._lock:
+            self._file.close()
+
+    def __enter__(self) -> 'TraceRecorder':
+        from .quad_agent import QUADAgent
+        QUADAgent.set_tracer(self)
+        return self
+
+    def __exit__(self, exc_type, exc, tb) -> None:
+        from .quad_agent import QUADAgent
+        if QUADAgent._tracer is self:
+            QUADAgent.set_tracer(None)
+        self.close()
+
+    def _now(self) -> float:
+        return time.perf_counter() - self._origin
+
+    def _id(self, context: Any, release: bool = False) -> int:
+        # Context ids are 32-char hex strings; the trace stores small ints
+        with self._lock:
+            inv = self._ids.pop(context.id, None) if release else self._ids.get(context.id)
+            if inv is None:
+                inv = next(self._next_id)
+                if not release:
+                    self._ids[context.id] = inv
+            return inv
+
+    def _add(self, event: Tuple) -> None:
+        with self._lock:
+            self._events.append(event)
+            full = len(self._events) >= self.buffer_events
+        if full:
+            self.flush()
+
+
+# ─────────────────────────────────────────────────────────────────
+# READING TRACES
+# ─────────────────────────────────────────────────────────────────
+
+@dataclass
+class Invocation:
+    """One recorded run (or run_many batch) of an agent"""
+    id: int
+    agent: str
+    agent_class: str
+    kind: str
+    start: float
+    config: Dict[str, Any]
+    parent: Optional[int] = None
+    parent_attempt: Optional[int] = None
+    attempts: List[Tuple[float, Optional[str]]] = field(default_factory=list)  # (duration, error)
+    heals: List[Tuple[str, bool]] = field(default_factory=list)  # (error, healed)
+    end: Optional[float] = None
+    success: Optional[bool] = None
+    retries: int = 0
+    children: List['Invocation'] = field(default_factory=list)
+
+    @property
+    def latency(self) -> Optional[float]:
+        return self.end - self.start if self.end is not None else None
+
+
+@dataclass
+class Trace:
+    """A loaded trace: invocations linked into call trees"""
+    invocations: Dict[int, Invocation]
+    roots: List[Invocation]
+    messages: int
+
+    def summary(self) -> Dict[str, Any]:
+        """Recorded throughput and latency of top-level invocations"""
+        return summarize([r.latency for r in self.roots if r.latency is not None],
+                         _span(self.roots), sum(1 for r in self.roots if r.success is False))
+
+
+def read_events(path: Union[str, Path]) -> List[Tuple]:
+    """All events of a trace file, in order"""
+    data = Path(path).read_bytes()
+    events: List[Tuple] = []
+    offset = 0
+    while offset + _SEGMENT.size <= len(data):
+        (length,) = _SEGMENT.unpack_from(data, offset)
+        offset += _SEGMENT.size
+        segment = data[offset:offset + length]
+        if len(segment) < length:
+            break  # Truncated by a crash mid-write: keep what is complete
+        events.extend(codec.unpack(zlib.decompress(segment)))
+        offset += length
+    return events
+
+
+def load_trace(path: Union[str, Path]) -> Trace:
+    """Load a trace file into call trees"""
+    invocations: Dict[int, Invocation] = {}
+    messages = 0
+    for event in read_events(path):
+        kind = event[0]
+        if kind == EVENT_MESSAGE:
+            messages += 1
+        elif kind == EVENT_START:
+            _, t, inv, parent, parent_attempt, agent, agent_class, run_kind, config = event
+            invocations[inv] = Invocation(inv, agent, agent_class, run_kind, t, config, parent, parent_attempt)
+        else:
+            invocation = invocations.get(event[2])
+            if invocation is None:
+                continue  # Started before recording began
+            if kind == EVENT_ATTEMPT:
+                invocation.attempts.append((event[3], event[4]))
+            elif kind == EVENT_HEAL:
+                invocation.heals.append((event[3], event[4]))
+            elif kind == EVENT_RESULT:
+                invocation.end, invocation.success, invocation.retries = event[1], event[3], event[5]
+
+    roots = []
+    for invocation in invocations.values():
+        parent = invocations.get(invocation.parent) if invocation.parent is not None else None
+        if parent is not None:
+            parent.children.append(invocation)
+        else:
+            roots.append(invocation)
+    roots.sort(key=lambda r: r.start)
+    return Trace(invocations, roots, messages)
+
+
+def summarize(latencies: List[float], elapsed: float, failures: int = 0) -> Dict[str, Any]:
+    """Throughput and latency percentiles (ms) of a set of invocations"""
+    ordered = sorted(latencies)
+
+    def percentile(fraction: float) -> float:
+        if not ordered:
+            return 0.0
+        return round(ordered[min(int(len(ordered) * fraction), len(ordered) - 1)] * 1000, 3)
+
+    return {
+        "invocations": len(ordered),
+        "failures": failures,
+        "elapsed": round(elapsed, 6),
+        "throughput": round(len(ordered) / elapsed, 3) if elapsed > 0 else 0.0,
+        "p50_ms": percentile(0.5),
+        "p99_ms": percentile(0.99)
+    }
+
+
+def _span(invocations: List[Invocation]) -> float:
+    ended = [i for i in invocations if i.end is not None]
+    if not ended:
+        return 0.0
+    return max(i.end for i in ended) - min(i.start for i in ended)
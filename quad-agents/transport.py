@@ -0,0 +1,505 @@
+"""
+QUAD Cross-Process Transport
+============================
+
+Lets `talk_to_agent` reach agents registered in other processes.
+
+Key Features:
+- Unix domain sockets locally ("unix:///tmp/quad.sock"), TCP optional
+  ("tcp://10.0.0.5:7420")
+- Length-prefixed binary frames carrying codec-packed AgentMessage/AgentResult
+- Many in-flight requests (and streams) multiplexed per connection
+- File-based name service mapping agent names to endpoints
+
+Frame layout (network byte order):
+    uint32 body length | uint8 frame type | uint64 request id | body
+
+Copyright (c) 2026 Gopi Suman Addanke. All Rights Reserved.
+Patent Pending (63/956,810) - QUAD Platform
+"""
+
+import dataclasses
+import itertools
+import json
+import logging
+import os
+import queue
+import socket
+import struct
+import threading
+from concurrent.futures import Future, ThreadPoolExecutor
+from contextlib import contextmanager
+from enum import IntEnum
+from pathlib import Path
+from typing import Any, Callable, Dict, Iterator, List, Optional, Tuple, Union
+
+from . import codec
+from .registry import NAMESPACE_SEPARATOR
+
+try:
+    import fcntl
+    HAS_FCNTL = True
+except ImportError:
+    HAS_FCNTL = False
+
+logger = logging.getLogger("QUADAgent.Transport")
+
+FRAME_HEADER = struct.Struct("!IBQ")
+MAX_FRAME_SIZE = 64 * 1024 * 1024
+
+# Name service file shared by all workers on a host
+DEFAULT_NAME_SERVICE = Path(os.getenv("QUAD_WIRE_NAMES", Path.home() / ".quad" / "wire" / "names.json"))
+
+
+class FrameType(IntEnum):
+    """SUMA WIRE frame types"""
+    REQUEST = 1   # AgentMessage, expects RESULT
+    SEND = 2      # AgentMessage, fire-and-forget
+    STREAM = 3    # AgentMessage, expects CHUNK* then END or ERROR
+    RESULT = 4    # AgentResult
+    CHUNK = 5     # One partial result
+    END = 6       # Stream finished
+    ERROR = 7     # AgentResult describing a failure
+
+
+# ─────────────────────────────────────────────────────────────────
+# ENDPOINTS & FRAMING
+# ─────────────────────────────────────────────────────────────────
+
+def parse_endpoint(endpoint: str) -> Tuple[int, Union[str, Tuple[str, int]]]:
+    """Split "unix:///path" or "tcp://host:port" into (family, address)"""
+    scheme, _, rest = endpoint.partition("://")
+    if scheme == "unix":
+        return socket.AF_UNIX, rest
+    if scheme == "tcp":
+        host, _, port = rest.rpartition(":")
+        return socket.AF_INET, (host, int(port))
+    raise ValueError(f"Unsupported endpoint (expected unix:// or tcp://): {endpoint}")
+
+
+class FramedConnection:
+    """Frame reader/writer over a socket; writes are safe from any thread"""
+
+    def __init__(self, sock: socket.socket):
+        self.sock = sock
+        self._reader = sock.makefile("rb")
+        self._write_lock = threading.Lock()
+
+    def send(self, frame_type: FrameType, request_id: int, body: bytes = b"") -> None:
+        header = FRAME_HEADER.pack(len(body), frame_type, request_id)
+        with self._write_lock:
+            if len(body) < 65536:
+                self.sock.sendall(header + body)
+            else:
+                # Avoid copying large bodies just to prepend the header
+                self.sock.sendall(header)
+                self.sock.sendall(body)
+
+    def recv(self) -> Optional[Tuple[FrameType, int, bytes]]:
+        """Read one frame, or None when the peer closed the connection"""
+        header = self._reader.read(FRAME_HEADER.size)
+        if len(header) < FRAME_HEADER.size:
+            return None
+        length, frame_type, request_id = FRAME_HEADER.unpack(header)
+        if length > MAX_FRAME_SIZE:
+            raise ValueError(f"Frame too large: {length} bytes")
+        body = self._reader.read(length) if length else b""
+        if len(body) < length:
+            return None
+        return FrameType(frame_type), request_id, body
+
+    def close(self) -> None:
+        try:
+            self.sock.shutdown(socket.SHUT_RDWR)
+        except OSError:
+            pass
+        self._reader.close()
+        self.sock.close()
+
+
+# ─────────────────────────────────────────────────────────────────
+# NAME SERVICE
+# ─────────────────────────────────────────────────────────────────
+
+class NameService:
+    """
+    Maps qualified agent names to endpoints through a shared JSON file.
+
+    Writers lock the file and replace it atomically; readers re-read it
+    only when it has been replaced.
+    """
+
+    def __init__(self, path: Union[str, Path, None] = None):
+        self.path = Path(path or DEFAULT_NAME_SERVICE).expanduser()
+        self._names: Dict[str, str] = {}
+        self._version: Optional[Tuple[int, int]] = None
+
+    def register(self, names: List[str], endpoint: str) -> None:
+        """Advertise agents as reachable at `endpoint`"""
+        with self._locked() as names_map:
+            names_map.update({name: endpoint for name in names})
+
+    def unregister_endpoint(self, endpoint: str) -> None:
+        """Remove every agent advertised at `endpoint`"""
+        with self._locked() as names_map:
+            for name in [n for n, e in names_map.items() if e == endpoint]:
+                del names_map[name]
+
+    def lookup(self, name: str, namespace: str = "") -> Optional[Tuple[str, str]]:
+        """
+        Find the endpoint of an agent, walking up namespaces like the registry.
+
+        Returns:
+            (qualified name, endpoint), or None
+        """
+        names = self._load()
+        scope = namespace.strip(NAMESPACE_SEPARATOR)
+        while scope:
+            key = f"{scope}{NAMESPACE_SEPARATOR}{name}"
+            if key in names:
+                return key, names[key]
+            scope = scope.rpartition(NAMESPACE_SEPARATOR)[0]
+        return (name, names[name]) if name in names else None
+
+    def names(self) -> Dict[str, str]:
+        """Current name -> endpoint mapping"""
+        return dict(self._load())
+
+    def _load(self) -> Dict[str, str]:
+        try:
+            stat = self.path.stat()
+        except FileNotFoundError:
+            return {}
+        # Writers replace the file, so a new inode means new content
+        version = (stat.st_ino, stat.st_mtime_ns)
+        if version != self._version:
+            try:
+                self._names = json.loads(self.path.read_text() or "{}")
+                self._version = version
+            except (json.JSONDecodeError, IOError):
+                pass
+        return self._names
+
+    @contextmanager
+    def _locked(self):
+        """Lock the file and yield its mapping for in-place update"""
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        with open(f"{self.path}.lock", "w") as lock_file:
+            if HAS_FCNTL:
+                fcntl.flock(lock_file, fcntl.LOCK_EX)
+            try:
+                names = json.loads(self.path.read_text() or "{}")
+            except (FileNotFoundError, json.JSONDecodeError):
+                names = {}
+
+            yield names
+
+            tmp = self.path.with_suffix(f".{os.getpid()}.tmp")
+            tmp.write_text(json.dumps(names, indent=2))
+            os.replace(tmp, self.path)
+
+
+# ─────────────────────────────────────────────────────────────────
+# SERVER
+# ─────────────────────────────────────────────────────────────────
+
+class AgentServer:
+    """
+    Serves this process's agents to other processes.
+
+    Example:
+        server = AgentServer("unix:///tmp/quad-worker-1.sock")
+        server.start()
+        server.advertise()  # publish all registered agents
+    """
+
+    def __init__(
+        self,
+        endpoint: str,
+        resolver: Optional[Callable[[str], Any]] = None,
+        max_workers: int = 32,
+        name_service: Optional[NameService] = None
+    ):
+        """
+        Args:
+            endpoint: Where to listen ("unix:///path" or "tcp://host:port")
+            resolver: Maps a qualified name to a local agent (default:
+                registry and catalog of this process, never remote)
+            max_workers: Threads executing incoming requests
+            name_service: Where `advertise` publishes agent names
+        """
+        self.endpoint = endpoint
+        self.name_service = name_service or NameService()
+        self._resolver = resolver
+        self._pool = ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix="quad-wire")
+        self._listener: Optional[socket.socket] = None
+        self._connections: List[FramedConnection] = []
+        self._running = False
+
+    def start(self) -> None:
+        """Bind the endpoint and accept connections on a background thread"""
+        family, address = parse_endpoint(self.endpoint)
+        if family == socket.AF_UNIX and os.path.exists(address):
+            os.unlink(address)
+        self._listener = socket.socket(family, socket.SOCK_STREAM)
+        if family == socket.AF_INET:
+            self._listener.setsockopt(socket.SOL_SOCKET, socket.SO_REUSEADDR, 1)
+        self._listener.bind(address)
+        self._listener.listen(128)
+        self._running = True
+        threading.Thread(target=self._accept_loop, name="quad-wire-accept", daemon=True).start()
+
+    def advertise(self, names: Optional[List[str]] = None) -> None:
+        """Publish agents (default: every registered one) in the name service"""
+        if names is None:
+            from .quad_agent import QUADAgent
+            names = QUADAgent.get_registered_agents() + QUADAgent._agent_catalog.names()
+        self.name_service.register(names, self.endpoint)
+
+    def stop(self) -> None:
+        """Stop accepting, close connections and withdraw advertised names"""
+        self._running = False
+        self.name_service.unregister_endpoint(self.endpoint)
+        if self._listener is not None:
+            self._listener.close()
+        for conn in list(self._connections):
+            conn.close()
+        self._pool.shutdown(wait=False)
+        family, address = parse_endpoint(self.endpoint)
+        if family == socket.AF_UNIX and os.path.exists(address):
+            os.unlink(address)
+
+    def _accept_loop(self) -> None:
+        while self._running:
+            try:
+                sock, _ = self._listener.accept()
+            except OSError:
+                return
+            conn = FramedConnection(sock)
+            self._connections.append(conn)
+            threading.Thread(target=self._read_loop, args=(conn,), name="quad-wire-conn", daemon=True).start()
+
+    def _read_loop(self, conn: FramedConnection) -> None:
+        try:
+            while True:
+                frame = conn.recv()
+                if frame is None:
+                    break
+                self._pool.submit(self._handle, conn, *frame)
+        except (OSError, ValueError) as e:
+            if self._running:
+                logger.warning(f"SUMA WIRE connection dropped: {e}")
+        finally:
+            if conn in self._connections:
+                self._connections.remove(conn)
+
+    def _resolve(self, name: str) -> Optional[Any]:
+        if self._resolver is not None:
+            return self._resolver(name)
+        from .quad_agent import QUADAgent
+        return QUADAgent._resolve_agent(name, remote=False)
+
+    def _handle(self, conn: FramedConnection, frame_type: FrameType, request_id: int, body: bytes) -> None:
+        from .quad_agent import AgentMessage, AgentResult, AgentStreamError
+
+        try:
+            message = AgentMessage.from_dict(codec.unpack(body))
+            agent = self._resolve(message.to_agent)
+            if agent is None:
+                raise LookupError(f"Agent not found: {message.to_agent}")
+
+            if frame_type == FrameType.REQUEST:
+                result = agent.receive_message(message)
+                conn.send(FrameType.RESULT, request_id, codec.pack(result.to_dict()))
+            elif frame_type == FrameType.SEND:
+                agent.receive_message(message)
+            elif frame_type == FrameType.STREAM:
+                for chunk in agent.receive_message_stream(message):
+                    conn.send(FrameType.CHUNK, request_id, codec.pack(chunk))
+                conn.send(FrameType.END, request_id)
+
+        except AgentStreamError as e:
+            self._send_error(conn, request_id, e.result)
+        except OSError:
+            pass  # Peer went away mid-response
+        except Exception as e:
+            logger.error(f"SUMA WIRE request failed: {e}")
+            if frame_type != FrameType.SEND:
+                self._send_error(conn, request_id, AgentResult(success=False, error=str(e)))
+
+    @staticmethod
+    def _send_error(conn: FramedConnection, request_id: int, result: Any) -> None:
+        try:
+            conn.send(FrameType.ERROR, request_id, codec.pack(result.to_dict()))
+        except OSError:
+            pass
+
+
+# ─────────────────────────────────────────────────────────────────
+# CLIENT
+# ─────────────────────────────────────────────────────────────────
+
+class AgentClient:
+    """
+    Multiplexing client for one AgentServer endpoint.
+
+    Any number of threads may issue requests concurrently over the single
+    connection; responses are matched back by request id.
+    """
+
+    def __init__(self, endpoint: str, stream_buffer: int = 1024):
+        """
+        Args:
+            endpoint: Server endpoint
+            stream_buffer: Chunks buffered per stream before the connection
+                stops reading (and the server's sends block)
+        """
+        self.endpoint = endpoint
+        self.stream_buffer = stream_buffer
+        self._conn: Optional[FramedConnection] = None
+        self._connect_lock = threading.Lock()
+        self._pending: Dict[int, Union[Future, queue.Queue]] = {}
+        self._ids = itertools.count(1)
+
+    def call(self, message: Any, timeout: Optional[float] = None) -> Any:
+        """Send a message and wait for the AgentResult"""
+        from .quad_agent import AgentResult
+
+        request_id = next(self._ids)
+        future: Future = Future()
+        self._pending[request_id] = future
+        self._send(FrameType.REQUEST, request_id, message)
+        try:
+            frame_type, body = future.result(timeout)
+        finally:
+            self._pending.pop(request_id, None)
+        return AgentResult.from_dict(codec.unpack(body))
+
+    def send(self, message: Any) -> None:
+        """Fire-and-forget a message"""
+        self._send(FrameType.SEND, next(self._ids), message)
+
+    def stream(self, message: Any) -> Iterator[Any]:
+        """Send a message and iterate over the partial results"""
+        from .quad_agent import AgentResult, AgentStreamError
+
+        request_id = next(self._ids)
+        chunks: queue.Queue = queue.Queue(maxsize=self.stream_buffer)
+        self._pending[request_id] = chunks
+        self._send(FrameType.STREAM, request_id, message)
+        try:
+            while True:
+                frame_type, body = chunks.get()
+                if frame_type == FrameType.CHUNK:
+                    yield codec.unpack(body)
+                elif frame_type == FrameType.END:
+                    return
+                else:
+                    raise AgentStreamError(AgentResult.from_dict(codec.unpack(body)))
+        finally:
+            self._pending.pop(request_id, None)
+
+    def close(self) -> None:
+        with self._connect_lock:
+            if self._conn is not None:
+                self._conn.close()
+                self._conn = None
+
+    def _send(self, frame_type: FrameType, request_id: int, message: Any) -> None:
+        self._connection().send(frame_type, request_id, codec.pack(message.to_dict()))
+
+    def _connection(self) -> FramedConnection:
+        conn = self._conn
+        if conn is not None:
+            return conn
+        with self._connect_lock:
+            if self._conn is None:
+                family, address = parse_endpoint(self.endpoint)
+                sock = socket.socket(family, socket.SOCK_STREAM)
+                sock.connect(address)
+                self._conn = FramedConnection(sock)
+                threading.Thread(target=self._read_loop, args=(self._conn,),
+                                 name="quad-wire-client", daemon=True).start()
+            return self._conn
+
+    def _read_loop(self, conn: FramedConnection) -> None:
+        from .quad_agent import AgentResult
+
+        try:
+            while True:
+                frame = conn.recv()
+                if frame is None:
+                    break
+                frame_type, request_id, body = frame
+                waiter = self._pending.get(request_id)
+                if isinstance(waiter, Future):
+                    waiter.set_result((frame_type, body))
+                elif waiter is not None:
+                    waiter.put((frame_type, body))
+        except (OSError, ValueError):
+            pass
+
+        # Connection lost: fail everything still waiting
+        with self._connect_lock:
+            if self._conn is conn:
+                self._conn = None
+        lost = codec.pack(AgentResult(success=False, error=f"Connection lost: {self.endpoint}").to_dict())
+        for waiter in list(self._pending.values()):
+            if isinstance(waiter, Future):
+                if not waiter.done():
+                    waiter.set_result((FrameType.ERROR, lost))
+            else:
+                waiter.put((FrameType.ERROR, lost))
+
+
+# ─────────────────────────────────────────────────────────────────
+# REMOTE AGENTS
+# ─────────────────────────────────────────────────────────────────
+
+class RemoteAgent:
+    """Proxy that forwards SUMA WIRE messages to an agent in another process"""
+
+    def __init__(self, qualified_name: str, client: AgentClient):
+        self.qualified_name = qualified_name
+        self.name = qualified_name.rpartition(NAMESPACE_SEPARATOR)[2]
+        self.client = client
+
+    def receive_message(self, message: Any) -> Any:
+        return self.client.call(dataclasses.replace(message, to_agent=self.qualified_name))
+
+    def receive_message_stream(self, message: Any) -> Iterator[Any]:
+        return self.client.stream(dataclasses.replace(message, to_agent=self.qualified_name))
+
+    def __repr__(self) -> str:
+        return f"<RemoteAgent(name={self.qualified_name}, endpoint={self.client.endpoint})>"
+
+
+class RemoteTransport:
+    """
+    Resolves agent names that are not local through the name service.
+
+    Example:
+        QUADAgent.set_remote_transport(RemoteTransport())
+        agent.talk_to_agent("Indexer", "index", {...})  # may run in another process
+    """
+
+    def __init__(self, name_service: Optional[NameService] = None):
+        self.name_service = name_service or NameService()
+        self._clients: Dict[str, AgentClient] = {}
+        self._lock = threading.Lock()
+
+    def resolve(self, name: str, namespace: str = "") -> Optional[RemoteAgent]:
+        found = self.name_service.lookup(name, namespace)
+        if found is None:
+            return None
+        qualified_name, endpoint = found
+        client = self._clients.get(endpoint)
+        if client is None:
+            with self._lock:
+                client = self._clients.setdefault(endpoint, AgentClient(endpoint))
+        return RemoteAgent(qualified_name, client)
+
+    def close(self) -> None:
+        for client in self._clients.values():
+            client.close()
+        self._clients.clear()
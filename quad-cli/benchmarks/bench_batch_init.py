@@ -0,0 +1,104 @@
+#!/usr/bin/env python3
+"""
+Benchmark: quad init --batch scaling
+====================================
+
+Generates N org workbooks (each with a Resources sheet and 5 project tabs)
+and runs the batch over them with 1, 2, 4, ... parser processes, up to the
+CPU count, with the parse cache off. Without a DSN it is a dry run (parse
+and validate). With one, each run also saves: quad_organizations and
+quad_domains are created in that database if missing and the bench orgs
+are inserted, so point it at a scratch database.
+
+Usage:
+  python quad-cli/benchmarks/bench_batch_init.py [workbooks] [rows] [dsn]
+"""
+
+import os
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
+
+from bench_excel_parser import ROLES, SKILLS
+
+SCHEMA = """
+    CREATE TABLE IF NOT EXISTS quad_organizations (
+        id UUID PRIMARY KEY DEFAULT gen_random_uuid(),
+        slug TEXT UNIQUE NOT NULL
+    );
+    CREATE TABLE IF NOT EXISTS quad_domains (
+        id UUID PRIMARY KEY DEFAULT gen_random_uuid(),
+        name TEXT NOT NULL,
+        slug VARCHAR(20) UNIQUE NOT NULL,
+        description TEXT,
+        methodology TEXT,
+        company_id UUID,
+        is_active BOOLEAN
+    );
+"""
+
+
+def generate(directory: Path, count: int, rows: int) -> None:
+    from openpyxl import Workbook
+
+    for n in range(count):
+        workbook = Workbook(write_only=True)
+        overview = workbook.create_sheet("Overview")
+        overview.append(["Org Name", f"Bench Org {n}"])
+        overview.append(["Org Code", f"BENCH{n}"])
+        resources = workbook.create_sheet("Resources")
+        resources.append(["Name", "Email", "Role", "Skills"])
+        for i in range(rows):
+            resources.append([f"Person {i}", f"person{i}@org{n}.example", ROLES[i % 5], SKILLS[i % 5]])
+        for p in range(5):
+            sheet = workbook.create_sheet(f"Project {p + 1}")
+            sheet.append(["Project Name", f"B{n} Project {p + 1}"])
+            sheet.append(["Type", "Web Application"])
+        workbook.save(directory / f"org{n:04d}.xlsx")
+
+
+def main():
+    count = int(sys.argv[1]) if len(sys.argv) > 1 else 24
+    rows = int(sys.argv[2]) if len(sys.argv) > 2 else 3000
+    dsn = sys.argv[3] if len(sys.argv) > 3 else os.environ.get("QUAD_BENCH_DSN")
+
+    from quad_cli import db
+    from quad_cli.commands.batch import find_workbooks, run_batch_init
+
+    if dsn:
+        import psycopg
+        db.configure(dsn)
+        with psycopg.connect(dsn) as conn:
+            conn.execute(SCHEMA)
+            for n in range(count):
+                conn.execute("INSERT INTO quad_organizations (slug) VALUES (%s) ON CONFLICT DO NOTHING",
+                             (f"bench{n}",))
+
+    cpus = os.cpu_count() or 1
+    steps = sorted({1, 2, 4, 8, 16, cpus} & set(range(1, cpus + 1))) or [1]
+    mode = "parse + save" if dsn else "dry run"
+
+    with tempfile.TemporaryDirectory() as tmp:
+        start = time.perf_counter()
+        generate(Path(tmp), count, rows)
+        paths = find_workbooks(tmp)
+        print(f"\n  {count} workbooks x {rows:,} resource rows, generated in "
+              f"{time.perf_counter() - start:.1f}s; {cpus} CPUs; {mode}\n")
+
+        base = None
+        for workers in steps:
+            report = run_batch_init(paths, workers=workers, dry_run=not dsn, use_cache=False)
+            assert sum(report["summary"].values()) == count and not report["summary"].keys() - {"ok", "parsed"}, \
+                report["summary"]
+            rate = report["workbooks_per_second"]
+            base = base or rate
+            print(f"  workers {workers:>3}   {report['total_seconds']:>7.2f}s   {rate:>7.1f} workbooks/s   "
+                  f"({rate / base:.1f}x)")
+    print()
+
+
+if __name__ == "__main__":
+    main()
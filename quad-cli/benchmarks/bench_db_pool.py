@@ -0,0 +1,94 @@
+#!/usr/bin/env python3
+"""
+Benchmark: Pooled, prepared saves vs a connection per save
+==========================================================
+
+Repeats the init save (org lookup + upsert of 20 domains, one
+transaction) N times:
+- fresh connection: psycopg.connect per save, as init did before quad_cli.db
+- pooled + prepared: quad_cli.db.transaction(), hot statements prepared
+
+Uses TEMP tables, so nothing real is touched; the pool is sized to one
+connection so every save sees the same session's temp tables.
+
+Usage:
+  python quad-cli/benchmarks/bench_db_pool.py [dsn] [saves]
+
+The DSN defaults to $QUAD_BENCH_DSN, then to db.DB_CONFIG. Connection
+setup costs more with TCP, TLS and password auth than over a local socket.
+"""
+
+import os
+import sys
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
+
+import psycopg
+from psycopg.rows import dict_row
+
+from quad_cli import db
+
+SCHEMA = """
+    CREATE TEMP TABLE IF NOT EXISTS quad_organizations (
+        id UUID PRIMARY KEY DEFAULT gen_random_uuid(),
+        slug TEXT UNIQUE NOT NULL
+    );
+    CREATE TEMP TABLE IF NOT EXISTS quad_domains (
+        id UUID PRIMARY KEY DEFAULT gen_random_uuid(),
+        name TEXT NOT NULL,
+        slug VARCHAR(20) UNIQUE NOT NULL,
+        description TEXT,
+        methodology TEXT,
+        company_id UUID,
+        is_active BOOLEAN
+    );
+    INSERT INTO quad_organizations (slug) VALUES ('acme') ON CONFLICT DO NOTHING;
+"""
+
+PROJECTS = [{"name": f"Project {i}", "description": "Core banking revamp"} for i in range(20)]
+
+
+def save(cur) -> None:
+    org_id = db.find_org_id(cur, "acme")
+    assert org_id is not None
+    assert len(db.upsert_domains(cur, org_id, PROJECTS)) == len(PROJECTS)
+
+
+def main():
+    args = sys.argv[1:]
+    dsn = args.pop(0) if args and not args[0].isdigit() else os.environ.get("QUAD_BENCH_DSN")
+    saves = int(args[0]) if args else 200
+    db.configure(dsn, min_size=1, max_size=1)
+    conninfo = db.conninfo()
+
+    # Fresh connection per save; temp tables recreated each time, which
+    # the timing excludes
+    fresh = 0.0
+    for _ in range(saves):
+        start = time.perf_counter()
+        with psycopg.connect(conninfo, row_factory=dict_row) as conn:
+            setup = time.perf_counter()
+            conn.execute(SCHEMA)
+            skipped = time.perf_counter() - setup
+            with conn.transaction(), conn.cursor() as cur:
+                save(cur)
+        fresh += time.perf_counter() - start - skipped
+
+    with db.transaction() as cur:
+        cur.execute(SCHEMA)
+    start = time.perf_counter()
+    for _ in range(saves):
+        with db.transaction() as cur:
+            save(cur)
+    pooled = time.perf_counter() - start
+    db.close_pool()
+
+    print(f"\n  {saves} saves of {len(PROJECTS)} domains\n")
+    print(f"  fresh connection    {fresh / saves * 1000:>7.2f} ms/save")
+    print(f"  pooled + prepared   {pooled / saves * 1000:>7.2f} ms/save   ({fresh / pooled:.1f}x)\n")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,117 @@
+#!/usr/bin/env python3
+"""
+Benchmark: Domain upsert strategies
+===================================
+
+Upserts N projects into quad_domains three ways, each in one transaction:
+- row by row: one INSERT ... ON CONFLICT ... RETURNING round trip per
+  project (what _save_to_database used to do)
+- pipelined executemany: same statement, psycopg pipeline mode
+- set-based: upsert_domains(), one statement over unnested arrays
+
+Runs against a TEMP quad_domains table (it shadows the real one for this
+session only), first inserting, then updating the same slugs.
+
+Usage:
+  python quad-cli/benchmarks/bench_domain_upsert.py [dsn] [rows ...]
+
+The DSN defaults to $QUAD_BENCH_DSN, then to db.DB_CONFIG. Round trips
+over a local socket are cheap; over a network the row-by-row cost grows
+with latency, the set-based cost does not.
+"""
+
+import os
+import sys
+import time
+import uuid
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
+
+import psycopg
+from psycopg.rows import dict_row
+
+from quad_cli.db import DB_CONFIG, domain_slug, upsert_domains
+
+ROW_SQL = """
+    INSERT INTO quad_domains (name, slug, description, methodology, company_id, is_active)
+    VALUES (%s, %s, %s, 'quad', %s, true)
+    ON CONFLICT (slug) DO UPDATE SET
+        name = EXCLUDED.name,
+        description = EXCLUDED.description
+    RETURNING id
+"""
+
+SCHEMA = """
+    CREATE TEMP TABLE quad_domains (
+        id UUID PRIMARY KEY DEFAULT gen_random_uuid(),
+        name TEXT NOT NULL,
+        slug VARCHAR(20) UNIQUE NOT NULL,
+        description TEXT,
+        methodology TEXT,
+        company_id UUID,
+        is_active BOOLEAN
+    )
+"""
+
+
+def row_by_row(conn, org_id, projects) -> dict:
+    ids = {}
+    with conn.transaction(), conn.cursor() as cur:
+        for project in projects:
+            slug = domain_slug(project['name'])
+            cur.execute(ROW_SQL, (project['name'], slug, project['description'], org_id))
+            ids[slug] = cur.fetchone()['id']
+    return ids
+
+
+def pipelined(conn, org_id, projects) -> dict:
+    params = [(p['name'], domain_slug(p['name']), p['description'], org_id) for p in projects]
+    ids = {}
+    with conn.transaction(), conn.cursor() as cur:
+        cur.executemany(ROW_SQL, params, returning=True)
+        for (_, slug, _, _) in params:
+            ids[slug] = cur.fetchone()['id']
+            cur.nextset()
+    return ids
+
+
+def set_based(conn, org_id, projects) -> dict:
+    with conn.transaction(), conn.cursor() as cur:
+        return upsert_domains(cur, org_id, projects)
+
+
+def main():
+    args = sys.argv[1:]
+    dsn = args.pop(0) if args and not args[0].isdigit() else os.environ.get("QUAD_BENCH_DSN")
+    sizes = [int(a) for a in args] or [100, 1000, 10000]
+    connect = (lambda: psycopg.connect(dsn, row_factory=dict_row)) if dsn else \
+        (lambda: psycopg.connect(**DB_CONFIG, row_factory=dict_row))
+
+    org_id = uuid.uuid4()
+    print(f"\n  {'rows':>7}  {'strategy':<22}{'insert':>12}{'update':>12}   rows/s")
+    for size in sizes:
+        projects = [{"name": f"Project {i:06d}", "description": f"Domain number {i}"} for i in range(size)]
+        for label, upsert in (("row by row", row_by_row), ("pipelined executemany", pipelined),
+                              ("set-based (unnest)", set_based)):
+            with connect() as conn:
+                conn.execute(SCHEMA)
+                start = time.perf_counter()
+                ids = upsert(conn, org_id, projects)
+                inserted = time.perf_counter() - start
+                for p in projects:
+                    p["description"] += "."
+                start = time.perf_counter()
+                again = upsert(conn, org_id, projects)
+                updated = time.perf_counter() - start
+
+                assert ids == again and len(ids) == size
+                count = conn.execute("SELECT count(*) AS n FROM quad_domains").fetchone()["n"]
+                assert count == size
+            print(f"  {size:>7,}  {label:<22}{inserted * 1000:>10.1f}ms{updated * 1000:>10.1f}ms"
+                  f"   {size / inserted:>9,.0f}")
+    print()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,106 @@
+#!/usr/bin/env python3
+"""
+Benchmark: journaled drafts vs whole-file saves
+===============================================
+
+Saving every answer of a `quad init` session, two ways:
+- rewrite: the whole draft JSON rewritten (and fsynced) after each answer,
+  the only way to get the same durability from the old save_draft
+- journal: quad_cli.utils.drafts (append per answer, fsync per batch,
+  periodic compaction)
+
+Then resuming the draft, and listing D drafts with their progress:
+parsing every draft vs reading the drafts index.
+
+Usage:
+  python quad-cli/benchmarks/bench_drafts.py [answers] [drafts]
+"""
+
+import json
+import os
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
+
+from quad_cli.utils.drafts import Draft, progress, read_index
+
+
+def answers(count: int):
+    """A session: org fields, then people, then project fields"""
+    yield "set", ["org", "org_name"], "Acme Bank"
+    for i in range(count - 1):
+        if i % 3:
+            yield "append", ["resources"], {"name": f"Person {i}", "email": f"person{i}@acme.example",
+                                             "role": "Developer", "skills": "python, sql"}
+        else:
+            yield "set", ["org", f"setting_{i}"], f"value {i}"
+
+
+def rewrite(directory: Path, count: int) -> float:
+    data = {"org": {}, "resources": [], "projects": []}
+    path = directory / "rewrite.json"
+    start = time.perf_counter()
+    for op, keys, value in answers(count):
+        if op == "set":
+            data[keys[0]][keys[1]] = value
+        else:
+            data[keys[0]].append(value)
+        with open(path, "w") as f:
+            f.write(json.dumps(data, indent=2))
+            f.flush()
+            os.fsync(f.fileno())
+    return time.perf_counter() - start
+
+
+def journal(directory: Path, count: int) -> float:
+    draft = Draft("journal", directory)
+    start = time.perf_counter()
+    for op, keys, value in answers(count):
+        getattr(draft, op)(keys, value)
+    draft.close()
+    return time.perf_counter() - start
+
+
+def timed(fn, *args) -> float:
+    start = time.perf_counter()
+    fn(*args)
+    return time.perf_counter() - start
+
+
+def main():
+    count = int(sys.argv[1]) if len(sys.argv) > 1 else 2000
+    drafts = int(sys.argv[2]) if len(sys.argv) > 2 else 300
+
+    with tempfile.TemporaryDirectory() as tmp:
+        directory = Path(tmp)
+        print(f"\n  {count:,} answers per session\n")
+        old, new = rewrite(directory, count), journal(directory, count)
+        print(f"  save each answer   rewrite {old * 1e3 / count:>7.3f} ms   journal {new * 1e3 / count:>7.3f} ms"
+              f"   ({old / new:.0f}x)")
+
+        resume = timed(Draft.load, "journal", directory)
+        print(f"  resume             {resume * 1e3:>7.1f} ms")
+
+        # D drafts, each closed mid-session (snapshot + journal tail)
+        for d in range(drafts):
+            draft = Draft(f"draft-{d}", directory)
+            for op, keys, value in answers(count // 4):
+                getattr(draft, op)(keys, value)
+            draft.close(compact=False)
+        read_index(directory)  # Build the index once
+
+        def parse_all():
+            return {p.stem: progress(Draft.load(p.stem, directory).data)
+                    for p in directory.glob("draft-*.json")}
+
+        old, new = timed(parse_all), timed(read_index, directory)
+        print(f"  list {drafts} drafts    parse all {old * 1e3:>7.1f} ms   index {new * 1e3:>7.1f} ms"
+              f"   ({old / new:.0f}x)")
+    print()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,110 @@
+#!/usr/bin/env python3
+"""
+Benchmark: ExcelParser full vs streaming mode
+=============================================
+
+Generates an org workbook (Overview, a Resources sheet with 100k rows and
+20 project tabs), then parses it in a fresh process per mode and reports
+wall time and peak RSS.
+
+Usage:
+  python quad-cli/benchmarks/bench_excel_parser.py [rows]
+"""
+
+import json
+import resource
+import subprocess
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
+
+ROLES = ["Developer", "QA Engineer", "Designer", "Product Manager", "DevOps"]
+SKILLS = ["python, sql", "react, typescript", "java, spring", "figma", "k8s, terraform"]
+
+
+def generate(path: Path, rows: int, projects: int = 20) -> None:
+    from openpyxl import Workbook
+
+    workbook = Workbook(write_only=True)
+    overview = workbook.create_sheet("Overview")
+    for key, value in [("Org Name", "Acme Bank"), ("Org Code", "ACME"), ("Timezone", "America/New_York")]:
+        overview.append([key, value])
+
+    resources = workbook.create_sheet("Resources")
+    resources.append(["Name", "Email", "Role", "Skills", "Team", "Location", "Start Date", "Capacity"])
+    for i in range(rows):
+        resources.append([
+            f"Person {i}", f"person{i}@acme.example", ROLES[i % 5], SKILLS[i % 5],
+            f"team-{i % 200}", "Remote" if i % 3 else "NYC", "2026-01-05", 0.5 + (i % 6) / 10
+        ])
+
+    for p in range(projects):
+        sheet = workbook.create_sheet(f"Project {p + 1}")
+        for key, value in [("Project Name", f"Project {p + 1}"), ("Description", "Core banking revamp"),
+                           ("Type", "Web Application"), ("Frontend", "React.js"), ("Backend", "Go")]:
+            sheet.append([key, value])
+    workbook.save(path)
+
+
+def child(mode: str, path: str) -> None:
+    from quad_cli.commands.init import ExcelParser
+
+    start = time.perf_counter()
+    parser = ExcelParser(path, streaming=(mode == "streaming"))
+    overview = parser.parse_overview()
+    resources = parser.parse_resources()
+    projects = parser.parse_projects()
+    emails = sum(1 for r in resources if r.get("email"))
+    parser.close()
+    elapsed = time.perf_counter() - start
+
+    assert overview["org_code"] == "ACME" and emails == len(resources)
+    print(json.dumps({
+        "seconds": elapsed,
+        "rss_mb": resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / 1024,
+        "resources": len(resources),
+        "projects": len(projects)
+    }))
+
+
+def main():
+    rows = int(sys.argv[1]) if len(sys.argv) > 1 else 100000
+
+    with tempfile.TemporaryDirectory() as tmp:
+        path = Path(tmp) / "org-setup.xlsx"
+        start = time.perf_counter()
+        generate(path, rows)
+        print(f"\n  Generated {rows:,} resource rows in {time.perf_counter() - start:.1f}s "
+              f"({path.stat().st_size / 1e6:.1f} MB)\n")
+
+        # An interpreter that only imports the parser, for the RSS baseline
+        baseline = subprocess.run(
+            [sys.executable, "-c", "import resource, sys; sys.path.insert(0, sys.argv[1]); "
+             "import quad_cli.commands.init; print(resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / 1024)",
+             str(Path(__file__).resolve().parents[1])],
+            capture_output=True, text=True, check=True
+        )
+        print(f"  {'baseline':<10}{'':>10}{float(baseline.stdout):>10.0f} MB peak RSS")
+
+        results = {}
+        for mode in ("full", "streaming"):
+            out = subprocess.run([sys.executable, __file__, "--child", mode, str(path)],
+                                 capture_output=True, text=True, check=True)
+            results[mode] = json.loads(out.stdout.strip().splitlines()[-1])
+            r = results[mode]
+            print(f"  {mode:<10}{r['seconds']:>9.2f}s{r['rss_mb']:>10.0f} MB peak RSS   "
+                  f"({r['resources']:,} resources, {r['projects']} projects)")
+
+        full, streaming = results["full"], results["streaming"]
+        print(f"\n  streaming: {full['seconds'] / streaming['seconds']:.1f}x faster, "
+              f"{full['rss_mb'] / streaming['rss_mb']:.1f}x less peak memory\n")
+
+
+if __name__ == "__main__":
+    if len(sys.argv) > 1 and sys.argv[1] == "--child":
+        child(sys.argv[2], sys.argv[3])
+    else:
+        main()
@@ -0,0 +1,152 @@
+#!/usr/bin/env python3
+"""
+Benchmark: Excel export, in-memory vs streaming
+===============================================
+
+Writes the same org (N resources, 20 projects) the way
+_generate_filled_excel used to (resources held in a list, a full
+in-memory Workbook) and the way `quad export` does (rows generated on
+the fly into a write-only Workbook). Each run is a fresh process; peak
+RSS should grow with N for the first and stay flat for the second.
+
+With a DSN, also seeds a scratch org in that database and exports it
+with `quad export` (server-side cursors). Creates its tables there; use
+a scratch database.
+
+Usage:
+  python quad-cli/benchmarks/bench_export.py [rows ...] [--dsn DSN]
+"""
+
+import json
+import os
+import resource
+import subprocess
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
+
+from bench_excel_parser import ROLES, SKILLS
+
+SCHEMA = """
+    DROP TABLE IF EXISTS quad_domains, quad_users, quad_org_settings, quad_organizations;
+    CREATE TABLE quad_organizations (id UUID PRIMARY KEY DEFAULT gen_random_uuid(), slug TEXT UNIQUE NOT NULL);
+    CREATE TABLE quad_domains (
+        id UUID PRIMARY KEY DEFAULT gen_random_uuid(), name TEXT NOT NULL, slug VARCHAR(20) UNIQUE NOT NULL,
+        description TEXT, methodology TEXT, company_id UUID, is_active BOOLEAN);
+    CREATE TABLE quad_users (
+        id UUID PRIMARY KEY DEFAULT gen_random_uuid(), company_id UUID NOT NULL, email VARCHAR(255) UNIQUE NOT NULL,
+        password_hash VARCHAR(255) NOT NULL, role VARCHAR(50), full_name VARCHAR(255), is_active BOOLEAN);
+    CREATE TABLE quad_org_settings (org_id UUID NOT NULL, setting_key TEXT NOT NULL, setting_value TEXT,
+        UNIQUE (org_id, setting_key));
+"""
+
+OVERVIEW = {"org_name": "Acme Bank", "org_code": "ACME", "timezone": "America/New_York"}
+
+
+def resources(rows: int):
+    for i in range(rows):
+        yield {"name": f"Person {i}", "email": f"person{i}@acme.example",
+               "role": ROLES[i % 5], "skills": SKILLS[i % 5]}
+
+
+def projects(count: int = 20):
+    for p in range(count):
+        yield {"name": f"Project {p + 1}", "description": "Core banking revamp", "type": "Web Application",
+               "frontend": "React.js", "backend": "Go", "deliverables": ["web", "api"]}
+
+
+def in_memory(path: str, rows: int) -> None:
+    """The pre-streaming _generate_filled_excel"""
+    from openpyxl import Workbook
+
+    people, tabs = list(resources(rows)), list(projects())
+    workbook = Workbook()
+    sheet = workbook.active
+    sheet.title = "Overview"
+    for row in [("Field", "Value")] + list(OVERVIEW.items()):
+        sheet.append(row)
+    sheet = workbook.create_sheet("Resources")
+    sheet.append(["Name", "Email", "Role", "Skills"])
+    for r in people:
+        sheet.append([r["name"], r["email"], r["role"], r["skills"]])
+    for i, project in enumerate(tabs):
+        sheet = workbook.create_sheet(f"Project {i + 1}")
+        for key in ("name", "description", "type", "frontend", "backend"):
+            sheet.append((key, project[key]))
+    workbook.save(path)
+
+
+def child(mode: str, rows: int, path: str) -> None:
+    start = time.perf_counter()
+    if mode == "in-memory":
+        in_memory(path, rows)
+    elif mode == "streaming":
+        from quad_cli.commands.export import write_workbook
+        write_workbook(path, OVERVIEW, resources(rows), projects())
+    else:
+        from quad_cli.commands.export import database_snapshot, write_workbook
+        with database_snapshot("ACME") as (overview, people, tabs):
+            write_workbook(path, overview, people, tabs)
+    elapsed = time.perf_counter() - start
+    print(json.dumps({"seconds": elapsed, "rss_mb": resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / 1024}))
+
+
+def seed(dsn: str, rows: int) -> None:
+    import psycopg
+
+    with psycopg.connect(dsn) as conn:
+        conn.execute(SCHEMA)
+        org_id = conn.execute("INSERT INTO quad_organizations (slug) VALUES ('acme') RETURNING id").fetchone()[0]
+        conn.execute("""INSERT INTO quad_org_settings
+                        SELECT %s, key, value FROM (VALUES ('org_name', 'Acme Bank'), ('timezone', 'UTC')) v(key, value)""",
+                     (org_id,))
+        conn.execute("""INSERT INTO quad_users (company_id, email, password_hash, role, full_name, is_active)
+                        SELECT %s, 'person' || i || '@acme.example', 'x', 'DEVELOPER', 'Person ' || i, true
+                        FROM generate_series(1, %s) i""", (org_id, rows))
+        conn.execute("""INSERT INTO quad_domains (company_id, name, slug, description, is_active)
+                        SELECT %s, 'Project ' || p, 'project-' || p, 'Core banking revamp', true
+                        FROM generate_series(1, 20) p""", (org_id,))
+
+
+def main():
+    args = sys.argv[1:]
+    dsn = None
+    if "--dsn" in args:
+        i = args.index("--dsn")
+        dsn = args[i + 1]
+        del args[i:i + 2]
+    sizes = [int(a) for a in args] or [10000, 50000, 200000]
+
+    modes = ["in-memory", "streaming"] + (["database"] if dsn else [])
+    env = dict(os.environ)
+    if dsn:
+        from psycopg.conninfo import conninfo_to_dict
+        info = conninfo_to_dict(dsn)
+        env.update(DB_HOST=str(info.get("host", "localhost")), DB_PORT=str(info.get("port", 5432)),
+                   DB_NAME=str(info.get("dbname", "")), DB_USER=str(info.get("user", "")),
+                   DB_PASSWORD=str(info.get("password", "")))
+
+    print(f"\n  {'rows':>9}  " + "".join(f"{m:>24}" for m in modes))
+    with tempfile.TemporaryDirectory() as tmp:
+        for rows in sizes:
+            if dsn:
+                seed(dsn, rows)
+            cells = []
+            for mode in modes:
+                path = str(Path(tmp) / f"{mode}.xlsx")
+                out = subprocess.run([sys.executable, __file__, "--child", mode, str(rows), path],
+                                     capture_output=True, text=True, check=True, env=env)
+                r = json.loads(out.stdout.strip().splitlines()[-1])
+                cells.append(f"{r['seconds']:>8.2f}s {r['rss_mb']:>7.0f} MB RSS")
+            print(f"  {rows:>9,}  " + "".join(f"{c:>24}" for c in cells))
+    print()
+
+
+if __name__ == "__main__":
+    if len(sys.argv) > 1 and sys.argv[1] == "--child":
+        child(sys.argv[2], int(sys.argv[3]), sys.argv[4])
+    else:
+        main()
@@ -0,0 +1,127 @@
+#!/usr/bin/env python3
+"""
+Benchmark: Incremental re-init vs blind upsert
+==============================================
+
+An org with D domains and U users is already in the database; the
+workbook is re-run after editing about 1% of its rows. Compares:
+- blind: upsert every domain, user and setting (set-based statements,
+  so this is the fast version of "write everything")
+- incremental: load state, diff, write only the delta
+
+Reports rows written, WAL generated, transaction time and lock time
+(first write to commit: reading and diffing take no row locks). Creates
+its tables in the given database; use a scratch database.
+
+Usage:
+  python quad-cli/benchmarks/bench_incremental.py DSN [domains] [users]
+"""
+
+import random
+import sys
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
+
+import psycopg
+from psycopg.rows import dict_row
+
+from quad_cli.commands.incremental import apply_diff, compute_diff, count_changes, load_state
+
+SCHEMA = """
+    DROP TABLE IF EXISTS quad_domains, quad_users, quad_org_settings, quad_organizations;
+    CREATE TABLE quad_organizations (id UUID PRIMARY KEY DEFAULT gen_random_uuid(), slug TEXT UNIQUE NOT NULL);
+    CREATE TABLE quad_domains (
+        id UUID PRIMARY KEY DEFAULT gen_random_uuid(), name TEXT NOT NULL, slug VARCHAR(20) UNIQUE NOT NULL,
+        description TEXT, methodology TEXT, company_id UUID, is_active BOOLEAN);
+    CREATE TABLE quad_users (
+        id UUID PRIMARY KEY DEFAULT gen_random_uuid(), company_id UUID NOT NULL, email VARCHAR(255) UNIQUE NOT NULL,
+        password_hash VARCHAR(255) NOT NULL, role VARCHAR(50), full_name VARCHAR(255), is_active BOOLEAN);
+    CREATE TABLE quad_org_settings (org_id UUID NOT NULL, setting_key TEXT NOT NULL, setting_value TEXT,
+        UNIQUE (org_id, setting_key));
+"""
+
+BLIND = [
+    """INSERT INTO quad_domains (slug, name, description, methodology, company_id, is_active)
+       SELECT slug, name, description, 'quad', %s, true
+       FROM unnest(%s::text[], %s::text[], %s::text[]) AS t(slug, name, description)
+       ON CONFLICT (slug) DO UPDATE SET name = EXCLUDED.name, description = EXCLUDED.description""",
+    """INSERT INTO quad_users (email, full_name, role, company_id, password_hash, is_active)
+       SELECT email, full_name, role, %s, '', true
+       FROM unnest(%s::text[], %s::text[], %s::text[]) AS t(email, full_name, role)
+       ON CONFLICT (email) DO UPDATE SET full_name = EXCLUDED.full_name, role = EXCLUDED.role""",
+    """INSERT INTO quad_org_settings (org_id, setting_key, setting_value)
+       SELECT %s, key, value FROM unnest(%s::text[], %s::text[]) AS t(key, value)
+       ON CONFLICT (org_id, setting_key) DO UPDATE SET setting_value = EXCLUDED.setting_value""",
+]
+
+
+def make_desired(domains: int, users: int, edit: float, rng: random.Random) -> dict:
+    def edited(text: str) -> str:
+        return text + " (edited)" if rng.random() < edit else text
+
+    return {
+        "domains": {f"project-{i:05d}": {"name": f"Project {i:05d}", "description": edited(f"Domain {i}")}
+                    for i in range(domains)},
+        "users": {f"person{i}@acme.example": {"full_name": f"Person {i}", "role": edited("Developer")}
+                  for i in range(users)},
+        "settings": {key: {"value": value} for key, value in
+                     [("org_name", "Acme"), ("timezone", "America/New_York"), ("size", "large")]},
+    }
+
+
+def blind(cur, org_id, desired) -> tuple:
+    writing = time.perf_counter()
+    d, u, s = desired["domains"], desired["users"], desired["settings"]
+    cur.execute(BLIND[0], (org_id, list(d), [v["name"] for v in d.values()], [v["description"] for v in d.values()]))
+    rows = cur.rowcount
+    cur.execute(BLIND[1], (org_id, list(u), [v["full_name"] for v in u.values()], [v["role"] for v in u.values()]))
+    rows += cur.rowcount
+    cur.execute(BLIND[2], (org_id, list(s), [v["value"] for v in s.values()]))
+    return rows + cur.rowcount, writing
+
+
+def incremental(cur, org_id, desired) -> tuple:
+    diff = compute_diff(load_state(cur, org_id), desired)
+    writing = time.perf_counter()
+    return (sum(apply_diff(cur, org_id, diff).values()) if count_changes(diff) else 0), writing
+
+
+def measure(conn, org_id, desired, write) -> tuple:
+    lsn = conn.execute("SELECT pg_current_wal_lsn() AS l").fetchone()["l"]
+    start = time.perf_counter()
+    with conn.transaction(), conn.cursor() as cur:
+        rows, writing = write(cur, org_id, desired)
+    end = time.perf_counter()
+    wal = conn.execute("SELECT pg_wal_lsn_diff(pg_current_wal_lsn(), %s) AS b", (lsn,)).fetchone()["b"]
+    return rows, int(wal), end - start, end - writing
+
+
+def main():
+    if len(sys.argv) < 2:
+        print(__doc__)
+        sys.exit(1)
+    dsn = sys.argv[1]
+    domains = int(sys.argv[2]) if len(sys.argv) > 2 else 500
+    users = int(sys.argv[3]) if len(sys.argv) > 3 else 20000
+
+    with psycopg.connect(dsn, row_factory=dict_row, autocommit=True) as conn:
+        conn.execute(SCHEMA)
+        org_id = conn.execute("INSERT INTO quad_organizations (slug) VALUES ('acme') RETURNING id").fetchone()["id"]
+        initial = make_desired(domains, users, 0.0, random.Random(1))
+
+        print(f"\n  {domains:,} domains, {users:,} users; re-run after editing ~1% of rows\n")
+        print(f"  {'':<14}{'rows written':>14}{'WAL':>12}{'transaction':>14}{'locks held':>13}")
+        for label, write in (("blind upsert", blind), ("incremental", incremental)):
+            conn.execute("TRUNCATE quad_domains, quad_users, quad_org_settings")
+            measure(conn, org_id, initial, incremental)
+            desired = make_desired(domains, users, 0.01, random.Random(2))
+            rows, wal, elapsed, locked = measure(conn, org_id, desired, write)
+            print(f"  {label:<14}{rows:>14,}{wal / 1024:>10,.0f}kB{elapsed * 1000:>12.1f}ms"
+                  f"{locked * 1000:>11.1f}ms")
+    print()
+
+
+if __name__ == "__main__":
+    main()
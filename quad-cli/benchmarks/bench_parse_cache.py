@@ -0,0 +1,91 @@
+#!/usr/bin/env python3
+"""
+Benchmark: ExcelParser parse cache
+==================================
+
+Parses the bench_excel_parser org workbook (100k resource rows, 20 project
+tabs) three times with cache=True: cold, warm (file unchanged), and after
+one project tab was edited. Each run is a fresh process, like repeated
+`quad init` invocations, with HOME pointed at a scratch directory so the
+real ~/.quad/cache/ is left alone.
+
+Usage:
+  python quad-cli/benchmarks/bench_parse_cache.py [rows]
+"""
+
+import json
+import os
+import subprocess
+import sys
+import tempfile
+import time
+import zipfile
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
+
+from bench_excel_parser import generate
+
+
+def child(path: str) -> None:
+    from quad_cli.commands.init import ExcelParser
+
+    start = time.perf_counter()
+    parser = ExcelParser(path, streaming=True, cache=True)
+    overview = parser.parse_overview()
+    resources = parser.parse_resources()
+    projects = parser.parse_projects()
+    stats = parser.cache.stats()
+    loaded = parser._workbook is not None
+    parser.close()
+    elapsed = time.perf_counter() - start
+
+    assert overview["org_code"] == "ACME" and all(r.get("email") for r in resources)
+    print(json.dumps({"seconds": elapsed, "loaded": loaded,
+                      "resources": len(resources), "projects": len(projects), **stats}))
+
+
+def edit_project(path: Path, sheet_part: str) -> None:
+    """Rewrite one sheet part in place, as saving after a small edit would"""
+    edited = path.with_suffix(".tmp")
+    with zipfile.ZipFile(path) as src, zipfile.ZipFile(edited, "w", zipfile.ZIP_DEFLATED) as dst:
+        for item in src.infolist():
+            data = src.read(item.filename)
+            if item.filename == sheet_part:
+                data = data.replace(b">Go<", b">Rust<")
+            dst.writestr(item, data)
+    edited.replace(path)
+
+
+def main():
+    rows = int(sys.argv[1]) if len(sys.argv) > 1 else 100000
+
+    with tempfile.TemporaryDirectory() as tmp:
+        path = Path(tmp) / "org-setup.xlsx"
+        env = dict(os.environ, HOME=tmp)
+        generate(path, rows)
+        print(f"\n  {rows:,} resource rows, 20 project tabs ({path.stat().st_size / 1e6:.1f} MB)\n")
+
+        def run(label: str) -> dict:
+            out = subprocess.run([sys.executable, __file__, "--child", str(path)],
+                                 capture_output=True, text=True, check=True, env=env)
+            r = json.loads(out.stdout.strip().splitlines()[-1])
+            print(f"  {label:<14}{r['seconds']:>8.2f}s   {r['hits']:>2} cached, {r['misses']:>2} parsed"
+                  f"{'' if r['loaded'] else '   (workbook never loaded)'}")
+            return r
+
+        cold = run("cold")
+        warm = run("warm")
+        edit_project(path, "xl/worksheets/sheet5.xml")
+        edited = run("one tab edited")
+
+        size = sum(f.stat().st_size for f in (Path(tmp) / ".quad" / "cache").glob("*.bin")) / 1e6
+        print(f"\n  warm run {cold['seconds'] / warm['seconds']:.0f}x faster than cold; "
+              f"after an edit {cold['seconds'] / edited['seconds']:.0f}x; cache {size:.1f} MB on disk\n")
+
+
+if __name__ == "__main__":
+    if len(sys.argv) > 1 and sys.argv[1] == "--child":
+        child(sys.argv[2])
+    else:
+        main()
@@ -0,0 +1,143 @@
+#!/usr/bin/env python3
+"""
+Benchmark: org source formats
+=============================
+
+Writes the same org (3 overview keys, N resources, 20 projects) as an
+Excel workbook, a CSV directory, a JSON document, a JSON Lines file and,
+with pyarrow installed, a Parquet directory. Each is then read the way
+`quad init` reads it (open_source, overview, resources, projects; parse
+cache off) in a fresh process, reporting wall time, throughput and peak
+RSS.
+
+Usage:
+  python quad-cli/benchmarks/bench_sources.py [rows]
+"""
+
+import csv
+import json
+import resource
+import subprocess
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
+
+from bench_excel_parser import ROLES, SKILLS, generate
+
+HEADER = ["Name", "Email", "Role", "Skills", "Team", "Location", "Start Date", "Capacity"]
+OVERVIEW = [("Org Name", "Acme Bank"), ("Org Code", "ACME"), ("Timezone", "America/New_York")]
+PROJECT_KEYS = ["Project Name", "Description", "Type", "Frontend", "Backend"]
+
+
+def resource_rows(rows: int):
+    """The rows bench_excel_parser.generate writes"""
+    for i in range(rows):
+        yield [f"Person {i}", f"person{i}@acme.example", ROLES[i % 5], SKILLS[i % 5],
+               f"team-{i % 200}", "Remote" if i % 3 else "NYC", "2026-01-05", 0.5 + (i % 6) / 10]
+
+
+def projects(count: int = 20):
+    return [[f"Project {p + 1}", "Core banking revamp", "Web Application", "React.js", "Go"]
+            for p in range(count)]
+
+
+def write_all(directory: Path, rows: int) -> dict:
+    paths = {}
+
+    paths["excel"] = directory / "org.xlsx"
+    generate(paths["excel"], rows)
+
+    paths["csv"] = directory / "csv"
+    paths["csv"].mkdir()
+    with open(paths["csv"] / "overview.csv", "w", newline="") as f:
+        csv.writer(f).writerows(OVERVIEW)
+    with open(paths["csv"] / "resources.csv", "w", newline="") as f:
+        writer = csv.writer(f)
+        writer.writerow(HEADER)
+        writer.writerows(resource_rows(rows))
+    with open(paths["csv"] / "projects.csv", "w", newline="") as f:
+        csv.writer(f).writerows([PROJECT_KEYS] + projects())
+
+    paths["json"] = directory / "org.json"
+    with open(paths["json"], "w") as f:
+        json.dump({"overview": dict(OVERVIEW),
+                   "resources": [dict(zip(HEADER, row)) for row in resource_rows(rows)],
+                   "projects": [dict(zip(PROJECT_KEYS, p)) for p in projects()]}, f)
+
+    paths["jsonl"] = directory / "org.jsonl"
+    with open(paths["jsonl"], "w") as f:
+        f.write(json.dumps({"kind": "overview", **dict(OVERVIEW)}) + "\n")
+        for p in projects():
+            f.write(json.dumps({"kind": "project", **dict(zip(PROJECT_KEYS, p))}) + "\n")
+        for row in resource_rows(rows):
+            f.write(json.dumps(dict(zip(HEADER, row))) + "\n")
+
+    try:
+        import pyarrow as pa
+        import pyarrow.parquet as pq
+    except ImportError:
+        return paths
+    paths["parquet"] = directory / "parquet"
+    paths["parquet"].mkdir()
+    pq.write_table(pa.table({"key": [k for k, _ in OVERVIEW], "value": [v for _, v in OVERVIEW]}),
+                   paths["parquet"] / "overview.parquet")
+    columns = list(zip(*resource_rows(rows)))
+    pq.write_table(pa.table({h: list(c) for h, c in zip(HEADER, columns)}), paths["parquet"] / "resources.parquet")
+    pq.write_table(pa.table({k: list(c) for k, c in zip(PROJECT_KEYS, zip(*projects()))}),
+                   paths["parquet"] / "projects.parquet")
+    return paths
+
+
+def size(path: Path) -> int:
+    return sum(p.stat().st_size for p in path.iterdir()) if path.is_dir() else path.stat().st_size
+
+
+def child(path: str) -> None:
+    from quad_cli.sources import open_source
+
+    start = time.perf_counter()
+    with open_source(path, cache=False) as source:
+        overview = source.parse_overview()
+        resources = source.parse_resources()
+        parsed = source.parse_projects()
+    elapsed = time.perf_counter() - start
+
+    assert overview["org_code"] == "ACME" and all(r.get("email") for r in resources)
+    print(json.dumps({
+        "seconds": elapsed,
+        "rss_mb": resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / 1024,
+        "resources": len(resources),
+        "projects": len(parsed)
+    }))
+
+
+def main():
+    rows = int(sys.argv[1]) if len(sys.argv) > 1 else 100000
+
+    with tempfile.TemporaryDirectory() as tmp:
+        paths = write_all(Path(tmp), rows)
+        print(f"\n  {rows:,} resources, 20 projects, same data in every format\n")
+        print(f"  {'format':<10}{'size':>9}{'time':>10}{'rows/s':>12}{'peak RSS':>11}")
+
+        base = None
+        for fmt, path in paths.items():
+            out = subprocess.run([sys.executable, __file__, "--child", str(path)],
+                                 capture_output=True, text=True, check=True)
+            r = json.loads(out.stdout.strip().splitlines()[-1])
+            assert r["resources"] == rows and r["projects"] == 20, (fmt, r)
+            base = base or r["seconds"]
+            print(f"  {fmt:<10}{size(path) / 1e6:>7.1f}MB{r['seconds']:>9.2f}s{rows / r['seconds']:>12,.0f}"
+                  f"{r['rss_mb']:>8.0f} MB   ({base / r['seconds']:.1f}x)")
+        if "parquet" not in paths:
+            print("  parquet   (skipped: pip install pyarrow)")
+    print()
+
+
+if __name__ == "__main__":
+    if len(sys.argv) > 1 and sys.argv[1] == "--child":
+        child(sys.argv[2])
+    else:
+        main()
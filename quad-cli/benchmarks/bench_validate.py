@@ -0,0 +1,71 @@
+#!/usr/bin/env python3
+"""
+Benchmark: quad validate on a large org workbook
+================================================
+
+Generates the bench_excel_parser workbook (100k resource rows, 20 project
+tabs) with one bad email, one duplicate name and one unknown backend
+planted, then times validate_workbook against a streaming ExcelParser
+parse of the same file (which checks nothing).
+
+Usage:
+  python quad-cli/benchmarks/bench_validate.py [rows]
+"""
+
+import sys
+import tempfile
+import time
+import zipfile
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
+
+from bench_excel_parser import generate
+
+
+def plant_errors(path: Path) -> None:
+    """Rewrite three cells in place: row 10's email, row 20's name, Project 3's backend"""
+    with zipfile.ZipFile(path) as source:
+        parts = {item: source.read(item) for item in source.infolist()}
+    with zipfile.ZipFile(path, "w", zipfile.ZIP_DEFLATED) as target:
+        for item, data in parts.items():
+            if item.filename == "xl/worksheets/sheet2.xml":
+                data = data.replace(b">person8@acme.example<", b">person8.acme.example<", 1)
+                data = data.replace(b">Person 18<", b">Person 0<", 1)
+            elif item.filename == "xl/worksheets/sheet5.xml":
+                data = data.replace(b">Go<", b">Rust<", 1)
+            target.writestr(item, data)
+
+
+def main():
+    rows = int(sys.argv[1]) if len(sys.argv) > 1 else 100000
+
+    from quad_cli.commands.init import ExcelParser
+    from quad_cli.validation import validate_workbook
+
+    with tempfile.TemporaryDirectory() as tmp:
+        path = Path(tmp) / "org-setup.xlsx"
+        generate(path, rows)
+        plant_errors(path)
+
+        start = time.perf_counter()
+        report = validate_workbook(str(path))
+        validated = time.perf_counter() - start
+        assert sorted(i.cell for i in report.errors) == ["Project 3!B5", "Resources!A20", "Resources!B10"], \
+            [i.cell for i in report.issues]
+
+        start = time.perf_counter()
+        with ExcelParser(str(path), streaming=True) as parser:
+            parser.parse_overview()
+            parser.parse_resources()
+            parser.parse_projects()
+        parsed = time.perf_counter() - start
+
+    print(f"\n  {rows:,} resource rows, 20 project tabs\n")
+    print(f"  validate_workbook        {validated:>6.2f}s   {report.rows / validated:>9,.0f} rows/s   "
+          f"{len(report.errors)} errors found")
+    print(f"  ExcelParser (streaming)  {parsed:>6.2f}s   (parse only, no checks)\n")
+
+
+if __name__ == "__main__":
+    main()
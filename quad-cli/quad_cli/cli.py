@@ -8,10 +8,13 @@ Usage:
 
 Commands:
   init      Initialize a project from Excel or interactively
+  validate  Check org workbooks and report every problem with its cell
+  export    Write an org (database, source file or draft) to Excel
   login     Authenticate with Anthropic or Enterprise SSO
   question  Ask a question with org context
   deploy    Deploy projects to GCP
   status    Show current configuration status
+  bench     Performance regression checks (replay recorded traffic)
 
 Copyright (c) 2026 Gopi Suman Addanke. All Rights Reserved.
 """
@@ -33,17 +36,94 @@ def main():
 @main.command()
 @click.argument("excel_file", required=False)
 @click.option("--resume", "-r", help="Resume from a saved draft")
+@click.option("--list-drafts", is_flag=True, help="List saved drafts with their progress")
 @click.option("--interactive", "-i", is_flag=True, help="Force interactive mode")
-def init(excel_file, resume, interactive):
+@click.option("--no-cache", is_flag=True, help="Re-parse every sheet (ignore ~/.quad/cache/)")
+@click.option("--batch", "-b", is_flag=True, help="Non-interactive: many workbooks (dir, glob or manifest)")
+@click.option("--workers", "-w", type=int, help="Batch: parser processes (default: CPU count)")
+@click.option("--db-concurrency", type=int, default=4, show_default=True, help="Batch: concurrent DB saves")
+@click.option("--report", type=click.Path(dir_okay=False), help="Batch: write the JSON report here")
+@click.option("--dry-run", is_flag=True, help="Batch: parse and validate only")
+@click.option("--incremental", is_flag=True, help="Write only what changed since the last init")
+@click.option("--plan", is_flag=True, help="Show what --incremental would change, write nothing")
+@click.option("--prune", is_flag=True, help="Incremental: also remove domains, users and settings the file lacks")
+def init(excel_file, resume, list_drafts, interactive, no_cache, batch, workers, db_concurrency, report, dry_run,
+         incremental, plan, prune):
     """Initialize a project from Excel or interactively.
 
     Examples:
       quad init                      # Interactive mode
       quad init @org-setup.xlsx      # From Excel file
+      quad init @exports/acme/       # From CSV exports (also .json, .jsonl, .parquet)
       quad init --resume bank-demo   # Resume saved draft
+      quad init --list-drafts        # Saved drafts and how far each got
+      quad init @org.xlsx --no-cache # Ignore cached sheets
+      quad init orgs/ --batch --report report.json   # Every workbook in orgs/
+      quad init @org.xlsx --plan     # Diff the workbook against the database
+      quad init @org.xlsx --incremental              # Apply only that diff
+      quad init @org.xlsx --incremental --prune      # Also remove what the file lacks
     """
+    if list_drafts:
+        from quad_cli.commands.init import show_drafts
+        show_drafts()
+        return
+
+    if batch:
+        if not excel_file:
+            raise click.UsageError("--batch needs a directory, glob or manifest")
+        from quad_cli.commands.batch import run_batch
+        source = excel_file[1:] if excel_file.startswith('@') else excel_file
+        run_batch(source, workers, db_concurrency, report, dry_run, use_cache=not no_cache)
+        return
+
+    if prune and not (incremental or plan):
+        raise click.UsageError("--prune needs --incremental or --plan")
+
+    if incremental or plan:
+        if not excel_file:
+            raise click.UsageError("--incremental/--plan need an Excel file")
+        from quad_cli.commands.incremental import run_incremental
+        filepath = excel_file[1:] if excel_file.startswith('@') else excel_file
+        run_incremental(filepath, plan_only=plan, use_cache=not no_cache, prune=prune)
+        return
+
     from quad_cli.commands.init import run_init
-    run_init(excel_file, resume, interactive)
+    run_init(excel_file, resume, interactive, use_cache=not no_cache)
+
+
+@main.command()
+@click.argument("sources", nargs=-1, required=True)
+@click.option("--json", "as_json", is_flag=True, help="Print the full report as JSON")
+@click.option("--strict", is_flag=True, help="Fail on warnings too")
+@click.option("--limit", type=int, default=50, show_default=True, help="Issues shown per workbook")
+def validate(sources, as_json, strict, limit):
+    """Check org workbooks without saving anything.
+
+    Examples:
+      quad validate org-setup.xlsx
+      quad validate orgs/ --strict           # Every workbook in orgs/ (CI)
+      quad validate org-setup.xlsx --json
+    """
+    from quad_cli.commands.validate import run_validate
+    run_validate(sources, as_json, strict, limit)
+
+
+@main.command()
+@click.argument("org_code", required=False)
+@click.option("--from", "source", metavar="SOURCE", help="Org source file or directory instead of the database")
+@click.option("--draft", metavar="NAME", help="Saved quad init draft instead of the database")
+@click.option("--output", "-o", metavar="FILE", help="Output .xlsx (default: quad-<org>-setup.xlsx)")
+def export(org_code, source, draft, output):
+    """Write an org to an Excel workbook quad init can read back.
+
+    Examples:
+      quad export ACME                       # From the database
+      quad export ACME -o acme-review.xlsx
+      quad export --from exports/acme/       # CSV, JSON, JSON Lines, Parquet, Excel
+      quad export --draft bank-demo
+    """
+    from quad_cli.commands.export import run_export
+    run_export(org_code, source, draft, output)
 
 
 @main.command()
@@ -123,6 +203,34 @@ def status():
     print()
 
 
+@main.group()
+def bench():
+    """Performance regression checks for the agent runtime."""
+    pass
+
+
+@bench.command("replay")
+@click.argument("trace_file", type=click.Path(exists=True, dir_okay=False))
+@click.option("--baseline", "-b", help="Baseline report (default: <trace>.baseline.json)")
+@click.option("--save-baseline", is_flag=True, help="Store this run as the baseline")
+@click.option("--latency-scale", type=float, default=1.0, show_default=True,
+              help="Multiplier for recorded external-call latencies")
+@click.option("--time-scale", type=float, help="Replay at recorded arrival times x this (open loop)")
+@click.option("--concurrency", "-c", type=int, default=16, show_default=True, help="Top-level calls in flight")
+@click.option("--limit", "-n", type=int, help="Replay only the first N top-level calls")
+@click.option("--tolerance", type=float, default=0.1, show_default=True, help="Allowed relative regression")
+def bench_replay(trace_file, baseline, save_baseline, latency_scale, time_scale, concurrency, limit, tolerance):
+    """Replay a recorded agent trace and compare against a baseline.
+
+    Examples:
+      quad bench replay traffic.qtrace --save-baseline
+      quad bench replay traffic.qtrace --latency-scale 0.1
+      quad bench replay traffic.qtrace --time-scale 1.0 -c 64
+    """
+    from quad_cli.commands.bench import run_replay
+    run_replay(trace_file, baseline, save_baseline, latency_scale, time_scale, concurrency, limit, tolerance)
+
+
 @main.command()
 def hook():
     """Run as Claude Code hook (internal use).
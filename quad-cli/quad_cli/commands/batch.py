@@ -0,0 +1,272 @@
+#!/usr/bin/env python3
+"""
+QUAD Batch Init
+===============
+
+Headless bulk provisioning: `quad init --batch` over many org workbooks.
+
+Usage:
+  quad init orgs/ --batch                        # Every org source in a directory
+  quad init "orgs/*/setup.xlsx" --batch          # A glob
+  quad init manifest.txt --batch                 # One path per line (or .json list)
+  quad init orgs/ --batch --workers 8 --db-concurrency 4 --report report.json
+  quad init orgs/ --batch --dry-run              # Parse and validate only
+
+A directory holds one org per entry: each workbook, CSV, JSON(L) or
+Parquet file, and each subdirectory of CSV or Parquet files.
+
+Every value is taken as parsed, with the defaults the interactive prompts
+would offer (QuadInit.accept_parsed). Workbooks are parsed and validated
+(quad_cli.validation, the checks `quad validate` runs) in a process pool. Each valid org is saved as soon as its parse finishes,
+through the shared quad_cli.db pool, with at most `db_concurrency` saves
+in flight. The JSON report lists status, timings and errors per workbook.
+
+Copyright (c) 2026 Gopi Suman Addanke. All Rights Reserved.
+"""
+
+import glob
+import json
+import os
+import sys
+import time
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor, as_completed
+from datetime import datetime
+from pathlib import Path
+from typing import Any, Dict, List, Optional
+
+from quad_cli import db
+from quad_cli.sources import SUFFIXES, detect_format
+from quad_cli.utils.console import Console
+
+OK = "ok"
+INVALID = "invalid"
+FAILED = "failed"
+ORG_MISSING = "org_missing"
+PARSED = "parsed"  # Dry run
+
+
+# ─────────────────────────────────────────────────────────────
+# Workbook discovery
+# ─────────────────────────────────────────────────────────────
+
+def _is_source_dir(path: Path) -> bool:
+    """Whether a directory is one org (CSV or Parquet files)"""
+    try:
+        detect_format(str(path))
+        return True
+    except ValueError:
+        return False
+
+
+def _manifest_entries(path: Path) -> Optional[List[str]]:
+    """Paths listed in a manifest (.txt, or .json holding a list of paths);
+    None if the file is not a manifest"""
+    if path.suffix.lower() == ".txt":
+        entries = [line.strip() for line in path.read_text().splitlines()]
+        return [e for e in entries if e and not e.startswith("#")]
+
+    try:
+        entries = json.loads(path.read_text())
+    except (UnicodeDecodeError, json.JSONDecodeError):
+        return None
+    if isinstance(entries, dict):
+        entries = entries.get("workbooks")
+    if isinstance(entries, list) and all(isinstance(e, str) for e in entries):
+        return entries
+    return None  # An org as JSON
+
+
+def find_workbooks(source: str) -> List[str]:
+    """Org source paths from a directory, a glob or a manifest (.txt / .json)"""
+    path = Path(source)
+    if path.is_dir():
+        return sorted(
+            str(p) for p in path.iterdir()
+            if not p.name.startswith(("~$", "."))
+            and (p.suffix.lower() in SUFFIXES if p.is_file() else _is_source_dir(p))
+        )
+
+    if path.is_file() and path.suffix.lower() in (".txt", ".json"):
+        entries = _manifest_entries(path)
+        if entries is not None:
+            return [str(path.parent / e) if not os.path.isabs(e) else e for e in entries]
+
+    if path.is_file():
+        return [str(path)]
+    return sorted(glob.glob(source, recursive=True))
+
+
+# ─────────────────────────────────────────────────────────────
+# Parse + validate (worker processes)
+# ─────────────────────────────────────────────────────────────
+
+def validate(path: str, projects: List[Dict], resources: int) -> Dict[str, List[str]]:
+    """Problems that block saving (errors) and ones that do not (warnings)
+
+    The checks are those of `quad validate` (quad_cli.validation), each
+    reported as "<cell>: <message>".
+    """
+    from quad_cli.validation import ERROR, validate_workbook
+
+    errors, warnings = [], []
+    for issue in validate_workbook(path).issues:
+        (errors if issue.severity == ERROR else warnings).append(f"{issue.cell}: {issue.message}")
+    if not projects:
+        warnings.append("No project tabs found")
+    if not resources:
+        warnings.append("No team members found")
+    return {"errors": errors, "warnings": warnings}
+
+
+def parse_workbook(path: str, use_cache: bool = True) -> Dict[str, Any]:
+    """Parse, normalize and validate one workbook; never raises"""
+    from quad_cli.commands.init import QuadInit
+
+    result = {"path": path, "status": PARSED, "errors": [], "warnings": []}
+    start = time.perf_counter()
+    try:
+        init = QuadInit(path, use_cache=use_cache)
+        init.load()
+        init.accept_parsed()
+        result.update(validate(path, init.projects, len(init.resources)))
+        result["org_code"] = init.org_data.get('org_code')
+        result["resources"] = len(init.resources)
+        result["projects"] = [
+            {"name": p['name'], "description": p.get('description'), "type": p.get('type')}
+            for p in init.projects
+        ]
+        if result["errors"]:
+            result["status"] = INVALID
+    except Exception as e:
+        result["status"] = FAILED
+        result["errors"].append(f"Parse error: {type(e).__name__}: {e}")
+    result["parse_seconds"] = round(time.perf_counter() - start, 4)
+    return result
+
+
+# ─────────────────────────────────────────────────────────────
+# Save (shared DB pool, bounded)
+# ─────────────────────────────────────────────────────────────
+
+def save_workbook(result: Dict[str, Any]) -> Dict[str, Any]:
+    """Upsert a parsed workbook's projects in one transaction; never raises"""
+    from quad_cli.commands.init import save_projects
+
+    start = time.perf_counter()
+    try:
+        domain_ids = save_projects(result["org_code"], result["projects"])
+        if domain_ids is None:
+            result["status"] = ORG_MISSING
+            result["errors"].append(f"Organization '{result['org_code']}' not found in database")
+        else:
+            result["status"] = OK
+            result["domains"] = {slug: str(id_) for slug, id_ in domain_ids.items()}
+    except Exception as e:
+        result["status"] = FAILED
+        result["errors"].append(f"Database error: {type(e).__name__}: {e}")
+    result["save_seconds"] = round(time.perf_counter() - start, 4)
+    return result
+
+
+# ─────────────────────────────────────────────────────────────
+# Batch
+# ─────────────────────────────────────────────────────────────
+
+def run_batch_init(
+    paths: List[str],
+    workers: Optional[int] = None,
+    db_concurrency: int = 4,
+    dry_run: bool = False,
+    use_cache: bool = True
+) -> Dict[str, Any]:
+    """Parse and save many workbooks; returns the report
+
+    Args:
+        paths: Workbook paths
+        workers: Parser processes (default: CPU count; 1 parses in-process)
+        db_concurrency: Saves in flight at once (also the DB pool size)
+        dry_run: Parse and validate only
+        use_cache: Reuse parsed sheets from ~/.quad/cache/
+    """
+    workers = max(1, min(workers or os.cpu_count() or 1, len(paths) or 1))
+    started = datetime.now().isoformat()
+    start = time.perf_counter()
+    results: Dict[str, Dict[str, Any]] = {}
+
+    if not dry_run:
+        db.configure(max_size=db_concurrency)
+    savers = ThreadPoolExecutor(max_workers=db_concurrency, thread_name_prefix="quad-save")
+    saving = []
+
+    def parsed(result: Dict[str, Any]) -> None:
+        results[result["path"]] = result
+        if result["status"] == PARSED and not dry_run:
+            saving.append(savers.submit(save_workbook, result))
+
+    try:
+        if workers == 1:
+            for path in paths:
+                parsed(parse_workbook(path, use_cache))
+        else:
+            with ProcessPoolExecutor(max_workers=workers) as parsers:
+                futures = {parsers.submit(parse_workbook, path, use_cache): path for path in paths}
+                for future in as_completed(futures):
+                    try:
+                        parsed(future.result())
+                    except Exception as e:  # Worker process died
+                        parsed({"path": futures[future], "status": FAILED, "warnings": [],
+                                "errors": [f"Worker error: {type(e).__name__}: {e}"]})
+        for future in saving:
+            future.result()
+    finally:
+        savers.shutdown(wait=True)
+
+    elapsed = time.perf_counter() - start
+    ordered = [results[path] for path in paths]
+    counts: Dict[str, int] = {}
+    for result in ordered:
+        counts[result["status"]] = counts.get(result["status"], 0) + 1
+
+    return {
+        "started_at": started,
+        "workers": workers,
+        "db_concurrency": 0 if dry_run else db_concurrency,
+        "dry_run": dry_run,
+        "total_seconds": round(elapsed, 4),
+        "workbooks_per_second": round(len(paths) / elapsed, 2) if elapsed else None,
+        "parse_seconds": round(sum(r.get("parse_seconds", 0) for r in ordered), 4),
+        "save_seconds": round(sum(r.get("save_seconds", 0) for r in ordered), 4),
+        "summary": counts,
+        "workbooks": ordered
+    }
+
+
+def run_batch(
+    source: str,
+    workers: Optional[int] = None,
+    db_concurrency: int = 4,
+    report_file: Optional[str] = None,
+    dry_run: bool = False,
+    use_cache: bool = True
+) -> None:
+    """CLI entry: run a batch and write the JSON report (stdout if no file)"""
+    paths = find_workbooks(source)
+    if not paths:
+        Console.error(f"No workbooks found: {source}")
+        sys.exit(1)
+    if not dry_run and not db.HAS_PSYCOPG:
+        Console.error("psycopg not installed. Run: pip install psycopg[binary]")
+        sys.exit(1)
+
+    report = run_batch_init(paths, workers, db_concurrency, dry_run, use_cache)
+    text = json.dumps(report, indent=2, default=str)
+    if report_file:
+        Path(report_file).write_text(text)
+        summary = ", ".join(f"{count} {status}" for status, count in sorted(report["summary"].items()))
+        Console.success(f"{len(paths)} workbooks in {report['total_seconds']:.1f}s ({summary})")
+        Console.info(f"Report: {report_file}")
+    else:
+        print(text)
+
+    if any(r["status"] in (FAILED, INVALID, ORG_MISSING) for r in report["workbooks"]):
+        sys.exit(1)
@@ -0,0 +1,116 @@
+#!/usr/bin/env python3
+"""
+QUAD Bench Commands
+===================
+
+Performance regression checks for the QUAD agent runtime.
+
+Usage:
+  quad bench replay traffic.qtrace --save-baseline    # Record a baseline
+  quad bench replay traffic.qtrace                    # Compare against it
+
+Traces are recorded with quad-agents' TraceRecorder. The quad-agents
+package is loaded from this repository checkout, or from QUAD_AGENTS_PATH
+(the directory containing quad-agents/).
+
+Copyright (c) 2026 Gopi Suman Addanke. All Rights Reserved.
+"""
+
+import importlib
+import json
+import logging
+import os
+import sys
+from pathlib import Path
+from typing import Optional
+
+from quad_cli.utils.console import Console
+
+
+def load_quad_agents(module: str):
+    """Import a quad-agents module (the package directory name has a hyphen)"""
+    root = os.environ.get("QUAD_AGENTS_PATH") or str(Path(__file__).resolve().parents[3])
+    if root not in sys.path:
+        sys.path.insert(0, root)
+    return importlib.import_module(f"quad-agents.{module}")
+
+
+def default_baseline(trace: Path) -> Path:
+    """Baseline stored next to the trace: traffic.qtrace -> traffic.baseline.json"""
+    return trace.with_suffix(".baseline.json")
+
+
+def run_replay(
+    trace_file: str,
+    baseline_file: Optional[str] = None,
+    save_baseline: bool = False,
+    latency_scale: float = 1.0,
+    time_scale: Optional[float] = None,
+    concurrency: int = 16,
+    limit: Optional[int] = None,
+    tolerance: float = 0.1
+) -> None:
+    """Replay a trace and compare throughput / p99 against a baseline"""
+    try:
+        tracing = load_quad_agents("tracing")
+        replay = load_quad_agents("replay")
+    except ImportError as e:
+        Console.error(f"Cannot load quad-agents: {e}")
+        Console.info("Set QUAD_AGENTS_PATH to the directory containing quad-agents/")
+        sys.exit(1)
+
+    trace_path = Path(trace_file)
+    if not trace_path.exists():
+        Console.error(f"Trace not found: {trace_path}")
+        sys.exit(1)
+    baseline_path = Path(baseline_file) if baseline_file else default_baseline(trace_path)
+
+    Console.header("QUAD Bench: Replay")
+
+    # Replayed errors make self_heal log on every retry
+    logging.getLogger("QUADAgent").setLevel(logging.WARNING)
+
+    trace = tracing.load_trace(trace_path)
+    recorded = trace.summary()
+    Console.info(f"Trace: {len(trace.invocations):,} invocations, {len(trace.roots):,} top-level, "
+                 f"{trace.messages:,} messages")
+
+    report = replay.Replayer(
+        trace,
+        latency_scale=latency_scale,
+        time_scale=time_scale,
+        concurrency=concurrency,
+        limit=limit
+    ).run()
+
+    print()
+    print(f"  {'':<14}{'recorded':>12}{'replayed':>12}")
+    print(f"  {'throughput/s':<14}{recorded['throughput']:>12.1f}{report['throughput']:>12.1f}")
+    print(f"  {'p50 ms':<14}{recorded['p50_ms']:>12.1f}{report['p50_ms']:>12.1f}")
+    print(f"  {'p99 ms':<14}{recorded['p99_ms']:>12.1f}{report['p99_ms']:>12.1f}")
+    print(f"  {'failures':<14}{recorded['failures']:>12}{report['failures']:>12}")
+    print()
+
+    if report["heal_divergences"]:
+        Console.warn(f"{report['heal_divergences']} self-heal decisions differ from the recording")
+        for sample in report["divergence_samples"]:
+            Console.info(f"{sample['agent']}: '{sample['error']}' recorded={sample['recorded']} "
+                         f"replayed={sample['replayed']}")
+
+    if save_baseline:
+        baseline_path.write_text(json.dumps(report, indent=2))
+        Console.success(f"Baseline saved: {baseline_path}")
+        return
+
+    if not baseline_path.exists():
+        Console.warn(f"No baseline at {baseline_path}. Run with --save-baseline first.")
+        return
+
+    baseline = json.loads(baseline_path.read_text())
+    regressions = replay.compare_to_baseline(report, baseline, tolerance)
+    if regressions:
+        for regression in regressions:
+            Console.error(regression)
+        sys.exit(1)
+    Console.success(f"Within {tolerance:.0%} of baseline "
+                    f"({baseline['throughput']:.1f}/s, p99 {baseline['p99_ms']:.1f} ms)")
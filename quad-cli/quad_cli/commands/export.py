@@ -0,0 +1,223 @@
+#!/usr/bin/env python3
+"""
+QUAD Export
+===========
+
+Write an org back to an Excel workbook for review.
+
+Usage:
+  quad export ACME                               # From the database
+  quad export ACME -o acme-review.xlsx
+  quad export --from exports/acme/ -o acme.xlsx   # From any org source (CSV, JSON, Excel, ...)
+  quad export --draft bank-demo                  # From a saved draft
+
+The workbook has the layout `quad init` reads (Overview, Resources,
+Project N), so it can be edited and fed back in. It is written in
+openpyxl's write-only mode: every row goes straight to its sheet's XML
+on disk instead of a cell object in memory. Rows come from server-side
+cursors (database) or the source's row iterators, so peak memory stays
+flat however many resources and projects the org has.
+
+Copyright (c) 2026 Gopi Suman Addanke. All Rights Reserved.
+"""
+
+import sys
+import time
+from contextlib import contextmanager
+from typing import Any, Dict, Iterable, Iterator, List, Optional, Tuple
+
+from quad_cli import db
+from quad_cli.utils.console import Console
+
+RESOURCE_HEADER = ["Name", "Email", "Role", "Skills"]
+
+# Overview keys written first, in this order; any others follow
+OVERVIEW_KEYS = ["org_name", "org_code", "timezone"]
+
+# Rows fetched per round trip from the server-side cursors
+FETCH_ROWS = 2000
+
+EXPORT_SQL = {
+    "settings": """
+        SELECT setting_key, setting_value FROM quad_org_settings
+        WHERE org_id = %s ORDER BY setting_key
+    """,
+    "users": """
+        SELECT full_name AS name, email, role FROM quad_users
+        WHERE company_id = %s AND is_active IS NOT FALSE ORDER BY lower(email)
+    """,
+    "domains": """
+        SELECT name, description FROM quad_domains
+        WHERE company_id = %s AND is_active IS NOT FALSE ORDER BY name
+    """,
+}
+
+
+# ─────────────────────────────────────────────────────────────
+# Workbook
+# ─────────────────────────────────────────────────────────────
+
+def resource_row(resource: Any) -> List[Any]:
+    """A Resources row from a resource dict (or Row)"""
+    return [
+        resource.get('name', resource.get('full_name')),
+        resource.get('email'),
+        resource.get('role', resource.get('job_title')),
+        resource.get('skills'),
+    ]
+
+
+def project_rows(project: Dict) -> List[Tuple[str, Any]]:
+    """Key-value rows of a project tab"""
+    deliverables = project.get('deliverables', '')
+    if isinstance(deliverables, (list, tuple)):
+        deliverables = ', '.join(deliverables)
+    return [
+        ("project_name", project.get('name', project.get('project_name', ''))),
+        ("description", project.get('description', '')),
+        ("type", project.get('type', '')),
+        ("frontend", project.get('frontend', '')),
+        ("backend", project.get('backend', '')),
+        ("database", project.get('database', '')),
+        ("deliverables", deliverables),
+        ("deadline", project.get('deadline', '')),
+        ("owner_email", project.get('owner_email', '')),
+    ]
+
+
+def write_workbook(path: str, overview: Dict[str, Any], resources: Iterable[Any],
+                   projects: Iterable[Dict]) -> Dict[str, int]:
+    """Stream an org into a new workbook (openpyxl write-only mode)
+
+    Args:
+        path: Output .xlsx
+        overview: Overview key-values (OVERVIEW_KEYS first, then the rest)
+        resources: Resource dicts or Rows, consumed once
+        projects: Project dicts, consumed once (one tab each)
+
+    Returns:
+        Rows written: {"resources": n, "projects": n}
+    """
+    from openpyxl import Workbook
+
+    workbook = Workbook(write_only=True)
+
+    # No header row: every Overview row is read back as a key-value pair
+    sheet = workbook.create_sheet("Overview")
+    for key in OVERVIEW_KEYS:
+        sheet.append((key, overview.get(key, '')))
+    for key, value in overview.items():
+        if key not in OVERVIEW_KEYS and not key.startswith('_'):
+            sheet.append((key, value))
+
+    sheet = workbook.create_sheet("Resources")
+    sheet.append(RESOURCE_HEADER)
+    count = 0
+    for resource in resources:
+        sheet.append(resource_row(resource))
+        count += 1
+
+    written = 0
+    for written, project in enumerate(projects, start=1):
+        sheet = workbook.create_sheet(f"Project {written}")
+        for row in project_rows(project):
+            sheet.append(row)
+
+    workbook.save(path)
+    return {"resources": count, "projects": written}
+
+
+# ─────────────────────────────────────────────────────────────
+# Org snapshots
+# ─────────────────────────────────────────────────────────────
+# Each yields (overview, resources, projects); the iterables are only
+# valid inside the `with` block and are read once, in that order.
+
+def _stream(conn, name: str, org_id: Any) -> Iterator[Dict]:
+    """Rows of one EXPORT_SQL statement through a server-side cursor"""
+    with conn.cursor(name=f"quad_export_{name}") as cur:
+        cur.itersize = FETCH_ROWS
+        cur.execute(EXPORT_SQL[name], (org_id,))
+        yield from cur
+
+
+@contextmanager
+def database_snapshot(org_code: str) -> Iterator[Optional[tuple]]:
+    """An org as stored in the database (None if it does not exist)
+
+    Read in one read-only REPEATABLE READ transaction, so the three
+    parts are consistent with each other.
+    """
+    with db.connection() as conn:
+        with conn.transaction():
+            conn.execute("SET TRANSACTION ISOLATION LEVEL REPEATABLE READ, READ ONLY")
+            with conn.cursor() as cur:
+                org_id = db.find_org_id(cur, org_code.lower())
+                if org_id is None:
+                    yield None
+                    return
+                overview = {'org_code': org_code.upper()}
+                overview.update((row['setting_key'], row['setting_value'])
+                                for row in _stream(conn, "settings", org_id))
+            yield overview, _stream(conn, "users", org_id), _stream(conn, "domains", org_id)
+
+
+@contextmanager
+def source_snapshot(path: str) -> Iterator[tuple]:
+    """An org from any quad_cli.sources format (streamed where it streams)"""
+    from quad_cli.sources import open_source
+
+    with open_source(path) as source:
+        yield source.parse_overview(), source.iter_resources(), source.iter_projects()
+
+
+@contextmanager
+def draft_snapshot(name: str) -> Iterator[Optional[tuple]]:
+    """An org from a saved `quad init` draft (None if there is none)"""
+    from quad_cli.commands.init import load_draft
+
+    draft = load_draft(name)
+    if draft is None:
+        yield None
+        return
+    yield draft.get('org', {}), draft.get('resources', []), draft.get('projects', [])
+
+
+# ─────────────────────────────────────────────────────────────
+# Entry
+# ─────────────────────────────────────────────────────────────
+
+def run_export(org_code: Optional[str] = None, source: Optional[str] = None, draft: Optional[str] = None,
+               output: Optional[str] = None) -> Optional[Dict[str, int]]:
+    """Export an org to Excel from the database, a source file or a draft
+
+    Returns:
+        Rows written, or None if there was nothing to export
+    """
+    if source:
+        snapshot, label = source_snapshot(source.lstrip('@')), source
+    elif draft:
+        snapshot, label = draft_snapshot(draft), f"draft '{draft}'"
+    elif org_code:
+        if not db.HAS_PSYCOPG:
+            Console.error("psycopg not installed. Run: pip install psycopg[binary]")
+            sys.exit(1)
+        snapshot, label = database_snapshot(org_code), f"organization '{org_code}'"
+    else:
+        Console.error("Nothing to export: give an org code, --from or --draft")
+        sys.exit(1)
+
+    start = time.perf_counter()
+    with snapshot as org:
+        if org is None:
+            Console.error(f"Not found: {label}")
+            sys.exit(1)
+        overview, resources, projects = org
+        code = str(overview.get('org_code') or org_code or 'org')
+        output = output or f"quad-{code.lower()}-setup.xlsx"
+        counts = write_workbook(output, overview, resources, projects)
+
+    Console.success(f"Exported {label}: {counts['resources']:,} resources, {counts['projects']} projects "
+                    f"({time.perf_counter() - start:.1f}s)")
+    Console.info(f"Excel file: {output}")
+    return counts
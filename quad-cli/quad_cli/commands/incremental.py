@@ -0,0 +1,338 @@
+#!/usr/bin/env python3
+"""
+QUAD Incremental Init
+=====================
+
+Re-run `quad init` on an edited workbook and write only what changed.
+
+Usage:
+  quad init @org-setup.xlsx --plan                    # Show the diff, change nothing
+  quad init @org-setup.xlsx --incremental             # Apply the diff
+  quad init @org-setup.xlsx --incremental --prune     # Also remove what the workbook lacks
+
+The org's current state (domains, users, settings) is read in one query
+and diffed against the parsed workbook, keyed by:
+- domains:   slug (from the project name)       -> name, description
+- resources: email (case-insensitive)           -> full name
+- settings:  Overview key (except org_code)     -> value
+The Resources "Role" column is a job title, not the access role stored
+in quad_users.role, so it is not written.
+
+Only inserted and updated rows are written, with one set-based statement
+per kind of change, all in one transaction. Rows missing from the
+workbook are left alone: the org may have users who signed up in the
+web app and settings written through the API. With --prune they are
+removed too: domains and users are deactivated rather than deleted
+(their history and memberships stay), settings are deleted. Values are
+taken as parsed, without prompts (QuadInit.accept_parsed).
+
+Copyright (c) 2026 Gopi Suman Addanke. All Rights Reserved.
+"""
+
+import json
+import sys
+import time
+from typing import Any, Dict, List, Optional, Tuple
+
+from quad_cli import db
+from quad_cli.db import domain_slug
+from quad_cli.utils.console import Console
+
+INSERT = "insert"
+UPDATE = "update"
+DELETE = "delete"
+
+# Current state of one org, one round trip
+STATE_SQL = """
+    SELECT
+        (SELECT coalesce(json_agg(json_build_object(
+                'id', id, 'slug', slug, 'name', name, 'description', description, 'is_active', is_active)), '[]')
+         FROM quad_domains WHERE company_id = %(org)s) AS domains,
+        (SELECT coalesce(json_agg(json_build_object(
+                'id', id, 'email', lower(email), 'full_name', full_name, 'is_active', is_active)), '[]')
+         FROM quad_users WHERE company_id = %(org)s) AS users,
+        (SELECT coalesce(json_agg(json_build_object('key', setting_key, 'value', setting_value)), '[]')
+         FROM quad_org_settings WHERE org_id = %(org)s) AS settings
+"""
+
+APPLY_SQL = {
+    ("domains", INSERT): """
+        INSERT INTO quad_domains (slug, name, description, methodology, company_id, is_active)
+        SELECT slug, name, description, 'quad', %s, true
+        FROM unnest(%s::text[], %s::text[], %s::text[]) AS t(slug, name, description)
+    """,
+    ("domains", UPDATE): """
+        UPDATE quad_domains d SET name = t.name, description = t.description, is_active = true
+        FROM unnest(%s::uuid[], %s::text[], %s::text[]) AS t(id, name, description)
+        WHERE d.id = t.id
+    """,
+    ("domains", DELETE): """
+        UPDATE quad_domains SET is_active = false WHERE id = ANY(%s::uuid[])
+    """,
+    # Imported users have no password until they sign in through SSO/invite,
+    # and get the default access role
+    ("users", INSERT): """
+        INSERT INTO quad_users (email, full_name, company_id, password_hash, is_active)
+        SELECT email, full_name, %s, '', true
+        FROM unnest(%s::text[], %s::text[]) AS t(email, full_name)
+    """,
+    ("users", UPDATE): """
+        UPDATE quad_users u SET full_name = t.full_name, is_active = true
+        FROM unnest(%s::uuid[], %s::text[]) AS t(id, full_name)
+        WHERE u.id = t.id
+    """,
+    ("users", DELETE): """
+        UPDATE quad_users SET is_active = false WHERE id = ANY(%s::uuid[])
+    """,
+    ("settings", INSERT): """
+        INSERT INTO quad_org_settings (org_id, setting_key, setting_value)
+        SELECT %s, key, value FROM unnest(%s::text[], %s::text[]) AS t(key, value)
+    """,
+    ("settings", UPDATE): """
+        UPDATE quad_org_settings s SET setting_value = t.value
+        FROM unnest(%s::text[], %s::text[]) AS t(key, value)
+        WHERE s.org_id = %s AND s.setting_key = t.key
+    """,
+    ("settings", DELETE): """
+        DELETE FROM quad_org_settings WHERE org_id = %s AND setting_key = ANY(%s::text[])
+    """,
+}
+
+# Compared and written fields per kind
+FIELDS = {
+    "domains": ("name", "description"),
+    "users": ("full_name",),
+    "settings": ("value",),
+}
+
+
+def _text(value: Any) -> Optional[str]:
+    """Compare and store values as text; empty is the same as missing"""
+    if value is None or value == '':
+        return None
+    return str(value)
+
+
+# ─────────────────────────────────────────────────────────────
+# Diff
+# ─────────────────────────────────────────────────────────────
+
+def desired_state(org_data: Dict, resources: List, projects: List[Dict]) -> Tuple[Dict[str, Dict], List[str]]:
+    """Keyed rows the workbook asks for, and warnings about skipped rows
+
+    Rows sharing a key (projects with the same slug, emails differing
+    only in case or spaces) collapse to the last one, with a warning.
+    """
+    warnings = []
+    domains = {}
+    sheets = {}
+    for project in projects:
+        slug = domain_slug(project['name'])
+        sheet = project.get('_sheet_name', project['name'])
+        if slug in domains:
+            warnings.append(f"{sheet}: project slug '{slug}' also used by {sheets[slug]}, the last one is used")
+        domains[slug] = {"name": _text(project['name']), "description": _text(project.get('description'))}
+        sheets[slug] = sheet
+
+    users = {}
+    rows = {}
+    for index, resource in enumerate(resources, start=2):  # Row 1 is the header
+        email = _text(resource.get('email'))
+        if not email or not email.strip():
+            warnings.append(f"Resources row {index}: no email, skipped")
+            continue
+        email = email.strip().lower()
+        if email in users:
+            warnings.append(f"Resources row {index}: duplicate email '{email}' (also in row {rows[email]}), "
+                            f"the last one is used")
+        users[email] = {"full_name": _text(resource.get('name'))}
+        rows[email] = index
+
+    settings = {key: {"value": _text(value)} for key, value in org_data.items()
+                if key != 'org_code' and _text(value) is not None}
+    return {"domains": domains, "users": users, "settings": settings}, warnings
+
+
+def compute_diff(current: Dict[str, List[Dict]], desired: Dict[str, Dict],
+                 prune: bool = False) -> Dict[str, Dict[str, List[Dict]]]:
+    """Changes per kind: {kind: {insert: [...], update: [...], delete: [...]}}
+
+    Each change carries the key, the new values and, for updates, the old
+    ones. Deactivated rows that reappear are updated (reactivated).
+
+    Args:
+        current: The org's rows (load_state)
+        desired: The workbook's rows (desired_state)
+        prune: Also delete (deactivate) active rows the workbook lacks;
+            otherwise there are no deletes
+    """
+    keys = {"domains": "slug", "users": "email", "settings": "key"}
+    diff = {}
+    for kind, key_name in keys.items():
+        existing = {}
+        for row in current.get(kind, []):
+            if kind == "settings":
+                row = {"key": row["key"], "value": _text(row["value"]), "is_active": True}
+            else:
+                row = dict(row, **{f: _text(row.get(f)) for f in FIELDS[kind]})
+            existing[row[key_name]] = row
+
+        changes = {INSERT: [], UPDATE: [], DELETE: []}
+        for key, values in desired[kind].items():
+            old = existing.get(key)
+            if old is None:
+                changes[INSERT].append({"key": key, "new": values})
+            elif not old.get("is_active", True) or any(old[f] != values[f] for f in FIELDS[kind]):
+                changes[UPDATE].append({"key": key, "id": old.get("id"), "new": values,
+                                        "old": {f: old[f] for f in FIELDS[kind]},
+                                        "reactivate": not old.get("is_active", True)})
+        for key, old in existing.items() if prune else ():
+            if key not in desired[kind] and old.get("is_active", True):
+                changes[DELETE].append({"key": key, "id": old.get("id"),
+                                        "old": {f: old[f] for f in FIELDS[kind]}})
+        diff[kind] = changes
+    return diff
+
+
+def count_changes(diff: Dict[str, Dict[str, List[Dict]]]) -> int:
+    return sum(len(rows) for changes in diff.values() for rows in changes.values())
+
+
+# ─────────────────────────────────────────────────────────────
+# Database
+# ─────────────────────────────────────────────────────────────
+
+def load_state(cur, org_id: Any) -> Dict[str, List[Dict]]:
+    """Domains, users and settings of an org in one query"""
+    cur.execute(STATE_SQL, {"org": org_id})
+    row = cur.fetchone()
+    return {kind: row[kind] if not isinstance(row[kind], str) else json.loads(row[kind])
+            for kind in ("domains", "users", "settings")}
+
+
+def apply_diff(cur, org_id: Any, diff: Dict[str, Dict[str, List[Dict]]]) -> Dict[str, int]:
+    """Write a diff (caller owns the transaction); returns rows written per statement"""
+    written = {}
+
+    def run(kind: str, change: str, params: tuple) -> None:
+        cur.execute(APPLY_SQL[(kind, change)], params)
+        written[f"{kind}.{change}"] = cur.rowcount
+
+    domains, users, settings = diff["domains"], diff["users"], diff["settings"]
+    if domains[INSERT]:
+        run("domains", INSERT, (org_id, [c["key"] for c in domains[INSERT]],
+                                [c["new"]["name"] for c in domains[INSERT]],
+                                [c["new"]["description"] for c in domains[INSERT]]))
+    if domains[UPDATE]:
+        run("domains", UPDATE, ([c["id"] for c in domains[UPDATE]],
+                                [c["new"]["name"] for c in domains[UPDATE]],
+                                [c["new"]["description"] for c in domains[UPDATE]]))
+    if domains[DELETE]:
+        run("domains", DELETE, ([c["id"] for c in domains[DELETE]],))
+
+    if users[INSERT]:
+        run("users", INSERT, (org_id, [c["key"] for c in users[INSERT]],
+                              [c["new"]["full_name"] for c in users[INSERT]]))
+    if users[UPDATE]:
+        run("users", UPDATE, ([c["id"] for c in users[UPDATE]],
+                              [c["new"]["full_name"] for c in users[UPDATE]]))
+    if users[DELETE]:
+        run("users", DELETE, ([c["id"] for c in users[DELETE]],))
+
+    if settings[INSERT]:
+        run("settings", INSERT, (org_id, [c["key"] for c in settings[INSERT]],
+                                 [c["new"]["value"] for c in settings[INSERT]]))
+    if settings[UPDATE]:
+        run("settings", UPDATE, ([c["key"] for c in settings[UPDATE]],
+                                 [c["new"]["value"] for c in settings[UPDATE]], org_id))
+    if settings[DELETE]:
+        run("settings", DELETE, (org_id, [c["key"] for c in settings[DELETE]]))
+    return written
+
+
+# ─────────────────────────────────────────────────────────────
+# Output
+# ─────────────────────────────────────────────────────────────
+
+def print_diff(diff: Dict[str, Dict[str, List[Dict]]], limit: int = 20) -> None:
+    """Human-readable diff, `limit` rows per kind of change"""
+    labels = {"domains": "Domains", "users": "Resources", "settings": "Settings"}
+    marks = {INSERT: "+", UPDATE: "~", DELETE: "-"}
+    for kind, changes in diff.items():
+        counts = "  ".join(f"{marks[c]}{len(changes[c])}" for c in (INSERT, UPDATE, DELETE))
+        print(f"\n  {labels[kind]:<10} {counts}")
+        for change in (INSERT, UPDATE, DELETE):
+            rows = changes[change]
+            for row in rows[:limit]:
+                if change == INSERT:
+                    detail = ", ".join(f"{f}={v!r}" for f, v in row["new"].items() if v is not None)
+                elif change == UPDATE:
+                    fields = [f"{f}: {row['old'][f]!r} -> {row['new'][f]!r}"
+                              for f in FIELDS[kind] if row["old"][f] != row["new"][f]]
+                    if row.get("reactivate"):
+                        fields.insert(0, "reactivate")
+                    detail = ", ".join(fields)
+                else:
+                    detail = "deactivate" if kind != "settings" else "delete"
+                print(f"    {marks[change]} {row['key']:<28} {detail}")
+            if len(rows) > limit:
+                print(f"    {marks[change]} ... {len(rows) - limit} more")
+
+
+# ─────────────────────────────────────────────────────────────
+# Entry
+# ─────────────────────────────────────────────────────────────
+
+def run_incremental(filepath: str, plan_only: bool = False, use_cache: bool = True,
+                    prune: bool = False) -> Optional[Dict]:
+    """Diff a workbook against the database and apply (or just show) it
+
+    Args:
+        filepath: Org workbook (or other source)
+        plan_only: Show the diff, write nothing
+        use_cache: Reuse parsed sheets from ~/.quad/cache/
+        prune: Also remove rows the workbook lacks (see compute_diff)
+
+    Returns:
+        The diff, or None if the org is not in the database
+    """
+    from quad_cli.commands.init import QuadInit
+
+    if not db.HAS_PSYCOPG:
+        Console.error("psycopg not installed. Run: pip install psycopg[binary]")
+        sys.exit(1)
+
+    Console.header("QUAD Init: Plan" if plan_only else "QUAD Init: Incremental")
+    init = QuadInit(filepath, use_cache=use_cache)
+    init.load()
+    init.accept_parsed()
+    desired, warnings = desired_state(init.org_data, init.resources, init.projects)
+    for warning in warnings[:10]:
+        Console.warn(warning)
+    if len(warnings) > 10:
+        Console.warn(f"... {len(warnings) - 10} more warnings")
+
+    org_code = str(init.org_data.get('org_code') or '')
+    start = time.perf_counter()
+    with db.transaction() as cur:
+        org_id = db.find_org_id(cur, org_code.lower())
+        if org_id is None:
+            Console.error(f"Organization '{org_code}' not found in database")
+            Console.info("Run database setup first to create org")
+            return None
+
+        diff = compute_diff(load_state(cur, org_id), desired, prune)
+        print_diff(diff)
+        total = count_changes(diff)
+        print()
+        if plan_only:
+            Console.info(f"Plan only: {total} changes, nothing written")
+            return diff
+        if not total:
+            Console.success("Already up to date")
+            return diff
+
+        written = apply_diff(cur, org_id, diff)
+    Console.success(f"Applied {total} changes ({sum(written.values())} rows) "
+                    f"in {(time.perf_counter() - start) * 1000:.0f} ms")
+    return diff
@@ -3,11 +3,13 @@
 QUAD Interactive Project Initialization
 ========================================
 
-Initialize projects from Excel or interactively.
+Initialize projects from Excel (or CSV, JSON, Parquet: see
+quad_cli.sources) or interactively.
 
 Usage:
   quad-init                      # Interactive mode
   quad-init @org-setup.xlsx      # From Excel
+  quad-init @exports/acme/       # From CSV exports (or .json, .jsonl, .parquet)
   quad-init --resume bank-demo   # Resume draft
 
 Copyright (c) 2026 Gopi Suman Addanke. All Rights Reserved.
@@ -23,21 +25,15 @@ from typing import Optional, List, Dict, Any
 # Add parent to path for imports
 sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
 
-try:
-    from openpyxl import load_workbook
-    HAS_OPENPYXL = True
-except ImportError:
-    HAS_OPENPYXL = False
-
-try:
-    import psycopg
-    from psycopg.rows import dict_row
-    HAS_PSYCOPG = True
-except ImportError:
-    HAS_PSYCOPG = False
-
 from dotenv import load_dotenv
 
+from quad_cli import db
+from quad_cli.db import DB_CONFIG, HAS_PSYCOPG, domain_slug  # noqa: F401 (re-exported)
+from quad_cli.sources import HAS_OPENPYXL, detect_format, open_source
+from quad_cli.sources.base import Row, _header_key, _row_class  # noqa: F401 (re-exported)
+from quad_cli.sources.excel import ExcelParser  # noqa: F401 (re-exported)
+from quad_cli.utils.drafts import Draft, describe, read_index
+
 load_dotenv()
 
 # Global config paths (CLI installation)
@@ -50,15 +46,6 @@ PROJECT_QUAD_DIR = Path.cwd() / ".quad"
 PROJECT_CONFIG_FILE = PROJECT_QUAD_DIR / "config.json"
 PROJECT_CONTEXT_DIR = PROJECT_QUAD_DIR / "context"
 
-# Database config
-DB_CONFIG = {
-    "host": os.getenv("DB_HOST", "localhost"),
-    "port": int(os.getenv("DB_PORT", 14201)),
-    "dbname": os.getenv("DB_NAME", "quad_dev_db"),
-    "user": os.getenv("DB_USER", "quad_user"),
-    "password": os.getenv("DB_PASSWORD", "quad_dev_pass"),
-}
-
 
 # ─────────────────────────────────────────────────────────────
 # Console Helpers
@@ -148,90 +135,24 @@ class Console:
 
 
 # ─────────────────────────────────────────────────────────────
-# Excel Parser
+# Database
 # ─────────────────────────────────────────────────────────────
 
-class ExcelParser:
-    """Parse QUAD organization Excel file"""
-
-    def __init__(self, filepath: str):
-        self.filepath = filepath
-        self.workbook = load_workbook(filepath, data_only=True)
-
-    def get_sheet_names(self) -> List[str]:
-        return self.workbook.sheetnames
-
-    def parse_overview(self) -> Dict:
-        """Parse Overview tab (Tab 1)"""
-        sheet = self._get_sheet(['Overview', 'Org', 'Organization'])
-        if not sheet:
-            return {}
-
-        data = {}
-        for row in sheet.iter_rows(min_row=1, max_col=2, values_only=True):
-            if row[0] and row[1]:
-                key = str(row[0]).lower().replace(' ', '_')
-                data[key] = row[1]
-
-        return data
-
-    def parse_resources(self) -> List[Dict]:
-        """Parse Resources tab (Tab 2)"""
-        sheet = self._get_sheet(['Resources', 'Team', 'Team Members', 'People'])
-        if not sheet:
-            return []
-
-        return self._parse_table(sheet)
-
-    def parse_projects(self) -> List[Dict]:
-        """Parse all Project tabs (Tab 3, 4, ...)"""
-        projects = []
-
-        for name in self.workbook.sheetnames:
-            if name.lower().startswith('project') or name.lower() in ['suma', 'nutrinne', 'nutri']:
-                sheet = self.workbook[name]
-                project = self._parse_key_value_sheet(sheet)
-                project['_sheet_name'] = name
-                projects.append(project)
-
-        return projects
-
-    def _get_sheet(self, names: List[str]):
-        """Get sheet by multiple possible names"""
-        for name in names:
-            if name in self.workbook.sheetnames:
-                return self.workbook[name]
-            # Case-insensitive search
-            for sheet_name in self.workbook.sheetnames:
-                if sheet_name.lower() == name.lower():
-                    return self.workbook[sheet_name]
-        return None
-
-    def _parse_table(self, sheet) -> List[Dict]:
-        """Parse a table with header row"""
-        rows = list(sheet.iter_rows(values_only=True))
-        if not rows:
-            return []
-
-        headers = [str(h).lower().replace(' ', '_') if h else f'col_{i}'
-                   for i, h in enumerate(rows[0])]
-
-        data = []
-        for row in rows[1:]:
-            if any(row):  # Skip empty rows
-                item = {headers[i]: row[i] for i in range(len(headers)) if i < len(row)}
-                data.append(item)
-
-        return data
-
-    def _parse_key_value_sheet(self, sheet) -> Dict:
-        """Parse a key-value format sheet"""
-        data = {}
-        for row in sheet.iter_rows(min_row=1, max_col=2, values_only=True):
-            if row[0] and row[1]:
-                key = str(row[0]).lower().replace(' ', '_')
-                data[key] = row[1]
-        return data
+def save_projects(org_code: str, projects: List[Dict]) -> Optional[Dict[str, Any]]:
+    """Upsert projects as domains of an organization, in one transaction.
+
+    Args:
+        org_code: Organization code (its slug, case-insensitive)
+        projects: Project dicts with 'name' and optional 'description'
+
+    Returns:
+        Domain id by slug, or None if the organization does not exist
+    """
+    with db.transaction() as cur:
+        org_id = db.find_org_id(cur, org_code.lower())
+        if org_id is None:
+            return None
+        return db.upsert_domains(cur, org_id, projects)
 
 
 # ─────────────────────────────────────────────────────────────
@@ -247,9 +168,15 @@ class QuadInit:
     DATABASE_TECH = ['PostgreSQL', 'MySQL', 'MongoDB', 'SQLite', 'None']
     DELIVERABLES = ['Web Application', 'API Server', 'Mobile App', 'JAR File', 'Docker Image', 'Documentation', 'SDK/Library']
 
-    def __init__(self, excel_path: str):
+    def __init__(self, excel_path: str, use_cache: bool = True):
+        """
+        Args:
+            excel_path: Org workbook, or any other source open_source reads
+                (CSV directory, JSON, JSON Lines, Parquet)
+            use_cache: Excel only: reuse parsed sheets from ~/.quad/cache/
+        """
         self.excel_path = excel_path
-        self.parser = ExcelParser(excel_path)
+        self.parser = open_source(excel_path, cache=use_cache)
         self.org_data = {}
         self.resources = []
         self.projects = []
@@ -286,24 +213,42 @@ class QuadInit:
         if self.projects:
             project = self.projects[0]  # Use first project
             org_code = self.org_data.get('org_code', 'unknown')
-            domain_slug = project['name'].lower().replace(' ', '-')[:20]
-            create_project_quad_folder(org_code, domain_slug, project['name'])
+            create_project_quad_folder(org_code, domain_slug(project['name']), project['name'])
 
         # Show summary
         self._show_summary(plan)
 
+    def load(self):
+        """Parse the workbook into org_data, resources and projects (no prompts)"""
+        with self.parser:
+            self.org_data = self.parser.parse_overview()
+            self.resources = self.parser.parse_resources()
+            self.projects = self.parser.parse_projects()
+
+    def accept_parsed(self):
+        """Non-interactive setup: every value as parsed, and where the sheet
+        has none, the default the prompts would offer"""
+        org_name = self.org_data.get('org_name', '')
+        self.org_data.setdefault('org_code', org_name[:4].upper() if org_name else '')
+        self.org_data.setdefault('timezone', 'America/New_York')
+
+        for project in self.projects:
+            project.update(self._project_defaults(project))
+
     def _parse_excel(self):
-        """Parse the Excel file"""
-        Console.header("Parsing Excel File")
+        """Parse the Excel file (or other source)"""
+        Console.header(f"Parsing {self.parser.LABEL}")
         Console.info(f"File: {self.excel_path}")
 
         sheets = self.parser.get_sheet_names()
-        Console.info(f"Found {len(sheets)} sheets: {', '.join(sheets)}")
+        parts = "sheets" if self.parser.FORMAT == "excel" else "parts"
+        Console.info(f"Found {len(sheets)} {parts}: {', '.join(sheets)}")
 
-        self.org_data = self.parser.parse_overview()
-        self.resources = self.parser.parse_resources()
-        self.projects = self.parser.parse_projects()
+        self.load()
 
+        if self.parser.cache is not None and self.parser.cache.hits:
+            stats = self.parser.cache.stats()
+            Console.info(f"Parse cache: {stats['hits']} sheets unchanged, {stats['misses']} re-parsed")
         Console.success(f"Organization: {self.org_data.get('org_name', 'Unknown')}")
         Console.success(f"Resources: {len(self.resources)} team members")
         Console.success(f"Projects: {len(self.projects)} found")
@@ -344,16 +289,17 @@ class QuadInit:
 
         for i, project in enumerate(self.projects):
             print(f"\n  ── Project {i+1}: {project.get('project_name', project.get('_sheet_name', 'Unknown'))} ──\n")
+            defaults = self._project_defaults(project)
 
             # Basic info
-            project['name'] = Console.ask("Project name", project.get('project_name', project.get('_sheet_name', '')))
-            project['description'] = Console.ask("Description", project.get('description', ''))
+            project['name'] = Console.ask("Project name", defaults['name'])
+            project['description'] = Console.ask("Description", defaults['description'])
 
             # Project type
             type_idx = Console.select(
                 "What type of project is this?",
                 self.PROJECT_TYPES,
-                self._find_index(self.PROJECT_TYPES, project.get('type', ''))
+                self.PROJECT_TYPES.index(defaults['type'])
             )
             project['type'] = self.PROJECT_TYPES[type_idx]
 
@@ -363,21 +309,21 @@ class QuadInit:
             fe_idx = Console.select(
                 "Frontend technology?",
                 self.FRONTEND_TECH,
-                self._find_index(self.FRONTEND_TECH, project.get('frontend', ''))
+                self.FRONTEND_TECH.index(defaults['frontend'])
             )
             project['frontend'] = self.FRONTEND_TECH[fe_idx]
 
             be_idx = Console.select(
                 "Backend technology?",
                 self.BACKEND_TECH,
-                self._find_index(self.BACKEND_TECH, project.get('backend', ''))
+                self.BACKEND_TECH.index(defaults['backend'])
             )
             project['backend'] = self.BACKEND_TECH[be_idx]
 
             db_idx = Console.select(
                 "Database?",
                 self.DATABASE_TECH,
-                self._find_index(self.DATABASE_TECH, project.get('database', ''))
+                self.DATABASE_TECH.index(defaults['database'])
             )
             project['database'] = self.DATABASE_TECH[db_idx]
 
@@ -392,23 +338,46 @@ class QuadInit:
 
             # Timeline
             print("\n  Timeline:")
-            deadline_str = project.get('deadline', '')
-            if deadline_str:
-                project['deadline'] = Console.ask("Deadline", str(deadline_str))
+            if project.get('deadline', ''):
+                project['deadline'] = Console.ask("Deadline", defaults['deadline'])
             else:
-                project['deadline'] = Console.ask("Deadline (YYYY-MM-DD)",
-                    (datetime.now() + timedelta(days=60)).strftime('%Y-%m-%d'))
+                project['deadline'] = Console.ask("Deadline (YYYY-MM-DD)", defaults['deadline'])
 
             # Owner
             if self.resources:
                 owner_names = [r.get('name', r.get('email', 'Unknown')) for r in self.resources]
                 owner_idx = Console.select("Project owner?", owner_names, 0)
-                project['owner'] = self.resources[owner_idx]
+                owner = self.resources[owner_idx]
+                project['owner'] = owner.to_dict() if isinstance(owner, Row) else dict(owner)
             else:
-                project['owner_email'] = Console.ask("Owner email", project.get('owner_email', ''))
+                project['owner_email'] = Console.ask("Owner email", defaults['owner_email'])
 
             Console.success(f"Project '{project['name']}' configured")
 
+    def _project_defaults(self, project: Dict) -> Dict:
+        """The answers each project prompt offers by default"""
+        defaults = {
+            'name': project.get('project_name', project.get('_sheet_name', '')),
+            'description': project.get('description', ''),
+            'type': self.PROJECT_TYPES[self._find_index(self.PROJECT_TYPES, project.get('type', ''))],
+            'frontend': self.FRONTEND_TECH[self._find_index(self.FRONTEND_TECH, project.get('frontend', ''))],
+            'backend': self.BACKEND_TECH[self._find_index(self.BACKEND_TECH, project.get('backend', ''))],
+            'database': self.DATABASE_TECH[self._find_index(self.DATABASE_TECH, project.get('database', ''))],
+        }
+        indices = self._find_deliverable_indices({**project, 'type': defaults['type']})
+        defaults['deliverables'] = [self.DELIVERABLES[i] for i in indices]
+
+        deadline = project.get('deadline', '')
+        defaults['deadline'] = str(deadline) if deadline else \
+            (datetime.now() + timedelta(days=60)).strftime('%Y-%m-%d')
+
+        if self.resources:
+            owner = self.resources[0]
+            defaults['owner'] = owner.to_dict() if isinstance(owner, Row) else dict(owner)
+        else:
+            defaults['owner_email'] = project.get('owner_email', '')
+        return defaults
+
     def _find_index(self, options: List[str], value: str) -> int:
         """Find index of value in options (case-insensitive partial match)"""
         if not value:
@@ -504,52 +473,25 @@ class QuadInit:
         return phases
 
     def _save_to_database(self):
-        """Save projects to database"""
-        try:
-            conn = psycopg.connect(
-                host=DB_CONFIG["host"],
-                port=DB_CONFIG["port"],
-                dbname=DB_CONFIG["dbname"],
-                user=DB_CONFIG["user"],
-                password=DB_CONFIG["password"],
-                row_factory=dict_row
-            )
-
-            with conn.cursor() as cur:
-                # Get or create organization
-                cur.execute("""
-                    SELECT id FROM quad_organizations WHERE slug = %s
-                """, (self.org_data.get('org_code', '').lower(),))
-                org = cur.fetchone()
-
-                if org:
-                    org_id = org['id']
-                else:
-                    Console.info("Organization not found, skipping DB save")
-                    Console.info("Run database setup first to create org")
-                    return
-
-                # Update/insert projects (domains)
-                for project in self.projects:
-                    slug = project['name'].lower().replace(' ', '-')[:20]
-
-                    cur.execute("""
-                        INSERT INTO quad_domains (name, slug, description, methodology, company_id, is_active)
-                        VALUES (%s, %s, %s, 'quad', %s, true)
-                        ON CONFLICT (slug) DO UPDATE SET
-                            name = EXCLUDED.name,
-                            description = EXCLUDED.description
-                        RETURNING id
-                    """, (project['name'], slug, project.get('description', ''), org_id))
-
-                    domain_id = cur.fetchone()['id']
-                    Console.success(f"Saved project: {project['name']} (ID: {domain_id})")
-
-            conn.commit()
-            conn.close()
+        """Save projects to database (one transaction)"""
+        if not HAS_PSYCOPG:
+            Console.error("psycopg not installed. Run: pip install psycopg[binary]")
+            return
 
+        try:
+            domain_ids = save_projects(self.org_data.get('org_code', ''), self.projects)
         except Exception as e:
             Console.error(f"Database error: {e}")
+            return
+
+        if domain_ids is None:
+            Console.info("Organization not found, skipping DB save")
+            Console.info("Run database setup first to create org")
+            return
+
+        for project in self.projects:
+            domain_id = domain_ids[domain_slug(project['name'])]
+            Console.success(f"Saved project: {project['name']} (ID: {domain_id})")
 
     def _show_summary(self, plan: Dict):
         """Show final summary"""
@@ -667,30 +609,32 @@ Add project-specific instructions below.
 
 
 def load_draft(name: str) -> Optional[Dict]:
-    """Load a saved draft"""
-    draft_file = QUAD_DRAFTS_DIR / f"{name}.json"
-    if draft_file.exists():
-        try:
-            return json.loads(draft_file.read_text())
-        except:
-            return None
-    return None
+    """Load a saved draft (snapshot plus journal, see quad_cli.utils.drafts)"""
+    draft = Draft.load(name, QUAD_DRAFTS_DIR)
+    return draft.data if draft else None
 
 
 def save_draft(name: str, data: Dict):
-    """Save work as draft"""
-    QUAD_DRAFTS_DIR.mkdir(parents=True, exist_ok=True)
-    draft_file = QUAD_DRAFTS_DIR / f"{name}.json"
-    data['_saved_at'] = datetime.now().isoformat()
-    draft_file.write_text(json.dumps(data, indent=2))
-    Console.success(f"Draft saved: {draft_file}")
+    """Save work as draft (a fresh snapshot, replacing any draft of that name)"""
+    draft = Draft(name, QUAD_DRAFTS_DIR, data)
+    draft.compact()
+    Console.success(f"Draft saved: {draft.snapshot_path}")
 
 
 def list_drafts() -> List[str]:
-    """List available drafts"""
-    if not QUAD_DRAFTS_DIR.exists():
-        return []
-    return [f.stem for f in QUAD_DRAFTS_DIR.glob("*.json")]
+    """List available drafts, newest first (from the drafts index)"""
+    return list(read_index(QUAD_DRAFTS_DIR))
+
+
+def show_drafts():
+    """Print saved drafts with their progress"""
+    drafts = read_index(QUAD_DRAFTS_DIR)
+    if not drafts:
+        Console.info("No drafts found")
+        return
+    Console.header("Saved Drafts")
+    for name, entry in drafts.items():
+        print(f"    • {name}  ({describe(entry)})")
 
 
 # ─────────────────────────────────────────────────────────────
@@ -712,20 +656,55 @@ class QuadInteractiveInit:
         self.resources = []
         self.projects = []
 
+        # Every answer is journaled here (a session draft until named)
+        self.draft: Optional[Draft] = None
+
         # Load existing config if available
         self.config = load_global_config()
 
         # Load draft if resuming
         if resume_draft:
-            draft = load_draft(resume_draft)
+            draft = Draft.load(resume_draft, QUAD_DRAFTS_DIR)
             if draft:
-                self.org_data = draft.get('org', {})
-                self.resources = draft.get('resources', [])
-                self.projects = draft.get('projects', [])
+                self._use_draft(draft)
                 Console.success(f"Resumed draft: {resume_draft}")
 
+    def _use_draft(self, draft: Draft):
+        """Continue in a draft: its data becomes the session state"""
+        if self.draft is not None and self.draft is not draft:
+            self.draft.discard()
+        self.draft = draft
+        self.org_data = draft.data.setdefault('org', {})
+        self.resources = draft.data.setdefault('resources', [])
+        self.projects = draft.data.setdefault('projects', [])
+
+    def _edit(self, op: str, path: List[Any], value: Any = None):
+        """Record one answer in the draft (started on the first answer)"""
+        if self.draft is None:
+            name = f"session-{datetime.now():%Y%m%d-%H%M%S}"
+            self._use_draft(Draft(name, QUAD_DRAFTS_DIR, {
+                'org': self.org_data, 'resources': self.resources, 'projects': self.projects
+            }))
+        getattr(self.draft, op)(path, *([] if op == 'delete' else [value]))
+
+    def _step(self, step: str):
+        """Mark progress in the draft (a checkpoint: the journal is fsynced)"""
+        self._edit('set', ['_step'], step)
+        self.draft.sync()
+
     def run(self):
         """Run pure interactive initialization"""
+        try:
+            self._run()
+        except (KeyboardInterrupt, EOFError):
+            print()
+            if self.draft is None:
+                raise
+            self.draft.close()
+            Console.info(f"Progress saved. Resume with: quad init --resume {self.draft.name}")
+            sys.exit(130)
+
+    def _run(self):
         print("\n" + "=" * 50)
         print("  QUAD Interactive Project Setup")
         print("=" * 50)
@@ -736,38 +715,44 @@ class QuadInteractiveInit:
 
         # Check for available drafts
         if not self.resume_draft:
-            drafts = list_drafts()
+            drafts = read_index(QUAD_DRAFTS_DIR)
             if drafts:
+                names = list(drafts)
                 Console.header("Found Saved Drafts")
-                for i, d in enumerate(drafts):
-                    print(f"    [{i+1}] {d}")
+                for i, d in enumerate(names):
+                    print(f"    [{i+1}] {d}  ({describe(drafts[d])})")
                 if Console.confirm("\n  Resume a draft?", default=False):
-                    idx = Console.select("Which draft?", drafts)
-                    draft = load_draft(drafts[idx])
+                    idx = Console.select("Which draft?", names)
+                    draft = Draft.load(names[idx], QUAD_DRAFTS_DIR)
                     if draft:
-                        self.org_data = draft.get('org', {})
-                        self.resources = draft.get('resources', [])
-                        self.projects = draft.get('projects', [])
-                        Console.success(f"Loaded draft: {drafts[idx]}")
+                        self._use_draft(draft)
+                        self.resume_draft = names[idx]
+                        Console.success(f"Loaded draft: {names[idx]}")
 
         # Step 1: Organization setup
+        self._step('organization')
         self._setup_organization()
 
         # Step 2: Team setup (optional)
         if Console.confirm("\n  Add team members?", default=False):
+            self._step('team')
             self._setup_resources()
 
         # Step 3: Project setup
+        self._step('projects')
         self._setup_projects_interactive()
+        self._step('finalize')
 
-        # Save draft option
+        # Keep the draft under a name, or drop the session draft
         if Console.confirm("\n  Save as draft? (can resume later)"):
-            draft_name = Console.ask("Draft name", self.projects[0]['name'].lower().replace(' ', '-') if self.projects else 'project')
-            save_draft(draft_name, {
-                'org': self.org_data,
-                'resources': self.resources,
-                'projects': self.projects
-            })
+            draft_name = Console.ask("Draft name", self.resume_draft or (self.projects[0]['name'].lower().replace(' ', '-') if self.projects else 'project'))
+            self.draft.rename(draft_name)
+            self.draft.close()
+            Console.success(f"Draft saved: {self.draft.snapshot_path}")
+        elif self.resume_draft:
+            self.draft.close()
+        else:
+            self.draft.discard()
 
         # Step 4: Generate or suggest Excel
         self._finalize()
@@ -779,7 +764,8 @@ class QuadInteractiveInit:
         print(f"  Config file: {QUAD_GLOBAL_CONFIG}")
 
         if Console.confirm("\n  Use existing organization?"):
-            self.org_data = self.config
+            for key, value in self.config.items():
+                self._edit('set', ['org', key], value)
         else:
             Console.info("Starting fresh setup")
 
@@ -787,22 +773,22 @@ class QuadInteractiveInit:
         """Setup organization interactively"""
         Console.header("Organization Setup")
 
-        self.org_data['org_name'] = Console.ask(
+        self._edit('set', ['org', 'org_name'], Console.ask(
             "Organization name",
             self.org_data.get('org_name', 'My Company')
-        )
-        self.org_data['org_code'] = Console.ask(
+        ))
+        self._edit('set', ['org', 'org_code'], Console.ask(
             "Organization code (short)",
             self.org_data.get('org_code', self.org_data['org_name'][:4].upper())
-        )
-        self.org_data['timezone'] = Console.ask(
+        ))
+        self._edit('set', ['org', 'timezone'], Console.ask(
             "Timezone",
             self.org_data.get('timezone', 'America/New_York')
-        )
+        ))
 
         # Save to config
         if Console.confirm("  Save as default organization?"):
-            save_config(self.org_data)
+            save_global_config(self.org_data)
             Console.success("Saved to ~/.quad/config.json")
 
     def _setup_resources(self):
@@ -819,7 +805,7 @@ class QuadInteractiveInit:
             role = Console.ask("Role", "Developer")
             skills = Console.ask("Skills (comma-separated)", "")
 
-            self.resources.append({
+            self._edit('append', ['resources'], {
                 'name': name,
                 'email': email,
                 'role': role,
@@ -835,61 +821,86 @@ class QuadInteractiveInit:
         Console.header("Project Setup")
 
         while True:
-            project = {}
+            if self.projects and not self._project_complete(self.projects[-1]):
+                # Quit halfway through this one last time: ask again, answers as defaults
+                index = len(self.projects) - 1
+                Console.info(f"Continuing project '{self.projects[index]['name']}' from the draft")
+            else:
+                print("\n  ── New Project ──\n")
 
-            print("\n  ── New Project ──\n")
+                # Basic info
+                name = Console.ask("Project name")
+                if not name:
+                    if not self.projects:
+                        Console.error("At least one project required")
+                        continue
+                    break
+                index = len(self.projects)
+                self._edit('append', ['projects'], {'name': name})
 
-            # Basic info
-            project['name'] = Console.ask("Project name")
-            if not project['name']:
-                if not self.projects:
-                    Console.error("At least one project required")
-                    continue
-                break
+            project = self.projects[index]
 
-            project['description'] = Console.ask("Description", "")
+            def answer(key, value):
+                self._edit('set', ['projects', index, key], value)
+
+            answer('description', Console.ask("Description", project.get('description', "")))
 
             # Project type
-            type_idx = Console.select("What type of project?", self.PROJECT_TYPES)
-            project['type'] = self.PROJECT_TYPES[type_idx]
+            type_idx = Console.select("What type of project?", self.PROJECT_TYPES,
+                                      self._option(self.PROJECT_TYPES, project.get('type')))
+            answer('type', self.PROJECT_TYPES[type_idx])
 
             # Tech stack
             print("\n  Tech Stack:")
 
-            fe_idx = Console.select("Frontend technology?", self.FRONTEND_TECH)
-            project['frontend'] = self.FRONTEND_TECH[fe_idx]
+            fe_idx = Console.select("Frontend technology?", self.FRONTEND_TECH,
+                                    self._option(self.FRONTEND_TECH, project.get('frontend')))
+            answer('frontend', self.FRONTEND_TECH[fe_idx])
 
-            be_idx = Console.select("Backend technology?", self.BACKEND_TECH)
-            project['backend'] = self.BACKEND_TECH[be_idx]
+            be_idx = Console.select("Backend technology?", self.BACKEND_TECH,
+                                    self._option(self.BACKEND_TECH, project.get('backend')))
+            answer('backend', self.BACKEND_TECH[be_idx])
 
-            db_idx = Console.select("Database?", self.DATABASE_TECH)
-            project['database'] = self.DATABASE_TECH[db_idx]
+            db_idx = Console.select("Database?", self.DATABASE_TECH,
+                                    self._option(self.DATABASE_TECH, project.get('database')))
+            answer('database', self.DATABASE_TECH[db_idx])
 
             # Deliverables
             print("\n  Deliverables:")
-            del_indices = Console.multi_select("What needs to be delivered?", self.DELIVERABLES, [0])
-            project['deliverables'] = [self.DELIVERABLES[i] for i in del_indices]
+            chosen = [self.DELIVERABLES.index(d) for d in project.get('deliverables', []) if d in self.DELIVERABLES]
+            del_indices = Console.multi_select("What needs to be delivered?", self.DELIVERABLES, chosen or [0])
+            answer('deliverables', [self.DELIVERABLES[i] for i in del_indices])
 
             # Timeline
-            project['deadline'] = Console.ask(
+            answer('deadline', Console.ask(
                 "Deadline (YYYY-MM-DD)",
-                (datetime.now() + timedelta(days=60)).strftime('%Y-%m-%d')
-            )
+                project.get('deadline') or (datetime.now() + timedelta(days=60)).strftime('%Y-%m-%d')
+            ))
 
             # Owner
             if self.resources:
                 owner_names = [r.get('name', 'Unknown') for r in self.resources]
                 owner_idx = Console.select("Project owner?", owner_names)
-                project['owner'] = self.resources[owner_idx]
+                answer('owner', self.resources[owner_idx])
             else:
-                project['owner_email'] = Console.ask("Owner email", "")
+                answer('owner_email', Console.ask("Owner email", project.get('owner_email', "")))
 
-            self.projects.append(project)
+            self.draft.sync()
             Console.success(f"Project '{project['name']}' added")
 
             if not Console.confirm("\n  Add another project?", default=False):
                 break
 
+    @staticmethod
+    def _project_complete(project: Dict) -> bool:
+        """Whether every question was answered (the owner is asked last)"""
+        return 'owner' in project or 'owner_email' in project
+
+    @staticmethod
+    def _option(options: List[str], value: Optional[str]) -> int:
+        """Index of a previous answer, for select() defaults"""
+        return options.index(value) if value in options else 0
+
     def _finalize(self):
         """Finalize - suggest Excel or save to DB"""
         Console.header("Finalization")
@@ -898,8 +909,7 @@ class QuadInteractiveInit:
         if self.projects:
             project = self.projects[0]
             org_code = self.org_data.get('org_code', 'unknown')
-            domain_slug = project['name'].lower().replace(' ', '-')[:20]
-            create_project_quad_folder(org_code, domain_slug, project['name'])
+            create_project_quad_folder(org_code, domain_slug(project['name']), project['name'])
 
         # Option 1: Generate Excel template with filled data
         if HAS_OPENPYXL:
@@ -924,52 +934,14 @@ class QuadInteractiveInit:
         Console.info("  3. Run 'quad-init @your-file.xlsx' to initialize")
 
     def _generate_filled_excel(self):
-        """Generate Excel pre-filled with interactive data"""
-        from openpyxl import Workbook
-        from openpyxl.styles import Font, PatternFill, Alignment
-
-        wb = Workbook()
-
-        # Overview sheet
-        ws = wb.active
-        ws.title = "Overview"
-        overview_data = [
-            ("Field", "Value"),
-            ("org_name", self.org_data.get('org_name', '')),
-            ("org_code", self.org_data.get('org_code', '')),
-            ("timezone", self.org_data.get('timezone', '')),
-        ]
-        for row in overview_data:
-            ws.append(row)
-
-        # Resources sheet
-        ws = wb.create_sheet("Resources")
-        ws.append(["Name", "Email", "Role", "Skills"])
-        for r in self.resources:
-            ws.append([r.get('name'), r.get('email'), r.get('role'), r.get('skills')])
-
-        # Project sheets
-        for i, project in enumerate(self.projects):
-            ws = wb.create_sheet(f"Project {i+1}")
-            project_data = [
-                ("project_name", project.get('name', '')),
-                ("description", project.get('description', '')),
-                ("type", project.get('type', '')),
-                ("frontend", project.get('frontend', '')),
-                ("backend", project.get('backend', '')),
-                ("database", project.get('database', '')),
-                ("deliverables", ', '.join(project.get('deliverables', []))),
-                ("deadline", project.get('deadline', '')),
-                ("owner_email", project.get('owner_email', '')),
-            ]
-            for row in project_data:
-                ws.append(row)
+        """Generate Excel pre-filled with interactive data (streamed, see quad export)"""
+        from quad_cli.commands.export import OVERVIEW_KEYS, write_workbook
 
-        # Save
+        overview = {key: self.org_data.get(key, '') for key in OVERVIEW_KEYS}
         filename = f"quad-{self.org_data.get('org_code', 'org').lower()}-setup.xlsx"
-        wb.save(filename)
+        write_workbook(filename, overview, self.resources, self.projects)
         Console.success(f"Excel file created: {filename}")
-        Console.info("You can edit this file and re-run 'quad-init @{filename}'")
+        Console.info(f"You can edit this file and re-run 'quad-init @{filename}'")
 
     def _save_to_database(self):
         """Save to database"""
@@ -978,50 +950,19 @@ class QuadInteractiveInit:
             return
 
         try:
-            conn = psycopg.connect(
-                host=DB_CONFIG["host"],
-                port=DB_CONFIG["port"],
-                dbname=DB_CONFIG["dbname"],
-                user=DB_CONFIG["user"],
-                password=DB_CONFIG["password"],
-                row_factory=dict_row
-            )
-
-            with conn.cursor() as cur:
-                # Get or create organization
-                cur.execute("""
-                    SELECT id FROM quad_organizations WHERE slug = %s
-                """, (self.org_data.get('org_code', '').lower(),))
-                org = cur.fetchone()
-
-                if org:
-                    org_id = org['id']
-                else:
-                    Console.info("Organization not found in database")
-                    Console.info("Run database setup first")
-                    return
-
-                # Save projects
-                for project in self.projects:
-                    slug = project['name'].lower().replace(' ', '-')[:20]
-
-                    cur.execute("""
-                        INSERT INTO quad_domains (name, slug, description, methodology, company_id, is_active)
-                        VALUES (%s, %s, %s, 'quad', %s, true)
-                        ON CONFLICT (slug) DO UPDATE SET
-                            name = EXCLUDED.name,
-                            description = EXCLUDED.description
-                        RETURNING id
-                    """, (project['name'], slug, project.get('description', ''), org_id))
-
-                    domain_id = cur.fetchone()['id']
-                    Console.success(f"Saved: {project['name']} (ID: {domain_id})")
-
-            conn.commit()
-            conn.close()
-
+            domain_ids = save_projects(self.org_data.get('org_code', ''), self.projects)
         except Exception as e:
             Console.error(f"Database error: {e}")
+            return
+
+        if domain_ids is None:
+            Console.info("Organization not found in database")
+            Console.info("Run database setup first")
+            return
+
+        for project in self.projects:
+            domain_id = domain_ids[domain_slug(project['name'])]
+            Console.success(f"Saved: {project['name']} (ID: {domain_id})")
 
     def _show_summary(self):
         """Show configuration summary"""
@@ -1051,6 +992,8 @@ QUAD Project Initialization
 Usage:
   quad-init                      Interactive mode (no file needed)
   quad-init @<excel-file>        Initialize from Excel file
+  quad-init @<source>            ... or CSV directory, .json, .jsonl, .parquet
+  quad-init @<file> --no-cache   Re-parse every sheet (ignore ~/.quad/cache/)
   quad-init --resume <name>      Resume a saved draft
   quad-init --list-drafts        List saved drafts
 
@@ -1084,13 +1027,7 @@ def main():
 
     # List drafts
     if arg == '--list-drafts':
-        drafts = list_drafts()
-        if drafts:
-            Console.header("Saved Drafts")
-            for d in drafts:
-                print(f"    • {d}")
-        else:
-            Console.info("No drafts found")
+        show_drafts()
         return
 
     # Resume draft
@@ -1108,30 +1045,50 @@ def main():
     else:
         filepath = arg
 
-    # Check openpyxl for Excel mode
-    if not HAS_OPENPYXL:
-        Console.error("openpyxl not installed for Excel mode")
-        Console.info("Run: pip install openpyxl")
-        Console.info("Or use: quad-init (interactive mode)")
-        sys.exit(1)
-
     # Check file exists
     if not os.path.exists(filepath):
         Console.error(f"File not found: {filepath}")
         sys.exit(1)
 
+    # Check the format (and openpyxl for Excel mode)
+    if not _check_source(filepath):
+        Console.info("Or use: quad-init (interactive mode)")
+        sys.exit(1)
+
     # Run Excel-based initialization
-    init = QuadInit(filepath)
+    init = QuadInit(filepath, use_cache='--no-cache' not in sys.argv)
     init.run()
 
 
-def run_init(excel_file: str = None, resume: str = None, interactive: bool = False):
+def _check_source(filepath: str) -> bool:
+    """Whether a source's format is recognized and its reader installed"""
+    try:
+        fmt = detect_format(filepath)
+    except ValueError as e:
+        Console.error(str(e))
+        return False
+    if fmt == "excel" and not HAS_OPENPYXL:
+        Console.error("openpyxl not installed for Excel mode")
+        Console.info("Run: pip install openpyxl")
+        return False
+    if fmt == "parquet":
+        from quad_cli.sources.parquet import HAS_PYARROW
+        if not HAS_PYARROW:
+            Console.error("pyarrow not installed for Parquet sources")
+            Console.info("Run: pip install pyarrow")
+            return False
+    return True
+
+
+def run_init(excel_file: str = None, resume: str = None, interactive: bool = False,
+             use_cache: bool = True):
     """Entry point for CLI integration.
 
     Args:
-        excel_file: Path to Excel file (with or without @ prefix)
+        excel_file: Path to Excel file, CSV directory, JSON or Parquet (with or without @ prefix)
         resume: Name of draft to resume
         interactive: Force interactive mode
+        use_cache: Reuse parsed sheets from ~/.quad/cache/
     """
     if resume:
         init = QuadInteractiveInit(resume_draft=resume)
@@ -1146,17 +1103,15 @@ def run_init(excel_file: str = None, resume: str = None, interactive: bool = Fal
     # Excel file mode
     filepath = excel_file[1:] if excel_file.startswith('@') else excel_file
 
-    if not HAS_OPENPYXL:
-        Console.error("openpyxl not installed for Excel mode")
-        Console.info("Run: pip install openpyxl")
-        Console.info("Or use: quad init (interactive mode)")
-        return
-
     if not os.path.exists(filepath):
         Console.error(f"File not found: {filepath}")
         return
 
-    init = QuadInit(filepath)
+    if not _check_source(filepath):
+        Console.info("Or use: quad init (interactive mode)")
+        return
+
+    init = QuadInit(filepath, use_cache=use_cache)
     init.run()
 
 
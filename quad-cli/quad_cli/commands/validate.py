@@ -0,0 +1,72 @@
+#!/usr/bin/env python3
+"""
+QUAD Validate
+=============
+
+Check org workbooks without touching the database or prompting.
+
+Usage:
+  quad validate org-setup.xlsx                # Every problem, with its cell
+  quad validate orgs/ --json > report.json     # A directory, glob or manifest
+  quad validate org-setup.xlsx --strict       # Warnings fail too (CI)
+
+Exits 1 if any workbook has errors (or, with --strict, warnings). See
+quad_cli.validation for the checks.
+
+Copyright (c) 2026 Gopi Suman Addanke. All Rights Reserved.
+"""
+
+import json
+import sys
+from typing import List
+
+from quad_cli.utils.console import Console
+
+
+def run_validate(sources: List[str], as_json: bool = False, strict: bool = False, limit: int = 50) -> None:
+    """Validate workbooks and print the issues
+
+    Args:
+        sources: Workbooks, directories, globs or manifests (as for --batch)
+        as_json: Print the full report as JSON instead
+        strict: Treat warnings as failures
+        limit: Issues printed per workbook (JSON lists all)
+    """
+    from quad_cli.commands.batch import find_workbooks
+    from quad_cli.validation import validate_workbook
+
+    paths = [path for source in sources for path in find_workbooks(source.lstrip('@'))]
+    if not paths:
+        Console.error(f"No workbooks found: {' '.join(sources)}")
+        sys.exit(1)
+
+    reports = [validate_workbook(path) for path in paths]
+    failed = [r for r in reports if r.errors or (strict and r.warnings)]
+
+    if as_json:
+        print(json.dumps({
+            "ok": not failed,
+            "strict": strict,
+            "workbooks": [r.to_dict() for r in reports],
+        }, indent=2, default=str))
+    else:
+        for report in reports:
+            Console.header(report.path)
+            for issue in report.issues[:limit]:
+                line = f"{issue.cell:<24} {issue.message}"
+                if issue.severity == "error":
+                    Console.error(line)
+                else:
+                    Console.warn(line)
+            if len(report.issues) > limit:
+                Console.info(f"... {len(report.issues) - limit} more (use --json for all)")
+            summary = (f"{len(report.errors)} errors, {len(report.warnings)} warnings "
+                       f"({report.rows:,} rows in {report.seconds:.2f}s)")
+            if report in failed:
+                Console.error(summary)
+            else:
+                Console.success(summary)
+        print()
+
+    if failed:
+        sys.exit(1)
@@ -0,0 +1,289 @@
+"""
+QUAD CLI Database Access
+========================
+
+Shared Postgres access for CLI commands (init, and sync/import commands
+to come): one lazily opened connection pool per process, sync and async,
+configured from DB_CONFIG (DB_HOST, DB_PORT, DB_NAME, DB_USER,
+DB_PASSWORD in the environment or .env).
+
+Usage:
+    from quad_cli import db
+
+    with db.transaction() as cur:          # commit on success, rollback on error
+        org_id = db.find_org_id(cur, "acme")
+        ids = db.upsert_domains(cur, org_id, projects)
+
+    async with db.async_transaction() as cur:
+        ...
+
+Hot statements (STATEMENTS) are executed with prepare=True, so each
+pooled connection parses and plans them once and later calls only send
+parameters. Set QUAD_DB_PREPARE=0 behind a transaction-mode pgbouncer,
+which cannot keep prepared statements. Without psycopg_pool installed,
+connection() falls back to one plain connection per call.
+
+Copyright (c) 2026 Gopi Suman Addanke. All Rights Reserved.
+"""
+
+import asyncio
+import atexit
+import os
+import threading
+from contextlib import asynccontextmanager, contextmanager
+from typing import Any, Dict, Iterator, List, Optional
+
+from dotenv import load_dotenv
+
+try:
+    import psycopg
+    from psycopg.rows import dict_row
+    HAS_PSYCOPG = True
+except ImportError:
+    HAS_PSYCOPG = False
+
+try:
+    from psycopg_pool import AsyncConnectionPool, ConnectionPool
+    HAS_POOL = True
+except ImportError:
+    HAS_POOL = False
+
+load_dotenv()
+
+# Database config
+DB_CONFIG = {
+    "host": os.getenv("DB_HOST", "localhost"),
+    "port": int(os.getenv("DB_PORT", 14201)),
+    "dbname": os.getenv("DB_NAME", "quad_dev_db"),
+    "user": os.getenv("DB_USER", "quad_user"),
+    "password": os.getenv("DB_PASSWORD", "quad_dev_pass"),
+}
+
+POOL_MIN_SIZE = int(os.getenv("QUAD_DB_POOL_MIN", 1))
+POOL_MAX_SIZE = int(os.getenv("QUAD_DB_POOL_MAX", 5))
+POOL_TIMEOUT = float(os.getenv("QUAD_DB_POOL_TIMEOUT", 30))
+PREPARE = os.getenv("QUAD_DB_PREPARE", "1") != "0"
+
+_dsn: Optional[str] = None
+_pool: Optional["ConnectionPool"] = None
+_async_pool: Optional["AsyncConnectionPool"] = None
+_async_loop: Optional[asyncio.AbstractEventLoop] = None  # Loop the async pool lives in
+_lock = threading.Lock()
+
+
+# ─────────────────────────────────────────────────────────────
+# Statements
+# ─────────────────────────────────────────────────────────────
+
+STATEMENTS = {
+    "org_by_slug": """
+        SELECT id FROM quad_organizations WHERE slug = %s
+    """,
+    # One statement for all projects: the arrays are unnested server-side
+    "upsert_domains": """
+        INSERT INTO quad_domains (name, slug, description, methodology, company_id, is_active)
+        SELECT name, slug, description, 'quad', %s, true
+        FROM unnest(%s::text[], %s::text[], %s::text[]) AS t(name, slug, description)
+        ON CONFLICT (slug) DO UPDATE SET
+            name = EXCLUDED.name,
+            description = EXCLUDED.description
+        RETURNING id, slug
+    """,
+}
+
+
+def execute(cur, name: str, params: Any = None):
+    """Run a statement from STATEMENTS, prepared on this connection"""
+    return cur.execute(STATEMENTS[name], params, prepare=PREPARE or None)
+
+
+def find_org_id(cur, slug: str) -> Optional[Any]:
+    """Organization id by slug, or None if it does not exist"""
+    execute(cur, "org_by_slug", (slug,))
+    row = cur.fetchone()
+    return row['id'] if row else None
+
+
+def domain_slug(name: str) -> str:
+    """Domain slug for a project name"""
+    return name.lower().replace(' ', '-')[:20]
+
+
+def upsert_domains(cur, org_id: Any, projects: List[Dict]) -> Dict[str, Any]:
+    """Insert or update projects as domains in one round trip.
+
+    Projects sharing a slug are collapsed to the last one, which is what
+    upserting them one by one would leave behind (a single INSERT may not
+    update the same row twice).
+
+    Args:
+        cur: Cursor with a dict row factory, inside the caller's transaction
+        org_id: Owning organization id
+        projects: Project dicts with 'name' and optional 'description'
+
+    Returns:
+        Domain id by slug
+    """
+    rows = {}
+    for project in projects:
+        rows[domain_slug(project['name'])] = project
+    if not rows:
+        return {}
+
+    def text(value):
+        return None if value is None else str(value)
+
+    execute(cur, "upsert_domains", (
+        org_id,
+        [text(p['name']) for p in rows.values()],
+        list(rows),
+        [text(p.get('description', '')) for p in rows.values()],
+    ))
+    return {row['slug']: row['id'] for row in cur.fetchall()}
+
+
+# ─────────────────────────────────────────────────────────────
+# Pools
+# ─────────────────────────────────────────────────────────────
+
+def _require_psycopg() -> None:
+    if not HAS_PSYCOPG:
+        raise RuntimeError("psycopg not installed. Run: pip install psycopg[binary]")
+
+
+def configure(dsn: Optional[str] = None, min_size: Optional[int] = None,
+              max_size: Optional[int] = None) -> None:
+    """Change pool settings (closes both pools if open, so the next call
+    opens them with the new settings). Arguments left None keep their
+    current value.
+
+    Args:
+        dsn: Connection string used instead of DB_CONFIG
+        min_size: Connections kept open
+        max_size: Connections opened at most
+    """
+    global _dsn, POOL_MIN_SIZE, POOL_MAX_SIZE
+    close_pool()
+    _discard_async_pool()
+    if dsn is not None:
+        _dsn = dsn
+    if min_size is not None:
+        POOL_MIN_SIZE = min_size
+    if max_size is not None:
+        POOL_MAX_SIZE = max_size
+
+
+def conninfo() -> str:
+    """Connection string for DB_CONFIG (or the configured DSN)"""
+    _require_psycopg()
+    return _dsn or psycopg.conninfo.make_conninfo(**DB_CONFIG)
+
+
+def _connect_kwargs() -> Dict[str, Any]:
+    kwargs = {"row_factory": dict_row}
+    if not PREPARE:
+        kwargs["prepare_threshold"] = None  # Never prepare, not even automatically
+    return kwargs
+
+
+def get_pool() -> "ConnectionPool":
+    """The process-wide connection pool, opened on first use"""
+    global _pool
+    _require_psycopg()
+    if not HAS_POOL:
+        raise RuntimeError("psycopg_pool not installed. Run: pip install psycopg-pool")
+    with _lock:
+        if _pool is None:
+            _pool = ConnectionPool(
+                conninfo(), min_size=POOL_MIN_SIZE, max_size=POOL_MAX_SIZE,
+                timeout=POOL_TIMEOUT, kwargs=_connect_kwargs(), name="quad-cli", open=True
+            )
+    return _pool
+
+
+async def get_async_pool() -> "AsyncConnectionPool":
+    """The process-wide async pool, opened on first use (one event loop per process)"""
+    global _async_pool, _async_loop
+    _require_psycopg()
+    if not HAS_POOL:
+        raise RuntimeError("psycopg_pool not installed. Run: pip install psycopg-pool")
+    with _lock:
+        if _async_pool is None:
+            _async_pool = AsyncConnectionPool(
+                conninfo(), min_size=POOL_MIN_SIZE, max_size=POOL_MAX_SIZE,
+                timeout=POOL_TIMEOUT, kwargs=_connect_kwargs(), name="quad-cli-async", open=False
+            )
+            _async_loop = asyncio.get_running_loop()
+        pool = _async_pool
+    if pool.closed:
+        await pool.open()  # Safe to await from concurrent callers
+    return pool
+
+
+def close_pool() -> None:
+    """Close the sync pool (runs at exit)"""
+    global _pool
+    with _lock:
+        pool, _pool = _pool, None
+    if pool is not None:
+        pool.close()
+
+
+atexit.register(close_pool)
+
+
+async def close_async_pool() -> None:
+    """Close the async pool; call before the event loop ends"""
+    global _async_pool, _async_loop
+    with _lock:
+        pool, _async_pool, _async_loop = _async_pool, None, None
+    if pool is not None:
+        await pool.close()
+
+
+def _discard_async_pool() -> None:
+    """Close the async pool from sync code, in the loop it belongs to"""
+    global _async_pool, _async_loop
+    with _lock:
+        pool, loop = _async_pool, _async_loop
+        _async_pool = _async_loop = None
+    if pool is None or loop.is_closed():
+        return
+    if loop.is_running():
+        # Possibly called from inside that loop: schedule, don't block
+        asyncio.run_coroutine_threadsafe(pool.close(), loop)
+    else:
+        loop.run_until_complete(pool.close())
+
+
+# ─────────────────────────────────────────────────────────────
+# Transactions
+# ─────────────────────────────────────────────────────────────
+
+@contextmanager
+def connection() -> Iterator["psycopg.Connection"]:
+    """A pooled connection; commits on success, rolls back on error"""
+    _require_psycopg()
+    if not HAS_POOL:
+        with psycopg.connect(conninfo(), **_connect_kwargs()) as conn:
+            yield conn
+        return
+    with get_pool().connection() as conn:
+        yield conn
+
+
+@contextmanager
+def transaction() -> Iterator["psycopg.Cursor"]:
+    """A cursor inside one transaction on a pooled connection"""
+    with connection() as conn:
+        with conn.transaction(), conn.cursor() as cur:
+            yield cur
+
+
+@asynccontextmanager
+async def async_transaction():
+    """Async counterpart of transaction()"""
+    pool = await get_async_pool()
+    async with pool.connection() as conn:
+        async with conn.transaction(), conn.cursor() as cur:
+            yield cur
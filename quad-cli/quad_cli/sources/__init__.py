@@ -0,0 +1,109 @@
+"""
+QUAD Org Sources
+================
+
+Where `quad init` reads an org from. Every source yields the same model
+(overview, resources, projects; see base.Source), so QuadInit does not
+care which format it came from.
+
+    excel     .xlsx workbook (Overview, Resources, project tabs)
+    csv       directory of CSV exports, or one CSV of resources
+    json      one JSON document
+    jsonl     JSON Lines, streamed
+    parquet   directory of Parquet files, or one file of resources (pyarrow)
+
+Usage:
+    from quad_cli.sources import open_source
+
+    with open_source("exports/acme/") as source:    # format detected
+        overview = source.parse_overview()
+        for person in source.iter_resources():
+            ...
+
+Copyright (c) 2026 Gopi Suman Addanke. All Rights Reserved.
+"""
+
+from pathlib import Path
+from typing import Dict, Optional
+
+from .base import Row, Source
+from .csv_dir import CsvSource
+from .excel import HAS_OPENPYXL, ExcelParser
+from .json_file import JsonLinesSource, JsonSource
+
+SOURCES: Dict[str, type] = {
+    "excel": ExcelParser,
+    "csv": CsvSource,
+    "json": JsonSource,
+    "jsonl": JsonLinesSource,
+}
+# Parquet is imported on first use (pyarrow is optional, and slow to import)
+FORMATS = tuple(SOURCES) + ("parquet",)
+
+SUFFIXES = {
+    ".xlsx": "excel", ".xlsm": "excel",
+    ".csv": "csv", ".tsv": "csv",
+    ".json": "json",
+    ".jsonl": "jsonl", ".ndjson": "jsonl",
+    ".parquet": "parquet", ".pq": "parquet",
+}
+
+
+def detect_format(path: str) -> str:
+    """Source format of a file or directory: by suffix, else by content
+
+    Raises:
+        ValueError: Nothing recognizable
+    """
+    target = Path(path)
+    if target.is_dir():
+        found = {SUFFIXES.get(p.suffix.lower()) for p in target.iterdir() if p.is_file()}
+        for fmt in ("parquet", "csv"):
+            if fmt in found:
+                return fmt
+        raise ValueError(f"{path}: no .csv or .parquet files in directory")
+
+    fmt = SUFFIXES.get(target.suffix.lower())
+    if fmt:
+        return fmt
+
+    with open(target, "rb") as f:
+        head = f.read(64 * 1024)
+    if head.startswith(b"PK\x03\x04"):
+        return "excel"
+    if head.startswith(b"PAR1"):
+        return "parquet"
+    text = head.lstrip(b"\xef\xbb\xbf \t\r\n")
+    if text[:1] == b"[":
+        return "json"
+    if text[:1] == b"{":
+        # JSON Lines: the first line is a whole object and more follow
+        first, _, rest = text.partition(b"\n")
+        return "jsonl" if first.rstrip().endswith(b"}") and rest.strip()[:1] == b"{" else "json"
+    return "csv"
+
+
+def open_source(path: str, fmt: Optional[str] = None, cache: bool = False, streaming: bool = True) -> Source:
+    """Open an org source
+
+    Args:
+        path: File or directory
+        fmt: One of FORMATS (default: detect_format)
+        cache: Excel only: reuse parsed sheets from ~/.quad/cache/
+        streaming: Excel only: read-only workbook, Row tuples
+    """
+    fmt = fmt or detect_format(path)
+    if fmt not in FORMATS:
+        raise ValueError(f"Unknown source format '{fmt}' (one of: {', '.join(FORMATS)})")
+    if fmt == "excel":
+        return ExcelParser(path, streaming=streaming, cache=cache)
+    if fmt == "parquet":
+        from .parquet import ParquetSource
+        return ParquetSource(path)
+    return SOURCES[fmt](path)
+
+
+__all__ = [
+    "Source", "Row", "ExcelParser", "CsvSource", "JsonSource", "JsonLinesSource",
+    "SOURCES", "FORMATS", "HAS_OPENPYXL", "detect_format", "open_source",
+]
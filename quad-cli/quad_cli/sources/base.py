@@ -0,0 +1,162 @@
+"""
+Org Source Base
+===============
+
+What every org source (Excel, CSV, JSON, Parquet) reads: the same
+logical model `quad init` works with.
+- overview:  {key: value}, keys normalized like the Overview tab
+- resources: one record per person, header keys normalized
+- projects:  one {key: value} dict per project, with `_sheet_name`
+             naming where it came from
+
+Copyright (c) 2026 Gopi Suman Addanke. All Rights Reserved.
+"""
+
+from typing import Any, Dict, Iterable, Iterator, List, Optional, Sequence
+
+# Names a part may go by: sheet names in a workbook, file stems in a
+# directory, top-level keys in a JSON document (case-insensitive)
+OVERVIEW_NAMES = ['Overview', 'Org', 'Organization']
+RESOURCE_NAMES = ['Resources', 'Team', 'Team Members', 'People']
+
+
+# ─────────────────────────────────────────────────────────────
+# Rows
+# ─────────────────────────────────────────────────────────────
+
+class Row(tuple):
+    """
+    A table row: a plain tuple, readable like a dict through its table's
+    header map (row.get('email'), row['name']). Much lighter than one dict
+    per row. Each table builds a subclass carrying its `header`.
+    """
+
+    __slots__ = ()
+    header: Dict[str, int] = {}
+
+    def get(self, key: str, default: Any = None) -> Any:
+        index = self.header.get(key)
+        if index is None or index >= len(self):
+            return default
+        return tuple.__getitem__(self, index)
+
+    def __getitem__(self, key):
+        if isinstance(key, str):
+            index = self.header[key]
+            return tuple.__getitem__(self, index) if index < len(self) else None
+        return tuple.__getitem__(self, key)
+
+    def keys(self) -> List[str]:
+        return list(self.header)
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {key: self.get(key) for key in self.header}
+
+
+def _row_class(header: Dict[str, int]) -> type:
+    return type("Row", (Row,), {"__slots__": (), "header": header})
+
+
+def _header_key(value: Any, index: int) -> str:
+    return str(value).lower().replace(' ', '_') if value else f'col_{index}'
+
+
+def iter_table(rows: Iterable[Sequence[Any]]) -> Iterator[Row]:
+    """Rows of a table whose first row is the header, as Row tuples
+
+    Rows with no truthy value are skipped; rows are cut to the header's
+    width.
+    """
+    rows = iter(rows)
+    first = next(rows, None)
+    if first is None:
+        return
+
+    header = {_header_key(h, i): i for i, h in enumerate(first)}
+    row_class = _row_class(header)
+    width = len(first)
+
+    for row in rows:
+        if any(row):  # Skip empty rows
+            yield row_class(row[:width])
+
+
+def key_values(pairs: Iterable[Sequence[Any]]) -> Dict[str, Any]:
+    """A key-value part as a dict: key in the first cell, value in the second"""
+    data = {}
+    for row in pairs:
+        if len(row) > 1 and row[0] and row[1]:
+            key = str(row[0]).lower().replace(' ', '_')
+            data[key] = row[1]
+    return data
+
+
+def is_project_name(name: str) -> bool:
+    """Whether a sheet (or file stem) holds a project"""
+    return name.lower().startswith('project') or name.lower() in ['suma', 'nutrinne', 'nutri']
+
+
+def find_name(candidates: Sequence[str], names: Iterable[str]) -> Optional[str]:
+    """The first of `names` matching one of `candidates` (case-insensitive)"""
+    names = list(names)
+    for candidate in candidates:
+        if candidate in names:
+            return candidate
+        for name in names:
+            if name.lower() == candidate.lower():
+                return name
+    return None
+
+
+# ─────────────────────────────────────────────────────────────
+# Source
+# ─────────────────────────────────────────────────────────────
+
+class Source:
+    """
+    Base class of org sources. Subclasses implement get_sheet_names,
+    parse_overview, iter_resources and iter_projects.
+
+    Resources are streamed: iter_resources yields one record at a time
+    and parse_resources just collects them.
+    """
+
+    FORMAT = ""
+    LABEL = "Source"
+
+    # Parsed-sheet cache (ExcelParser only)
+    cache = None
+
+    def __init__(self, filepath: str):
+        self.filepath = filepath
+
+    def get_sheet_names(self) -> List[str]:
+        """Names of the parts found (sheets, files or sections)"""
+        raise NotImplementedError
+
+    def parse_overview(self) -> Dict:
+        raise NotImplementedError
+
+    def iter_resources(self) -> Iterator[Any]:
+        raise NotImplementedError
+
+    def parse_resources(self) -> List:
+        return list(self.iter_resources())
+
+    def iter_projects(self) -> Iterator[Dict]:
+        raise NotImplementedError
+
+    def parse_projects(self) -> List[Dict]:
+        return list(self.iter_projects())
+
+    def close(self):
+        pass
+
+    def __enter__(self) -> 'Source':
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        self.close()
+
+    def __repr__(self) -> str:
+        return f"<{type(self).__name__}({self.filepath})>"
@@ -0,0 +1,110 @@
+"""
+CSV Org Source
+==============
+
+An org as CSV exports, one file per part, in a directory:
+
+    org/
+      overview.csv      Key,Value rows, like the Overview tab
+      resources.csv     Header row, then one row per person
+      projects.csv      Header row (Project Name, Type, ...), one row per project
+      project-*.csv     Or: one Key,Value file per project, like the project tabs
+
+File stems are matched like sheet names (overview.csv, team.csv,
+people.csv, ...). A single .csv file is read as the resources table.
+The delimiter (, ; tab |) is sniffed; a UTF-8 BOM is ignored. Empty
+cells read as None, everything else as text.
+
+Copyright (c) 2026 Gopi Suman Addanke. All Rights Reserved.
+"""
+
+import csv
+from pathlib import Path
+from typing import Any, Dict, Iterator, List, Optional
+
+from .base import OVERVIEW_NAMES, RESOURCE_NAMES, Row, Source, find_name, is_project_name, iter_table, key_values
+
+SUFFIXES = ('.csv', '.tsv')
+
+# Bytes read to sniff the delimiter
+SNIFF_BYTES = 64 * 1024
+
+
+def _values(row: List[str]) -> tuple:
+    return tuple(value if value != '' else None for value in row)
+
+
+class CsvSource(Source):
+    """
+    Org from a directory of CSV files (or resources from one CSV file).
+
+    Example:
+        with CsvSource("exports/acme/") as source:
+            overview = source.parse_overview()
+            for person in source.iter_resources():
+                ...
+    """
+
+    FORMAT = "csv"
+
+    def __init__(self, filepath: str):
+        super().__init__(filepath)
+        path = Path(filepath)
+        self.LABEL = "CSV Directory" if path.is_dir() else "CSV File"
+        if path.is_dir():
+            self._files = {p.stem: p for p in sorted(path.iterdir())
+                           if p.suffix.lower() in SUFFIXES and p.is_file()}
+            self._resources = self._find(RESOURCE_NAMES)
+        else:
+            self._files = {path.stem: path}
+            self._resources = path.stem
+
+    def get_sheet_names(self) -> List[str]:
+        return [path.name for path in self._files.values()]
+
+    def parse_overview(self) -> Dict:
+        name = self._find(OVERVIEW_NAMES)
+        if not name or name == self._resources:
+            return {}
+        return key_values(self._rows(name))
+
+    def iter_resources(self) -> Iterator[Row]:
+        if self._resources:
+            yield from iter_table(self._rows(self._resources))
+
+    def iter_projects(self) -> Iterator[Dict]:
+        for name, path in self._files.items():
+            if name == self._resources or not is_project_name(name):
+                continue
+            if name.lower() == 'projects':
+                # One row per project
+                for number, row in enumerate(iter_table(self._rows(name)), start=2):
+                    project = {key: value for key, value in row.to_dict().items() if value}
+                    project['_sheet_name'] = f"{path.name} row {number}"
+                    yield project
+            else:
+                project = key_values(self._rows(name))
+                project['_sheet_name'] = path.name
+                yield project
+
+    def _find(self, names: List[str]) -> Optional[str]:
+        return find_name(names, self._files)
+
+    def _rows(self, name: str) -> Iterator[tuple]:
+        """Rows of one file, streamed"""
+        path = self._files[name]
+        with open(path, newline='', encoding='utf-8-sig') as f:
+            sample = f.read(SNIFF_BYTES)
+            f.seek(0)
+            yield from map(_values, csv.reader(f, self._dialect(path, sample)))
+
+    @staticmethod
+    def _dialect(path: Path, sample: str) -> Any:
+        if path.suffix.lower() == '.tsv':
+            return csv.excel_tab
+        if len(sample) == SNIFF_BYTES and '\n' in sample:
+            sample = sample[:sample.rindex('\n')]  # Whole lines only
+        try:
+            return csv.Sniffer().sniff(sample, delimiters=',;\t|')
+        except csv.Error:
+            return csv.excel
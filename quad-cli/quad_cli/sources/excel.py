@@ -0,0 +1,164 @@
+"""
+Excel Org Source
+================
+
+The org workbook `quad init` was built around: an Overview tab, a
+Resources tab and one tab per project.
+
+Copyright (c) 2026 Gopi Suman Addanke. All Rights Reserved.
+"""
+
+from typing import Dict, Iterator, List, Optional
+
+try:
+    from openpyxl import load_workbook
+    HAS_OPENPYXL = True
+except ImportError:
+    HAS_OPENPYXL = False
+
+from quad_cli.utils.parse_cache import ParseCache
+
+from .base import (OVERVIEW_NAMES, RESOURCE_NAMES, Row, Source, _row_class, find_name, is_project_name,
+                   iter_table, key_values)
+
+
+class ExcelParser(Source):
+    """
+    Parse QUAD organization Excel file
+
+    With streaming=True the workbook is opened read-only: sheets are only
+    read when parsed, cells are never built as objects, and table rows are
+    Row tuples instead of dicts. Use it for large org files; call close()
+    (or use `with`) to release the file.
+
+    With cache=True parsed sheets are kept in ~/.quad/cache/ (see
+    quad_cli.utils.parse_cache) and the workbook is only loaded if some
+    sheet changed since it was last parsed.
+    """
+
+    FORMAT = "excel"
+    LABEL = "Excel File"
+
+    # Bump when parsing results change shape
+    CACHE_TAG = "excel-parser/1"
+
+    OVERVIEW_SHEETS = OVERVIEW_NAMES
+    RESOURCE_SHEETS = RESOURCE_NAMES
+
+    def __init__(self, filepath: str, streaming: bool = False, cache: bool = False):
+        super().__init__(filepath)
+        self.streaming = streaming
+        self.cache = ParseCache(filepath) if cache else None
+        self._workbook = None
+        if self.cache is None:
+            self._workbook = self._load_workbook()
+
+    @property
+    def workbook(self):
+        if self._workbook is None:
+            self._workbook = self._load_workbook()
+        return self._workbook
+
+    def get_sheet_names(self) -> List[str]:
+        if self.cache is not None:
+            return self.cache.sheetnames
+        return self.workbook.sheetnames
+
+    def parse_overview(self) -> Dict:
+        """Parse Overview tab (Tab 1)"""
+        name = self._find_sheet(self.OVERVIEW_SHEETS)
+        if not name:
+            return {}
+
+        return self._cached(name, 'key_value', lambda: self._parse_key_value_sheet(self.workbook[name]))
+
+    def parse_resources(self) -> List[Dict]:
+        """Parse Resources tab (Tab 2)"""
+        name = self._find_sheet(self.RESOURCE_SHEETS)
+        if not name:
+            return []
+
+        if self.cache is not None:
+            header, rows = self._cached(name, 'table', lambda: self._read_table(self.workbook[name]))
+            if self.streaming:
+                row_class = _row_class(header)
+                return [row_class(row) for row in rows]
+            return [{key: row[i] for key, i in header.items() if i < len(row)} for row in rows]
+
+        if self.streaming:
+            return list(self._iter_table(self.workbook[name]))
+        return self._parse_table(self.workbook[name])
+
+    def iter_resources(self) -> Iterator[Row]:
+        """Yield Resources rows one at a time (nothing is kept in memory)"""
+        name = self._find_sheet(self.RESOURCE_SHEETS)
+        if name:
+            yield from self._iter_table(self.workbook[name])
+
+    def parse_projects(self) -> List[Dict]:
+        """Parse all Project tabs (Tab 3, 4, ...)"""
+        return list(self.iter_projects())
+
+    def iter_projects(self) -> Iterator[Dict]:
+        """Parse Project tabs one at a time, in workbook order"""
+        for name in self.get_sheet_names():
+            if self._is_project_sheet(name):
+                project = self._cached(name, 'key_value', lambda: self._parse_key_value_sheet(self.workbook[name]))
+                project['_sheet_name'] = name
+                yield project
+
+    def close(self):
+        """Release the workbook file (streaming mode keeps it open)"""
+        if self.cache is not None:
+            self.cache.close()
+        if self.streaming and self._workbook is not None:
+            self._workbook.close()
+
+    def _load_workbook(self):
+        if self.streaming:
+            return load_workbook(self.filepath, read_only=True, data_only=True)
+        return load_workbook(self.filepath, data_only=True)
+
+    def _cached(self, name: str, kind: str, parse):
+        """Cached result of parse() for a sheet, parsing on a miss"""
+        if self.cache is None:
+            return parse()
+        kind = f"{self.CACHE_TAG}/{kind}"
+        value = self.cache.get(name, kind)
+        if value is None:
+            value = parse()
+            self.cache.put(name, kind, value)
+        return value
+
+    @staticmethod
+    def _is_project_sheet(name: str) -> bool:
+        return is_project_name(name)
+
+    def _get_sheet(self, names: List[str]):
+        """Get sheet by multiple possible names"""
+        name = self._find_sheet(names)
+        return self.workbook[name] if name else None
+
+    def _find_sheet(self, names: List[str]) -> Optional[str]:
+        """Name of the first sheet matching one of `names`"""
+        return find_name(names, self.get_sheet_names())
+
+    def _parse_table(self, sheet) -> List[Dict]:
+        """Parse a table with header row"""
+        return [{key: row[i] for key, i in row.header.items() if i < len(row)} for row in self._iter_table(sheet)]
+
+    def _iter_table(self, sheet) -> Iterator[Row]:
+        """Stream a table with header row as Row tuples"""
+        return iter_table(sheet.iter_rows(values_only=True))
+
+    def _read_table(self, sheet) -> tuple:
+        """A table as (header map, plain row tuples), the form it is cached in"""
+        rows = self._iter_table(sheet)
+        first = next(rows, None)
+        if first is None:
+            return {}, []
+        return first.header, [tuple(first)] + [tuple(row) for row in rows]
+
+    def _parse_key_value_sheet(self, sheet) -> Dict:
+        """Parse a key-value format sheet"""
+        return key_values(sheet.iter_rows(min_row=1, max_col=2, values_only=True))
@@ -0,0 +1,140 @@
+"""
+JSON Org Sources
+================
+
+JSON document (.json), one object with a key per part:
+
+    {"overview":  {"Org Name": "Acme Bank", "Org Code": "ACME"},
+     "resources": [{"Name": "Ann", "Email": "ann@acme.example"}, ...],
+     "projects":  [{"Project Name": "Core Banking", "Type": "Web"}, ...]}
+
+Part names are matched like sheet names ("team", "people", "org", ...);
+a top-level list is read as the resources. Keys are normalized like
+sheet headers ("Org Name" -> org_name).
+
+JSON Lines (.jsonl / .ndjson), one record per line, streamed:
+
+    {"kind": "overview", "Org Name": "Acme Bank", "Org Code": "ACME"}
+    {"kind": "project", "Project Name": "Core Banking", "Type": "Web"}
+    {"Name": "Ann", "Email": "ann@acme.example"}
+
+Lines without a "kind" (or with "kind": "resource") are resources, so a
+plain export of people works as is. Only lines mentioning "kind" are
+decoded when reading the overview and projects.
+
+Resources come back as dicts (records need not share their keys). A
+record that is not an object is an error naming the file and the row
+(or line).
+
+Copyright (c) 2026 Gopi Suman Addanke. All Rights Reserved.
+"""
+
+import json
+from typing import Any, Dict, Iterator, List
+
+from .base import OVERVIEW_NAMES, RESOURCE_NAMES, Source, _header_key, find_name
+
+KIND = "kind"
+OVERVIEW = "overview"
+RESOURCE = "resource"
+PROJECT = "project"
+
+
+def _record(data: Any, where: str) -> Dict[str, Any]:
+    """An object with keys normalized like sheet headers; empty values dropped
+
+    Args:
+        data: A decoded JSON value
+        where: File and row for the error if it is not an object
+    """
+    if not isinstance(data, dict):
+        raise ValueError(f"{where} is not an object (got {type(data).__name__})")
+    return {_header_key(key, i): value for i, (key, value) in enumerate(data.items())
+            if value is not None and value != ''}
+
+
+class JsonSource(Source):
+    """Org from one JSON document (parsed whole)"""
+
+    FORMAT = "json"
+    LABEL = "JSON File"
+
+    def __init__(self, filepath: str):
+        super().__init__(filepath)
+        with open(filepath, encoding='utf-8-sig') as f:
+            data = json.load(f)
+        if isinstance(data, list):
+            data = {"resources": data}
+        if not isinstance(data, dict):
+            raise ValueError(f"{filepath}: expected a JSON object or list, got {type(data).__name__}")
+        self._data = data
+
+    def get_sheet_names(self) -> List[str]:
+        return list(self._data)
+
+    def parse_overview(self) -> Dict:
+        name = find_name(OVERVIEW_NAMES, self._data)
+        return _record(self._data[name], f"{self.filepath}: {name}") if name else {}
+
+    def iter_resources(self) -> Iterator[Dict]:
+        name = find_name(RESOURCE_NAMES, self._data)
+        for index, item in enumerate((self._data.get(name) or []) if name else [], start=1):
+            record = _record(item, f"{self.filepath}: {name} row {index}")
+            if record:
+                yield record
+
+    def iter_projects(self) -> Iterator[Dict]:
+        name = find_name(['Projects'], self._data)
+        projects = self._data.get(name) if name else None
+        keyed = isinstance(projects, dict)  # {"Core Banking": {...}, ...}
+        items = projects.items() if keyed else ((None, item) for item in projects or [])
+        for index, (key, item) in enumerate(items):
+            project = _record(item, f"{self.filepath}: {name} row {index + 1}")
+            if keyed:
+                project.setdefault('project_name', key)
+            project['_sheet_name'] = f"{name}[{index}]"
+            yield project
+
+
+class JsonLinesSource(Source):
+    """Org from a JSON Lines file (streamed, one record per line)"""
+
+    FORMAT = "jsonl"
+    LABEL = "JSON Lines File"
+
+    def get_sheet_names(self) -> List[str]:
+        return [OVERVIEW, RESOURCE, PROJECT]
+
+    def parse_overview(self) -> Dict:
+        overview = {}
+        for _, record in self._records(OVERVIEW):
+            overview.update(record)
+        return overview
+
+    def iter_resources(self) -> Iterator[Dict]:
+        for _, record in self._records(RESOURCE):
+            if record:
+                yield record
+
+    def iter_projects(self) -> Iterator[Dict]:
+        for number, record in self._records(PROJECT):
+            record['_sheet_name'] = f"line {number}"
+            yield record
+
+    def _records(self, kind: str) -> Iterator[tuple]:
+        """(line number, record) for every record of one kind"""
+        marker = f'"{KIND}"'
+        with open(self.filepath, encoding='utf-8-sig') as f:
+            for number, line in enumerate(f, start=1):
+                if kind != RESOURCE and marker not in line:
+                    continue  # A resource: not decoded at all
+                line = line.strip()
+                if not line:
+                    continue
+                try:
+                    data = json.loads(line)
+                except json.JSONDecodeError as e:
+                    raise ValueError(f"{self.filepath}, line {number}: {e}") from None
+                record = _record(data, f"{self.filepath}, line {number}")
+                if str(record.pop(KIND, RESOURCE)).lower() == kind:
+                    yield number, record
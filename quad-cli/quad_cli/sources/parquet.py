@@ -0,0 +1,82 @@
+"""
+Parquet Org Source
+==================
+
+Parquet files laid out like the CSV source: overview.parquet (key and
+value columns), resources.parquet (one row per person) and
+projects.parquet (one row per project) in a directory, or a single
+.parquet file read as the resources table. Rows are streamed in record
+batches. Needs pyarrow (pip install pyarrow).
+
+Copyright (c) 2026 Gopi Suman Addanke. All Rights Reserved.
+"""
+
+from pathlib import Path
+from typing import Dict, Iterator, List
+
+try:
+    import pyarrow.parquet as pq
+    HAS_PYARROW = True
+except ImportError:
+    HAS_PYARROW = False
+
+from .base import OVERVIEW_NAMES, RESOURCE_NAMES, Row, Source, find_name, is_project_name, iter_table, key_values
+
+SUFFIXES = ('.parquet', '.pq')
+
+# Rows decoded at a time
+BATCH_ROWS = 65536
+
+
+class ParquetSource(Source):
+    """Org from Parquet files (a directory, or one resources file)"""
+
+    FORMAT = "parquet"
+    LABEL = "Parquet"
+
+    def __init__(self, filepath: str):
+        if not HAS_PYARROW:
+            raise ImportError("pyarrow not installed for Parquet sources. Run: pip install pyarrow")
+        super().__init__(filepath)
+        path = Path(filepath)
+        if path.is_dir():
+            self._files = {p.stem: p for p in sorted(path.iterdir())
+                           if p.suffix.lower() in SUFFIXES and p.is_file()}
+            self._resources = find_name(RESOURCE_NAMES, self._files)
+        else:
+            self._files = {path.stem: path}
+            self._resources = path.stem
+
+    def get_sheet_names(self) -> List[str]:
+        return [path.name for path in self._files.values()]
+
+    def parse_overview(self) -> Dict:
+        name = find_name(OVERVIEW_NAMES, self._files)
+        if not name or name == self._resources:
+            return {}
+        rows = self._rows(name)
+        next(rows, None)  # Column names; the first two columns are key and value
+        return key_values(rows)
+
+    def iter_resources(self) -> Iterator[Row]:
+        if self._resources:
+            yield from iter_table(self._rows(self._resources))
+
+    def iter_projects(self) -> Iterator[Dict]:
+        for name, path in self._files.items():
+            if name == self._resources or not is_project_name(name):
+                continue
+            for number, row in enumerate(iter_table(self._rows(name)), start=1):
+                project = {key: value for key, value in row.to_dict().items() if value}
+                project['_sheet_name'] = f"{path.name} row {number}"
+                yield project
+
+    def _rows(self, name: str) -> Iterator[tuple]:
+        """Column names, then one tuple per row, batch by batch"""
+        parquet = pq.ParquetFile(self._files[name])
+        try:
+            yield tuple(parquet.schema_arrow.names)
+            for batch in parquet.iter_batches(batch_size=BATCH_ROWS):
+                yield from zip(*(column.to_pylist() for column in batch.columns))
+        finally:
+            parquet.close()
@@ -35,6 +35,13 @@ def get_drafts_dir() -> Path:
     return drafts_dir
 
 
+def get_cache_dir() -> Path:
+    """Get the parse cache directory (~/.quad/cache/)"""
+    cache_dir = get_config_dir() / "cache"
+    cache_dir.mkdir(parents=True, exist_ok=True)
+    return cache_dir
+
+
 def load_config() -> dict:
     """Load config from ~/.quad/config.json"""
     config_file = get_config_file()
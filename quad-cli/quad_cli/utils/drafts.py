@@ -0,0 +1,386 @@
+"""
+Journaled drafts for quad init
+==============================
+
+Interactive `quad init` sessions are saved answer by answer, so quitting
+halfway loses nothing. Each draft in ~/.quad/drafts/ is two files:
+
+    <name>.json      snapshot: the draft as of journal entry "_seq"
+    <name>.journal   field-level edits made since, one JSON object per line
+
+    {"seq": 12, "op": "set", "path": ["org", "timezone"], "value": "UTC"}
+    {"seq": 13, "op": "append", "path": ["resources"], "value": {"name": "Ann", ...}}
+
+An edit reaches the OS as soon as it is made (a killed process keeps
+it) and the journal is fsynced every FSYNC_EDITS edits and at
+checkpoints (power loss costs at most one batch). Every COMPACT_EDITS
+edits the draft is compacted: the snapshot is rewritten atomically
+(temp file, fsync, rename) and the journal emptied.
+
+Opening a draft reads the snapshot and replays the journal tail.
+Entries the snapshot already holds (a crash between rename and
+truncate) are skipped by seq; a torn last line (a crash mid-write) is
+dropped and cut off before new edits are appended.
+
+index.json keeps name, timestamps and progress of every draft, so
+listing drafts reads one small file instead of every draft. It is
+rewritten on each fsync and rebuilt if lost.
+
+Snapshots use the format drafts had before the journal, so older drafts
+open as is.
+
+Copyright (c) 2026 Gopi Suman Addanke. All Rights Reserved.
+"""
+
+import json
+import os
+import tempfile
+from datetime import datetime
+from pathlib import Path
+from typing import Any, Dict, List, Optional
+
+from .config import get_drafts_dir
+
+SNAPSHOT_SUFFIX = ".json"
+JOURNAL_SUFFIX = ".journal"
+INDEX_FILE = "index.json"
+
+# fsync the journal every N edits (and at checkpoints)
+FSYNC_EDITS = 32
+
+# Fold the journal into the snapshot every N edits
+COMPACT_EDITS = 500
+
+
+def _now() -> str:
+    return datetime.now().isoformat(timespec="seconds")
+
+
+def _empty() -> Dict[str, Any]:
+    return {"org": {}, "resources": [], "projects": []}
+
+
+def _write_atomic(path: Path, text: str, durable: bool = True) -> None:
+    """Replace a file in one step (temp file in the same directory, rename)"""
+    fd, tmp = tempfile.mkstemp(dir=path.parent, suffix=".tmp")
+    try:
+        with os.fdopen(fd, "w", encoding="utf-8") as f:
+            f.write(text)
+            if durable:
+                f.flush()
+                os.fsync(f.fileno())
+        os.replace(tmp, path)
+    except BaseException:
+        Path(tmp).unlink(missing_ok=True)
+        raise
+    if durable and hasattr(os, "O_DIRECTORY"):
+        fd = os.open(path.parent, os.O_RDONLY | os.O_DIRECTORY)
+        try:
+            os.fsync(fd)
+        finally:
+            os.close(fd)
+
+
+# ─────────────────────────────────────────────────────────────
+# Edits
+# ─────────────────────────────────────────────────────────────
+
+def _apply(data: Dict[str, Any], op: str, path: List[Any], value: Any = None) -> None:
+    """Apply one edit in place
+
+    Args:
+        data: The draft
+        op: "set", "append" or "delete"
+        path: Keys (dicts) and indexes (lists) from the top of the draft
+        value: New value (set) or item (append)
+    """
+    parent = data
+    for key in path[:-1]:
+        parent = parent[key]
+    key = path[-1]
+    if op == "set":
+        if isinstance(parent, list) and key == len(parent):
+            parent.append(value)
+        else:
+            parent[key] = value
+    elif op == "append":
+        parent.setdefault(key, []).append(value)
+    elif op == "delete":
+        if isinstance(parent, list) or key in parent:
+            del parent[key]
+    else:
+        raise ValueError(f"Unknown draft edit '{op}'")
+
+
+def progress(data: Dict[str, Any]) -> Dict[str, Any]:
+    """What an index entry records about a draft's content"""
+    return {
+        "org": (data.get("org") or {}).get("org_name"),
+        "resources": len(data.get("resources") or []),
+        "projects": len(data.get("projects") or []),
+        "step": data.get("_step"),
+    }
+
+
+def describe(entry: Dict[str, Any]) -> str:
+    """One-line summary of an index entry ("Acme · 3 people · 2 projects · ...")"""
+    people, projects = entry.get("resources", 0), entry.get("projects", 0)
+    parts = [entry.get("org") or "(no org yet)",
+             f"{people} {'person' if people == 1 else 'people'}",
+             f"{projects} project{'' if projects == 1 else 's'}"]
+    if entry.get("step"):
+        parts.append(f"at {entry['step']}")
+    if entry.get("updated_at"):
+        parts.append(f"saved {entry['updated_at'].replace('T', ' ')[:16]}")
+    return " · ".join(parts)
+
+
+# ─────────────────────────────────────────────────────────────
+# Draft
+# ─────────────────────────────────────────────────────────────
+
+class Draft:
+    """One draft: snapshot + journal, edited through set/append/delete
+
+    `data` is the live draft ({"org", "resources", "projects"}); edits
+    change it in place, so callers may hold references into it.
+
+    Usage:
+        draft = Draft.load("bank-demo") or Draft("bank-demo")
+        draft.set(["org", "org_name"], "Acme Bank")
+        draft.append(["resources"], {"name": "Ann", "email": "ann@acme.example"})
+        draft.close()
+    """
+
+    def __init__(self, name: str, directory: Optional[Path] = None, data: Optional[Dict[str, Any]] = None):
+        """A new draft (see load() for an existing one)
+
+        Args:
+            name: Draft name (file stem)
+            directory: Drafts directory (default: ~/.quad/drafts/)
+            data: Initial content, kept by reference (default: empty)
+        """
+        self.name = name
+        self.directory = Path(directory) if directory else get_drafts_dir()
+        self.data = _empty() if data is None else data
+        self.created_at = _now()
+        self.updated_at = self.created_at
+        self.seq = 0
+        self._journal = None
+        self._journal_size: Optional[int] = None  # Valid bytes to keep on reopen
+        self._unsynced = 0
+        self._uncompacted = 0
+
+    @property
+    def snapshot_path(self) -> Path:
+        return self.directory / f"{self.name}{SNAPSHOT_SUFFIX}"
+
+    @property
+    def journal_path(self) -> Path:
+        return self.directory / f"{self.name}{JOURNAL_SUFFIX}"
+
+    @classmethod
+    def load(cls, name: str, directory: Optional[Path] = None) -> Optional["Draft"]:
+        """Open a saved draft: snapshot plus journal tail (None if there is none)"""
+        draft = cls(name, directory)
+        snapshot, journal = draft.snapshot_path, draft.journal_path
+        if not snapshot.exists() and not journal.exists():
+            return None
+
+        if snapshot.exists():
+            try:
+                data = json.loads(snapshot.read_text(encoding="utf-8"))
+            except (OSError, ValueError):
+                return None
+            draft.seq = data.pop("_seq", 0)
+            draft.updated_at = data.pop("_saved_at", draft.updated_at)
+            draft.created_at = data.pop("_created_at", draft.updated_at)
+            draft.data = {**_empty(), **data}
+
+        if journal.exists():
+            draft._replay()
+        return draft
+
+    def _replay(self) -> None:
+        """Apply journal entries newer than the snapshot"""
+        valid = 0
+        with open(self.journal_path, "rb") as f:
+            for line in f:
+                try:
+                    entry = json.loads(line) if line.endswith(b"\n") else None
+                except ValueError:
+                    entry = None
+                if entry is None:
+                    break  # Torn write: nothing after it was acknowledged
+                valid += len(line)
+                if entry["seq"] > self.seq:
+                    _apply(self.data, entry["op"], entry["path"], entry.get("value"))
+                    self.seq = entry["seq"]
+                    self.updated_at = entry.get("at", self.updated_at)
+                    self._uncompacted += 1
+        self._journal_size = valid
+
+    # ── Edits ──
+
+    def set(self, path: List[Any], value: Any) -> None:
+        """Set a field (an index one past the end of a list appends)"""
+        self._edit("set", path, value)
+
+    def append(self, path: List[Any], value: Any) -> None:
+        """Append an item to a list"""
+        self._edit("append", path, value)
+
+    def delete(self, path: List[Any]) -> None:
+        """Remove a field or list item"""
+        self._edit("delete", path)
+
+    def _edit(self, op: str, path: List[Any], value: Any = None) -> None:
+        _apply(self.data, op, path, value)
+        self.seq += 1
+        self.updated_at = _now()
+        entry = {"seq": self.seq, "at": self.updated_at, "op": op, "path": path}
+        if op != "delete":
+            entry["value"] = value
+
+        journal = self._open_journal()
+        journal.write(json.dumps(entry, default=str) + "\n")
+        journal.flush()
+        self._unsynced += 1
+        self._uncompacted += 1
+
+        if self._uncompacted >= COMPACT_EDITS:
+            self.compact()
+        elif self._unsynced >= FSYNC_EDITS:
+            self.sync()
+
+    def _open_journal(self):
+        if self._journal is None:
+            self.directory.mkdir(parents=True, exist_ok=True)
+            self._journal = open(self.journal_path, "a+", encoding="utf-8")
+            if self._journal_size is not None and self._journal.tell() > self._journal_size:
+                self._journal.truncate(self._journal_size)  # Cut a torn last line
+                self._journal.seek(self._journal_size)
+        return self._journal
+
+    # ── Persistence ──
+
+    def sync(self) -> None:
+        """fsync pending edits and update the index"""
+        if self._journal is not None and self._unsynced:
+            os.fsync(self._journal.fileno())
+        self._unsynced = 0
+        update_index(self.directory, self.name, self._index_entry())
+
+    def compact(self) -> None:
+        """Fold the journal into a new snapshot and empty it"""
+        self.directory.mkdir(parents=True, exist_ok=True)
+        snapshot = dict(self.data, _seq=self.seq, _created_at=self.created_at, _saved_at=self.updated_at)
+        _write_atomic(self.snapshot_path, json.dumps(snapshot, indent=2, default=str))
+
+        # A crash before this leaves entries the snapshot holds: skipped by seq
+        if self._journal is not None:
+            self._journal.truncate(0)
+            self._journal.seek(0)
+            os.fsync(self._journal.fileno())
+        else:
+            self.journal_path.unlink(missing_ok=True)
+        self._journal_size = 0
+        self._unsynced = 0
+        self._uncompacted = 0
+        update_index(self.directory, self.name, self._index_entry())
+
+    def rename(self, name: str) -> None:
+        """Save under another name (replacing a draft of that name)"""
+        if name == self.name:
+            self.compact()
+            return
+        old = self.name
+        self.compact()
+        self.close(compact=False)
+        self.name = name
+        self.journal_path.unlink(missing_ok=True)
+        os.replace(self.directory / f"{old}{SNAPSHOT_SUFFIX}", self.snapshot_path)
+        (self.directory / f"{old}{JOURNAL_SUFFIX}").unlink(missing_ok=True)
+        update_index(self.directory, old, None)
+        update_index(self.directory, name, self._index_entry())
+
+    def discard(self) -> None:
+        """Delete the draft"""
+        self.close(compact=False)
+        self.snapshot_path.unlink(missing_ok=True)
+        self.journal_path.unlink(missing_ok=True)
+        update_index(self.directory, self.name, None)
+
+    def close(self, compact: bool = True) -> None:
+        """Compact (or just fsync) and close the journal"""
+        if compact and self._uncompacted:
+            self.compact()
+        elif self._unsynced:
+            self.sync()
+        if self._journal is not None:
+            self._journal.close()
+            self._journal = None
+
+    def _index_entry(self) -> Dict[str, Any]:
+        return {"created_at": self.created_at, "updated_at": self.updated_at, **progress(self.data)}
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *args):
+        self.close()
+
+    def __repr__(self) -> str:
+        return f"<Draft({self.name}, seq={self.seq}, uncompacted={self._uncompacted})>"
+
+
+# ─────────────────────────────────────────────────────────────
+# Index
+# ─────────────────────────────────────────────────────────────
+
+def _draft_names(directory: Path) -> set:
+    """Drafts on disk, from file names only"""
+    return {p.stem for p in directory.iterdir()
+            if p.suffix in (SNAPSHOT_SUFFIX, JOURNAL_SUFFIX) and p.name != INDEX_FILE}
+
+
+def read_index(directory: Optional[Path] = None) -> Dict[str, Dict[str, Any]]:
+    """Every draft's index entry, newest first
+
+    Drafts missing from the index (lost index, drafts from before it)
+    are opened once and added; entries whose files are gone are dropped.
+    """
+    directory = Path(directory) if directory else get_drafts_dir()
+    if not directory.exists():
+        return {}
+    try:
+        index = json.loads((directory / INDEX_FILE).read_text(encoding="utf-8"))
+    except (OSError, ValueError):
+        index = {}
+
+    names = _draft_names(directory)
+    changed = set(index) - names
+    for name in names - set(index):
+        draft = Draft.load(name, directory)
+        if draft is not None:
+            index[name] = draft._index_entry()
+            changed.add(name)
+    if changed:
+        index = {name: entry for name, entry in index.items() if name in names}
+        _write_atomic(directory / INDEX_FILE, json.dumps(index, indent=2), durable=False)
+    return dict(sorted(index.items(), key=lambda item: item[1].get("updated_at") or "", reverse=True))
+
+
+def update_index(directory: Path, name: str, entry: Optional[Dict[str, Any]]) -> None:
+    """Set (or, with None, remove) one draft's index entry"""
+    path = Path(directory) / INDEX_FILE
+    try:
+        index = json.loads(path.read_text(encoding="utf-8"))
+    except (OSError, ValueError):
+        index = {}
+    if entry is None:
+        if index.pop(name, None) is None:
+            return
+    else:
+        index[name] = entry
+    _write_atomic(path, json.dumps(index, indent=2), durable=False)
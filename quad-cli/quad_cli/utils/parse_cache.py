@@ -0,0 +1,243 @@
+"""
+Parse cache for org workbooks
+=============================
+
+Caches parsed sheets of an .xlsx under ~/.quad/cache/, keyed by the
+content of each sheet's XML part inside the zip, so repeated `quad init`
+runs on the same (or a lightly edited) workbook skip openpyxl entirely
+for sheets that did not change.
+
+A sheet's key covers everything its parsed values depend on:
+- the sheet XML part itself
+- the shared strings it references (not the whole string table, which
+  changes whenever any sheet gains a new string)
+- styles.xml (number formats decide which cells are dates) and the
+  workbook's 1900/1904 date system
+- what was parsed (`kind`, e.g. a key-value sheet vs a table) and the
+  cache format version
+
+Working out which shared strings a sheet references means scanning its
+XML, so an index remembers the answer for a given (sheet XML, string
+table) pair: an unchanged workbook costs one hash per part.
+
+Values are pickled and zlib-compressed, one file per key. The cache only
+holds data written by this module for the current user.
+
+Copyright (c) 2026 Gopi Suman Addanke. All Rights Reserved.
+"""
+
+import hashlib
+import os
+import pickle
+import re
+import tempfile
+import time
+import zlib
+from pathlib import Path
+from typing import Any, Dict, List, Optional
+
+from .config import get_cache_dir
+from .xlsx import XlsxPackage
+
+CACHE_VERSION = 1
+
+# Index entries kept (one per sheet version seen)
+MAX_INDEX_ENTRIES = 4096
+# Cached values unused for this long are removed
+MAX_AGE_SECONDS = 30 * 24 * 3600
+
+# <c r="B2" s="3" t="s"><v>17</v></c>: a cell holding shared string 17
+_SHARED_REF = re.compile(rb'<(?:\w+:)?c\b[^>]*?\bt="s"[^>]*>\s*<(?:\w+:)?v>(\d+)<')
+_SHARED_CELL = b't="s"'
+
+
+class ParseCache:
+    """
+    Parsed-sheet cache for one workbook file.
+
+    Example:
+        cache = ParseCache("org-setup.xlsx")
+        overview = cache.get("Overview", "key_value")
+        if overview is None:
+            overview = parse(...)
+            cache.put("Overview", "key_value", overview)
+        cache.close()
+    """
+
+    def __init__(self, filepath: str, directory: Optional[Path] = None):
+        """
+        Args:
+            filepath: Path to the .xlsx file
+            directory: Cache directory (default ~/.quad/cache/)
+        """
+        self.filepath = filepath
+        self.directory = Path(directory) if directory else get_cache_dir()
+        self.directory.mkdir(parents=True, exist_ok=True)
+        self.hits = 0
+        self.misses = 0
+
+        self._package = XlsxPackage(filepath)
+        self._digests: Dict[str, str] = {}
+        self._index: Optional[Dict[str, str]] = None
+        self._index_dirty = False
+        self._written = False
+
+    @property
+    def sheetnames(self) -> List[str]:
+        """Sheet names in workbook order, read without loading the workbook"""
+        return self._package.sheetnames
+
+    # ─────────────────────────────────────────────────────────────
+    # LOOKUP
+    # ─────────────────────────────────────────────────────────────
+
+    def get(self, sheet: str, kind: str) -> Optional[Any]:
+        """
+        Cached value for a sheet, or None if it has changed or was never
+        parsed as `kind`.
+        """
+        path = self._value_path(self.key(sheet, kind))
+        try:
+            with open(path, "rb") as f:
+                value = pickle.loads(zlib.decompress(f.read()))
+        except FileNotFoundError:
+            self.misses += 1
+            return None
+        except Exception:
+            # Truncated or from an incompatible build: parse again
+            self.misses += 1
+            path.unlink(missing_ok=True)
+            return None
+        os.utime(path)  # Keep recently used values from being pruned
+        self.hits += 1
+        return value
+
+    def put(self, sheet: str, kind: str, value: Any) -> None:
+        """Store a parsed value for a sheet"""
+        data = zlib.compress(pickle.dumps(value, protocol=pickle.HIGHEST_PROTOCOL), 1)
+        self._write(self._value_path(self.key(sheet, kind)), data)
+        self._written = True
+
+    def key(self, sheet: str, kind: str) -> str:
+        """Content key of a sheet parsed as `kind` (hex sha256)"""
+        part = self._package.sheets.get(sheet)
+        if part is None:
+            raise KeyError(f"Worksheet {sheet} does not exist.")
+        common = [kind, str(CACHE_VERSION), str(int(self._package.date1904)),
+                  self._digest(self._package.styles_part), self._digest(part)]
+
+        index = self._load_index()
+        quick = self._hash(common + [self._digest(self._package.shared_strings_part)])
+        key = index.pop(quick, None)
+        if key is None:
+            key = self._hash(common + [self._referenced_strings(part)])
+            self._index_dirty = True
+        index[quick] = key  # Most recently used last
+        return key
+
+    def stats(self) -> Dict[str, int]:
+        return {"hits": self.hits, "misses": self.misses}
+
+    # ─────────────────────────────────────────────────────────────
+    # LIFECYCLE
+    # ─────────────────────────────────────────────────────────────
+
+    def close(self) -> None:
+        """Save the index, prune stale values and release the workbook file"""
+        if self._index is not None and self._index_dirty:
+            entries = list(self._index.items())[-MAX_INDEX_ENTRIES:]
+            self._write(self._index_path(), pickle.dumps(dict(entries), protocol=pickle.HIGHEST_PROTOCOL))
+            self._index_dirty = False
+        if self._written:
+            self.prune()
+            self._written = False
+        self._package.close()
+
+    def prune(self, max_age: float = MAX_AGE_SECONDS) -> int:
+        """Remove cached values not used for `max_age` seconds; returns the count"""
+        cutoff = time.time() - max_age
+        removed = 0
+        for path in self.directory.glob("*.bin"):
+            try:
+                if path.stat().st_mtime < cutoff:
+                    path.unlink()
+                    removed += 1
+            except OSError:
+                pass
+        return removed
+
+    def __enter__(self) -> 'ParseCache':
+        return self
+
+    def __exit__(self, exc_type, exc, tb) -> None:
+        self.close()
+
+    # ─────────────────────────────────────────────────────────────
+    # WORKBOOK PARTS
+    # ─────────────────────────────────────────────────────────────
+
+    def _digest(self, part: Optional[str]) -> str:
+        if part is None:
+            return "-"
+        digest = self._digests.get(part)
+        if digest is None:
+            try:
+                digest = hashlib.sha256(self._package.read(part)).hexdigest()
+            except KeyError:
+                digest = "-"
+            self._digests[part] = digest
+        return digest
+
+    def _referenced_strings(self, part: str) -> str:
+        """Digest of the shared strings a sheet uses, in cell order"""
+        xml = self._package.read(part)
+        refs = _SHARED_REF.findall(xml)
+        if len(refs) != xml.count(_SHARED_CELL):
+            # Cells laid out in a way the scan does not follow: depend on
+            # the whole string table rather than risk a stale hit
+            return "all:" + self._digest(self._package.shared_strings_part)
+
+        strings = self._package.shared_strings()
+        digest = hashlib.sha256()
+        for ref in refs:
+            index = int(ref)
+            digest.update(strings[index].encode() if index < len(strings) else b"\x01")
+            digest.update(b"\x00")
+        return digest.hexdigest()
+
+    # ─────────────────────────────────────────────────────────────
+    # STORAGE
+    # ─────────────────────────────────────────────────────────────
+
+    @staticmethod
+    def _hash(parts: List[str]) -> str:
+        return hashlib.sha256("\x00".join(parts).encode()).hexdigest()
+
+    def _value_path(self, key: str) -> Path:
+        return self.directory / f"{key}.bin"
+
+    def _index_path(self) -> Path:
+        return self.directory / "index.pkl"
+
+    def _load_index(self) -> Dict[str, str]:
+        if self._index is None:
+            try:
+                with open(self._index_path(), "rb") as f:
+                    self._index = pickle.load(f)
+            except Exception:
+                self._index = {}
+        return self._index
+
+    def _write(self, path: Path, data: bytes) -> None:
+        """Write atomically, so concurrent runs never read a partial file"""
+        fd, tmp = tempfile.mkstemp(dir=self.directory, suffix=".tmp")
+        try:
+            with os.fdopen(fd, "wb") as f:
+                f.write(data)
+            os.replace(tmp, path)
+        except BaseException:
+            Path(tmp).unlink(missing_ok=True)
+            raise
+
+    def __repr__(self) -> str:
+        return f"<ParseCache({self.filepath}, hits={self.hits}, misses={self.misses})>"
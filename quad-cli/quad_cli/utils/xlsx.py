@@ -0,0 +1,392 @@
+"""
+Fast .xlsx reader
+=================
+
+Reads worksheet values straight from the package XML, without openpyxl:
+the zip parts are located through the workbook relationships, and each
+sheet is streamed in blocks of whole <row> elements and scanned with
+precompiled regexes. Cells come back as plain Python values (str, int,
+float, bool, datetime, time, timedelta), like openpyxl's values_only=True.
+
+Cells written the way Excel and openpyxl write them (attributes in
+r, s, t order, a <v> or inline <is><t> body) are matched by one regex over
+the whole block. A block holding anything else (formulas, rich text,
+cells without a reference) is read with a slower per-cell scan instead.
+
+Copyright (c) 2026 Gopi Suman Addanke. All Rights Reserved.
+"""
+
+import posixpath
+import re
+import zipfile
+from datetime import datetime, timedelta
+from html import unescape
+from typing import Any, Dict, Iterator, List, Optional, Set, Tuple
+from xml.etree import ElementTree
+
+MAIN_NS = "{http://schemas.openxmlformats.org/spreadsheetml/2006/main}"
+REL_NS = "{http://schemas.openxmlformats.org/officeDocument/2006/relationships}"
+PKG_REL_NS = "{http://schemas.openxmlformats.org/package/2006/relationships}"
+
+# Sheet XML is read this much at a time (cut back to the last </row>)
+BLOCK_SIZE = 4 * 1024 * 1024
+
+# <c r="B2" s="3" t="s"><v>17</v></c> and <c r="A2" t="inlineStr"><is><t>Ann</t></is></c>
+_FAST_CELL = re.compile(
+    rb'<c r="([A-Z]{1,3})(\d+)"(?: s="(\d+)")?(?: t="(\w+)")?'
+    rb'(?:/>|>(?:<v>([^<]*)</v>|<is><t(?: [^>]*)?>([^<]*)</t></is>)?</c>)'
+)
+_CELL_START = b"<c "
+# Cells the fast scan would miss: no attributes, or a namespace prefix
+_SLOW_TAGS = (b"<c>", b":c ", b":c>")
+
+_ROW = re.compile(rb'<(?:\w+:)?row\b([^>]*?)(?:/>|>(.*?)</(?:\w+:)?row>)', re.S)
+_CELL = re.compile(rb'<(?:\w+:)?c\b([^>]*?)(?:/>|>(.*?)</(?:\w+:)?c>)', re.S)
+_ATTR = re.compile(rb'\b(r|s|t)="([^"]*)"')
+_REF = re.compile(rb'([A-Z]{1,3})(\d+)')
+_VALUE = re.compile(rb'<(?:\w+:)?v>(.*?)</(?:\w+:)?v>', re.S)
+_TEXT = re.compile(rb'<(?:\w+:)?t\b[^>]*>(.*?)</(?:\w+:)?t>', re.S)
+_PHONETIC = re.compile(rb'<(?:\w+:)?rPh\b.*?</(?:\w+:)?rPh>', re.S)
+
+# Built-in number formats that show dates or times
+_DATE_FORMAT_IDS = set(range(14, 23)) | set(range(27, 37)) | set(range(45, 48)) | set(range(50, 59))
+# Quoted text, escaped or padding characters, [colors] and [conditions]; not [h] [m] [s]
+_FORMAT_LITERALS = re.compile(r'"[^"]*"|[\\_].|\[(?!hh?\]|mm?\]|ss?\])[^\]]*\]')
+_DATE_TOKENS = re.compile(r'[dmyhs]', re.I)
+_ELAPSED_TIME = re.compile(r'\[hh?\](:mm(:ss(\.0*)?)?)?|\[mm?\](:ss(\.0*)?)?|\[ss?\](\.0*)?')
+
+_EPOCH_1900 = datetime(1899, 12, 30)
+_EPOCH_1904 = datetime(1904, 1, 1)
+
+Row = Tuple[int, Tuple[Any, ...]]
+
+
+def column_index(letters: str) -> int:
+    """Zero-based index of a column reference ('A' -> 0, 'AA' -> 26)"""
+    index = 0
+    for ch in letters:
+        index = index * 26 + ord(ch) - 64
+    return index - 1
+
+
+def column_letter(index: int) -> str:
+    """Column reference of a zero-based index (0 -> 'A', 26 -> 'AA')"""
+    letters = ""
+    index += 1
+    while index:
+        index, rem = divmod(index - 1, 26)
+        letters = chr(65 + rem) + letters
+    return letters
+
+
+def is_date_format(code: str) -> bool:
+    """Whether a custom number format shows a date or time (first section only)"""
+    return bool(_DATE_TOKENS.search(_FORMAT_LITERALS.sub("", code.split(";")[0])))
+
+
+def is_elapsed_format(code: str) -> bool:
+    """Whether a number format shows elapsed time ([h]:mm), read as a timedelta"""
+    return bool(_ELAPSED_TIME.search(code.split(";")[0]))
+
+
+def from_serial(value: float, date1904: bool = False, elapsed: bool = False) -> Any:
+    """
+    A date serial as openpyxl reads it: a datetime, a time for serials
+    under one day, or a timedelta for elapsed-time formats. Times are
+    rounded to the millisecond, and 1900-system serials before March 1900
+    are shifted a day (Excel counts a 29 February 1900 that never was).
+    """
+    if elapsed:
+        delta = timedelta(days=value)
+        if delta.microseconds:
+            delta = timedelta(seconds=delta.total_seconds() // 1, microseconds=round(delta.microseconds, -3))
+        return delta
+
+    day, fraction = divmod(value, 1)
+    delta = timedelta(milliseconds=round(fraction * 86400000))
+    if 0 <= value < 1 and delta.days == 0:
+        return (datetime.min + delta).time()
+    if 0 < value < 60 and not date1904:
+        day += 1
+    return (_EPOCH_1904 if date1904 else _EPOCH_1900) + timedelta(days=day) + delta
+
+
+class XlsxPackage:
+    """
+    An .xlsx file opened as a zip package.
+
+    Example:
+        with XlsxPackage("org-setup.xlsx") as package:
+            for row_number, values in package.iter_rows("Resources"):
+                ...
+    """
+
+    def __init__(self, filepath: str):
+        """
+        Args:
+            filepath: Path to the .xlsx file
+        """
+        self.filepath = filepath
+        self.zip = zipfile.ZipFile(filepath)
+        self.date1904 = False
+        self.sheets: Dict[str, str] = {}  # Sheet name -> zip part, in workbook order
+        self._strings: Optional[List[str]] = None
+        self._date_styles: Optional[Set[int]] = None
+        self._elapsed_styles: Set[int] = set()
+
+        self.workbook_part = self._office_document()
+        rels = self.relationships(self.workbook_part)
+        root = ElementTree.fromstring(self.zip.read(self.workbook_part))
+        properties = root.find(f"{MAIN_NS}workbookPr")
+        if properties is not None:
+            self.date1904 = properties.get("date1904", "0").lower() in ("1", "true")
+        for sheet in root.iter(f"{MAIN_NS}sheet"):
+            target = rels.get(sheet.get(f"{REL_NS}id"), {}).get("target")
+            if target:
+                self.sheets[sheet.get("name")] = target
+
+        by_type = {rel["type"].rsplit("/", 1)[-1]: rel["target"] for rel in rels.values()}
+        self.shared_strings_part = by_type.get("sharedStrings")
+        self.styles_part = by_type.get("styles")
+
+    @property
+    def sheetnames(self) -> List[str]:
+        """Sheet names in workbook order"""
+        return list(self.sheets)
+
+    def find_sheet(self, names: List[str]) -> Optional[str]:
+        """Name of the first sheet matching one of `names` (case-insensitive)"""
+        for name in names:
+            if name in self.sheets:
+                return name
+            for sheet_name in self.sheets:
+                if sheet_name.lower() == name.lower():
+                    return sheet_name
+        return None
+
+    def read(self, part: str) -> bytes:
+        """Raw bytes of a zip part (KeyError if missing)"""
+        return self.zip.read(part)
+
+    def close(self) -> None:
+        self.zip.close()
+
+    def __enter__(self) -> 'XlsxPackage':
+        return self
+
+    def __exit__(self, exc_type, exc, tb) -> None:
+        self.close()
+
+    # ─────────────────────────────────────────────────────────────
+    # ROWS
+    # ─────────────────────────────────────────────────────────────
+
+    def iter_rows(self, sheet: str, max_col: Optional[int] = None) -> Iterator[Row]:
+        """
+        Yield (row number, values) for every row holding at least one cell.
+
+        Values run from column A to the row's last cell; missing cells are
+        None. Dates (numbers in a date format) come back as datetime.
+
+        Args:
+            sheet: Sheet name
+            max_col: Only return the first `max_col` columns
+        """
+        part = self.sheets.get(sheet)
+        if part is None:
+            raise KeyError(f"Worksheet {sheet} does not exist.")
+        for block in self._blocks(part):
+            cells = _FAST_CELL.findall(block)
+            if len(cells) == block.count(_CELL_START) and not any(tag in block for tag in _SLOW_TAGS):
+                yield from self._fast_rows(block, cells, max_col)
+            else:
+                yield from self._slow_rows(block, max_col)
+
+    def _blocks(self, part: str) -> Iterator[bytes]:
+        """A sheet part in blocks that each end after a whole </row>"""
+        with self.zip.open(part) as f:
+            tail = b""
+            while True:
+                data = f.read(BLOCK_SIZE)
+                if not data:
+                    if tail:
+                        yield tail
+                    return
+                data = tail + data
+                cut = max(data.rfind(b"</row>"), data.rfind(b":row>"))
+                if cut < 0:
+                    tail = data
+                    continue
+                cut = data.index(b">", cut) + 1
+                yield data[:cut]
+                tail = data[cut:]
+
+    def _fast_rows(self, block: bytes, cells: List[tuple], max_col: Optional[int]) -> Iterator[Row]:
+        strings = self.shared_strings() if b't="s"' in block else []
+        date_styles = self.date_styles()
+        columns: Dict[bytes, int] = {}
+        current = None
+        values: List[Any] = []
+
+        for letters, row, style, kind, raw, inline in cells:
+            if row != current:
+                if values:
+                    yield int(current), tuple(values)
+                current = row
+                values = []
+            index = columns.get(letters)
+            if index is None:
+                index = columns[letters] = column_index(letters.decode())
+            if max_col is not None and index >= max_col:
+                continue
+
+            if kind == b"inlineStr":
+                value = inline.decode()
+                if "&" in value:
+                    value = unescape(value)
+            elif kind == b"s":
+                value = strings[int(raw)] if raw else None
+            elif not raw:
+                value = None
+            elif kind == b"" or kind == b"n":
+                value = self._number(raw, style, date_styles)
+            else:
+                value = self._typed(kind, raw.decode())
+
+            if index == len(values):
+                values.append(value)
+            elif index > len(values):
+                values.extend([None] * (index - len(values)))
+                values.append(value)
+            else:
+                values[index] = value
+        if values:
+            yield int(current), tuple(values)
+
+    def _slow_rows(self, block: bytes, max_col: Optional[int]) -> Iterator[Row]:
+        date_styles = self.date_styles()
+        row_number = 0
+        for row_attrs, body in _ROW.findall(block):
+            attrs = dict(_ATTR.findall(row_attrs))
+            row_number = int(attrs[b"r"]) if b"r" in attrs else row_number + 1
+            values: List[Any] = []
+            for cell_attrs, cell_body in _CELL.findall(body or b""):
+                attrs = dict(_ATTR.findall(cell_attrs))
+                ref = _REF.match(attrs.get(b"r", b""))
+                index = column_index(ref.group(1).decode()) if ref else len(values)
+                if max_col is not None and index >= max_col:
+                    continue
+                values.extend([None] * (index + 1 - len(values)))
+                values[index] = self._cell_value(attrs.get(b"t", b"n"), attrs.get(b"s", b""),
+                                                 cell_body or b"", date_styles)
+            if values:
+                yield row_number, tuple(values)
+
+    def _cell_value(self, kind: bytes, style: bytes, body: bytes, date_styles: Set[int]) -> Any:
+        if kind == b"inlineStr":
+            return unescape(b"".join(_TEXT.findall(_PHONETIC.sub(b"", body))).decode())
+        match = _VALUE.search(body)
+        if not match or not match.group(1):
+            return None
+        raw = match.group(1)
+        if kind == b"s":
+            return self.shared_strings()[int(raw)]
+        if kind == b"n":
+            return self._number(raw, style, date_styles)
+        return self._typed(kind, unescape(raw.decode()))
+
+    def _number(self, raw: bytes, style: bytes, date_styles: Set[int]) -> Any:
+        value = float(raw) if b"." in raw or b"E" in raw or b"e" in raw else int(raw)
+        if style and date_styles and int(style) in date_styles:
+            try:
+                return from_serial(value, self.date1904, int(style) in self._elapsed_styles)
+            except OverflowError:
+                return value
+        return value
+
+    @staticmethod
+    def _typed(kind: bytes, text: str) -> Any:
+        if kind == b"b":
+            return text == "1"
+        if kind == b"d":
+            try:
+                return datetime.fromisoformat(text)
+            except ValueError:
+                return text
+        if "&" in text:
+            text = unescape(text)
+        return text  # str (formula result) and e (error, e.g. #N/A)
+
+    # ─────────────────────────────────────────────────────────────
+    # SHARED PARTS
+    # ─────────────────────────────────────────────────────────────
+
+    def shared_strings(self) -> List[str]:
+        """The shared string table (empty if the workbook has none)"""
+        if self._strings is None:
+            self._strings = []
+            if self.shared_strings_part and self.shared_strings_part in self.zip.namelist():
+                with self.zip.open(self.shared_strings_part) as f:
+                    for _, element in ElementTree.iterparse(f):
+                        if element.tag == f"{MAIN_NS}si":
+                            # Plain <t>, or rich text runs <r><t>; not phonetic <rPh>
+                            texts = element.findall(f"{MAIN_NS}t") + element.findall(f"{MAIN_NS}r/{MAIN_NS}t")
+                            self._strings.append("".join(t.text or "" for t in texts))
+                            element.clear()
+        return self._strings
+
+    def date_styles(self) -> Set[int]:
+        """Cell style indices (the s attribute) whose number format is a date
+        (elapsed-time formats included; those are also in _elapsed_styles)"""
+        if self._date_styles is None:
+            self._date_styles = set()
+            try:
+                root = ElementTree.fromstring(self.zip.read(self.styles_part)) if self.styles_part else None
+            except KeyError:
+                root = None
+            if root is not None:
+                custom = {int(fmt.get("numFmtId")): fmt.get("formatCode", "")
+                          for fmt in root.iter(f"{MAIN_NS}numFmt")}
+                cell_xfs = root.find(f"{MAIN_NS}cellXfs")
+                for index, xf in enumerate(cell_xfs if cell_xfs is not None else []):
+                    fmt_id = int(xf.get("numFmtId", "0"))
+                    if fmt_id in custom:
+                        if is_date_format(custom[fmt_id]):
+                            self._date_styles.add(index)
+                        if is_elapsed_format(custom[fmt_id]):
+                            self._elapsed_styles.add(index)
+                    elif fmt_id in _DATE_FORMAT_IDS:
+                        self._date_styles.add(index)
+                        if fmt_id == 46:  # [h]:mm:ss
+                            self._elapsed_styles.add(index)
+        return self._date_styles
+
+    def relationships(self, part: str) -> Dict[str, Dict[str, str]]:
+        """Relationships of a part: id -> {type, target (zip path)}"""
+        folder, name = posixpath.split(part)
+        try:
+            root = ElementTree.fromstring(self.zip.read(posixpath.join(folder, "_rels", name + ".rels")))
+        except KeyError:
+            return {}
+        rels = {}
+        for rel in root.iter(f"{PKG_REL_NS}Relationship"):
+            target = rel.get("Target", "")
+            if target.startswith("/"):
+                target = target.lstrip("/")
+            else:
+                target = posixpath.normpath(posixpath.join(folder, target))
+            rels[rel.get("Id")] = {"type": rel.get("Type", ""), "target": target}
+        return rels
+
+    def _office_document(self) -> str:
+        try:
+            root = ElementTree.fromstring(self.zip.read("_rels/.rels"))
+        except KeyError:
+            return "xl/workbook.xml"
+        for rel in root.iter(f"{PKG_REL_NS}Relationship"):
+            if rel.get("Type", "").endswith("/officeDocument"):
+                return rel.get("Target").lstrip("/")
+        return "xl/workbook.xml"
+
+    def __repr__(self) -> str:
+        return f"<XlsxPackage({self.filepath}, sheets={len(self.sheets)})>"
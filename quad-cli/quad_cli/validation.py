@@ -0,0 +1,441 @@
+"""
+Workbook Validation
+===================
+
+Schema-driven checks for org workbooks, reporting every problem at once
+with its sheet, row and column (`quad validate`, e.g. in CI).
+
+Each sheet has a schema of fields. Resources is a table: rows are
+streamed from the sheet XML (quad_cli.utils.xlsx, no openpyxl), taken
+CHUNK_ROWS at a time and checked a column at a time, so each check is
+one pass over a list with a precompiled regex or a set lookup. Overview
+and the project tabs are key-value sheets and are checked the same way,
+one field at a time.
+
+CSV, JSON and Parquet sources go through the same checks over the
+records `open_source` streams. Issues there name the part or record
+instead of a cell; table rows are numbered like sheet rows (header in
+row 1 for CSV and Parquet, JSON records from 1).
+
+What the fields mean follows how `quad init` reads them: header and key
+names are normalized like ExcelParser does, and a tech-stack value is
+valid when `QuadInit._find_index` would match it (a case-insensitive
+substring of one of the options) rather than silently falling back to
+the first option. Deadlines must parse the way the plan reads them
+(a date cell, or YYYY-MM-DD text).
+
+Copyright (c) 2026 Gopi Suman Addanke. All Rights Reserved.
+"""
+
+import re
+import time
+from itertools import chain
+from dataclasses import asdict, dataclass, field
+from datetime import date, datetime
+from typing import Any, Dict, Iterator, List, Optional, Sequence, Tuple
+
+from quad_cli.commands.init import QuadInit
+from quad_cli.db import domain_slug
+from quad_cli.sources import detect_format, open_source
+from quad_cli.sources.base import Row, Source, _header_key
+from quad_cli.sources.excel import ExcelParser
+from quad_cli.utils.xlsx import XlsxPackage, column_letter
+
+ERROR = "error"
+WARNING = "warning"
+
+# Field kinds
+TEXT = "text"
+EMAIL = "email"
+DATE = "date"
+CHOICE = "choice"
+
+# Table rows checked per batch
+CHUNK_ROWS = 8192
+
+EMAIL_RE = re.compile(r"[A-Za-z0-9.!#$%&'*+/=?^_`{|}~-]+@[A-Za-z0-9](?:[A-Za-z0-9-]*[A-Za-z0-9])?"
+                      r"(?:\.[A-Za-z0-9](?:[A-Za-z0-9-]*[A-Za-z0-9])?)*\.[A-Za-z]{2,}")
+DATE_RE = re.compile(r"\d{4}-\d{2}-\d{2}")
+
+
+# ─────────────────────────────────────────────────────────────
+# Schema
+# ─────────────────────────────────────────────────────────────
+
+@dataclass(frozen=True)
+class Field:
+    """
+    One column of a table, or one key of a key-value sheet.
+
+    `missing` is the severity of an empty or absent value (None: optional).
+    Bad values (invalid email, unknown choice, unparsable date, duplicate
+    of a unique field) are always errors.
+    """
+
+    name: str
+    kind: str = TEXT
+    missing: Optional[str] = None
+    unique: bool = False
+    choices: Sequence[str] = ()
+    aliases: Sequence[str] = ()
+
+    @property
+    def names(self) -> Tuple[str, ...]:
+        return (self.name,) + tuple(self.aliases)
+
+
+RESOURCE_FIELDS = (
+    Field('name', missing=WARNING, unique=True, aliases=('full_name',)),
+    Field('email', EMAIL, missing=WARNING, unique=True),
+)
+
+PROJECT_FIELDS = (
+    Field('project_name', missing=WARNING),
+    Field('type', CHOICE, choices=QuadInit.PROJECT_TYPES),
+    Field('frontend', CHOICE, choices=QuadInit.FRONTEND_TECH),
+    Field('backend', CHOICE, choices=QuadInit.BACKEND_TECH),
+    Field('database', CHOICE, choices=QuadInit.DATABASE_TECH),
+    Field('deadline', DATE),
+    Field('owner_email', EMAIL),
+)
+
+OVERVIEW_FIELDS = (
+    Field('org_name'),
+    Field('org_code'),
+)
+
+
+def _substrings(options: Sequence[str]) -> frozenset:
+    """Every value QuadInit._find_index matches to one of `options`"""
+    found = set()
+    for option in options:
+        option = option.lower()
+        for start in range(len(option)):
+            for end in range(start + 1, len(option) + 1):
+                found.add(option[start:end])
+    return frozenset(found)
+
+
+_CHOICES = {f.name: _substrings(f.choices) for f in PROJECT_FIELDS if f.kind == CHOICE}
+
+
+# ─────────────────────────────────────────────────────────────
+# Report
+# ─────────────────────────────────────────────────────────────
+
+@dataclass
+class Issue:
+    """A problem with one cell (or, with no column, one row)"""
+
+    sheet: str
+    row: int
+    column: str
+    field: str
+    message: str
+    severity: str = ERROR
+    value: Any = None
+
+    @property
+    def cell(self) -> str:
+        if not self.row:
+            return self.sheet  # A whole part or record
+        return f"{self.sheet}!{self.column}{self.row}" if self.column else f"{self.sheet}!{self.row}:{self.row}"
+
+    def to_dict(self) -> Dict[str, Any]:
+        data = asdict(self)
+        data["cell"] = self.cell
+        if not isinstance(self.value, (str, int, float, bool, type(None))):
+            data["value"] = str(self.value)
+        return data
+
+
+@dataclass
+class ValidationReport:
+    """Every issue found in one workbook"""
+
+    path: str
+    issues: List[Issue] = field(default_factory=list)
+    rows: int = 0
+    seconds: float = 0.0
+
+    @property
+    def errors(self) -> List[Issue]:
+        return [i for i in self.issues if i.severity == ERROR]
+
+    @property
+    def warnings(self) -> List[Issue]:
+        return [i for i in self.issues if i.severity == WARNING]
+
+    @property
+    def ok(self) -> bool:
+        return not self.errors
+
+    def add(self, sheet: str, row: int, column: int, name: str, message: str,
+            severity: str = ERROR, value: Any = None) -> None:
+        letter = column_letter(column) if column is not None else ""
+        self.issues.append(Issue(sheet, row, letter, name, message, severity, value))
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            "path": self.path,
+            "ok": self.ok,
+            "errors": len(self.errors),
+            "warnings": len(self.warnings),
+            "rows": self.rows,
+            "seconds": round(self.seconds, 4),
+            "issues": [i.to_dict() for i in self.issues],
+        }
+
+
+# ─────────────────────────────────────────────────────────────
+# Column checks
+# ─────────────────────────────────────────────────────────────
+# Each takes a column (values in row order, already stripped to text or
+# None) and returns (position, message, value) for every bad value.
+
+def _text(value: Any) -> Optional[str]:
+    if value is None:
+        return None
+    if isinstance(value, float) and value.is_integer():
+        value = int(value)
+    text = str(value).strip()
+    return text or None
+
+
+def _check_email(values: List[Any], name: str) -> List[Tuple[int, str, Any]]:
+    match = EMAIL_RE.fullmatch
+    return [(i, f"invalid email '{v}'", v) for i, v in enumerate(values) if v is not None and not match(v)]
+
+
+def _check_choice(values: List[Any], name: str) -> List[Tuple[int, str, Any]]:
+    allowed = _CHOICES[name]
+    options = ", ".join(next(f.choices for f in PROJECT_FIELDS if f.name == name))
+    return [(i, f"unknown {name} '{v}' (expected one of: {options})", v)
+            for i, v in enumerate(values) if v is not None and v.lower() not in allowed]
+
+
+def _check_date(values: List[Any], name: str, raw: List[Any]) -> List[Tuple[int, str, Any]]:
+    bad = []
+    for i, v in enumerate(values):
+        if v is None or isinstance(raw[i], (datetime, date)):
+            continue
+        head = v.split()[0]
+        if DATE_RE.fullmatch(head):
+            try:
+                datetime.strptime(head, '%Y-%m-%d')
+                continue
+            except ValueError:
+                pass
+        hint = " (format the cell as a date)" if isinstance(raw[i], (int, float)) else " (expected YYYY-MM-DD)"
+        bad.append((i, f"unparsable {name} '{v}'{hint}", raw[i]))
+    return bad
+
+
+class _ColumnState:
+    """What a field's checks carry from one chunk to the next"""
+
+    def __init__(self, spec: Field):
+        self.spec = spec
+        self.seen: Dict[str, int] = {}  # Unique fields: casefolded value -> first row
+
+
+def _check_column(report: ValidationReport, sheet: str, state: _ColumnState, column: Optional[int],
+                  rows: List[int], raw: List[Any]) -> None:
+    """Run every check of one field over one column of a chunk"""
+    spec = state.spec
+    values = [_text(v) for v in raw]
+
+    if spec.missing:
+        for i in [i for i, v in enumerate(values) if v is None]:
+            report.add(sheet, rows[i], column, spec.name, f"missing {spec.name}", spec.missing)
+
+    if spec.kind == EMAIL:
+        bad = _check_email(values, spec.name)
+    elif spec.kind == CHOICE:
+        bad = _check_choice(values, spec.name)
+    elif spec.kind == DATE:
+        bad = _check_date(values, spec.name, raw)
+    else:
+        bad = []
+    for i, message, value in bad:
+        report.add(sheet, rows[i], column, spec.name, message, ERROR, value)
+
+    if spec.unique:
+        seen = state.seen
+        for i, v in enumerate(values):
+            if v is None:
+                continue
+            key = v.casefold()
+            first = seen.setdefault(key, rows[i])
+            if first != rows[i]:
+                report.add(sheet, rows[i], column, spec.name,
+                           f"duplicate {spec.name} '{v}' (first in row {first})", ERROR, v)
+
+
+# ─────────────────────────────────────────────────────────────
+# Sheets
+# ─────────────────────────────────────────────────────────────
+
+def _chunks(rows: Iterator[Tuple[int, tuple]]) -> Iterator[List[Tuple[int, tuple]]]:
+    chunk = []
+    for row in rows:
+        if any(row[1]):  # Skip empty rows, like ExcelParser
+            chunk.append(row)
+            if len(chunk) >= CHUNK_ROWS:
+                yield chunk
+                chunk = []
+    if chunk:
+        yield chunk
+
+
+def validate_table(package: XlsxPackage, sheet: str, fields: Sequence[Field],
+                   report: ValidationReport) -> None:
+    """Check a table sheet (header row, then one record per row)"""
+    rows = package.iter_rows(sheet)
+    first = next(rows, None)
+    if first is None:
+        return
+    header_row, header = first
+    columns = {_header_key(h, i): i for i, h in enumerate(header)}
+    validate_rows(sheet, header_row, columns, rows, fields, report)
+
+
+def validate_rows(sheet: str, header_row: int, columns: Dict[str, int], rows: Iterator[Tuple[int, tuple]],
+                  fields: Sequence[Field], report: ValidationReport) -> None:
+    """Check table rows, given as (row number, values) under a normalized header map"""
+    states = []
+    for spec in fields:
+        index = next((columns[n] for n in spec.names if n in columns), None)
+        if index is None:
+            if spec.missing:
+                report.add(sheet, header_row, None, spec.name, f"no '{spec.name}' column", spec.missing)
+            continue
+        states.append((_ColumnState(spec), index))
+
+    for chunk in _chunks(rows):
+        report.rows += len(chunk)
+        numbers = [number for number, _ in chunk]
+        for state, index in states:
+            column = [values[index] if index < len(values) else None for _, values in chunk]
+            _check_column(report, sheet, state, index, numbers, column)
+
+
+def read_key_values(package: XlsxPackage, sheet: str) -> Dict[str, Tuple[int, Any]]:
+    """A key-value sheet as {key: (row, value)}, keys normalized like ExcelParser"""
+    data = {}
+    for number, values in package.iter_rows(sheet, max_col=2):
+        if len(values) > 1 and values[0] and values[1]:
+            data[str(values[0]).lower().replace(' ', '_')] = (number, values[1])
+    return data
+
+
+def validate_key_values(sheet: str, data: Dict[str, Tuple[int, Any]], fields: Sequence[Field],
+                        report: ValidationReport) -> None:
+    """Check a key-value sheet (keys in column A, values in column B; row 0
+    for a record without cells)"""
+    report.rows += len(data)
+    for spec in fields:
+        key = next((n for n in spec.names if n in data), None)
+        if key is None:
+            if spec.missing:
+                report.add(sheet, 1, None, spec.name, f"no '{spec.name}' row", spec.missing)
+            continue
+        row, value = data[key]
+        _check_column(report, sheet, _ColumnState(spec), 1 if row else None, [row], [value])
+
+
+# ─────────────────────────────────────────────────────────────
+# Workbook
+# ─────────────────────────────────────────────────────────────
+
+def validate_workbook(path: str) -> ValidationReport:
+    """Validate one org workbook; problems opening it are reported as issues"""
+    report = ValidationReport(path)
+    start = time.perf_counter()
+    try:
+        if detect_format(path) == "excel":
+            with XlsxPackage(path) as package:
+                _validate_package(package, report)
+        else:
+            with open_source(path) as source:
+                _validate_source(source, report)
+    except Exception as e:
+        report.add("(workbook)", 0, None, "", f"cannot read workbook: {type(e).__name__}: {e}")
+    report.seconds = time.perf_counter() - start
+    return report
+
+
+def _validate_package(package: XlsxPackage, report: ValidationReport) -> None:
+    overview = package.find_sheet(ExcelParser.OVERVIEW_SHEETS)
+    if overview:
+        data = read_key_values(package, overview)
+        validate_key_values(overview, data, OVERVIEW_FIELDS, report)
+        if 'org_code' not in data and 'org_name' not in data:
+            report.add(overview, 1, None, 'org_code', "no org code (and no org name to derive it from)")
+    else:
+        report.add("Overview", 1, None, 'org_code', "no Overview sheet", WARNING)
+
+    resources = package.find_sheet(ExcelParser.RESOURCE_SHEETS)
+    if resources:
+        validate_table(package, resources, RESOURCE_FIELDS, report)
+    else:
+        report.add("Resources", 1, None, 'name', "no Resources sheet", WARNING)
+
+    slugs: Dict[str, str] = {}
+    for sheet in package.sheetnames:
+        if not ExcelParser._is_project_sheet(sheet):
+            continue
+        data = read_key_values(package, sheet)
+        validate_key_values(sheet, data, PROJECT_FIELDS, report)
+
+        row, name = data.get('project_name', (1, sheet))
+        slug = domain_slug(str(name))
+        if slug in slugs:
+            report.add(sheet, row, 1 if 'project_name' in data else None, 'project_name',
+                       f"project slug '{slug}' also used by {slugs[slug]}", ERROR, name)
+        slugs.setdefault(slug, sheet)
+
+
+def _record(data: Dict[str, Any]) -> Dict[str, Tuple[int, Any]]:
+    """A parsed key-value part in the form validate_key_values takes"""
+    return {key: (0, value) for key, value in data.items() if not key.startswith('_')}
+
+
+def _validate_source(source: Source, report: ValidationReport) -> None:
+    """Same checks as _validate_package, over a CSV, JSON or Parquet source"""
+    overview = _record(source.parse_overview())
+    if overview:
+        validate_key_values("Overview", overview, OVERVIEW_FIELDS, report)
+        if 'org_code' not in overview and 'org_name' not in overview:
+            report.add("Overview", 0, None, 'org_code', "no org code (and no org name to derive it from)")
+    else:
+        report.add("Overview", 0, None, 'org_code', "no overview", WARNING)
+
+    records = source.iter_resources()
+    first = next(records, None)
+    if first is None:
+        report.add("Resources", 0, None, 'name', "no team members", WARNING)
+    elif isinstance(first, Row):
+        # A table (CSV, Parquet): header in row 1
+        validate_rows("Resources", 1, first.header, enumerate(chain([first], records), start=2),
+                      RESOURCE_FIELDS, report)
+    else:
+        # JSON records: row n is the n-th record
+        states = [_ColumnState(spec) for spec in RESOURCE_FIELDS]
+        for number, record in enumerate(chain([first], records), start=1):
+            report.rows += 1
+            for state in states:
+                value = next((record[n] for n in state.spec.names if n in record), None)
+                _check_column(report, "Resources", state, None, [number], [value])
+
+    slugs: Dict[str, str] = {}
+    for project in source.iter_projects():
+        sheet = project.get('_sheet_name', 'Project')
+        validate_key_values(sheet, _record(project), PROJECT_FIELDS, report)
+
+        name = project.get('project_name', sheet)
+        slug = domain_slug(str(name))
+        if slug in slugs:
+            report.add(sheet, 0, None, 'project_name',
+                       f"project slug '{slug}' also used by {slugs[slug]}", ERROR, name)
+        slugs.setdefault(slug, sheet)
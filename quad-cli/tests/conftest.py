@@ -0,0 +1,195 @@
+"""
+Shared fixtures for the quad-cli tests.
+
+Database tests run against DB_CONFIG (DB_HOST, DB_PORT, DB_NAME, DB_USER,
+DB_PASSWORD) and are skipped when that database cannot be reached.
+
+`write_org` writes one org in any source format, for tests that compare
+formats or need a source on disk.
+
+Copyright (c) 2026 Gopi Suman Addanke. All Rights Reserved.
+"""
+
+import csv
+import json
+import re
+import uuid
+import zipfile
+from pathlib import Path
+from typing import Any, Dict, List, Sequence
+
+import pytest
+
+from quad_cli import db
+
+OVERVIEW = [("Org Name", "Acme Bank"), ("Org Code", "ACME"), ("Timezone", "UTC")]
+RESOURCES = [("Name", "Email", "Role"), ("Ann", "ann@acme.io", "Developer"), ("Bob", "bob@acme.io", "QA Lead")]
+PROJECTS = [{"Project Name": "Core Banking", "Type": "Web", "Backend": "Go"},
+            {"Project Name": "Mobile", "Type": "Mobile", "Backend": "Python"}]
+
+FORMATS = ("excel", "csv", "json", "jsonl", "parquet")
+
+
+def write_org(directory: Path, fmt: str, overview: Sequence[tuple] = OVERVIEW,
+              resources: Sequence[tuple] = RESOURCES, projects: List[Dict[str, Any]] = PROJECTS) -> str:
+    """Write an org as `fmt` under `directory`; returns the source path"""
+    header, people = resources[0], [dict(zip(resources[0], row)) for row in resources[1:]]
+
+    if fmt == "excel":
+        from openpyxl import Workbook
+
+        workbook = Workbook()
+        sheet = workbook.active
+        sheet.title = "Overview"
+        for row in overview:
+            sheet.append(row)
+        sheet = workbook.create_sheet("Resources")
+        for row in resources:
+            sheet.append(row)
+        for i, project in enumerate(projects, start=1):
+            sheet = workbook.create_sheet(f"Project {i}")
+            for row in project.items():
+                sheet.append(row)
+        path = directory / "org.xlsx"
+        workbook.save(path)
+        share_strings(path)
+
+    elif fmt == "csv":
+        path = directory / "org"
+        path.mkdir()
+        keys = list(dict.fromkeys(key for project in projects for key in project))
+        for name, rows in (("overview", overview), ("resources", resources),
+                           ("projects", [keys] + [[p.get(k) for k in keys] for p in projects])):
+            with open(path / f"{name}.csv", "w", newline="", encoding="utf-8") as f:
+                csv.writer(f).writerows([["" if v is None else v for v in row] for row in rows])
+
+    elif fmt == "json":
+        path = directory / "org.json"
+        path.write_text(json.dumps({"overview": dict(overview), "resources": people, "projects": projects}))
+
+    elif fmt == "jsonl":
+        path = directory / "org.jsonl"
+        lines = [{"kind": "overview", **dict(overview)}] + people
+        lines += [{"kind": "project", **project} for project in projects]
+        path.write_text("".join(json.dumps(line) + "\n" for line in lines))
+
+    elif fmt == "parquet":
+        import pyarrow as pa
+        import pyarrow.parquet as pq
+
+        path = directory / "org"
+        path.mkdir()
+        keys = list(dict.fromkeys(key for project in projects for key in project))
+        pq.write_table(pa.table({"key": [k for k, _ in overview], "value": [v for _, v in overview]}),
+                       path / "overview.parquet")
+        pq.write_table(pa.table({h: [p[h] for p in people] for h in header}), path / "resources.parquet")
+        pq.write_table(pa.table({k: [p.get(k) for p in projects] for k in keys}), path / "projects.parquet")
+
+    else:
+        raise ValueError(fmt)
+    return str(path)
+
+
+def share_strings(path: Path) -> None:
+    """Move an .xlsx's inline strings into a shared string table, the way
+    Excel saves them (openpyxl may write every string inline)"""
+    with zipfile.ZipFile(path) as zin:
+        items = [(item, zin.read(item.filename)) for item in zin.infolist()]
+    strings: Dict[bytes, int] = {}
+
+    def shared(match) -> bytes:
+        index = strings.setdefault(match.group(2), len(strings))
+        return match.group(1) + b't="s"><v>%d</v></c>' % index
+
+    parts = {}
+    for item, data in items:
+        if item.filename.startswith("xl/worksheets/"):
+            data = re.sub(rb'(<c [^>]*?)t="inlineStr"><is>(.*?)</is></c>', shared, data, flags=re.S)
+        parts[item.filename] = (item, data)
+    if not strings:
+        return
+
+    ns = b'xmlns="http://schemas.openxmlformats.org/spreadsheetml/2006/main"'
+    table = b"".join(b"<si>" + text + b"</si>" for text in strings)
+    parts["xl/sharedStrings.xml"] = ("xl/sharedStrings.xml", b'<sst %s count="%d">%s</sst>' % (ns, len(strings), table))
+    item, rels = parts["xl/_rels/workbook.xml.rels"]
+    rel = (b'<Relationship Id="rIdStrings" Target="sharedStrings.xml" Type="http://schemas.openxmlformats.org/'
+           b'officeDocument/2006/relationships/sharedStrings"/>')
+    parts[item.filename] = (item, rels.replace(b"</Relationships>", rel + b"</Relationships>"))
+    item, types = parts["[Content_Types].xml"]
+    override = (b'<Override PartName="/xl/sharedStrings.xml" ContentType="application/'
+                b'vnd.openxmlformats-officedocument.spreadsheetml.sharedStrings+xml"/>')
+    parts[item.filename] = (item, types.replace(b"</Types>", override + b"</Types>"))
+
+    with zipfile.ZipFile(path, "w", zipfile.ZIP_DEFLATED) as zout:
+        for item, data in parts.values():
+            zout.writestr(item, data)
+
+
+@pytest.fixture(autouse=True)
+def quad_home(tmp_path, monkeypatch) -> Path:
+    """A throwaway home, so ~/.quad (cache, drafts, config) is never the real one"""
+    home = tmp_path / "home"
+    home.mkdir()
+    monkeypatch.setenv("HOME", str(home))
+    return home / ".quad"
+
+
+@pytest.fixture(scope="session")
+def database() -> str:
+    """Connection string of a reachable test database"""
+    if not (db.HAS_PSYCOPG and db.HAS_POOL):
+        pytest.skip("psycopg and psycopg_pool are required")
+    import psycopg
+
+    dsn = db.conninfo()
+    try:
+        psycopg.connect(dsn, connect_timeout=3).close()
+    except psycopg.OperationalError as e:
+        pytest.skip(f"database not reachable: {e}")
+    return dsn
+
+
+@pytest.fixture
+def pools(database):
+    """The db module pointed at the test database, pools closed afterwards"""
+    db.configure(database)
+    yield db
+    db.configure()
+
+
+# The tables the CLI reads and writes, as the web app creates them
+SCHEMA_SQL = """
+    CREATE TABLE quad_organizations (
+        id UUID PRIMARY KEY DEFAULT gen_random_uuid(), slug TEXT UNIQUE NOT NULL, name TEXT);
+    CREATE TABLE quad_domains (
+        id UUID PRIMARY KEY DEFAULT gen_random_uuid(), name TEXT NOT NULL, slug VARCHAR(20) UNIQUE NOT NULL,
+        description TEXT, methodology TEXT, company_id UUID REFERENCES quad_organizations(id), is_active BOOLEAN);
+    CREATE TABLE quad_users (
+        id UUID PRIMARY KEY DEFAULT gen_random_uuid(), company_id UUID NOT NULL REFERENCES quad_organizations(id),
+        email VARCHAR(255) UNIQUE NOT NULL, password_hash VARCHAR(255) NOT NULL,
+        role VARCHAR(50) DEFAULT 'DEVELOPER', full_name VARCHAR(255), is_active BOOLEAN DEFAULT true);
+    CREATE TABLE quad_org_settings (
+        org_id UUID NOT NULL, setting_key TEXT NOT NULL, setting_value TEXT, UNIQUE (org_id, setting_key));
+"""
+
+
+@pytest.fixture
+def org_db(database):
+    """The db module on a fresh schema holding org "acme"; yields its id"""
+    import psycopg
+
+    schema = f"quad_test_{uuid.uuid4().hex[:12]}"
+    with psycopg.connect(database, autocommit=True) as conn:
+        conn.execute(f"CREATE SCHEMA {schema}")
+    dsn = psycopg.conninfo.make_conninfo(database, options=f"-c search_path={schema},public")
+    with psycopg.connect(dsn) as conn:
+        conn.execute(SCHEMA_SQL)
+        org_id = conn.execute("INSERT INTO quad_organizations (slug, name) VALUES ('acme', 'Acme Bank') "
+                              "RETURNING id").fetchone()[0]
+
+    db.configure(dsn)
+    yield org_id
+    db.configure()
+    with psycopg.connect(database, autocommit=True) as conn:
+        conn.execute(f"DROP SCHEMA {schema} CASCADE")
@@ -0,0 +1,68 @@
+"""
+Tests for `quad init --batch` discovery and validation.
+
+Copyright (c) 2026 Gopi Suman Addanke. All Rights Reserved.
+"""
+
+import json
+from pathlib import Path
+
+import pytest
+
+from conftest import FORMATS, RESOURCES, write_org
+from quad_cli.commands import batch
+
+
+@pytest.fixture
+def orgs(tmp_path):
+    """A directory holding one org per source format"""
+    for fmt in FORMATS:
+        (tmp_path / fmt).mkdir()
+        source = Path(write_org(tmp_path / fmt, fmt))
+        source.rename(tmp_path / f"{fmt}-{source.name}")
+        (tmp_path / fmt).rmdir()
+    (tmp_path / "notes.txt").write_text("not an org")
+    (tmp_path / "~$org.xlsx").write_bytes(b"lock file")
+    (tmp_path / "empty").mkdir()
+    return tmp_path
+
+
+def test_directory_finds_every_format(orgs):
+    found = [Path(p).name for p in batch.find_workbooks(str(orgs))]
+    assert found == ["csv-org", "excel-org.xlsx", "json-org.json", "jsonl-org.jsonl", "parquet-org"]
+
+
+def test_json_manifest_and_json_org(tmp_path):
+    org = write_org(tmp_path, "json")
+    assert batch.find_workbooks(org) == [org]
+
+    manifest = tmp_path / "manifest.json"
+    manifest.write_text(json.dumps({"workbooks": ["org.json", "/abs/other.xlsx"]}))
+    assert batch.find_workbooks(str(manifest)) == [org, "/abs/other.xlsx"]
+
+    manifest.write_text(json.dumps(["org.json"]))
+    assert batch.find_workbooks(str(manifest)) == [org]
+
+
+def test_dry_run_parses_every_format(orgs):
+    report = batch.run_batch_init(batch.find_workbooks(str(orgs)), workers=1, dry_run=True, use_cache=False)
+    assert report["summary"] == {batch.PARSED: len(FORMATS)}, report
+    for result in report["workbooks"]:
+        assert result["org_code"] == "ACME" and result["resources"] == 2
+        assert [p["name"] for p in result["projects"]] == ["Core Banking", "Mobile"]
+
+
+@pytest.mark.parametrize("fmt", FORMATS)
+def test_validation_is_shared_with_quad_validate(tmp_path, fmt):
+    from quad_cli.validation import validate_workbook
+
+    resources = RESOURCES + [("Cid", "cid@@acme", "QA")]
+    projects = [{"Project Name": "Core Banking"}, {"Project Name": "core banking"}]
+    path = write_org(tmp_path, fmt, resources=resources, projects=projects)
+
+    result = batch.parse_workbook(path, use_cache=False)
+    assert result["status"] == batch.INVALID
+    expected = [f"{i.cell}: {i.message}" for i in validate_workbook(path).errors]
+    assert result["errors"] == expected
+    assert any("invalid email 'cid@@acme'" in e for e in expected)
+    assert any("project slug 'core-banking' also used" in e for e in expected)
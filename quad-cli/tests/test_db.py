@@ -0,0 +1,102 @@
+"""
+Tests for quad_cli.db: the shared connection pools and the set-based statements.
+
+Copyright (c) 2026 Gopi Suman Addanke. All Rights Reserved.
+"""
+
+import asyncio
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+
+from quad_cli import db
+
+
+def test_transaction_commits_and_rolls_back(pools):
+    try:
+        with pools.transaction() as cur:
+            cur.execute("CREATE TABLE quad_cli_test_rollback (x int)")
+            raise ValueError
+    except ValueError:
+        pass
+    with pools.transaction() as cur:
+        cur.execute("SELECT to_regclass('quad_cli_test_rollback') AS r")
+        assert cur.fetchone()["r"] is None
+
+
+def test_concurrent_callers_share_one_sync_pool(pools):
+    with ThreadPoolExecutor(max_workers=8) as executor:
+        found = set(map(id, executor.map(lambda _: pools.get_pool(), range(32))))
+    assert found == {id(pools.get_pool())}
+
+
+def test_concurrent_callers_share_one_async_pool(pools):
+    async def main():
+        found = await asyncio.gather(*(pools.get_async_pool() for _ in range(16)))
+        assert len(set(map(id, found))) == 1
+        async with pools.async_transaction() as cur:
+            await cur.execute("SELECT 2 AS x")
+            assert (await cur.fetchone())["x"] == 2
+        await pools.close_async_pool()
+
+    asyncio.run(main())
+
+
+def test_configure_resets_both_pools(pools, database):
+    loop = asyncio.new_event_loop()
+    try:
+        sync_pool = pools.get_pool()
+        async_pool = loop.run_until_complete(pools.get_async_pool())
+
+        pools.configure(database, max_size=2)
+        assert sync_pool.closed and async_pool.closed
+        assert pools.get_pool() is not sync_pool
+        assert pools.get_pool().max_size == 2
+
+        new_async_pool = loop.run_until_complete(pools.get_async_pool())
+        assert new_async_pool is not async_pool and new_async_pool.max_size == 2
+        loop.run_until_complete(pools.close_async_pool())
+    finally:
+        loop.close()
+
+
+# ─────────────────────────────────────────────────────────────
+# Statements
+# ─────────────────────────────────────────────────────────────
+
+def domains(org_id):
+    with db.transaction() as cur:
+        cur.execute("SELECT slug, name, description, methodology, is_active FROM quad_domains "
+                    "WHERE company_id = %s ORDER BY slug", (org_id,))
+        return [tuple(row.values()) for row in cur.fetchall()]
+
+
+@pytest.mark.parametrize("prepare", [True, False], ids=["prepared", "unprepared"])
+def test_upsert_domains_in_one_statement(org_db, monkeypatch, prepare):
+    monkeypatch.setattr(db, "PREPARE", prepare)
+    projects = [{"name": "Core Banking", "description": "Ledger"},
+                {"name": "Mobile", "description": 42},
+                {"name": "core banking", "description": "Last one wins"},
+                {"name": "A very long project name"}]
+    with db.transaction() as cur:
+        assert db.upsert_domains(cur, org_db, []) == {}
+        ids = db.upsert_domains(cur, org_db, projects)
+    assert sorted(ids) == ["a-very-long-project-", "core-banking", "mobile"]
+    assert domains(org_db) == [
+        ("a-very-long-project-", "A very long project name", "", "quad", True),
+        ("core-banking", "core banking", "Last one wins", "quad", True),
+        ("mobile", "Mobile", "42", "quad", True),
+    ]
+
+    # Again on a pooled connection that may hold the prepared statement: an update
+    for _ in range(3):
+        with db.transaction() as cur:
+            again = db.upsert_domains(cur, org_db, [{"name": "Mobile", "description": None}])
+    assert again == {"mobile": ids["mobile"]}
+    assert domains(org_db)[2] == ("mobile", "Mobile", None, "quad", True)
+
+
+def test_find_org_id(org_db):
+    with db.transaction() as cur:
+        assert db.find_org_id(cur, "acme") == org_db
+        assert db.find_org_id(cur, "missing") is None
@@ -0,0 +1,172 @@
+"""
+Tests for journaled quad init drafts: replay, compaction, crash recovery
+and the drafts index.
+
+Copyright (c) 2026 Gopi Suman Addanke. All Rights Reserved.
+"""
+
+import json
+
+import pytest
+
+from quad_cli.utils import drafts
+from quad_cli.utils.drafts import Draft, read_index
+
+ANN = {"name": "Ann", "email": "ann@acme.io"}
+BOB = {"name": "Bob", "email": "bob@acme.io"}
+
+
+@pytest.fixture
+def directory(tmp_path):
+    return tmp_path / "drafts"
+
+
+def edit(draft):
+    """A few edits of every kind; returns the draft's expected content"""
+    draft.set(["org", "org_name"], "Acme Bank")
+    draft.set(["org", "timezone"], "UTC")
+    draft.append(["resources"], dict(ANN))
+    draft.append(["resources"], dict(BOB))
+    draft.set(["resources", 0, "role"], "Developer")
+    draft.delete(["resources", 1])
+    draft.set(["projects", 0], {"name": "Core Banking"})
+    return {"org": {"org_name": "Acme Bank", "timezone": "UTC"},
+            "resources": [dict(ANN, role="Developer")], "projects": [{"name": "Core Banking"}]}
+
+
+def journal(draft):
+    return [json.loads(line) for line in draft.journal_path.read_text().splitlines()]
+
+
+# ─────────────────────────────────────────────────────────────
+# Replay & compaction
+# ─────────────────────────────────────────────────────────────
+
+def test_unclosed_draft_replays_from_the_journal(directory):
+    draft = Draft("demo", directory)
+    expected = edit(draft)
+    # Not closed (a killed process): the edits are in the journal only
+    assert not draft.snapshot_path.exists()
+    assert [e["seq"] for e in journal(draft)] == list(range(1, 8))
+
+    loaded = Draft.load("demo", directory)
+    assert loaded.data == expected
+    assert loaded.seq == 7
+    draft.close()
+
+
+def test_close_compacts(directory):
+    with Draft("demo", directory) as draft:
+        expected = edit(draft)
+    assert draft.journal_path.read_text() == ""
+    snapshot = json.loads(draft.snapshot_path.read_text())
+    assert snapshot["_seq"] == 7
+
+    loaded = Draft.load("demo", directory)
+    assert loaded.data == expected and loaded.seq == 7
+    loaded.append(["resources"], dict(BOB))
+    assert journal(loaded)[0]["seq"] == 8
+    loaded.close()
+
+
+def test_compacts_every_n_edits(directory, monkeypatch):
+    monkeypatch.setattr(drafts, "COMPACT_EDITS", 3)
+    draft = Draft("demo", directory)
+    for i in range(7):
+        draft.append(["resources"], {"name": f"P{i}"})
+    assert json.loads(draft.snapshot_path.read_text())["_seq"] == 6
+    assert [e["seq"] for e in journal(draft)] == [7]
+    assert len(Draft.load("demo", directory).data["resources"]) == 7
+    draft.close(compact=False)
+
+
+def test_missing_draft_and_old_snapshot(directory):
+    assert Draft.load("none", directory) is None
+
+    directory.mkdir()
+    (directory / "old.json").write_text(json.dumps({"org": {"org_name": "Old"}, "resources": [ANN]}))
+    draft = Draft.load("old", directory)
+    assert draft.data == {"org": {"org_name": "Old"}, "resources": [ANN], "projects": []}
+    assert draft.seq == 0
+
+
+# ─────────────────────────────────────────────────────────────
+# Crashes
+# ─────────────────────────────────────────────────────────────
+
+def test_torn_last_line_is_dropped_and_cut(directory):
+    draft = Draft("demo", directory)
+    expected = edit(draft)
+    draft.close(compact=False)
+    with open(draft.journal_path, "a") as f:
+        f.write('{"seq": 8, "op": "append", "path": ["resour')
+
+    loaded = Draft.load("demo", directory)
+    assert loaded.data == expected and loaded.seq == 7
+    loaded.append(["resources"], dict(BOB))
+    loaded.close(compact=False)
+
+    assert [e["seq"] for e in journal(loaded)] == list(range(1, 9))
+    assert Draft.load("demo", directory).data["resources"] == expected["resources"] + [BOB]
+
+
+def test_crash_between_rename_and_truncate(directory):
+    draft = Draft("demo", directory)
+    expected = edit(draft)
+    draft.close(compact=False)
+    entries = draft.journal_path.read_bytes()
+
+    Draft.load("demo", directory).close()  # Compacts
+    draft.journal_path.write_bytes(entries)  # ...as if the journal had not been emptied
+
+    loaded = Draft.load("demo", directory)
+    assert loaded.data == expected  # Appends are not applied twice
+    assert loaded.seq == 7 and loaded._uncompacted == 0
+
+    loaded.append(["resources"], dict(BOB))
+    loaded.close(compact=False)
+    assert Draft.load("demo", directory).data["resources"] == expected["resources"] + [BOB]
+
+
+def test_corrupt_snapshot_is_no_draft(directory):
+    directory.mkdir()
+    (directory / "bad.json").write_text('{"org": ')
+    assert Draft.load("bad", directory) is None
+
+
+# ─────────────────────────────────────────────────────────────
+# Index
+# ─────────────────────────────────────────────────────────────
+
+def test_index_tracks_progress(directory):
+    with Draft("demo", directory) as draft:
+        edit(draft)
+    entry = read_index(directory)["demo"]
+    assert (entry["org"], entry["resources"], entry["projects"]) == ("Acme Bank", 1, 1)
+    assert drafts.describe(entry).startswith("Acme Bank · 1 person · 1 project · saved ")
+
+
+def test_lost_index_is_rebuilt(directory):
+    with Draft("one", directory) as draft:
+        draft.set(["org", "org_name"], "One")
+    draft = Draft("two", directory)
+    draft.append(["resources"], dict(ANN))
+    draft.close(compact=False)
+
+    (directory / drafts.INDEX_FILE).unlink()
+    index = read_index(directory)
+    assert sorted(index) == ["one", "two"]
+    assert index["two"]["resources"] == 1
+
+
+def test_rename_and_discard(directory):
+    with Draft("demo", directory) as draft:
+        expected = edit(draft)
+    draft.rename("final")
+    assert not (directory / "demo.json").exists()
+    assert Draft.load("final", directory).data == expected
+    assert list(read_index(directory)) == ["final"]
+
+    draft.discard()
+    assert Draft.load("final", directory) is None
+    assert read_index(directory) == {}
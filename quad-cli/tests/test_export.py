@@ -0,0 +1,40 @@
+"""
+Tests for `quad export`: a workbook written from any snapshot reads back
+as the same org.
+
+Copyright (c) 2026 Gopi Suman Addanke. All Rights Reserved.
+"""
+
+import pytest
+
+from conftest import FORMATS, write_org
+from quad_cli.commands.export import run_export
+from quad_cli.commands.incremental import count_changes, run_incremental
+from quad_cli.sources import open_source
+
+
+def read_org(path):
+    with open_source(path) as source:
+        overview = source.parse_overview()
+        people = [(r.get("name"), r.get("email")) for r in source.iter_resources()]
+        projects = [(p.get("project_name"), p.get("type"), p.get("backend")) for p in source.iter_projects()]
+    return overview, people, projects
+
+
+@pytest.mark.parametrize("fmt", FORMATS)
+def test_export_from_source_reads_back(tmp_path, fmt):
+    path = write_org(tmp_path, fmt)
+    output = str(tmp_path / "export.xlsx")
+    assert run_export(source=path, output=output) == {"resources": 2, "projects": 2}
+    assert read_org(output) == read_org(path)
+
+
+@pytest.mark.parametrize("prune", [False, True], ids=["plain", "prune"])
+def test_database_export_plans_no_changes(tmp_path, org_db, prune):
+    source = write_org(tmp_path, "excel")
+    applied = run_incremental(source, use_cache=False)
+    assert count_changes(applied) > 0
+
+    output = str(tmp_path / "export.xlsx")
+    assert run_export(org_code="ACME", output=output) == {"resources": 2, "projects": 2}
+    assert count_changes(run_incremental(output, plan_only=True, use_cache=False, prune=prune)) == 0
@@ -0,0 +1,139 @@
+"""
+Tests for `quad init --incremental / --plan`: desired state, diff and apply.
+
+Copyright (c) 2026 Gopi Suman Addanke. All Rights Reserved.
+"""
+
+from quad_cli import db
+from quad_cli.commands.incremental import (
+    DELETE, INSERT, UPDATE, apply_diff, compute_diff, count_changes, desired_state, load_state
+)
+
+ORG = {"org_name": "Acme Bank", "org_code": "ACME", "timezone": "UTC"}
+PROJECTS = [{"name": "Core Banking", "description": "Ledger", "_sheet_name": "Project 1"},
+            {"name": "Mobile", "_sheet_name": "Project 2"}]
+RESOURCES = [{"name": "Ann", "email": "ann@acme.io", "role": "Developer"},
+             {"name": "Bob", "email": "bob@acme.io", "role": "QA Lead"}]
+
+
+def keys(diff, kind, change):
+    return sorted(row["key"] for row in diff[kind][change])
+
+
+# ─────────────────────────────────────────────────────────────
+# Desired state
+# ─────────────────────────────────────────────────────────────
+
+def test_desired_state_keeps_job_titles_out():
+    desired, warnings = desired_state(ORG, RESOURCES, PROJECTS)
+    assert desired["users"] == {"ann@acme.io": {"full_name": "Ann"}, "bob@acme.io": {"full_name": "Bob"}}
+    assert desired["domains"]["core-banking"] == {"name": "Core Banking", "description": "Ledger"}
+    assert set(desired["settings"]) == {"org_name", "timezone"}
+    assert warnings == []
+
+
+def test_desired_state_warns_on_duplicate_and_missing_keys():
+    resources = RESOURCES + [{"name": "No Mail"}, {"name": "Ann B", "email": " ANN@acme.io "}]
+    projects = PROJECTS + [{"name": "core banking", "_sheet_name": "Project 3"}]
+    desired, warnings = desired_state(ORG, resources, projects)
+
+    assert desired["users"]["ann@acme.io"] == {"full_name": "Ann B"}
+    assert desired["domains"]["core-banking"]["name"] == "core banking"
+    assert warnings == [
+        "Project 3: project slug 'core-banking' also used by Project 1, the last one is used",
+        "Resources row 4: no email, skipped",
+        "Resources row 5: duplicate email 'ann@acme.io' (also in row 2), the last one is used",
+    ]
+
+
+# ─────────────────────────────────────────────────────────────
+# Diff
+# ─────────────────────────────────────────────────────────────
+
+CURRENT = {
+    "domains": [{"id": "d1", "slug": "core-banking", "name": "Core", "description": "Ledger", "is_active": True},
+                {"id": "d2", "slug": "mobile", "name": "Mobile", "description": None, "is_active": False}],
+    "users": [{"id": "u1", "email": "ann@acme.io", "full_name": "Ann", "is_active": True},
+              {"id": "u9", "email": "admin@acme.io", "full_name": "Signup Admin", "is_active": True}],
+    "settings": [{"key": "org_name", "value": "Acme Bank"}, {"key": "sprint_length", "value": "14"}],
+}
+
+
+def test_diff_keeps_rows_the_file_does_not_own():
+    desired, _ = desired_state(ORG, RESOURCES, PROJECTS)
+    diff = compute_diff(CURRENT, desired)
+
+    assert keys(diff, "domains", UPDATE) == ["core-banking", "mobile"]
+    assert [row["reactivate"] for row in diff["domains"][UPDATE]] == [False, True]
+    assert keys(diff, "users", INSERT) == ["bob@acme.io"]
+    assert diff["users"][UPDATE] == []
+    assert keys(diff, "settings", INSERT) == ["timezone"]
+    assert all(not changes[DELETE] for changes in diff.values())
+
+
+def test_diff_with_prune_deactivates_the_rest():
+    desired, _ = desired_state(ORG, RESOURCES, PROJECTS)
+    diff = compute_diff(CURRENT, desired, prune=True)
+
+    assert keys(diff, "users", DELETE) == ["admin@acme.io"]
+    assert diff["users"][DELETE][0]["id"] == "u9"
+    assert keys(diff, "settings", DELETE) == ["sprint_length"]
+    assert diff["domains"][DELETE] == []
+
+
+def test_unchanged_state_is_an_empty_diff():
+    desired, _ = desired_state(ORG, RESOURCES, PROJECTS)
+    current = {
+        "domains": [dict(values, slug=slug, id=slug) for slug, values in desired["domains"].items()],
+        "users": [dict(values, email=email, id=email) for email, values in desired["users"].items()],
+        "settings": [{"key": key, "value": values["value"]} for key, values in desired["settings"].items()],
+    }
+    assert count_changes(compute_diff(current, desired, prune=True)) == 0
+
+
+# ─────────────────────────────────────────────────────────────
+# Apply
+# ─────────────────────────────────────────────────────────────
+
+def test_apply_diff_writes_and_preserves_access_roles(org_db):
+    with db.transaction() as cur:
+        cur.execute("INSERT INTO quad_users (company_id, email, password_hash, role, full_name) "
+                    "VALUES (%s, 'ann@acme.io', 'x', 'ADMIN', 'Ann Old'), "
+                    "(%s, 'admin@acme.io', 'x', 'ADMIN', 'Signup Admin')", (org_db, org_db))
+        cur.execute("INSERT INTO quad_org_settings VALUES (%s, 'sprint_length', '14')", (org_db,))
+
+    desired, _ = desired_state(ORG, RESOURCES, PROJECTS)
+    with db.transaction() as cur:
+        diff = compute_diff(load_state(cur, org_db), desired)
+        written = apply_diff(cur, org_db, diff)
+    assert written == {"domains.insert": 2, "users.insert": 1, "users.update": 1, "settings.insert": 2}
+
+    with db.transaction() as cur:
+        cur.execute("SELECT email, full_name, role, is_active FROM quad_users ORDER BY email")
+        assert [tuple(row.values()) for row in cur.fetchall()] == [
+            ("admin@acme.io", "Signup Admin", "ADMIN", True),
+            ("ann@acme.io", "Ann", "ADMIN", True),
+            ("bob@acme.io", "Bob", "DEVELOPER", True),
+        ]
+        cur.execute("SELECT setting_key FROM quad_org_settings ORDER BY setting_key")
+        assert [row["setting_key"] for row in cur.fetchall()] == ["org_name", "sprint_length", "timezone"]
+        assert count_changes(compute_diff(load_state(cur, org_db), desired)) == 0
+
+
+def test_apply_diff_prune_and_reactivate(org_db):
+    desired, _ = desired_state(ORG, RESOURCES, PROJECTS)
+    with db.transaction() as cur:
+        apply_diff(cur, org_db, compute_diff(load_state(cur, org_db), desired))
+        cur.execute("INSERT INTO quad_org_settings VALUES (%s, 'sprint_length', '14')", (org_db,))
+
+    fewer, _ = desired_state(ORG, RESOURCES[:1], PROJECTS[:1])
+    with db.transaction() as cur:
+        written = apply_diff(cur, org_db, compute_diff(load_state(cur, org_db), fewer, prune=True))
+    assert written == {"domains.delete": 1, "users.delete": 1, "settings.delete": 1}
+
+    with db.transaction() as cur:
+        diff = compute_diff(load_state(cur, org_db), desired)
+        assert keys(diff, "domains", UPDATE) == ["mobile"] and diff["domains"][UPDATE][0]["reactivate"]
+        apply_diff(cur, org_db, diff)
+        cur.execute("SELECT count(*) AS n FROM quad_users WHERE is_active")
+        assert cur.fetchone()["n"] == 2
@@ -0,0 +1,64 @@
+"""
+Tests for quad init from a workbook: streaming and full Excel parsing set
+up the same projects.
+
+Copyright (c) 2026 Gopi Suman Addanke. All Rights Reserved.
+"""
+
+import json
+
+import pytest
+
+from conftest import write_org
+from quad_cli.commands.init import Console, QuadInit
+from quad_cli.sources.base import Row
+from quad_cli.sources.excel import ExcelParser
+
+
+def loaded(path, streaming):
+    init = QuadInit(path, use_cache=False)
+    init.parser = ExcelParser(path, streaming=streaming)
+    init.load()
+    return init
+
+
+@pytest.fixture
+def answers(monkeypatch, capsys):
+    """Accept every prompt's default, except the project owner: the second resource"""
+    monkeypatch.setattr("builtins.input", lambda prompt: "")
+    monkeypatch.setattr(Console, "select", staticmethod(
+        lambda question, options, default=0: 1 if question == "Project owner?" else default
+    ))
+
+
+def test_streaming_and_full_parsing_read_the_same_org(tmp_path):
+    path = write_org(tmp_path, "excel")
+    streaming, full = loaded(path, True), loaded(path, False)
+
+    assert all(isinstance(row, Row) for row in streaming.resources)
+    assert streaming.org_data == full.org_data
+    assert [row.to_dict() for row in streaming.resources] == full.resources
+    assert streaming.projects == full.projects
+
+
+def test_interactive_setup_is_the_same_in_both_modes(tmp_path, answers):
+    path = write_org(tmp_path, "excel")
+    streaming, full = loaded(path, True), loaded(path, False)
+    streaming._setup_projects()
+    full._setup_projects()
+
+    assert streaming.projects == full.projects
+    for project in streaming.projects:
+        assert type(project["owner"]) is dict
+        assert project["owner"] == {"name": "Bob", "email": "bob@acme.io", "role": "QA Lead"}
+    json.dumps(streaming.projects)  # Saved to drafts and the database as JSON
+
+
+def test_accepting_parsed_values_is_the_same_in_both_modes(tmp_path):
+    path = write_org(tmp_path, "excel")
+    streaming, full = loaded(path, True), loaded(path, False)
+    streaming.accept_parsed()
+    full.accept_parsed()
+
+    assert streaming.projects == full.projects
+    assert type(streaming.projects[0]["owner"]) is dict
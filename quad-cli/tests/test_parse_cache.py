@@ -0,0 +1,130 @@
+"""
+Tests for the parse cache: hits on unchanged sheets, misses on anything a
+sheet's values depend on.
+
+Copyright (c) 2026 Gopi Suman Addanke. All Rights Reserved.
+"""
+
+import zipfile
+from datetime import datetime
+
+import pytest
+from openpyxl import Workbook
+
+from conftest import share_strings, write_org
+from quad_cli.sources import ExcelParser
+from quad_cli.utils.parse_cache import ParseCache
+from quad_cli.utils.xlsx import XlsxPackage
+
+
+def patch(path, part, old, new):
+    """Replace bytes in one zip part, keeping every other part as is"""
+    with zipfile.ZipFile(path) as zin:
+        items = [(item, zin.read(item.filename)) for item in zin.infolist()]
+    assert part in [item.filename for item, _ in items], part
+    with zipfile.ZipFile(path, "w") as zout:
+        for item, data in items:
+            if item.filename == part:
+                assert old in data, (part, old)
+                data = data.replace(old, new)
+            zout.writestr(item, data)
+
+
+def cached(path, directory, sheet, kind="table"):
+    """Look a sheet up, storing a marker on a miss; returns whether it hit"""
+    with ParseCache(str(path), directory) as cache:
+        if cache.get(sheet, kind) is not None:
+            return True
+        cache.put(sheet, kind, sheet)
+        return False
+
+
+@pytest.fixture
+def workbook(tmp_path):
+    """Two sheets sharing the string table, and a number in a custom format"""
+    wb = Workbook()
+    wb.active.title = "Overview"
+    wb.active.append(["Org Name", "Acme Bank"])
+    sheet = wb.create_sheet("Resources")
+    sheet.append(["Name", "Email"])
+    sheet.append(["Ann", "ann@acme.io"])
+    sheet["C2"] = 45000
+    sheet["C2"].number_format = "0.000"
+    path = tmp_path / "org.xlsx"
+    wb.save(path)
+    share_strings(path)
+    return path
+
+
+def test_unchanged_sheet_hits(workbook, tmp_path):
+    assert not cached(workbook, tmp_path / "cache", "Overview")
+    assert cached(workbook, tmp_path / "cache", "Overview")
+    assert not cached(workbook, tmp_path / "cache", "Overview", kind="key_value")
+
+
+def test_new_string_elsewhere_keeps_other_sheets_cached(workbook, tmp_path):
+    cache = tmp_path / "cache"
+    cached(workbook, cache, "Overview")
+    cached(workbook, cache, "Resources")
+
+    from openpyxl import load_workbook
+    wb = load_workbook(workbook)
+    wb["Resources"]["A2"] = "Anna"
+    wb.save(workbook)
+    share_strings(workbook)
+
+    assert cached(workbook, cache, "Overview")
+    assert not cached(workbook, cache, "Resources")
+
+
+def test_shared_string_text_change_misses(workbook, tmp_path):
+    cache = tmp_path / "cache"
+    cached(workbook, cache, "Overview")
+    cached(workbook, cache, "Resources")
+
+    # The sheet XML is unchanged; only the string it points at differs
+    patch(workbook, "xl/sharedStrings.xml", b"Acme Bank", b"Acme Corp")
+    assert not cached(workbook, cache, "Overview")
+    assert cached(workbook, cache, "Resources")
+
+
+def test_number_format_change_misses(workbook, tmp_path):
+    cache = tmp_path / "cache"
+    cached(workbook, cache, "Resources")
+
+    patch(workbook, "xl/styles.xml", b'formatCode="0.000"', b'formatCode="yyyy-mm-dd"')
+    with XlsxPackage(str(workbook)) as package:
+        assert list(package.iter_rows("Resources"))[1][1][2] == datetime(2023, 3, 15)
+    assert not cached(workbook, cache, "Resources")
+
+
+def test_date_system_change_misses(workbook, tmp_path):
+    cache = tmp_path / "cache"
+    cached(workbook, cache, "Resources")
+
+    patch(workbook, "xl/workbook.xml", b"<workbookPr />", b'<workbookPr date1904="1" />')
+    assert not cached(workbook, cache, "Resources")
+
+
+def test_corrupt_value_is_a_miss(workbook, tmp_path):
+    cache = tmp_path / "cache"
+    cached(workbook, cache, "Overview")
+    for value in cache.glob("*.bin"):
+        value.write_bytes(b"not zlib")
+    assert not cached(workbook, cache, "Overview")
+    assert cached(workbook, cache, "Overview")
+
+
+def test_excel_parser_skips_openpyxl_on_hits(tmp_path, quad_home):
+    path = write_org(tmp_path, "excel")
+    first = ExcelParser(path, cache=True)
+    expected = (first.parse_overview(), first.parse_resources(), first.parse_projects())
+    first.close()
+    assert first.cache.stats() == {"hits": 0, "misses": 4}
+    assert any((quad_home / "cache").glob("*.bin"))
+
+    second = ExcelParser(path, cache=True)
+    assert (second.parse_overview(), second.parse_resources(), second.parse_projects()) == expected
+    second.close()
+    assert second.cache.stats() == {"hits": 4, "misses": 0}
+    assert second._workbook is None
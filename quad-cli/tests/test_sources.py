@@ -0,0 +1,73 @@
+"""
+Tests for org sources: every format reads the same org.
+
+Copyright (c) 2026 Gopi Suman Addanke. All Rights Reserved.
+"""
+
+import json
+
+import pytest
+
+from conftest import FORMATS, write_org
+from quad_cli.sources import detect_format, open_source
+
+EXPECTED_OVERVIEW = {"org_name": "Acme Bank", "org_code": "ACME", "timezone": "UTC"}
+EXPECTED_PEOPLE = [("Ann", "ann@acme.io", "Developer"), ("Bob", "bob@acme.io", "QA Lead")]
+EXPECTED_PROJECTS = [{"project_name": "Core Banking", "type": "Web", "backend": "Go"},
+                     {"project_name": "Mobile", "type": "Mobile", "backend": "Python"}]
+
+
+@pytest.mark.parametrize("fmt", FORMATS)
+def test_every_format_reads_the_same_org(tmp_path, fmt):
+    path = write_org(tmp_path, fmt)
+    assert detect_format(path) == fmt
+
+    with open_source(path) as source:
+        assert source.parse_overview() == EXPECTED_OVERVIEW
+        people = [(r.get("name"), r.get("email"), r.get("role")) for r in source.iter_resources()]
+        assert people == EXPECTED_PEOPLE
+        projects = source.parse_projects()
+        assert all(project.pop("_sheet_name") for project in projects)
+        assert projects == EXPECTED_PROJECTS
+
+
+# ─────────────────────────────────────────────────────────────────
+# JSON records that are not objects
+# ─────────────────────────────────────────────────────────────────
+
+@pytest.mark.parametrize("document, read, where", [
+    ({"resources": [{"Name": "Ann"}, "Bob"]}, "iter_resources", "resources row 2"),
+    (["Ann"], "iter_resources", "resources row 1"),
+    ({"projects": [{"Project Name": "Core"}, [1, 2]]}, "parse_projects", "projects row 2"),
+    ({"projects": {"Core": {"Type": "Web"}, "Mobile": "App"}}, "parse_projects", "projects row 2"),
+    ({"overview": "Acme"}, "parse_overview", "overview"),
+])
+def test_json_item_that_is_not_an_object(tmp_path, document, read, where):
+    path = tmp_path / "org.json"
+    path.write_text(json.dumps(document))
+    with open_source(str(path)) as source:
+        with pytest.raises(ValueError, match=f"{path}: {where} is not an object"):
+            list(getattr(source, read)())
+
+
+def test_keyed_json_projects(tmp_path):
+    path = tmp_path / "org.json"
+    path.write_text(json.dumps({"projects": {"Core": {"Type": "Web"}, "Mobile": {"Project Name": "Mobile App"}}}))
+    with open_source(str(path)) as source:
+        assert [p["project_name"] for p in source.parse_projects()] == ["Core", "Mobile App"]
+
+
+def test_jsonl_line_that_is_not_an_object(tmp_path):
+    path = tmp_path / "org.jsonl"
+    path.write_text('{"Name": "Ann"}\n\n["Bob"]\n')
+    with open_source(str(path)) as source:
+        with pytest.raises(ValueError, match=f"{path}, line 3 is not an object \\(got list\\)"):
+            list(source.iter_resources())
+
+
+def test_jsonl_bad_line(tmp_path):
+    path = tmp_path / "org.jsonl"
+    path.write_text('{"Name": "Ann"}\n{oops\n')
+    with open_source(str(path)) as source:
+        with pytest.raises(ValueError, match=f"{path}, line 2: "):
+            list(source.iter_resources())
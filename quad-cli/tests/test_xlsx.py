@@ -0,0 +1,162 @@
+"""
+Parity tests: the fast .xlsx reader against openpyxl and ExcelParser.
+
+Copyright (c) 2026 Gopi Suman Addanke. All Rights Reserved.
+"""
+
+import re
+import zipfile
+from datetime import date, datetime, time
+
+import pytest
+from openpyxl import Workbook, load_workbook
+from openpyxl.utils.datetime import CALENDAR_MAC_1904
+
+from conftest import share_strings, write_org
+from quad_cli.sources import ExcelParser
+from quad_cli.utils import xlsx
+from quad_cli.utils.xlsx import XlsxPackage
+from quad_cli.validation import read_key_values
+
+
+def trimmed(rows):
+    """(row number, values) without trailing empty cells or empty rows"""
+    result = []
+    for number, values in rows:
+        values = list(values)
+        while values and values[-1] is None:
+            values.pop()
+        if values:
+            result.append((number, tuple(values)))
+    return result
+
+
+def openpyxl_rows(path, sheet):
+    ws = load_workbook(path, data_only=True)[sheet]
+    return trimmed(enumerate(ws.iter_rows(values_only=True), start=1))
+
+
+def fast_rows(path, sheet, **kwargs):
+    with XlsxPackage(path) as package:
+        return trimmed(package.iter_rows(sheet, **kwargs))
+
+
+def build(path, date1904=False, strings="shared"):
+    """A workbook with every kind of value openpyxl writes, strings shared or inline"""
+    wb = Workbook()
+    if date1904:
+        wb.epoch = CALENDAR_MAC_1904
+    ws = wb.active
+    ws.title = "Data"
+    ws.append(["Name", "Joined", 1, 2.5, True, "a & <b>", "ünï", -3e-7, 10 ** 15])
+    ws.append([None, datetime(2024, 2, 29, 13, 30, 15), None, None, False, "Name"])
+    ws.append([])
+    ws["D4"] = date(1900, 1, 15)
+    ws["E4"] = time(9, 30)
+    ws["F4"] = datetime(1900, 3, 1)
+    cells = {"G4": (45000, "yyyy-mm-dd"), "H4": (0.25, "[h]:mm"), "I4": (30.5, "[h]:mm:ss"),
+             "A5": (3, '"d"0'), "B5": (4, "0.00_d"), "C5": (5, "[Red]0"), "D5": (45000.5, "0;dd"),
+             "AB7": ("far", "@")}
+    for ref, (value, fmt) in cells.items():
+        ws[ref] = value
+        ws[ref].number_format = fmt
+    ws["C8"].number_format = "yyyy-mm-dd"  # Styled but empty
+    wb.save(path)
+    if strings == "shared":
+        share_strings(path)
+    return path
+
+
+# ─────────────────────────────────────────────────────────────────
+# openpyxl parity
+# ─────────────────────────────────────────────────────────────────
+
+@pytest.mark.parametrize("strings", ["shared", "inline"])
+@pytest.mark.parametrize("date1904", [False, True], ids=["1900", "1904"])
+def test_values_match_openpyxl(tmp_path, date1904, strings):
+    path = build(tmp_path / "values.xlsx", date1904, strings)
+    with XlsxPackage(str(path)) as package:
+        assert package.date1904 == date1904
+        assert bool(package.shared_strings()) == (strings == "shared")
+    assert fast_rows(str(path), "Data") == openpyxl_rows(path, "Data")
+
+
+def test_max_col(tmp_path):
+    path = build(tmp_path / "values.xlsx")
+    assert fast_rows(str(path), "Data", max_col=2) == trimmed((n, v[:2]) for n, v in openpyxl_rows(path, "Data"))
+
+
+def test_rows_across_blocks(tmp_path, monkeypatch):
+    wb = Workbook()
+    for i in range(500):
+        wb.active.append([f"name {i}", i, i * 0.5, datetime(2026, 1, 1 + i % 28)])
+    path = tmp_path / "long.xlsx"
+    wb.save(path)
+    share_strings(path)
+
+    monkeypatch.setattr(xlsx, "BLOCK_SIZE", 1000)
+    assert fast_rows(str(path), "Sheet") == openpyxl_rows(path, "Sheet")
+
+
+INLINE_ROWS = (
+    '<row r="1"><c r="A1" t="inlineStr"><is><t>Ann &amp; Co</t></is></c>'
+    '<c r="B1" t="inlineStr"><is><t xml:space="preserve"> padded </t></is></c>'
+    '<c r="C1" t="n"><v>7</v></c></row>'
+    # Rich text and phonetic runs, a formula with a cached string, an error: the per-cell scan
+    '<row r="3"><c r="A3" t="inlineStr"><is><r><t>Bo</t></r><r><rPr><b/></rPr><t>b</t></r>'
+    '<rPh sb="0" eb="1"><t>x</t></rPh></is></c>'
+    '<c r="B3" t="str"><f>UPPER(A1)</f><v>ANN &amp; CO</v></c>'
+    '<c r="D3" t="e"><v>#N/A</v></c></row>'
+)
+
+
+def test_inline_strings_match_openpyxl(tmp_path):
+    source = tmp_path / "source.xlsx"
+    wb = Workbook()
+    wb.active["A1"] = "placeholder"
+    wb.save(source)
+
+    path = tmp_path / "inline.xlsx"
+    with zipfile.ZipFile(source) as zin, zipfile.ZipFile(path, "w") as zout:
+        for item in zin.infolist():
+            data = zin.read(item.filename)
+            if item.filename == "xl/worksheets/sheet1.xml":
+                data = re.sub(rb"<sheetData>.*</sheetData>", f"<sheetData>{INLINE_ROWS}</sheetData>".encode(), data)
+            zout.writestr(item, data)
+
+    rows = fast_rows(str(path), "Sheet")
+    assert rows == [(1, ("Ann & Co", " padded ", 7)), (3, ("Bob", "ANN & CO", None, "#N/A"))]
+    assert rows == openpyxl_rows(path, "Sheet")
+
+
+def test_shared_strings_with_rich_text(tmp_path):
+    from openpyxl.cell.rich_text import CellRichText, TextBlock
+    from openpyxl.cell.text import InlineFont
+
+    wb = Workbook()
+    wb.active.append(["plain", CellRichText("rich ", TextBlock(InlineFont(b=True), "bold")), "plain"])
+    path = tmp_path / "rich.xlsx"
+    wb.save(path)
+    share_strings(path)
+    assert fast_rows(str(path), "Sheet") == [(1, ("plain", "rich bold", "plain"))]
+
+
+# ─────────────────────────────────────────────────────────────────
+# ExcelParser parity
+# ─────────────────────────────────────────────────────────────────
+
+def test_org_sheets_match_excel_parser(tmp_path):
+    path = write_org(tmp_path, "excel")
+    parser = ExcelParser(path)
+
+    with XlsxPackage(path) as package:
+        overview = {key: value for key, (_, value) in read_key_values(package, "Overview").items()}
+        assert overview == parser.parse_overview()
+
+        header, *rows = [values for _, values in package.iter_rows("Resources")]
+        keys = [str(h).lower().replace(' ', '_') for h in header]
+        assert [dict(zip(keys, row)) for row in rows] == parser.parse_resources()
+
+        projects = [dict({k: v for k, (_, v) in read_key_values(package, name).items()}, _sheet_name=name)
+                    for name in package.sheetnames if ExcelParser._is_project_sheet(name)]
+        assert projects == parser.parse_projects()